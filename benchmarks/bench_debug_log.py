@@ -0,0 +1,101 @@
+"""
+bench_debug_log.py - Debug logging overhead benchmark
+
+Measures the time and memory allocated to write an API response to the debug log with
+log sanitization enabled. Results are compared against a baseline emulating previous
+versions, where the entire response was deep copied before the resources list was truncated
+and the record was formatted. Both are measured with the logger enabled for DEBUG and with
+DEBUG records filtered out by the logger level.
+
+    python benchmarks/bench_debug_log.py --records 5000 --calls 50
+"""
+import argparse
+import gc
+import json
+import logging
+import os
+import sys
+import time
+import tracemalloc
+from copy import deepcopy
+
+sys.path.append(os.path.abspath("src"))
+from falconpy._api_request import APIRequest
+from falconpy._constant import GLOBAL_API_MAX_RETURN
+from falconpy._util._functions import log_api_activity
+
+
+def legacy_sanitize(dirty: dict, record_max: int) -> dict:
+    """Sanitize the logged dictionary in place the way previous versions did."""
+    for redact in ["access_token", "client_id", "client_secret", "member_cid", "token"]:
+        if redact in dirty:
+            dirty[redact] = "REDACTED"
+        if redact in dirty["body"]:
+            dirty["body"][redact] = "REDACTED"
+    del dirty["body"]["resources"][max(1, min(record_max, GLOBAL_API_MAX_RETURN)):]
+    return dirty
+
+
+def baseline(content: dict, content_type: str, api: APIRequest):
+    """Log the response the way previous versions did."""
+    if api.log_util:
+        api.log_util.debug("STATUS CODE: %i", content["status_code"])
+        if content_type.startswith("application/json"):
+            api.log_util.debug("RESULT: %s", legacy_sanitize(deepcopy(content), api.max_debug))
+
+
+def measure(log_response, calls: int, content: dict, api: APIRequest) -> dict:
+    """Return the time and peak memory used to log a response a number of times."""
+    gc.collect()
+    tracemalloc.start()
+    log_response(content, "application/json", api)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for _ in range(calls):
+        log_response(content, "application/json", api)
+    elapsed = time.perf_counter() - start
+
+    return {"ms_per_call": elapsed / calls * 1000, "peak_kb": peak / 1024}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=5000, help="Number of resources in the response")
+    parser.add_argument("--calls", type=int, default=50, help="Number of responses logged per measurement")
+    parser.add_argument("--debug-records", type=int, default=100, help="Number of resources written to the log")
+    args = parser.parse_args()
+
+    content = {"status_code": 200,
+               "headers": {"Content-Type": "application/json", "X-Cs-Region": "us-1"},
+               "body": {"meta": {"query_time": 0.01, "trace_id": "0f1e2d3c-4b5a-6978-8a9b-0c1d2e3f4a5b"},
+                        "resources": [{"device_id": f"{num:032x}",
+                                       "hostname": f"host-{num:05d}.example.com",
+                                       "policies": [{"policy_type": "prevention", "applied": True}],
+                                       "tags": ["FalconGroupingTags/Production"]
+                                       } for num in range(args.records)],
+                        "errors": []
+                        }
+               }
+    log = logging.getLogger("falconpy.bench")
+    log.propagate = False
+    with open(os.devnull, "w", encoding="utf-8") as devnull:
+        log.addHandler(logging.StreamHandler(devnull))
+        api = APIRequest("/devices/entities/devices/v2",
+                         {"log_util": log, "debug_record_count": args.debug_records, "sanitize": True}
+                         )
+        results = {"records": args.records, "calls": args.calls}
+        for label, level in (("enabled", logging.DEBUG), ("filtered", logging.INFO)):
+            log.setLevel(level)
+            before = measure(baseline, args.calls, content, api)
+            after = measure(log_api_activity, args.calls, content, api)
+            results[label] = {"deepcopy": before,
+                              "lazy": after,
+                              "speedup": before["ms_per_call"] / max(after["ms_per_call"], 1e-9)
+                              }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
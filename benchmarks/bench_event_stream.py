@@ -0,0 +1,85 @@
+"""
+bench_event_stream.py - Event Streams consumer throughput benchmark
+
+Measures the number of events per second delivered by EventStreams.consume when reading
+every partition from a local stub of the Falcon API. Each partition is served as a chunked,
+newline-delimited event stream.
+
+    python benchmarks/bench_event_stream.py --partitions 2 --events 500000
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath("src"))
+sys.path.append(os.path.abspath("."))
+# flake8: noqa=E402
+from tests.mock_falcon import MockFalcon, falcon_body
+from falconpy import EventStreams
+
+FEED = "/sensors/entities/datafeed/v1/{}"
+EVENT = (b'{"metadata": {"customerIDString": "benchmark", "offset": %d, "eventType": "DetectionSummaryEvent",'
+         b' "eventCreationTime": 1714564800000, "version": "1.0"}, "event": {"DetectId": "ldt:%d",'
+         b' "ComputerName": "host-benchmark", "Severity": 3, "Tactic": "Execution"}}\n'
+         )
+
+
+def serve(events: int, batch: int = 1000):
+    """Return a route serving a partition as a chunked event stream."""
+    def route(request):
+        start = int(request.query.get("offset", ["0"])[0])
+
+        def generate():
+            for position in range(start, events, batch):
+                yield b"".join(EVENT % (num, num) for num in range(position, min(position + batch, events)))
+        return 200, {"Content-Type": "application/json"}, generate()
+    return route
+
+
+def streams(mock: MockFalcon, partitions: int):
+    """Return a route listing the stub partitions."""
+    def route(_):
+        return 200, {}, falcon_body(resources=[{
+            "dataFeedURL": f"{mock.base_url}{FEED.format(partition)}",
+            "sessionToken": {"token": "benchmark", "expiration": "2099-01-01T00:00:00Z"},
+            "refreshActiveSessionURL": f"{mock.base_url}/sensors/entities/datafeed-actions/v1/{partition}",
+            "refreshActiveSessionInterval": 1800
+        } for partition in range(partitions)])
+    return route
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--partitions", type=int, default=2, help="Number of stream partitions")
+    parser.add_argument("--events", type=int, default=500000, help="Number of events in each partition")
+    args = parser.parse_args()
+    total = args.partitions * args.events
+
+    with MockFalcon() as mock:
+        mock.route("GET", "/sensors/entities/datafeed/v2", streams(mock, args.partitions))
+        for partition in range(args.partitions):
+            mock.route("GET", FEED.format(partition), serve(args.events))
+        falcon = EventStreams(client_id="benchmark", client_secret="benchmark", base_url=mock.base_url)
+        falcon.login()
+        count = 0
+        start = time.perf_counter()
+        with falcon.consume(app_id="benchmark") as consumer:
+            for _ in consumer:
+                count += 1
+                if count == total:
+                    break
+            elapsed = time.perf_counter() - start
+            metrics = consumer.metrics
+
+    print(json.dumps({"events": count,
+                      "seconds": elapsed,
+                      "events_per_second": count / elapsed,
+                      "batches": metrics["batches"],
+                      "reconnects": metrics["reconnects"]
+                      }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
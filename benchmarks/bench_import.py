@@ -0,0 +1,73 @@
+"""
+bench_import.py - Import time and memory benchmark
+
+Measures the cost of `import falconpy` in a fresh interpreter using
+`python -X importtime`, along with resident memory and the number of loaded
+modules. The cost of importing requests is reported separately so the
+overhead added by the SDK itself can be tracked.
+
+    python benchmarks/bench_import.py --runs 20
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+SRC = os.path.abspath("src")
+SCENARIOS = {
+    "requests": "import requests",
+    "falconpy": "import falconpy",
+    "one_service_class": "from falconpy import Hosts",
+    "uber_class": "from falconpy import APIHarnessV2; APIHarnessV2(client_id='x', client_secret='y')",
+    "everything": "from falconpy import *"
+}
+PROBE = "import resource, sys; {statement}; print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, len(sys.modules))"
+
+
+def import_time(statement: str) -> int:
+    """Return the cumulative import time in microseconds for the top level imports of a statement."""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", statement],
+                            env={**os.environ, "PYTHONPATH": SRC},
+                            capture_output=True, text=True, check=True
+                            )
+    total = 0
+    for line in result.stderr.splitlines():
+        fields = line.split("|")
+        # Top level imports are not indented beneath another package.
+        if len(fields) == 3 and fields[1].strip().isdigit() and not fields[2].startswith("  "):
+            total += int(fields[1])
+    return total
+
+
+def footprint(statement: str):
+    """Return the maximum resident memory (KB) and module count after running a statement."""
+    result = subprocess.run([sys.executable, "-c", PROBE.format(statement=statement)],
+                            env={**os.environ, "PYTHONPATH": SRC},
+                            capture_output=True, text=True, check=True
+                            )
+    rss, modules = result.stdout.split()
+    return int(rss), int(modules)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10, help="Number of interpreter launches per scenario")
+    args = parser.parse_args()
+
+    results = {}
+    for name, statement in SCENARIOS.items():
+        times = [import_time(statement) for _ in range(args.runs)]
+        rss, modules = footprint(statement)
+        results[name] = {"import_ms": statistics.median(times) / 1000,
+                         "max_rss_kb": rss,
+                         "modules": modules
+                         }
+    results["sdk_overhead_ms"] = results["falconpy"]["import_ms"] - results["requests"]["import_ms"]
+    results["runs"] = args.runs
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
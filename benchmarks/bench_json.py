@@ -0,0 +1,79 @@
+"""
+bench_json.py - JSON codec benchmark
+
+Compares the time taken by each installed JSON codec (orjson, simdjson, ujson and the
+standard library) to decode API responses and encode request bodies. Representative
+payloads are generated for a 5,000 record device details response, a 5,000 record
+combined vulnerabilities response and an indicator creation body. Recorded responses
+can be benchmarked instead by providing their paths.
+
+    python benchmarks/bench_json.py --runs 10
+    python benchmarks/bench_json.py --fixture recorded/device_details.json
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath("src"))
+# flake8: noqa=E402
+from falconpy import JSONCodec
+from falconpy._constant import JSON_CODECS
+from payloads import device_details, vulnerabilities, indicators
+
+
+def best(operation, runs: int) -> float:
+    """Return the best time (in milliseconds) taken by an operation."""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        operation()
+        timings.append((time.perf_counter() - start) * 1000)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10, help="Number of runs per measurement, the best is reported")
+    parser.add_argument("--records", type=int, default=5000, help="Number of records in generated payloads")
+    parser.add_argument("--fixture", action="append", default=[], help="Path to a recorded JSON payload (repeatable)")
+    args = parser.parse_args()
+
+    if args.fixture:
+        payloads = {}
+        for path in args.fixture:
+            with open(path, "rb") as recorded:
+                payloads[os.path.basename(path)] = json.loads(recorded.read())
+    else:
+        payloads = {"device_details": device_details(args.records),
+                    "vulnerabilities_combined": vulnerabilities(args.records),
+                    "indicator_create": indicators(args.records)
+                    }
+
+    codecs = []
+    for name in JSON_CODECS:
+        try:
+            codecs.append(JSONCodec.get(name))
+        except ImportError:
+            continue
+
+    results = {"codecs": [codec.name for codec in codecs], "default": JSONCodec.get().name, "payloads": {}}
+    for payload_name, payload in payloads.items():
+        encoded = json.dumps(payload).encode("utf-8")
+        measured = {"size_kb": len(encoded) / 1024}
+        for codec in codecs:
+            measured[codec.name] = {"decode_ms": best(lambda: codec.loads(encoded), args.runs),
+                                    "encode_ms": best(lambda: codec.dumps(payload), args.runs)
+                                    }
+        baseline = measured["json"]
+        for codec in codecs:
+            measured[codec.name]["decode_speedup"] = baseline["decode_ms"] / measured[codec.name]["decode_ms"]
+            measured[codec.name]["encode_speedup"] = baseline["encode_ms"] / measured[codec.name]["encode_ms"]
+        results["payloads"][payload_name] = measured
+    results["runs"] = args.runs
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+bench_resource_stream.py - Incremental resource parsing benchmark
+
+Measures peak memory and elapsed time when reading every record returned by a large
+combined endpoint response (Discover.query_combined_hosts) from a local stub of the
+Falcon API. Responses are served with chunked transfer encoding. Results compare the
+default behavior, where the full body is read and decoded before being returned, against
+streaming the resources with stream_resources=True.
+
+    python benchmarks/bench_resource_stream.py --records 20000
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.append(os.path.abspath("src"))
+sys.path.append(os.path.abspath("."))
+# flake8: noqa=E402
+from tests.mock_falcon import MockFalcon
+from falconpy import Discover
+
+ROUTE = "/discover/combined/hosts/v1"
+
+
+def host(num: int) -> dict:
+    """Return a record shaped like a Discover host asset."""
+    return {"id": f"{num:032x}_{num:032x}", "cid": f"{num:032x}", "entity_type": "managed",
+            "hostname": f"host-{num:05d}", "platform_name": "Windows", "os_version": "Windows 11",
+            "first_seen_timestamp": "2024-01-01T00:00:00Z", "last_seen_timestamp": "2024-05-01T12:00:00Z",
+            "network_interfaces": [{"local_ip": f"10.0.{num % 256}.{num % 254 + 1}", "mac_address": "00-11-22-33-44-55",
+                                    "interface_alias": "Ethernet", "network_prefix": "10.0"}],
+            "tags": ["FalconGroupingTags/Production"], "confidence": 75, "criticality": "Unassigned"
+            }
+
+
+def serve(records: int):
+    """Return a route serving a combined hosts response in chunks."""
+    def route(_):
+        def generate():
+            yield b'{"meta": {"query_time": 0.2, "pagination": {"total": %d}}, "resources": [' % records
+            for num in range(records):
+                yield (b"," if num else b"") + json.dumps(host(num)).encode("utf-8")
+            yield b'], "errors": []}'
+        return 200, {"Content-Type": "application/json"}, generate()
+    return route
+
+
+def measure(read) -> dict:
+    """Return the peak memory and elapsed time of reading every record."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    count = read()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"records": count, "peak_mb": peak / 1048576, "seconds": elapsed}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=20000, help="Number of records in the response")
+    args = parser.parse_args()
+
+    with MockFalcon() as mock:
+        mock.route("GET", ROUTE, serve(args.records))
+        discover = Discover(client_id="benchmark", client_secret="benchmark", base_url=mock.base_url)
+        discover.login()
+        buffered = measure(lambda: sum(1 for _ in discover.query_combined_hosts()["body"]["resources"]))
+        streamed = measure(lambda: sum(1 for _ in discover.query_combined_hosts(stream_resources=True)))
+
+    print(json.dumps({"buffered": buffered,
+                      "streamed": streamed,
+                      "memory_reduction": 1 - streamed["peak_mb"] / buffered["peak_mb"]
+                      }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+bench_result.py - Pythonic Result access benchmark
+
+Measures the time taken to iterate, index, search and measure the length of
+large pythonic Result objects retrieved from a local stub of the Falcon API.
+Results are compared against a baseline where every access to the resources
+list returns a copy (the behavior of previous versions), which makes indexing
+within a loop quadratic.
+
+    python benchmarks/bench_result.py --records 5000 --runs 5
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath("src"))
+sys.path.append(os.path.abspath("."))
+# flake8: noqa=E402
+from tests.mock_falcon import MockFalcon, falcon_body
+from falconpy import Hosts, Result
+from falconpy._result import Resources
+
+ROUTE = "/devices/queries/devices/v1"
+
+
+class CopiedResources(Resources):
+    """Resources returning a copy of the underlying list on every access."""
+
+    @property
+    def data(self):
+        return list(self._data)
+
+
+def scenarios(result: Result) -> dict:
+    """Return the operations measured against a result."""
+    last = result.data[-1]
+    return {
+        "iterate": lambda: sum(1 for _ in result),
+        "index": lambda: [result[pos] for pos in range(len(result))],
+        "contains": lambda: [last in result for _ in range(100)],
+        "length": lambda: [len(result) for _ in range(10000)]
+    }
+
+
+def measure(result: Result, runs: int) -> dict:
+    """Return the best time (in milliseconds) for each operation."""
+    timings = {}
+    for name, operation in scenarios(result).items():
+        best = None
+        for _ in range(runs):
+            start = time.perf_counter()
+            operation()
+            elapsed = (time.perf_counter() - start) * 1000
+            best = elapsed if best is None else min(best, elapsed)
+        timings[name] = best
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=5000, help="Number of resources in the result")
+    parser.add_argument("--runs", type=int, default=5, help="Number of runs per operation, the best is reported")
+    args = parser.parse_args()
+
+    with MockFalcon() as mock:
+        mock.route("GET", ROUTE, falcon_body(resources=[f"{num:032x}" for num in range(args.records)]))
+        hosts = Hosts(client_id="bench", client_secret="bench", base_url=mock.base_url, pythonic=True)
+        result = hosts.query_devices_by_filter()
+
+    copied = Result(full=result.full_return)
+    copied.resources = CopiedResources(copied.resources.copy())
+    results = {"current": measure(result, args.runs), "copied": measure(copied, args.runs)}
+    results["speedup"] = {name: results["copied"][name] / max(results["current"][name], 1e-6)
+                          for name in results["current"]
+                          }
+    results["records"] = args.records
+    results["runs"] = args.runs
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
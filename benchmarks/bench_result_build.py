@@ -0,0 +1,108 @@
+"""
+bench_result_build.py - Pythonic Result construction benchmark
+
+Measures the time and memory allocated to build the pythonic Result returned for
+an API response when the caller only reads the status code and resources. Results
+are compared against a baseline emulating previous versions, where every response
+component was created upon construction and the pythonic Result was built twice
+(once to produce the dictionary representation, and again from that dictionary).
+
+    python benchmarks/bench_result_build.py --records 100 --calls 10000
+"""
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.append(os.path.abspath("src"))
+# flake8: noqa=E402
+from requests.structures import CaseInsensitiveDict
+from falconpy import Result
+from falconpy._result import Headers, Meta, Errors, Resources, RawBody
+
+
+class EagerResult(Result):
+    """Result creating every response component upon construction."""
+
+    def __init__(self, *args, **kwargs):
+        # Previous versions created empty defaults before parsing the response.
+        _defaults = (Headers(), Meta(), Resources([]), Errors(), RawBody())
+        super().__init__(*args, **kwargs)
+        for name in ("headers", "meta", "errors", "resources", "raw"):
+            getattr(self, name)
+
+
+def baseline(status_code: int, headers: CaseInsensitiveDict, body: dict) -> Result:
+    """Build the pythonic Result the way previous versions did."""
+    return EagerResult(full=EagerResult(status_code, headers, body).full_return)
+
+
+def lazy(status_code: int, headers: CaseInsensitiveDict, body: dict) -> Result:
+    """Build the pythonic Result the way the SDK does now."""
+    return Result(status_code, headers, body)
+
+
+def measure(build, calls: int, status_code: int, headers: CaseInsensitiveDict, body: dict) -> dict:
+    """Return the time and memory used to build and read a number of results."""
+    gc.collect()
+    tracemalloc.start()
+    start_blocks = sys.getallocatedblocks()
+    retained = []
+    for _ in range(calls):
+        result = build(status_code, headers, body)
+        _read = (result.status_code, len(result.resources))
+        retained.append(result)
+    blocks = sys.getallocatedblocks() - start_blocks
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del retained
+
+    start = time.perf_counter()
+    for _ in range(calls):
+        result = build(status_code, headers, body)
+        _read = (result.status_code, len(result.resources))
+    elapsed = time.perf_counter() - start
+
+    return {"us_per_call": elapsed / calls * 1000000,
+            "bytes_per_result": current / calls,
+            "blocks_per_result": blocks / calls,
+            "peak_kb": peak / 1024
+            }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=100, help="Number of resources in the response")
+    parser.add_argument("--calls", type=int, default=10000, help="Number of results built per measurement")
+    args = parser.parse_args()
+
+    headers = CaseInsensitiveDict({"Content-Type": "application/json",
+                                   "Content-Length": "4096",
+                                   "Date": "Wed, 01 May 2024 12:00:00 GMT",
+                                   "X-Cs-Region": "us-1",
+                                   "X-Cs-Traceid": "0f1e2d3c-4b5a-6978-8a9b-0c1d2e3f4a5b",
+                                   "X-Ratelimit-Limit": "6000",
+                                   "X-Ratelimit-Remaining": "5999"
+                                   })
+    body = {"meta": {"query_time": 0.01, "pagination": {"offset": 0, "limit": args.records, "total": args.records},
+                     "powered_by": "device-api", "trace_id": "0f1e2d3c-4b5a-6978-8a9b-0c1d2e3f4a5b"},
+            "resources": [f"{num:032x}" for num in range(args.records)],
+            "errors": []
+            }
+
+    before = measure(baseline, args.calls, 200, headers, body)
+    after = measure(lazy, args.calls, 200, headers, body)
+    print(json.dumps({"records": args.records,
+                      "calls": args.calls,
+                      "eager": before,
+                      "lazy": after,
+                      "speedup": before["us_per_call"] / after["us_per_call"],
+                      "allocation_reduction": 1 - after["bytes_per_result"] / before["bytes_per_result"]
+                      }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
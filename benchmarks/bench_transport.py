@@ -0,0 +1,68 @@
+"""
+bench_transport.py - Pooled transport throughput benchmark
+
+Measures requests per second against a local HTTPS stub of the Falcon API,
+comparing single use connections (a new session and TLS handshake per call)
+against the persistent pooled transport shared by an auth_object.
+
+    python benchmarks/bench_transport.py --requests 2000 --threads 8
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.append(os.path.abspath("src"))
+sys.path.append(os.path.abspath("."))
+# flake8: noqa=E402
+from tests.mock_falcon import MockFalcon, falcon_body
+from falconpy import Hosts, SSLDisabledWarning
+import warnings
+
+warnings.simplefilter("ignore", SSLDisabledWarning)
+ROUTE = "/devices/queries/devices/v1"
+
+
+def run(hosts: Hosts, total: int, threads: int) -> float:
+    """Perform the requested number of calls and return the requests per second."""
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        statuses = list(pool.map(lambda _: hosts.query_devices_by_filter()["status_code"], range(total)))
+    elapsed = time.perf_counter() - start
+    assert statuses.count(200) == total, "Unexpected responses received from the mock server."
+    return total / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=1000, help="Number of requests per scenario")
+    parser.add_argument("--threads", type=int, default=8, help="Number of worker threads")
+    args = parser.parse_args()
+
+    results = {}
+    with MockFalcon(tls=True) as mock:
+        mock.route("GET", ROUTE, falcon_body(resources=["a" * 32] * 100))
+        # Single use connections, emulates the previous per-call requests.request behavior.
+        unpooled = Hosts(client_id="bench", client_secret="bench", base_url=mock.base_url, ssl_verify=False)
+        unpooled.auth_object.transport = None
+        before = mock.connections
+        results["unpooled"] = {"rps": run(unpooled, args.requests, args.threads),
+                               "connections": mock.connections - before
+                               }
+        pooled = Hosts(client_id="bench", client_secret="bench", base_url=mock.base_url,
+                       ssl_verify=False, pool_maxsize=args.threads
+                       )
+        before = mock.connections
+        results["pooled"] = {"rps": run(pooled, args.requests, args.threads),
+                             "connections": mock.connections - before
+                             }
+    results["speedup"] = results["pooled"]["rps"] / results["unpooled"]["rps"]
+    results["requests"] = args.requests
+    results["threads"] = args.threads
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
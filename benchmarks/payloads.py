@@ -0,0 +1,185 @@
+"""
+payloads.py - Canned API payloads used by the benchmarks
+
+Generates deterministic, realistically shaped responses for the core operations
+exercised by the benchmarks (token, hosts, alerts, spotlight, real time response
+and downloads), along with request bodies. Generated payloads depend only on the
+requested record count, so results are comparable between runs and releases.
+"""
+import random
+
+
+def device_details(count: int) -> dict:
+    """Return a response body shaped like get_device_details_v2."""
+    rng = random.Random(1)
+    return {
+        "meta": {"query_time": 0.123, "powered_by": "device-api", "trace_id": "0f1e2d3c-4b5a-6978-8a9b-0c1d2e3f4a5b"},
+        "errors": [],
+        "resources": [{
+            "device_id": f"{rng.getrandbits(128):032x}",
+            "cid": f"{rng.getrandbits(128):032x}",
+            "agent_load_flags": "0",
+            "agent_local_time": "2024-05-01T12:00:00.000Z",
+            "agent_version": f"7.{rng.randint(1, 20)}.{rng.randint(10000, 19999)}.0",
+            "bios_manufacturer": "Dell Inc.",
+            "bios_version": f"1.{rng.randint(1, 30)}.0",
+            "config_id_base": "65994763",
+            "config_id_build": str(rng.randint(10000, 19999)),
+            "config_id_platform": "3",
+            "cpu_signature": str(rng.randint(100000, 999999)),
+            "external_ip": f"203.0.113.{rng.randint(1, 254)}",
+            "mac_address": "-".join(f"{rng.randint(0, 255):02x}" for _ in range(6)),
+            "hostname": f"host-{num:05d}.example.com",
+            "first_seen": "2023-01-01T00:00:00Z",
+            "last_seen": "2024-05-01T12:00:00Z",
+            "local_ip": f"10.{rng.randint(0, 255)}.{rng.randint(0, 255)}.{rng.randint(1, 254)}",
+            "machine_domain": "example.com",
+            "major_version": "10",
+            "minor_version": "0",
+            "os_version": "Windows 11",
+            "os_build": "22631",
+            "platform_id": "0",
+            "platform_name": "Windows",
+            "policies": [{"policy_type": "prevention", "policy_id": f"{rng.getrandbits(128):032x}",
+                          "applied": True, "settings_hash": f"{rng.getrandbits(32):08x}",
+                          "assigned_date": "2024-04-01T00:00:00Z", "applied_date": "2024-04-01T00:01:00Z"
+                          }],
+            "reduced_functionality_mode": "no",
+            "device_policies": {"sensor_update": {"policy_type": "sensor-update", "applied": True,
+                                                  "uninstall_protection": "ENABLED"}},
+            "groups": [f"{rng.getrandbits(128):032x}" for _ in range(rng.randint(0, 4))],
+            "product_type_desc": "Workstation",
+            "provision_status": "Provisioned",
+            "serial_number": f"{rng.getrandbits(40):010X}",
+            "status": "normal",
+            "system_manufacturer": "Dell Inc.",
+            "system_product_name": "Latitude 7440",
+            "tags": ["FalconGroupingTags/Production", "SensorGroupingTags/Finance"],
+            "modified_timestamp": "2024-05-01T12:00:00Z",
+            "meta": {"version": str(rng.randint(1000, 9999)), "version_string": "1:1234567890"},
+            "kernel_version": "10.0.22631.3447",
+            "chassis_type": "9",
+            "chassis_type_desc": "Laptop",
+            "connection_ip": f"10.0.{rng.randint(0, 255)}.{rng.randint(1, 254)}",
+            "default_gateway_ip": "10.0.0.1",
+            "connection_mac_address": "-".join(f"{rng.randint(0, 255):02x}" for _ in range(6))
+        } for num in range(count)]
+    }
+
+
+def vulnerabilities(count: int) -> dict:
+    """Return a response body shaped like query_vulnerabilities_combined."""
+    rng = random.Random(2)
+    return {
+        "meta": {"query_time": 0.456, "pagination": {"limit": count, "total": count * 4, "after": "eyJ2ZXJzaW9uIjoidjEifQ=="},
+                 "powered_by": "spapi", "trace_id": "1a2b3c4d-5e6f-7081-92a3-b4c5d6e7f809"},
+        "errors": [],
+        "resources": [{
+            "id": f"{rng.getrandbits(128):032x}_{rng.getrandbits(128):032x}",
+            "cid": f"{rng.getrandbits(128):032x}",
+            "aid": f"{rng.getrandbits(128):032x}",
+            "created_timestamp": "2024-04-01T00:00:00Z",
+            "updated_timestamp": "2024-05-01T12:00:00Z",
+            "status": rng.choice(["open", "reopen", "closed"]),
+            "cve": {"id": f"CVE-2024-{rng.randint(1000, 49999)}", "base_score": round(rng.uniform(1, 10), 1),
+                    "severity": rng.choice(["LOW", "MEDIUM", "HIGH", "CRITICAL"]),
+                    "exploit_status": rng.choice([0, 30, 60, 90]), "exprt_rating": "MEDIUM",
+                    "description": "A vulnerability in a widely deployed component allows remote code execution " * 2,
+                    "references": [f"https://example.com/advisory/{rng.randint(1, 99999)}" for _ in range(3)],
+                    "vector": "CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:H/I:H/A:H"},
+            "apps": [{"product_name_version": f"Application {rng.randint(1, 50)}.{rng.randint(0, 9)}",
+                      "sub_status": "open", "remediation": {"ids": [f"{rng.getrandbits(128):032x}"]},
+                      "evaluation_logic": {"id": f"{rng.getrandbits(128):032x}"}} for _ in range(rng.randint(1, 3))],
+            "host_info": {"hostname": f"host-{num:05d}", "local_ip": f"10.1.{rng.randint(0, 255)}.{rng.randint(1, 254)}",
+                          "machine_domain": "example.com", "os_version": "Windows 11", "ou": "Workstations",
+                          "site_name": "HQ", "platform": "Windows", "tags": ["FalconGroupingTags/Production"]},
+            "remediation": {"ids": [f"{rng.getrandbits(128):032x}"]}
+        } for num in range(count)]
+    }
+
+
+def indicators(count: int) -> dict:
+    """Return an indicator_create body payload."""
+    return {
+        "comment": "Bulk indicator import",
+        "indicators": [{"type": "domain", "value": f"malicious-{num}.example.com", "action": "detect",
+                        "severity": "high", "platforms": ["windows", "mac", "linux"], "applied_globally": True,
+                        "source": "threat-intel-feed", "description": "Known command and control domain",
+                        "tags": ["c2", "campaign-2024"], "expiration": "2025-01-01T00:00:00Z"}
+                       for num in range(count)]
+    }
+
+
+def device_ids(count: int) -> dict:
+    """Return a response body shaped like query_devices_by_filter."""
+    return {
+        "meta": {"query_time": 0.004, "pagination": {"offset": 0, "limit": count, "total": count * 10},
+                 "powered_by": "device-api", "trace_id": "2b3c4d5e-6f70-8192-a3b4-c5d6e7f80912"},
+        "errors": [],
+        "resources": [f"{num:032x}" for num in range(count)]
+    }
+
+
+def alerts(count: int) -> dict:
+    """Return a response body shaped like get_alerts_v2."""
+    rng = random.Random(3)
+    return {
+        "meta": {"query_time": 0.052, "powered_by": "detectsapi", "trace_id": "3c4d5e6f-7081-92a3-b4c5-d6e7f8091a2b"},
+        "errors": [],
+        "resources": [{
+            "composite_id": f"{rng.getrandbits(128):032x}:ind:{rng.getrandbits(128):032x}:{num}",
+            "aggregate_id": f"aggind:{rng.getrandbits(128):032x}:{rng.getrandbits(40)}",
+            "cid": f"{rng.getrandbits(128):032x}",
+            "created_timestamp": "2024-05-01T12:00:00.000Z",
+            "updated_timestamp": "2024-05-01T12:05:00.000Z",
+            "status": rng.choice(["new", "in_progress", "closed"]),
+            "severity": rng.randint(10, 100),
+            "severity_name": rng.choice(["Low", "Medium", "High", "Critical"]),
+            "tactic": "Execution", "technique": "Command and Scripting Interpreter", "technique_id": "T1059",
+            "description": "A process launched a script interpreter with a suspicious command line.",
+            "cmdline": f"powershell.exe -enc {rng.getrandbits(256):064x}",
+            "filename": "powershell.exe",
+            "sha256": f"{rng.getrandbits(256):064x}",
+            "device": {"device_id": f"{rng.getrandbits(128):032x}", "hostname": f"host-{num:05d}",
+                       "platform_name": "Windows", "os_version": "Windows 11", "external_ip": "203.0.113.10"},
+            "parent_details": {"filename": "explorer.exe", "sha256": f"{rng.getrandbits(256):064x}"},
+            "tags": ["campaign-2024"]
+        } for num in range(count)]
+    }
+
+
+def alert_ids(count: int) -> dict:
+    """Return a response body shaped like query_alerts_v2."""
+    return {
+        "meta": {"query_time": 0.011, "pagination": {"offset": 0, "limit": count, "total": count * 3},
+                 "powered_by": "detectsapi", "trace_id": "4d5e6f70-8192-a3b4-c5d6-e7f8091a2b3c"},
+        "errors": [],
+        "resources": [f"{num:032x}:ind:{num:032x}:{num}" for num in range(count)]
+    }
+
+
+def rtr_session() -> dict:
+    """Return a response body shaped like the real time response init_session operation."""
+    return {
+        "meta": {"query_time": 0.8, "powered_by": "empower-api", "trace_id": "5e6f7081-92a3-b4c5-d6e7-f8091a2b3c4d"},
+        "errors": [],
+        "resources": [{"session_id": "6f708192-a3b4-c5d6-e7f8-091a2b3c4d5e", "scripts": [],
+                       "existing_aid_sessions": 1, "created_at": "2024-05-01T12:00:00Z", "pwd": "C:\\",
+                       "offline_queued": False}]
+    }
+
+
+def rtr_command() -> dict:
+    """Return a response body shaped like the real time response execute_command operation."""
+    return {
+        "meta": {"query_time": 0.3, "powered_by": "empower-api", "trace_id": "708192a3-b4c5-d6e7-f809-1a2b3c4d5e6f"},
+        "errors": [],
+        "resources": [{"session_id": "6f708192-a3b4-c5d6-e7f8-091a2b3c4d5e",
+                       "cloud_request_id": "8192a3b4-c5d6-e7f8-091a-2b3c4d5e6f70", "queued_command_offline": False}]
+    }
+
+
+def sample(size: int) -> bytes:
+    """Return binary content of the requested size, shaped like a downloaded sample."""
+    block = bytes(random.Random(4).getrandbits(8) for _ in range(65536))
+    return (block * (size // len(block) + 1))[:size]
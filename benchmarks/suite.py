@@ -0,0 +1,367 @@
+"""
+suite.py - Benchmark suite with machine-readable results
+
+Runs the core SDK benchmarks against a local stub of the Falcon API (tests/mock_falcon.py)
+serving canned payloads (benchmarks/payloads.py), and writes the results along with the
+details of the environment they were measured in as JSON. Every metric records its unit
+and whether lower or higher values are better, so results produced by different releases
+can be compared and regressions detected.
+
+    python benchmarks/suite.py --output results/1.4.6.json
+    python benchmarks/suite.py --quick --only dispatch overhead
+    python benchmarks/suite.py --baseline results/1.4.5.json --threshold 0.15
+
+Scenarios
+    import      Time to import the SDK and a single Service Class in a fresh interpreter.
+    dispatch    Time to prepare a request without sending it, Service Class versus Uber Class.
+    overhead    Time added per call by the SDK over a bare requests session, per core operation.
+    throughput  Requests per second through a shared auth_object for each thread count.
+    memory      Peak memory allocated to retrieve a 5,000 record page.
+    download    Throughput of a streamed binary download.
+
+The exit status is 1 when a baseline is provided and any metric regressed by more than the threshold.
+"""
+import argparse
+import datetime
+import gc
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict
+
+sys.path.append(os.path.abspath("src"))
+sys.path.append(os.path.abspath("."))
+import requests
+from tests.mock_falcon import MockFalcon
+from falconpy import (
+    Alerts,
+    APIHarnessV2,
+    Hosts,
+    JSONCodec,
+    OAuth2,
+    RealTimeResponse,
+    SampleUploads,
+    SpotlightVulnerabilities,
+    SSLDisabledWarning
+    )
+from falconpy._util import capture_requests
+from falconpy._version import _VERSION
+from payloads import (
+    alert_ids,
+    alerts,
+    device_details,
+    device_ids,
+    rtr_command,
+    rtr_session,
+    sample,
+    vulnerabilities
+    )
+from bench_import import import_time
+
+warnings.simplefilter("ignore", SSLDisabledWarning)
+SCHEMA_VERSION = 1
+SCENARIOS: Dict[str, Callable] = {}
+
+
+def scenario(name: str) -> Callable:
+    """Register a benchmark scenario."""
+    def register(func: Callable) -> Callable:
+        SCENARIOS[name] = func
+        return func
+    return register
+
+
+def metric(value: float, unit: str, better: str = "lower") -> dict:
+    """Return a measurement along with its unit and the direction considered an improvement."""
+    return {"value": value, "unit": unit, "better": better}
+
+
+def per_call(call: Callable, iterations: int, rounds: int) -> float:
+    """Return the time (in microseconds) taken per call during the fastest round."""
+    call()  # Warm up connections, tokens and caches.
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            call()
+        timings.append((time.perf_counter() - start) / iterations * 1000000)
+    return min(timings)
+
+
+def encoded(body) -> tuple:
+    """Return a route serving a body that is encoded once, so server time does not skew results."""
+    return 200, {"Content-Type": "application/json", "X-Cs-Traceid": "bench"}, json.dumps(body).encode("utf-8")
+
+
+def serve(mock: MockFalcon, config: argparse.Namespace):
+    """Register the canned payloads served for the core operations."""
+    mock.route("GET", "/devices/queries/devices/v1", encoded(device_ids(100)))
+    mock.route("POST", "/devices/entities/devices/v2", encoded(device_details(config.small)))
+    mock.route("GET", "/alerts/queries/alerts/v2", encoded(alert_ids(100)))
+    mock.route("POST", "/alerts/entities/alerts/v2", encoded(alerts(config.small)))
+    mock.route("GET", "/spotlight/combined/vulnerabilities/v1", encoded(vulnerabilities(config.small)))
+    mock.route("POST", "/real-time-response/entities/sessions/v1", encoded(rtr_session()))
+    mock.route("POST", "/real-time-response/entities/command/v1", encoded(rtr_command()))
+    mock.route("GET", "/samples/entities/samples/v3",
+               (200, {"Content-Type": "application/octet-stream"}, sample(config.download_mb * 1048576))
+               )
+
+
+def client(cls, mock: MockFalcon, **kwargs):
+    """Return an authenticated client connected to the stub."""
+    return cls(client_id="bench", client_secret="bench", base_url=mock.base_url, ssl_verify=False, **kwargs)
+
+
+@scenario("import")
+def bench_import(config: argparse.Namespace, _) -> dict:
+    """Measure import time in a fresh interpreter."""
+    runs = max(3, config.rounds)
+    return {
+        "falconpy_ms": metric(statistics.median(import_time("import falconpy") for _ in range(runs)) / 1000, "ms"),
+        "service_class_ms": metric(statistics.median(import_time("from falconpy import Hosts")
+                                                     for _ in range(runs)) / 1000, "ms"
+                                   ),
+        "requests_ms": metric(statistics.median(import_time("import requests") for _ in range(runs)) / 1000, "ms")
+    }
+
+
+@scenario("dispatch")
+def bench_dispatch(config: argparse.Namespace, mock: MockFalcon) -> dict:
+    """Measure the time taken to prepare a request, Service Class versus Uber Class."""
+    hosts = client(Hosts, mock)
+    uber = client(APIHarnessV2, mock)
+    hosts.auth_object.token()
+    uber.login()
+
+    def prepared(call: Callable) -> Callable:
+        def capture():
+            with capture_requests():
+                call()
+        return capture
+
+    calls = {
+        "service_class_get_us": lambda: hosts.query_devices_by_filter(filter="platform_name:'Windows'", limit=100),
+        "uber_class_get_us": lambda: uber.command("QueryDevicesByFilter", filter="platform_name:'Windows'", limit=100),
+        "service_class_post_us": lambda: hosts.get_device_details(ids=["a" * 32] * 100),
+        "uber_class_post_us": lambda: uber.command("PostDeviceDetailsV2", body={"ids": ["a" * 32] * 100})
+    }
+    return {name: metric(per_call(prepared(call), config.iterations, config.rounds), "us")
+            for name, call in calls.items()
+            }
+
+
+@scenario("overhead")
+def bench_overhead(config: argparse.Namespace, mock: MockFalcon) -> dict:
+    """Measure the time added per call by the SDK over a bare requests session."""
+    auth = client(OAuth2, mock)
+    auth.token()
+    hosts = Hosts(auth_object=auth)
+    alert = Alerts(auth_object=auth)
+    spotlight = SpotlightVulnerabilities(auth_object=auth)
+    rtr = RealTimeResponse(auth_object=auth)
+    # The bare baseline shares the pooled session and JSON codec used by the SDK.
+    session = auth.transport.session
+    codec = JSONCodec.get()
+    headers = {"Authorization": f"Bearer {auth.token_value}"}
+    url = mock.base_url
+
+    def bare(method: str, path: str, **kwargs) -> Callable:
+        return lambda: codec.loads(session.request(method, f"{url}{path}", verify=False, **kwargs).content)
+
+    ids = ["a" * 32] * 100
+    command = {"base_command": "ls", "command_string": "ls", "session_id": "a" * 32}
+    operations = {
+        "token": (lambda: client(OAuth2, mock).token(),
+                  bare("POST", "/oauth2/token", data={"client_id": "bench", "client_secret": "bench"})
+                  ),
+        "query_devices": (hosts.query_devices_by_filter,
+                          bare("GET", "/devices/queries/devices/v1", headers=headers)
+                          ),
+        "device_details": (lambda: hosts.get_device_details(ids=ids),
+                           bare("POST", "/devices/entities/devices/v2", headers=headers, json={"ids": ids})
+                           ),
+        "alerts": (lambda: alert.get_alerts_v2(composite_ids=ids),
+                   bare("POST", "/alerts/entities/alerts/v2", headers=headers, json={"composite_ids": ids})
+                   ),
+        "spotlight_combined": (lambda: spotlight.query_vulnerabilities_combined(filter="status:'open'"),
+                               bare("GET", "/spotlight/combined/vulnerabilities/v1", headers=headers,
+                                    params={"filter": "status:'open'"}
+                                    )
+                               ),
+        "rtr_session": (lambda: rtr.init_session(device_id="a" * 32),
+                        bare("POST", "/real-time-response/entities/sessions/v1", headers=headers,
+                             json={"device_id": "a" * 32}
+                             )
+                        ),
+        "rtr_command": (lambda: rtr.execute_command(**command),
+                        bare("POST", "/real-time-response/entities/command/v1", headers=headers, json=command)
+                        )
+    }
+    returned = {}
+    for name, (sdk_call, bare_call) in operations.items():
+        sdk = per_call(sdk_call, config.iterations, config.rounds)
+        bare_time = per_call(bare_call, config.iterations, config.rounds)
+        returned[f"{name}_us"] = metric(sdk, "us")
+        # Differences within timing noise may be negative.
+        returned[f"{name}_overhead_us"] = metric(sdk - bare_time, "us")
+    return returned
+
+
+@scenario("throughput")
+def bench_throughput(config: argparse.Namespace, mock: MockFalcon) -> dict:
+    """Measure requests per second through a shared auth_object for each thread count."""
+    returned = {}
+    for threads in config.threads:
+        hosts = client(Hosts, mock, pool_maxsize=threads)
+        hosts.query_devices_by_filter()
+        total = config.iterations * threads
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            statuses = list(pool.map(lambda _: hosts.query_devices_by_filter()["status_code"], range(total)))
+        elapsed = time.perf_counter() - start
+        assert statuses.count(200) == total, "Unexpected responses received from the stub."
+        returned[f"threads_{threads}_rps"] = metric(total / elapsed, "requests/s", "higher")
+    return returned
+
+
+@scenario("memory")
+def bench_memory(config: argparse.Namespace, mock: MockFalcon) -> dict:
+    """Measure the peak memory allocated to retrieve a page of records."""
+    mock.route("POST", "/devices/entities/devices/v2", encoded(device_details(config.records)))
+    ids = [f"{num:032x}" for num in range(config.records)]
+
+    def peak(call: Callable) -> float:
+        gc.collect()
+        tracemalloc.start()
+        count = call()
+        _, peak_bytes = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        assert count == config.records, "Unexpected number of records received from the stub."
+        return peak_bytes / 1048576
+
+    hosts = client(Hosts, mock)
+    pythonic = client(Hosts, mock, pythonic=True)
+    hosts.auth_object.token()
+    pythonic.auth_object.token()
+
+    def streamed():
+        with hosts.get_device_details(ids=ids, stream_resources=True) as stream:
+            return sum(1 for _ in stream)
+
+    returned = {
+        "dictionary_mb": metric(peak(lambda: len(hosts.get_device_details(ids=ids)["body"]["resources"])), "MB"),
+        "pythonic_mb": metric(peak(lambda: len(pythonic.get_device_details(ids=ids))), "MB"),
+        "stream_resources_mb": metric(peak(streamed), "MB")
+    }
+    mock.route("POST", "/devices/entities/devices/v2", encoded(device_details(config.small)))
+    return returned
+
+
+@scenario("download")
+def bench_download(config: argparse.Namespace, mock: MockFalcon) -> dict:
+    """Measure the throughput of a streamed binary download."""
+    samples = client(SampleUploads, mock)
+    samples.auth_object.token()
+    timings = []
+    for _ in range(config.rounds):
+        target = io.BytesIO()
+        start = time.perf_counter()
+        samples.get_sample(ids="a" * 64, stream=True, target=target)
+        timings.append(time.perf_counter() - start)
+        assert target.tell() == config.download_mb * 1048576, "Unexpected download size received from the stub."
+    return {"streamed_mb_per_s": metric(config.download_mb / min(timings), "MB/s", "higher")}
+
+
+def environment(config: argparse.Namespace) -> dict:
+    """Return the details of the environment the results were measured in."""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {"falconpy": _VERSION,
+            "commit": commit,
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "cpus": os.cpu_count(),
+            "requests": requests.__version__,
+            "tls": config.tls
+            }
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> dict:
+    """Compare results against a baseline, returning the change of every metric measured by both."""
+    changes = {}
+    regressions = []
+    for name, metrics in results["scenarios"].items():
+        for key, current in metrics.items():
+            previous = baseline.get("scenarios", {}).get(name, {}).get(key, None)
+            if not previous or not previous["value"]:
+                continue
+            change = (current["value"] - previous["value"]) / previous["value"]
+            # A positive change is always an improvement.
+            if current["better"] == "lower":
+                change = -change
+            changes[f"{name}.{key}"] = change
+            if change < -threshold:
+                regressions.append(f"{name}.{key}")
+    return {"baseline": baseline.get("environment", {}), "threshold": threshold,
+            "changes": changes, "regressions": regressions
+            }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--only", nargs="+", choices=list(SCENARIOS), help="Scenarios to run [Default: all]")
+    parser.add_argument("--iterations", type=int, default=200, help="Calls per timed round")
+    parser.add_argument("--rounds", type=int, default=5, help="Timed rounds per measurement, the fastest is reported")
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 4, 16], help="Thread counts measured")
+    parser.add_argument("--records", type=int, default=5000, help="Records in the page measured by the memory scenario")
+    parser.add_argument("--small", type=int, default=100, help="Records in the detail responses timed")
+    parser.add_argument("--download-mb", type=int, default=16, help="Size of the download measured")
+    parser.add_argument("--tls", action="store_true", help="Serve the stub over HTTPS")
+    parser.add_argument("--quick", action="store_true", help="Run fewer iterations (smoke test)")
+    parser.add_argument("--output", help="Write the results to this path in addition to stdout")
+    parser.add_argument("--baseline", help="Compare the results against previously written results")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Relative change treated as a regression")
+    config = parser.parse_args()
+    if config.quick:
+        config.iterations, config.rounds, config.download_mb = 20, 2, 2
+
+    results = {"schema": SCHEMA_VERSION,
+               "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+               "environment": environment(config),
+               "config": {key: value for key, value in vars(config).items()
+                          if key not in ("output", "baseline", "only")
+                          },
+               "scenarios": {}
+               }
+    with MockFalcon(tls=config.tls) as mock:
+        serve(mock, config)
+        for name in config.only or SCENARIOS:
+            results["scenarios"][name] = SCENARIOS[name](config, mock)
+    if config.baseline:
+        with open(config.baseline, "r", encoding="utf-8") as previous:
+            results["comparison"] = compare(results, json.load(previous), config.threshold)
+
+    output = json.dumps(results, indent=2)
+    if config.output:
+        os.makedirs(os.path.dirname(os.path.abspath(config.output)), exist_ok=True)
+        with open(config.output, "w", encoding="utf-8") as written:
+            written.write(output)
+    print(output)
+    if results.get("comparison", {}).get("regressions"):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -19,6 +19,8 @@
                                                         |::.|     CrowdStrike Falcon      |::.|
                                                         `---' OAuth2 API SDK for Python 3 `---'
 """
+from importlib import import_module as _import_module
+import typing as _typing
 from ._version import _VERSION, _MAINTAINER, _AUTHOR, _AUTHOR_EMAIL
 from ._version import _CREDITS, _DESCRIPTION, _TITLE, _PROJECT_URL
 from ._version import _DOCS_URL, _KEYWORDS, version
@@ -42,6 +44,7 @@ from ._constant import (
     )
 from ._enum import BaseURL, ContainerBaseURL, TokenFailReason
 from ._log import LogFacility
+from ._codec import JSONCodec
 from ._error import (
     APIError,
     SDKError,
@@ -87,86 +90,256 @@ from ._api_request import (
     RequestPayloads,
     RequestValidator
     )
-from .alerts import Alerts
-from .api_integrations import APIIntegrations
-from .api_complete import APIHarness, APIHarnessV2
-from .aspm import ASPM
-from .certificate_based_exclusions import CertificateBasedExclusions
-from .cloud_snapshots import CloudSnapshots
-from .compliance_assessments import ComplianceAssessments
-from .configuration_assessment_evaluation_logic import ConfigurationAssessmentEvaluationLogic
-from .configuration_assessment import ConfigurationAssessment
-from .container_alerts import ContainerAlerts
-from .container_detections import ContainerDetections
-from .container_images import ContainerImages
-from .container_packages import ContainerPackages
-from .container_vulnerabilities import ContainerVulnerabilities
-from .cloud_connect_aws import CloudConnectAWS
-from .cspm_registration import CSPMRegistration
-from .custom_ioa import CustomIOA
-from .custom_storage import CustomStorage
-from .d4c_registration import D4CRegistration
-from .datascanner import DataScanner
-from .delivery_settings import DeliverySettings
-from .detects import Detects
-from .device_control_policies import DeviceControlPolicies
-from .discover import Discover
-from .downloads import Downloads
-from .drift_indicators import DriftIndicators
-from .event_streams import EventStreams
-from .exposure_management import ExposureManagement
-from .falcon_complete_dashboard import CompleteDashboard
-from .falcon_container import FalconContainer
-from .falconx_sandbox import FalconXSandbox
-from .fdr import FDR
-from .filevantage import FileVantage
-from .firewall_management import FirewallManagement
-from .firewall_policies import FirewallPolicies
-from .foundry_logscale import FoundryLogScale
-from .host_group import HostGroup
-from .hosts import Hosts
-from .host_migration import HostMigration
-from .identity_protection import IdentityProtection
-from .image_assessment_policies import ImageAssessmentPolicies
-from .incidents import Incidents
-from .installation_tokens import InstallationTokens
-from .intel import Intel
-from .ioa_exclusions import IOAExclusions
-from .ioc import IOC
-from .iocs import Iocs
-from .kubernetes_protection import KubernetesProtection
-from .malquery import MalQuery
-from .message_center import MessageCenter
-from .ml_exclusions import MLExclusions
-from .mobile_enrollment import MobileEnrollment
-from .mssp import FlightControl
-from .oauth2 import OAuth2
-from .ods import ODS
-from .overwatch_dashboard import OverwatchDashboard
-from .prevention_policy import PreventionPolicy, PreventionPolicies
-from .quarantine import Quarantine
-from .quick_scan import QuickScan
-from .quick_scan_pro import QuickScanPro
-from .real_time_response_admin import RealTimeResponseAdmin
-from .real_time_response_audit import RealTimeResponseAudit
-from .real_time_response import RealTimeResponse
-from .recon import Recon
-from .report_executions import ReportExecutions
-from .response_policies import ResponsePolicies
-from .sample_uploads import SampleUploads
-from .scheduled_reports import ScheduledReports
-from .sensor_download import SensorDownload
-from .sensor_update_policy import SensorUpdatePolicy, SensorUpdatePolicies
-from .sensor_usage import SensorUsage
-from .sensor_visibility_exclusions import SensorVisibilityExclusions
-from .spotlight_vulnerabilities import SpotlightVulnerabilities
-from .spotlight_evaluation_logic import SpotlightEvaluationLogic
-from .tailored_intelligence import TailoredIntelligence
-from .threatgraph import ThreatGraph
-from .unidentified_containers import UnidentifiedContainers
-from .user_management import UserManagement
-from .workflows import Workflows
-from .zero_trust_assessment import ZeroTrustAssessment
+if _typing.TYPE_CHECKING:
+    # Service Classes, asynchronous interfaces and helpers are imported on first access,
+    # see __getattr__ below.
+    from ._auth_object._async_interface import AsyncFalconInterface
+    from ._service_class._async_service_class import AsyncServiceClass
+    from ._transport import (
+        Transport,
+        AsyncTransport,
+        RateLimiter,
+        RetryPolicy,
+        ResourceStream,
+        ResponseCache,
+        RequestCoalescer
+        )
+    from ._telemetry import (
+        Telemetry,
+        RequestEvent,
+        MetricsAggregator,
+        PrometheusExporter,
+        OpenTelemetryExporter
+        )
+    from ._paginator import Paginator, Hydrator
+    from ._event_stream import EventStreamConsumer, OffsetStore, FileOffsetStore
+    from ._rtr import RTRBatchOrchestrator, RTRBatchSession, RTRHostResult, RTRFileResult
+    from ._malquery import MalQueryJob, MalQueryJobRunner
+    from ._falconx import FalconXSandboxPipeline, SandboxIndex, FileSandboxIndex, SandboxSample
+    from .alerts import Alerts
+    from .api_integrations import APIIntegrations
+    from .api_complete import APIHarness, APIHarnessV2, AsyncAPIHarnessV2
+    from .aspm import ASPM
+    from .certificate_based_exclusions import CertificateBasedExclusions
+    from .cloud_snapshots import CloudSnapshots
+    from .compliance_assessments import ComplianceAssessments
+    from .configuration_assessment_evaluation_logic import ConfigurationAssessmentEvaluationLogic
+    from .configuration_assessment import ConfigurationAssessment
+    from .container_alerts import ContainerAlerts
+    from .container_detections import ContainerDetections
+    from .container_images import ContainerImages
+    from .container_packages import ContainerPackages
+    from .container_vulnerabilities import ContainerVulnerabilities
+    from .cloud_connect_aws import CloudConnectAWS
+    from .cspm_registration import CSPMRegistration
+    from .custom_ioa import CustomIOA
+    from .custom_storage import CustomStorage
+    from .d4c_registration import D4CRegistration
+    from .datascanner import DataScanner
+    from .delivery_settings import DeliverySettings
+    from .detects import Detects
+    from .device_control_policies import DeviceControlPolicies
+    from .discover import Discover
+    from .downloads import Downloads
+    from .drift_indicators import DriftIndicators
+    from .event_streams import EventStreams
+    from .exposure_management import ExposureManagement
+    from .falcon_complete_dashboard import CompleteDashboard
+    from .falcon_container import FalconContainer
+    from .falconx_sandbox import FalconXSandbox
+    from .fdr import FDR
+    from .filevantage import FileVantage
+    from .firewall_management import FirewallManagement
+    from .firewall_policies import FirewallPolicies
+    from .foundry_logscale import FoundryLogScale
+    from .host_group import HostGroup
+    from .hosts import Hosts
+    from .host_migration import HostMigration
+    from .identity_protection import IdentityProtection
+    from .image_assessment_policies import ImageAssessmentPolicies
+    from .incidents import Incidents
+    from .installation_tokens import InstallationTokens
+    from .intel import Intel
+    from .ioa_exclusions import IOAExclusions
+    from .ioc import IOC
+    from .iocs import Iocs
+    from .kubernetes_protection import KubernetesProtection
+    from .malquery import MalQuery
+    from .message_center import MessageCenter
+    from .ml_exclusions import MLExclusions
+    from .mobile_enrollment import MobileEnrollment
+    from .mssp import FlightControl
+    from .oauth2 import OAuth2
+    from .ods import ODS
+    from .overwatch_dashboard import OverwatchDashboard
+    from .prevention_policy import PreventionPolicy, PreventionPolicies
+    from .quarantine import Quarantine
+    from .quick_scan import QuickScan
+    from .quick_scan_pro import QuickScanPro
+    from .real_time_response_admin import RealTimeResponseAdmin
+    from .real_time_response_audit import RealTimeResponseAudit
+    from .real_time_response import RealTimeResponse
+    from .recon import Recon
+    from .report_executions import ReportExecutions
+    from .response_policies import ResponsePolicies
+    from .sample_uploads import SampleUploads
+    from .scheduled_reports import ScheduledReports
+    from .sensor_download import SensorDownload
+    from .sensor_update_policy import SensorUpdatePolicy, SensorUpdatePolicies
+    from .sensor_usage import SensorUsage
+    from .sensor_visibility_exclusions import SensorVisibilityExclusions
+    from .spotlight_vulnerabilities import SpotlightVulnerabilities
+    from .spotlight_evaluation_logic import SpotlightEvaluationLogic
+    from .tailored_intelligence import TailoredIntelligence
+    from .threatgraph import ThreatGraph
+    from .unidentified_containers import UnidentifiedContainers
+    from .user_management import UserManagement
+    from .workflows import Workflows
+    from .zero_trust_assessment import ZeroTrustAssessment
+
+# Public classes that are imported on first access, mapped to the module that defines them.
+_LAZY_CLASSES: _typing.Dict[str, str] = {
+    "Alerts": "alerts",
+    "APIIntegrations": "api_integrations",
+    "APIHarness": "api_complete",
+    "APIHarnessV2": "api_complete",
+    "AsyncAPIHarnessV2": "api_complete",
+    "ASPM": "aspm",
+    "CertificateBasedExclusions": "certificate_based_exclusions",
+    "CloudSnapshots": "cloud_snapshots",
+    "ComplianceAssessments": "compliance_assessments",
+    "ConfigurationAssessmentEvaluationLogic": "configuration_assessment_evaluation_logic",
+    "ConfigurationAssessment": "configuration_assessment",
+    "ContainerAlerts": "container_alerts",
+    "ContainerDetections": "container_detections",
+    "ContainerImages": "container_images",
+    "ContainerPackages": "container_packages",
+    "ContainerVulnerabilities": "container_vulnerabilities",
+    "CloudConnectAWS": "cloud_connect_aws",
+    "CSPMRegistration": "cspm_registration",
+    "CustomIOA": "custom_ioa",
+    "CustomStorage": "custom_storage",
+    "D4CRegistration": "d4c_registration",
+    "DataScanner": "datascanner",
+    "DeliverySettings": "delivery_settings",
+    "Detects": "detects",
+    "DeviceControlPolicies": "device_control_policies",
+    "Discover": "discover",
+    "Downloads": "downloads",
+    "DriftIndicators": "drift_indicators",
+    "EventStreams": "event_streams",
+    "ExposureManagement": "exposure_management",
+    "CompleteDashboard": "falcon_complete_dashboard",
+    "FalconContainer": "falcon_container",
+    "FalconXSandbox": "falconx_sandbox",
+    "FDR": "fdr",
+    "FileVantage": "filevantage",
+    "FirewallManagement": "firewall_management",
+    "FirewallPolicies": "firewall_policies",
+    "FoundryLogScale": "foundry_logscale",
+    "HostGroup": "host_group",
+    "Hosts": "hosts",
+    "HostMigration": "host_migration",
+    "IdentityProtection": "identity_protection",
+    "ImageAssessmentPolicies": "image_assessment_policies",
+    "Incidents": "incidents",
+    "InstallationTokens": "installation_tokens",
+    "Intel": "intel",
+    "IOAExclusions": "ioa_exclusions",
+    "IOC": "ioc",
+    "Iocs": "iocs",
+    "KubernetesProtection": "kubernetes_protection",
+    "MalQuery": "malquery",
+    "MessageCenter": "message_center",
+    "MLExclusions": "ml_exclusions",
+    "MobileEnrollment": "mobile_enrollment",
+    "FlightControl": "mssp",
+    "OAuth2": "oauth2",
+    "ODS": "ods",
+    "OverwatchDashboard": "overwatch_dashboard",
+    "PreventionPolicy": "prevention_policy",
+    "PreventionPolicies": "prevention_policy",
+    "Quarantine": "quarantine",
+    "QuickScan": "quick_scan",
+    "QuickScanPro": "quick_scan_pro",
+    "RealTimeResponseAdmin": "real_time_response_admin",
+    "RealTimeResponseAudit": "real_time_response_audit",
+    "RealTimeResponse": "real_time_response",
+    "Recon": "recon",
+    "ReportExecutions": "report_executions",
+    "ResponsePolicies": "response_policies",
+    "SampleUploads": "sample_uploads",
+    "ScheduledReports": "scheduled_reports",
+    "SensorDownload": "sensor_download",
+    "SensorUpdatePolicy": "sensor_update_policy",
+    "SensorUpdatePolicies": "sensor_update_policy",
+    "SensorUsage": "sensor_usage",
+    "SensorVisibilityExclusions": "sensor_visibility_exclusions",
+    "SpotlightVulnerabilities": "spotlight_vulnerabilities",
+    "SpotlightEvaluationLogic": "spotlight_evaluation_logic",
+    "TailoredIntelligence": "tailored_intelligence",
+    "ThreatGraph": "threatgraph",
+    "UnidentifiedContainers": "unidentified_containers",
+    "UserManagement": "user_management",
+    "Workflows": "workflows",
+    "ZeroTrustAssessment": "zero_trust_assessment",
+    "AsyncFalconInterface": "_auth_object._async_interface",
+    "AsyncServiceClass": "_service_class._async_service_class",
+    "Transport": "_transport",
+    "AsyncTransport": "_transport",
+    "RateLimiter": "_transport",
+    "RetryPolicy": "_transport",
+    "ResourceStream": "_transport",
+    "ResponseCache": "_transport",
+    "RequestCoalescer": "_transport",
+    "Telemetry": "_telemetry",
+    "RequestEvent": "_telemetry",
+    "MetricsAggregator": "_telemetry",
+    "PrometheusExporter": "_telemetry",
+    "OpenTelemetryExporter": "_telemetry",
+    "Paginator": "_paginator",
+    "Hydrator": "_paginator",
+    "EventStreamConsumer": "_event_stream",
+    "OffsetStore": "_event_stream",
+    "FileOffsetStore": "_event_stream",
+    "RTRBatchOrchestrator": "_rtr",
+    "RTRBatchSession": "_rtr",
+    "RTRHostResult": "_rtr",
+    "RTRFileResult": "_rtr",
+    "MalQueryJob": "_malquery",
+    "MalQueryJobRunner": "_malquery",
+    "FalconXSandboxPipeline": "_falconx",
+    "SandboxIndex": "_falconx",
+    "FileSandboxIndex": "_falconx",
+    "SandboxSample": "_falconx"
+    }
+# Service Class modules, available as falconpy.<module> once first accessed.
+_LAZY_MODULES: _typing.Set[str] = {module for module in _LAZY_CLASSES.values() if not module.startswith("_")}
+
+
+def __getattr__(name: str) -> _typing.Any:
+    """Import Service Classes, the Uber Class and SDK helpers when they are first requested.
+
+    Importing falconpy only loads the SDK core. Each Service Class module, along with
+    the endpoint definitions it uses, is loaded the first time the class (or the module
+    itself, as falconpy.<module>) is accessed. Asynchronous interfaces (and asyncio),
+    transports, telemetry exporters, paginators and the batch helpers are loaded the
+    same way.
+    """
+    if name in _LAZY_CLASSES:
+        loaded = getattr(_import_module(f".{_LAZY_CLASSES[name]}", __name__), name)
+        globals()[name] = loaded
+        return loaded
+    if name in _LAZY_MODULES:
+        return _import_module(f".{name}", __name__)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> _typing.List[str]:
+    """Include lazily imported classes and modules in the module listing."""
+    return sorted(set(globals()) | set(_LAZY_CLASSES) | _LAZY_MODULES)
+
 
 __version__ = _VERSION
 __maintainer__ = _MAINTAINER
@@ -209,8 +382,16 @@ __all__ = [
     "ContainerVulnerabilities", "DriftIndicators", "UnidentifiedContainers",
     "ImageAssessmentPolicies", "APIIntegrations", "ThreatGraph", "ExposureManagement",
     "CertificateBasedExclusions", "ComplianceAssessments", "HostMigration", "QuickScanPro",
-    "DataScanner", "SensorUsage", "Downloads", "DeliverySettings", "ASPM"
+    "DataScanner", "SensorUsage", "Downloads", "DeliverySettings", "ASPM", "Transport",
+    "AsyncTransport", "AsyncFalconInterface", "AsyncServiceClass", "AsyncAPIHarnessV2",
+    "Paginator", "Hydrator", "RateLimiter", "RetryPolicy", "JSONCodec",
+    "ResourceStream", "ResponseCache", "RequestCoalescer", "Telemetry", "RequestEvent",
+    "MetricsAggregator", "PrometheusExporter", "OpenTelemetryExporter", "EventStreamConsumer",
+    "OffsetStore", "FileOffsetStore", "RTRBatchOrchestrator", "RTRBatchSession", "RTRHostResult",
+    "RTRFileResult", "MalQueryJob", "MalQueryJobRunner", "FalconXSandboxPipeline", "SandboxIndex",
+    "FileSandboxIndex", "SandboxSample"
     ]
+
 """
 This is free and unencumbered software released into the public domain.
 
@@ -36,6 +36,7 @@ OTHER DEALINGS IN THE SOFTWARE.
 For more information, please refer to <https://unlicense.org>
 """
 from ._request import APIRequest
+from ._deferred_request import DeferredRequest, DEFERRED_REQUESTS
 from ._request_behavior import RequestBehavior
 from ._request_connection import RequestConnection
 from ._request_meta import RequestMeta
@@ -43,5 +44,6 @@ from ._request_payloads import RequestPayloads
 from ._request_validator import RequestValidator
 
 __all__ = ["APIRequest", "RequestBehavior", "RequestConnection",
-           "RequestMeta", "RequestPayloads", "RequestValidator"
+           "RequestMeta", "RequestPayloads", "RequestValidator", "DeferredRequest",
+           "DEFERRED_REQUESTS"
            ]
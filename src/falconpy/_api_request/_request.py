@@ -35,6 +35,7 @@ OTHER DEALINGS IN THE SOFTWARE.
 
 For more information, please refer to <https://unlicense.org>
 """
+# pylint: disable=R0904  # Properties mirror the attributes of the connected request objects
 from typing import Union, Dict, Optional, List, Any
 from logging import Logger
 from ._request_behavior import RequestBehavior
@@ -42,6 +43,9 @@ from ._request_connection import RequestConnection
 from ._request_meta import RequestMeta
 from ._request_payloads import RequestPayloads
 from .._log import LogFacility
+from .._transport import Transport, RateLimiter, RetryPolicy, StreamDownload, ResponseCache, RequestCoalescer
+from .._codec import JSONCodec
+from .._telemetry import Telemetry, RequestEvent
 
 
 class APIRequest:
@@ -58,7 +62,10 @@ class APIRequest:
         """Construct an instance of the APIRequest class."""
         if initializer:
             # Key metadata regarding this API request
-            self._meta = RequestMeta(endpoint, initializer.get("method", "GET"))
+            self._meta = RequestMeta(endpoint,
+                                     initializer.get("method", "GET"),
+                                     operation=initializer.get("operation", None)
+                                     )
             # Payloads for the request
             self._payloads = RequestPayloads(params=initializer.get("params", None),
                                              body=initializer.get("body", None),
@@ -69,7 +76,15 @@ class APIRequest:
             self._connection = RequestConnection(user_agent=initializer.get("user_agent", None),
                                                  proxy=initializer.get("proxy", {}),
                                                  timeout=initializer.get("timeout", None),
-                                                 verify=initializer.get("verify", True)
+                                                 verify=initializer.get("verify", True),
+                                                 transport=initializer.get("transport", None),
+                                                 rate_limiter=initializer.get("rate_limiter", None),
+                                                 retry_policy=initializer.get("retry_policy", None),
+                                                 codec=initializer.get("codec", None),
+                                                 cache=initializer.get("cache", None),
+                                                 client_label=initializer.get("client_label", None),
+                                                 coalescer=initializer.get("coalescer", None),
+                                                 telemetry=initializer.get("telemetry", None)
                                                  )
             # Behavioral flags that alter the behavior of request processing
             self._behavior = RequestBehavior(expand_result=initializer.get("expand_result", False),
@@ -77,7 +92,9 @@ class APIRequest:
                                              authenticating=initializer.get("authenticating", False),
                                              perform=initializer.get("perform", True),
                                              body_validator=initializer.get("body_validator", None),
-                                             body_required=initializer.get("body_required", None)
+                                             body_required=initializer.get("body_required", None),
+                                             stream=initializer.get("stream", None),
+                                             stream_resources=initializer.get("stream_resources", False)
                                              )
             # Logging functionality
             self._request_log = LogFacility(log=initializer.get("log_util", None),
@@ -91,6 +108,8 @@ class APIRequest:
             self._connection = RequestConnection()
             self._behavior = RequestBehavior()
             self._request_log: Optional[LogFacility] = None
+        # Telemetry event for this request, created on first use.
+        self._event: Optional[RequestEvent] = None
 
     # _  _ ____ ___ _  _ ____ ___  ____
     # |\/| |___  |  |__| |  | |  \ [__
@@ -133,6 +152,11 @@ class APIRequest:
         """Return the method attribute."""
         return self.meta.method
 
+    @property
+    def operation(self) -> Optional[str]:
+        """Return the operation ID attribute."""
+        return self.meta.operation
+
     @property
     def debug_headers(self) -> Optional[Dict[str, Optional[Union[str, int, float]]]]:
         """Return the debug headers."""
@@ -208,6 +232,16 @@ class APIRequest:
         """Set the perform boolean (this request has passed validation)."""
         self.behavior.perform = value
 
+    @property
+    def stream(self) -> Optional[StreamDownload]:
+        """Return the streamed download destination from the behavior object."""
+        return self.behavior.stream
+
+    @property
+    def stream_resources(self) -> bool:
+        """Return the resource streaming flag from the behavior object."""
+        return self.behavior.stream_resources
+
     @property
     def body_validator(self) -> Optional[Dict[str, Any]]:
         """Return the body payload validator from the behavior object."""
@@ -268,3 +302,50 @@ class APIRequest:
     def verify(self) -> bool:
         """Return the SSL verification setting."""
         return self.connection.verify
+
+    @property
+    def transport(self) -> Optional[Transport]:
+        """Return the HTTP transport from the connection object."""
+        return self.connection.transport
+
+    @property
+    def rate_limiter(self) -> Optional[RateLimiter]:
+        """Return the rate limiter from the connection object."""
+        return self.connection.rate_limiter
+
+    @property
+    def retry_policy(self) -> Optional[RetryPolicy]:
+        """Return the retry policy from the connection object."""
+        return self.connection.retry_policy
+
+    @property
+    def codec(self) -> JSONCodec:
+        """Return the JSON codec from the connection object, or the default codec if one is not provided."""
+        return self.connection.codec or JSONCodec.get()
+
+    @property
+    def cache(self) -> Optional[ResponseCache]:
+        """Return the response cache from the connection object."""
+        return self.connection.cache
+
+    @property
+    def client_label(self) -> Optional[str]:
+        """Return the label identifying the credentials of the request from the connection object."""
+        return self.connection.client_label
+
+    @property
+    def coalescer(self) -> Optional[RequestCoalescer]:
+        """Return the request coalescer from the connection object."""
+        return self.connection.coalescer
+
+    @property
+    def telemetry(self) -> Optional[Telemetry]:
+        """Return the telemetry hooks from the connection object."""
+        return self.connection.telemetry
+
+    @property
+    def event(self) -> Optional[RequestEvent]:
+        """Return the telemetry event recording this request, created when telemetry is enabled."""
+        if self._event is None and self.telemetry:
+            self._event = self.telemetry.start(self.operation, self.method, self.endpoint)
+        return self._event
@@ -37,6 +37,7 @@ For more information, please refer to <https://unlicense.org>
 """
 from typing import Optional, Any, Dict, List
 from ._request_validator import RequestValidator
+from .._transport import StreamDownload
 
 
 class RequestBehavior:
@@ -52,7 +53,9 @@ class RequestBehavior:
                  authenticating: Optional[bool] = False,
                  perform: Optional[bool] = True,
                  body_validator: Optional[Dict[str, Any]] = None,
-                 body_required: Optional[List[str]] = None
+                 body_required: Optional[List[str]] = None,
+                 stream: Optional[StreamDownload] = None,
+                 stream_resources: Optional[bool] = False
                  ):
         """Construct an instance of RequestBehavior class."""
         self._expand_result = False
@@ -71,6 +74,14 @@ class RequestBehavior:
         if isinstance(perform, bool):
             self._perform = perform
 
+        self._stream: Optional[StreamDownload] = None
+        if isinstance(stream, StreamDownload):
+            self._stream = stream
+
+        self._stream_resources = False
+        if isinstance(stream_resources, bool):
+            self._stream_resources = stream_resources
+
         if isinstance(body_validator, dict) or isinstance(body_required, list):
             self._validator = RequestValidator(validator=body_validator,
                                                required=body_required
@@ -122,6 +133,26 @@ class RequestBehavior:
         """Enable or disable the perform bit."""
         self._perform = value
 
+    @property
+    def stream(self) -> Optional[StreamDownload]:
+        """Destination binary content is streamed to, if the download should be streamed."""
+        return self._stream
+
+    @stream.setter
+    def stream(self, value: Optional[StreamDownload]):
+        """Change the stream destination."""
+        self._stream = value
+
+    @property
+    def stream_resources(self) -> bool:
+        """Flag indicating if the resources of the response should be parsed incrementally as they arrive."""
+        return self._stream_resources
+
+    @stream_resources.setter
+    def stream_resources(self, value: bool):
+        """Enable or disable resource streaming."""
+        self._stream_resources = value
+
     @property
     def validator(self) -> RequestValidator:
         """Object representing the request validation performed on any provided payloads."""
@@ -37,6 +37,9 @@ For more information, please refer to <https://unlicense.org>
 """
 from dataclasses import dataclass
 from typing import Optional, Dict, Union
+from .._transport import Transport, RateLimiter, RetryPolicy, ResponseCache, RequestCoalescer
+from .._codec import JSONCodec
+from .._telemetry import Telemetry
 
 
 @dataclass
@@ -51,3 +54,12 @@ class RequestConnection:
     verify: bool = True
     timeout: Optional[Union[int, tuple]] = None
     proxy: Optional[Dict[str, str]] = None
+    transport: Optional[Transport] = None
+    rate_limiter: Optional[RateLimiter] = None
+    retry_policy: Optional[RetryPolicy] = None
+    codec: Optional[JSONCodec] = None
+    cache: Optional[ResponseCache] = None
+    # Label identifying the credentials the request is sent with, used to key cached responses.
+    client_label: Optional[str] = None
+    coalescer: Optional[RequestCoalescer] = None
+    telemetry: Optional[Telemetry] = None
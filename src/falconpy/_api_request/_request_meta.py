@@ -48,11 +48,13 @@ class RequestMeta:
     def __init__(self,
                  endpoint: Optional[str] = None,
                  method: str = "GET",
-                 debug_headers: Optional[Dict[str, Optional[Union[str, int, float]]]] = None
+                 debug_headers: Optional[Dict[str, Optional[Union[str, int, float]]]] = None,
+                 operation: Optional[str] = None
                  ):
         """Construct an instance of RequestMeta class."""
         self._endpoint: Optional[str] = endpoint
         self._method: str = method
+        self._operation: Optional[str] = operation
 
         self._debug_headers: Optional[Dict[str, Optional[Union[str, int, float]]]] = debug_headers
         if debug_headers is None:
@@ -82,6 +84,16 @@ class RequestMeta:
         """Set the method attribute."""
         self._method = value
 
+    @property
+    def operation(self) -> Optional[str]:
+        """Return the operation ID attribute."""
+        return self._operation
+
+    @operation.setter
+    def operation(self, value: Optional[str]):
+        """Set the operation ID attribute."""
+        self._operation = value
+
     @property
     def debug_headers(self) -> Optional[Dict[str, Optional[Union[str, int, float]]]]:
         """Return the debug headers."""
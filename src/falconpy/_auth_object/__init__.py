@@ -39,8 +39,9 @@ from ._base_falcon_auth import BaseFalconAuth
 from ._falcon_interface import FalconInterface
 from ._uber_interface import UberInterface
 from ._bearer_token import BearerToken
+from ._token_refresher import TokenRefresher
 from ._interface_config import InterfaceConfiguration
 
 __all__ = ["BaseFalconAuth", "FalconInterface", "UberInterface",
-           "BearerToken", "InterfaceConfiguration"
+           "BearerToken", "InterfaceConfiguration", "TokenRefresher"
            ]
@@ -0,0 +1,180 @@
+"""Asynchronous API Interface class.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+import asyncio
+from typing import Any, Callable, Dict, Optional
+from ._falcon_interface import FalconInterface
+from ._bearer_token import BearerToken
+from .._transport import AsyncTransport
+from .._util._async import dispatch_deferred, async_perform_request
+from .._error import InvalidCredentials
+
+
+class AsyncFalconInterface(FalconInterface):
+    """Asynchronous Falcon API interface used by asynchronous Service Classes.
+
+    Accepts the same keywords as FalconInterface. Requests are sent using an asynchronous
+    connection pool (httpx) created within the running event loop. Tokens are requested
+    when the first request is awaited, and concurrent requests that find the token stale
+    wait on a single refresh.
+    """
+
+    # ____ ___ ___ ____ _ ___  _  _ ___ ____ ____
+    # |__|  |   |  |__/ | |__] |  |  |  |___ [__
+    # |  |  |   |  |  \ | |__] |__|  |  |___ ___]
+    #
+    # Asynchronous state is bound to the event loop it was created within,
+    # and is recreated when the interface is used from a different loop.
+    _async_loop: Optional[asyncio.AbstractEventLoop] = None
+    _async_lock: Optional[asyncio.Lock] = None
+    _async_transport: Optional[AsyncTransport] = None
+
+    #  _______ _______ _______ _     _  _____  ______  _______
+    #  |  |  | |______    |    |_____| |     | |     \ |______
+    #  |  |  | |______    |    |     | |_____| |_____/ ______|
+    #
+    def _bind_loop(self):
+        """Create the refresh lock and connection pool for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._async_loop is not loop:
+            self._async_loop = loop
+            self._async_lock = asyncio.Lock()
+            self._async_transport = AsyncTransport(
+                pool_maxsize=self.transport.pool_maxsize if self.transport else None,
+                keep_alive=self.transport.keep_alive if self.transport else True,
+                verify=self.ssl_verify,
+                proxy=self.proxy
+                )
+
+    async def login(self) -> dict:  # pylint: disable=W0236
+        """Login to the Falcon API by requesting a new token."""
+        return await self._async_login_handler()
+
+    async def logout(self) -> dict:  # pylint: disable=W0236
+        """Log out of the Falcon API by revoking the current token."""
+        return await self._async_logout_handler()
+
+    async def _async_login_handler(self, stateful: bool = True) -> dict:
+        """Login by requesting a new token using the asynchronous transport."""
+        try:
+            returned = self._login_result(
+                await async_perform_request(self.async_transport, **self._login_keywords(stateful)),
+                stateful
+                )
+        except InvalidCredentials as bad_creds:
+            returned = bad_creds.result
+            if self.log:
+                self.log.error(bad_creds.message)
+
+        return returned
+
+    async def _async_logout_handler(self, token_value: str = None, stateful: bool = True, client_id: str = None) -> dict:
+        """Log out by revoking the current token using the asynchronous transport."""
+        try:
+            returned = await async_perform_request(self.async_transport,
+                                                   **self._logout_keywords(token_value, client_id)
+                                                   )
+            if stateful:
+                self.bearer_token: BearerToken = BearerToken()
+        except InvalidCredentials as bad_creds:
+            returned = bad_creds.result
+            if self.log:
+                self.log.error(bad_creds.message)
+
+        return returned
+
+    async def refresh_token(self) -> bool:
+        """Request a new token if the current token is stale.
+
+        Only one coroutine performs the refresh, others awaiting this method wait for it to
+        complete and reuse the new token. Returns a boolean indicating the token is valid.
+        """
+        if self.token_stale and self.refreshable:
+            self._bind_loop()
+            async with self._async_lock:
+                # Another coroutine may have refreshed the token while we waited.
+                if self.token_stale and self.refreshable:
+                    await self._async_login_handler()
+
+        return self.token_valid
+
+    async def dispatch(self, func: Callable, *args, **kwargs) -> Any:
+        """Perform a synchronous SDK method using the asynchronous transport.
+
+        The method is provided by a Service Class (or Uber Class) leveraging this interface.
+        """
+        await self.refresh_token()
+        return await dispatch_deferred(self.async_transport, func, *args, **kwargs)
+
+    async def aclose(self):
+        """Close the asynchronous connection pool."""
+        if self._async_transport:
+            await self._async_transport.aclose()
+            self._async_loop = None
+            self._async_transport = None
+
+    async def __aenter__(self):
+        """Allow for entry as an asynchronous context manager."""
+        return self
+
+    async def __aexit__(self, *args):
+        """Discard our token and close our connections when we exit the context."""
+        if self.token_value:
+            await self.logout()
+        await self.aclose()
+
+    # ___  ____ ____ ___  ____ ____ ___ _ ____ ____
+    # |__] |__/ |  | |__] |___ |__/  |  | |___ [__
+    # |    |  \ |__| |    |___ |  \  |  | |___ ___]
+    #
+    @property
+    def asynchronous(self) -> bool:
+        """Return a boolean if this interface sends requests asynchronously."""
+        return True
+
+    @property
+    def async_transport(self) -> AsyncTransport:
+        """Return the asynchronous connection pool for the running event loop."""
+        self._bind_loop()
+        return self._async_transport
+
+    # Tokens are refreshed by awaiting refresh_token before each request is dispatched,
+    # so retrieving the headers never blocks the event loop with a synchronous login.
+    @property
+    def auth_headers(self) -> Dict[str, str]:
+        """Return a Bearer token baked into an Authorization header ready for an HTTP request."""
+        return {"Authorization": f"Bearer {self.token_value}"}
@@ -40,15 +40,25 @@ For more information, please refer to <https://unlicense.org>
 """
 import time
 import os
+import threading
 import warnings
 from contextvars import copy_context
 from logging import Logger, getLogger
-from typing import Dict, Optional, Union
+from typing import Callable, Dict, Iterable, Optional, Union
 from ._base_falcon_auth import BaseFalconAuth
 from ._bearer_token import BearerToken
+from ._token_refresher import TokenRefresher
 from .._log import LogFacility
-from .._constant import MIN_TOKEN_RENEW_WINDOW, MAX_TOKEN_RENEW_WINDOW
+from .._constant import (
+    MIN_TOKEN_RENEW_WINDOW,
+    MAX_TOKEN_RENEW_WINDOW,
+    TOKEN_REFRESH_LEAD_TIME,
+    TOKEN_REFRESH_RETRY_INTERVAL
+    )
 from ._interface_config import InterfaceConfiguration
+from .._transport import Transport, RateLimiter, RetryPolicy, ResponseCache, RequestCoalescer
+from .._codec import JSONCodec
+from .._telemetry import Telemetry
 from .._enum import TokenFailReason
 from .._util import (
     autodiscover_region,
@@ -72,7 +82,7 @@ class FalconInterface(BaseFalconAuth):
     #
     # The default constructor for all authentication objects. Ingests provided credentials
     # and sets the necessary class attributes based upon the authentication detail received.
-    # pylint: disable=R0912,R0913,R0914
+    # pylint: disable=R0912,R0913,R0914,R0915,R0917
     def __init__(self,  # noqa: C901
                  access_token: Optional[Union[str, bool]] = False,
                  base_url: Optional[str] = "https://api.crowdstrike.com",
@@ -89,7 +99,18 @@ class FalconInterface(BaseFalconAuth):
                  debug_record_count: Optional[int] = None,
                  sanitize_log: Optional[bool] = None,
                  pythonic: Optional[bool] = False,
-                 environment: Optional[Dict[str, str]] = None
+                 environment: Optional[Dict[str, str]] = None,
+                 pool_connections: Optional[int] = None,
+                 pool_maxsize: Optional[int] = None,
+                 keep_alive: Optional[bool] = True,
+                 transport: Optional[Transport] = None,
+                 background_refresh: Optional[bool] = False,
+                 rate_limit: Optional[Union[bool, RateLimiter]] = False,
+                 retry: Optional[Union[bool, RetryPolicy]] = False,
+                 json_codec: Optional[Union[str, JSONCodec]] = None,
+                 cache: Optional[Union[bool, ResponseCache]] = False,
+                 coalesce: Optional[Union[bool, RequestCoalescer]] = False,
+                 telemetry: Optional[Union[bool, Callable, Iterable[Callable], Telemetry]] = None
                  ) -> "FalconInterface":
         """Construct an instance of the FalconInterface class."""
         # Set the pythonic behavior mode.
@@ -102,7 +123,12 @@ class FalconInterface(BaseFalconAuth):
                                                                       proxy=proxy,
                                                                       timeout=timeout,
                                                                       user_agent=user_agent,
-                                                                      ssl_verify=ssl_verify
+                                                                      ssl_verify=ssl_verify,
+                                                                      pool_connections=pool_connections,
+                                                                      pool_maxsize=pool_maxsize,
+                                                                      keep_alive=keep_alive,
+                                                                      transport=transport,
+                                                                      codec=json_codec
                                                                       )            # \ o /
         # ____ _  _ ___ _  _ ____ _  _ ___ _ ____ ____ ___ _ ____ _  _                 |
         # |__| |  |  |  |__| |___ |\ |  |  | |    |__|  |  | |  | |\ |                / \
@@ -126,6 +152,11 @@ class FalconInterface(BaseFalconAuth):
 
         # Set up an empty Bearer Token container.
         self._token: BearerToken = BearerToken()
+        # Token refreshes are performed by a single thread at a time. The generation counter
+        # lets threads that waited on the lock detect that the refresh they needed has completed.
+        self._token_lock: threading.RLock = threading.RLock()
+        self._token_generation: int = 0
+        self._token_refresher: Optional[TokenRefresher] = None
 
         # ___  _ ____ ____ ____ ___    ____ _  _ ___     ____ ____ ____ ___  ____ _  _ ___ _ ____ _
         # |  \ | |__/ |___ |     |     |__| |\ | |  \    |    |__/ |___ |  \ |___ |\ |  |  | |__| |
@@ -245,6 +276,50 @@ class FalconInterface(BaseFalconAuth):
             if self.log:
                 self.log.warning(no_auth_mechanism.message)
 
+        # Optionally pace requests using a client side rate limiter. Limits are enforced by the API
+        # per client and member CID, so the limiter is shared by interfaces using the same credentials.
+        self._rate_limiter: Optional[RateLimiter] = None
+        if isinstance(rate_limit, RateLimiter):
+            self._rate_limiter = rate_limit
+        elif rate_limit:
+            self._rate_limiter = RateLimiter.shared(self.base_url,
+                                                    self.creds.get("client_id", self.token_value),
+                                                    self.creds.get("member_cid")
+                                                    )
+
+        # Optionally retry requests that fail for transient reasons.
+        self._retry_policy: Optional[RetryPolicy] = None
+        if isinstance(retry, RetryPolicy):
+            self._retry_policy = retry
+        elif retry:
+            self._retry_policy = RetryPolicy()
+
+        # Optionally cache responses to read-mostly operations, shared by every Service Class using this interface.
+        self._cache: Optional[ResponseCache] = None
+        if isinstance(cache, ResponseCache):
+            self._cache = cache
+        elif cache:
+            self._cache = ResponseCache()
+
+        # Optionally share one API call between identical requests made while it is in flight.
+        self._coalescer: Optional[RequestCoalescer] = None
+        if isinstance(coalesce, RequestCoalescer):
+            self._coalescer = coalesce
+        elif coalesce:
+            self._coalescer = RequestCoalescer()
+
+        # Optionally provide the measurements of every request to instrumentation hooks.
+        # Events are labeled per set of credentials so shared hooks can attribute them to this interface.
+        self._telemetry: Optional[Telemetry] = None
+        if telemetry:
+            self._telemetry = Telemetry.create(telemetry).bind(
+                Telemetry.client_label(self.creds.get("client_id", None), self.creds.get("member_cid", None))
+                )
+
+        # Optionally renew tokens in the background so requests never wait on a token refresh.
+        if background_refresh and self.refreshable:
+            self._token_refresher = TokenRefresher(self._background_refresh).start()
+
     #  _______ _______ _______ _     _  _____  ______  _______
     #  |  |  | |______    |    |_____| |     | |     \ |______
     #  |  |  | |______    |    |     | |_____| |_____/ ______|
@@ -267,44 +342,8 @@ class FalconInterface(BaseFalconAuth):
 
         This method can also be leveraged to generate tokens without impacting authorization state.
         """
-        _returned_headers = {}
         try:
-            if self.cred_format_valid:
-                operation, target_url, data_payload = login_payloads(self.creds, self.base_url)
-                # Log the call to this operation if debugging is enabled.
-                if self.log:
-                    self.log.debug("OPERATION: %s", operation)
-                returned = perform_request(method="POST", endpoint=target_url, data=data_payload,
-                                           headers={}, verify=self.ssl_verify, proxy=self.proxy,
-                                           timeout=self.timeout, user_agent=self.user_agent,
-                                           log_util=self.log, authenticating=True,
-                                           sanitize=self.sanitize_log
-                                           )
-                _returned_headers = returned["headers"]
-                if stateful:
-                    self.token_status = returned["status_code"]
-                    if self.token_status == 201:
-                        # Token generation was successful.
-                        self.bearer_token = BearerToken(token_value=returned["body"]["access_token"],
-                                                        expiration=returned["body"]["expires_in"],
-                                                        status=201
-                                                        )
-                        # Cloud Region auto discovery.
-                        self.base_url = autodiscover_region(self.base_url, returned)
-                    else:
-                        # Token generation failure, reset the current token and check for an error response.
-                        self.bearer_token = BearerToken(status=returned["status_code"])
-                        # Retrieve the list of errors, there should only be one item in the list.
-                        error_list = returned["body"].get("errors", [])
-                        if error_list:
-                            self.bearer_token.fail_token(returned["status_code"],
-                                                         error_list[0]["message"]
-                                                         )
-            else:
-                if stateful:
-                    self.bearer_token.fail_token(403, TokenFailReason["INVALID"])
-                raise InvalidCredentials(headers=_returned_headers)
-
+            returned = self._login_result(perform_request(**self._login_keywords(stateful)), stateful)
         except InvalidCredentials as bad_creds:
             returned = bad_creds.result
             if self.log:
@@ -312,34 +351,63 @@ class FalconInterface(BaseFalconAuth):
 
         return returned
 
+    def _login_keywords(self, stateful: bool = True) -> dict:
+        """Create the keyword payload for a token request."""
+        if not self.cred_format_valid:
+            if stateful:
+                self.bearer_token.fail_token(403, TokenFailReason["INVALID"])
+            raise InvalidCredentials(headers={})
+
+        operation, target_url, data_payload = login_payloads(self.creds, self.base_url)
+        # Log the call to this operation if debugging is enabled.
+        if self.log:
+            self.log.debug("OPERATION: %s", operation)
+
+        return {"method": "POST", "endpoint": target_url, "data": data_payload,
+                "headers": {}, "verify": self.ssl_verify, "proxy": self.proxy,
+                "timeout": self.timeout, "user_agent": self.user_agent,
+                "log_util": self.log, "authenticating": True,
+                "sanitize": self.sanitize_log, "transport": self.transport,
+                "retry_policy": self.retry_policy, "operation": operation,
+                "codec": self.codec, "telemetry": self.telemetry
+                }
+
+    def _login_result(self, returned: dict, stateful: bool = True) -> dict:
+        """Update the authorization state using the result of a token request."""
+        if stateful:
+            self.token_status = returned["status_code"]
+            if self.token_status == 201:
+                # Token generation was successful.
+                self.bearer_token = BearerToken(token_value=returned["body"]["access_token"],
+                                                expiration=returned["body"]["expires_in"],
+                                                status=201
+                                                )
+                # Cloud Region auto discovery.
+                self.base_url = autodiscover_region(self.base_url, returned)
+                # Schedule background renewal of our new token.
+                if self._token_refresher:
+                    self._token_refresher.wake()
+            else:
+                # Token generation failure, reset the current token and check for an error response.
+                self.bearer_token = BearerToken(status=returned["status_code"])
+                # Retrieve the list of errors, there should only be one item in the list.
+                error_list = returned["body"].get("errors", [])
+                if error_list:
+                    self.bearer_token.fail_token(returned["status_code"],
+                                                 error_list[0]["message"]
+                                                 )
+
+        return returned
+
     def _logout_handler(self, token_value: str = None, stateful: bool = True, client_id: str = None) -> dict:
         """Log out by revoking the current token.
 
         This method can also be leveraged to revoke other tokens.
         """
         try:
-            if self.cred_format_valid:
-                if not token_value:
-                    token_value = self.token_value
-                operation, target_url, data_payload, header_payload = logout_payloads(
-                    creds=self.creds,
-                    base=self.base_url,
-                    token_val=token_value,
-                    client_id=client_id
-                    )
-                # Log the call to this operation if debugging is enabled.
-                if self.log:
-                    self.log.debug("OPERATION: %s", operation)
-                returned = perform_request(method="POST", endpoint=target_url, data=data_payload,
-                                           headers=header_payload, verify=self.ssl_verify,
-                                           proxy=self.proxy, timeout=self.timeout,
-                                           user_agent=self.user_agent, log_util=self.log,
-                                           sanitize=self.sanitize_log
-                                           )
-                if stateful:
-                    self.bearer_token: BearerToken = BearerToken()
-            else:
-                raise InvalidCredentials
+            returned = perform_request(**self._logout_keywords(token_value, client_id))
+            if stateful:
+                self.bearer_token: BearerToken = BearerToken()
         except InvalidCredentials as bad_creds:
             returned = bad_creds.result
             if self.log:
@@ -347,6 +415,61 @@ class FalconInterface(BaseFalconAuth):
 
         return returned
 
+    def _refresh_token(self, generation: int):
+        """Refresh the token unless another thread has already done so since generation was observed.
+
+        Threads arriving while a refresh is in progress wait for it to complete and reuse its result.
+        """
+        with self._token_lock:
+            if generation == self._token_generation:
+                self._login_handler()
+                self._token_generation += 1
+
+    def _background_refresh(self) -> float:
+        """Renew the token ahead of the renew window and return the number of seconds until the next renewal."""
+        if not self.token_value:
+            # Nothing to renew until a login has been performed.
+            return TOKEN_REFRESH_RETRY_INTERVAL
+        due = self.token_time + self.token_expiration - self.renew_window - TOKEN_REFRESH_LEAD_TIME
+        if due <= time.time():
+            self._refresh_token(self._token_generation)
+            due = self.token_time + self.token_expiration - self.renew_window - TOKEN_REFRESH_LEAD_TIME
+            if not self.token_value or due <= time.time():
+                # The refresh failed, or the token lifetime is shorter than our renewal lead time.
+                return TOKEN_REFRESH_RETRY_INTERVAL
+
+        return due - time.time()
+
+    def stop_refresher(self):
+        """Stop background token renewal if it is active."""
+        if self._token_refresher:
+            self._token_refresher.stop()
+
+    def _logout_keywords(self, token_value: str = None, client_id: str = None) -> dict:
+        """Create the keyword payload for a token revocation request."""
+        if not self.cred_format_valid:
+            raise InvalidCredentials
+
+        if not token_value:
+            token_value = self.token_value
+        operation, target_url, data_payload, header_payload = logout_payloads(
+            creds=self.creds,
+            base=self.base_url,
+            token_val=token_value,
+            client_id=client_id
+            )
+        # Log the call to this operation if debugging is enabled.
+        if self.log:
+            self.log.debug("OPERATION: %s", operation)
+
+        return {"method": "POST", "endpoint": target_url, "data": data_payload,
+                "headers": header_payload, "verify": self.ssl_verify,
+                "proxy": self.proxy, "timeout": self.timeout,
+                "user_agent": self.user_agent, "log_util": self.log,
+                "sanitize": self.sanitize_log, "transport": self.transport,
+                "operation": operation, "telemetry": self.telemetry
+                }
+
     #  _____   ______  _____   _____  _______  ______ _______ _____ _______ _______
     # |_____] |_____/ |     | |_____] |______ |_____/    |      |   |______ |______
     # |       |    \_ |_____| |       |______ |    \_    |    __|__ |______ ______|
@@ -361,6 +484,11 @@ class FalconInterface(BaseFalconAuth):
     def creds(self, value: Dict[str, str]):
         self._creds = value
 
+    @property
+    def client_label(self) -> str:
+        """Return a label identifying the credentials (and member CID) of this interface without disclosing them."""
+        return Telemetry.client_label(self.creds.get("client_id", self.token_value), self.creds.get("member_cid", None))
+
     @property
     def config(self) -> InterfaceConfiguration:
         """Return the interface configuration object for this interface."""
@@ -417,6 +545,69 @@ class FalconInterface(BaseFalconAuth):
     def timeout(self, value: Union[int, tuple]):
         self.config.timeout = value
 
+    @property
+    def transport(self) -> Transport:
+        """Return the HTTP transport from the configuration object."""
+        return self.config.transport
+
+    @transport.setter
+    def transport(self, value: Transport):
+        self.config.transport = value
+
+    @property
+    def codec(self) -> JSONCodec:
+        """Return the JSON codec from the configuration object."""
+        return self.config.codec
+
+    @codec.setter
+    def codec(self, value: JSONCodec):
+        self.config.codec = value
+
+    @property
+    def rate_limiter(self) -> Optional[RateLimiter]:
+        """Return the client side rate limiter."""
+        return self._rate_limiter
+
+    @rate_limiter.setter
+    def rate_limiter(self, value: Optional[RateLimiter]):
+        self._rate_limiter = value
+
+    @property
+    def retry_policy(self) -> Optional[RetryPolicy]:
+        """Return the policy used to retry requests that fail for transient reasons."""
+        return self._retry_policy
+
+    @retry_policy.setter
+    def retry_policy(self, value: Optional[RetryPolicy]):
+        self._retry_policy = value
+
+    @property
+    def cache(self) -> Optional[ResponseCache]:
+        """Return the response cache."""
+        return self._cache
+
+    @cache.setter
+    def cache(self, value: Optional[ResponseCache]):
+        self._cache = value
+
+    @property
+    def coalescer(self) -> Optional[RequestCoalescer]:
+        """Return the request coalescer."""
+        return self._coalescer
+
+    @coalescer.setter
+    def coalescer(self, value: Optional[RequestCoalescer]):
+        self._coalescer = value
+
+    @property
+    def telemetry(self) -> Optional[Telemetry]:
+        """Return the telemetry hooks."""
+        return self._telemetry
+
+    @telemetry.setter
+    def telemetry(self, value: Optional[Telemetry]):
+        self._telemetry = value
+
     @property
     def debug_record_count(self) -> int:
         """Return the current debug record count setting."""
@@ -511,6 +702,11 @@ class FalconInterface(BaseFalconAuth):
         self._pythonic = value
 
     # All properties defined here are by design IMMUTABLE.
+    @property
+    def asynchronous(self) -> bool:
+        """Return a boolean if this interface sends requests asynchronously."""
+        return False
+
     @property
     def refreshable(self) -> bool:
         """Return a boolean if this interface can automatically refresh tokens when they expire."""
@@ -547,11 +743,14 @@ class FalconInterface(BaseFalconAuth):
 
     # The default functionality of a FalconInterface object performs a token refresh
     # whenever a request is made for the auth_headers property and the token is stale.
+    # The generation is read before checking the token so a refresh completed by
+    # another thread in the meantime is never repeated.
     @property
     def auth_headers(self) -> Dict[str, str]:
         """Return a Bearer token baked into an Authorization header ready for an HTTP request."""
+        generation = self._token_generation
         if self.token_stale and self.refreshable:
-            self.login()
+            self._refresh_token(generation)
 
         return {"Authorization": f"Bearer {self.token_value}"}
 
@@ -36,6 +36,8 @@ OTHER DEALINGS IN THE SOFTWARE.
 For more information, please refer to <https://unlicense.org>
 """
 from typing import Dict, Union, Optional
+from .._transport import Transport
+from .._codec import JSONCodec
 
 
 class InterfaceConfiguration:
@@ -50,7 +52,12 @@ class InterfaceConfiguration:
                  proxy: Optional[Dict[str, str]] = None,
                  timeout: Optional[Union[int, tuple]] = None,
                  user_agent: Optional[str] = None,
-                 ssl_verify: Optional[bool] = True
+                 ssl_verify: Optional[bool] = True,
+                 pool_connections: Optional[int] = None,
+                 pool_maxsize: Optional[int] = None,
+                 keep_alive: Optional[bool] = True,
+                 transport: Optional[Transport] = None,
+                 codec: Optional[Union[str, JSONCodec]] = None
                  ):
         """Construct an instance of the InterfaceConfiguration class."""
         self._base_url: Optional[str] = base_url
@@ -62,6 +69,22 @@ class InterfaceConfiguration:
         if isinstance(ssl_verify, bool):
             self._ssl_verify = ssl_verify
 
+        # Persistent connection pool shared by every request made using this configuration.
+        # An existing transport may be provided to share a pool between multiple interfaces.
+        if isinstance(transport, Transport):
+            self._transport: Transport = transport
+        else:
+            self._transport: Transport = Transport(pool_connections=pool_connections,
+                                                   pool_maxsize=pool_maxsize,
+                                                   keep_alive=keep_alive
+                                                   )
+
+        # JSON library used to decode responses and encode request bodies.
+        if isinstance(codec, JSONCodec):
+            self._codec: JSONCodec = codec
+        else:
+            self._codec: JSONCodec = JSONCodec.get(codec)
+
     # ___  ____ ____ ___  ____ ____ ___ _ ____ ____
     # |__] |__/ |  | |__] |___ |__/  |  | |___ [__
     # |    |  \ |__| |    |___ |  \  |  | |___ ___]
@@ -115,3 +138,23 @@ class InterfaceConfiguration:
     def ssl_verify(self, value: bool):
         """Change the SSL verification setting."""
         self._ssl_verify = value
+
+    @property
+    def transport(self) -> Transport:
+        """Return the HTTP transport."""
+        return self._transport
+
+    @transport.setter
+    def transport(self, value: Transport):
+        """Replace the HTTP transport."""
+        self._transport = value
+
+    @property
+    def codec(self) -> JSONCodec:
+        """Return the JSON codec."""
+        return self._codec
+
+    @codec.setter
+    def codec(self, value: JSONCodec):
+        """Replace the JSON codec."""
+        self._codec = value
@@ -0,0 +1,113 @@
+"""Background token refresher.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+import threading
+from typing import Callable, Optional
+from weakref import WeakMethod
+
+
+class TokenRefresher:
+    """This class represents a background thread that renews bearer tokens before they become stale.
+
+    The refresher only holds a weak reference to the refresh method of the interface it serves,
+    allowing the interface to be garbage collected normally. The thread exits when the
+    interface is released or when stop is called.
+    """
+
+    # ____ ____ _  _ ____ ___ ____ _  _ ____ ___ ____ ____
+    # |    |  | |\ | [__   |  |__/ |  | |     |  |  | |__/
+    # |___ |__| | \| ___]  |  |  \ |__| |___  |  |__| |  \
+    #
+    def __init__(self, refresh: Callable[[], float]):
+        """Construct an instance of the TokenRefresher class.
+
+        Arguments
+        ----
+        refresh : Callable
+            Bound method that renews the token when due and returns the number
+            of seconds to wait before it should be called again.
+        """
+        self._refresh: WeakMethod = WeakMethod(refresh)
+        self._stopped: threading.Event = threading.Event()
+        # Set when a new token is received so the next renewal can be rescheduled.
+        self._wakeup: threading.Event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # _  _ ____ ___ _  _ ____ ___  ____
+    # |\/| |___  |  |__| |  | |  \ [__
+    # |  | |___  |  |  | |__| |__/ ___]
+    #
+    def _run(self):
+        """Renew the token whenever it is due until stopped or the interface is released."""
+        while not self._stopped.is_set():
+            refresh = self._refresh()
+            if refresh is None:
+                break
+            delay = refresh()
+            # Do not keep the interface alive while we sleep.
+            del refresh
+            self._wakeup.wait(delay)
+            self._wakeup.clear()
+
+    def start(self) -> "TokenRefresher":
+        """Start the background refresh thread."""
+        if not self.running:
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self._run, name="falconpy-token-refresher", daemon=True)
+            self._thread.start()
+
+        return self
+
+    def wake(self):
+        """Reschedule the next renewal, called whenever a new token is received."""
+        self._wakeup.set()
+
+    def stop(self, timeout: Optional[float] = None):
+        """Stop the background refresh thread."""
+        self._stopped.set()
+        self._wakeup.set()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+
+    # ___  ____ ____ ___  ____ ____ ___ _ ____ ____
+    # |__] |__/ |  | |__] |___ |__/  |  | |___ [__
+    # |    |  \ |__| |    |___ |  \  |  | |___ ___]
+    #
+    @property
+    def running(self) -> bool:
+        """Return a boolean indicating if the refresh thread is active."""
+        return bool(self._thread and self._thread.is_alive())
@@ -35,10 +35,13 @@ OTHER DEALINGS IN THE SOFTWARE.
 
 For more information, please refer to <https://unlicense.org>
 """
-from typing import Dict, List, Optional, Union
+from typing import Callable, Dict, Iterable, List, Optional, Union
 from ._falcon_interface import FalconInterface
 from .._constant import MAX_DEBUG_RECORDS
-from .._endpoint import api_endpoints
+from .. import _endpoint
+from .._transport import Transport, RateLimiter, RetryPolicy, ResponseCache, RequestCoalescer
+from .._codec import JSONCodec
+from .._telemetry import Telemetry
 from .._util import confirm_base_url
 
 
@@ -61,7 +64,7 @@ class UberInterface(FalconInterface):
     # Starting in v1.3.0, the Uber Class constructs itself leveraging the generic
     # FalconAuth constructor. This results in the Uber Class benefiting from a new
     # authentication style; Legacy / Token authentication.
-    # pylint: disable=R0913
+    # pylint: disable=R0913,R0914,R0917
     def __init__(self,
                  access_token: Optional[Union[str, bool]] = False,
                  base_url: Optional[str] = "https://api.crowdstrike.com",
@@ -78,7 +81,18 @@ class UberInterface(FalconInterface):
                  debug_record_count: Optional[int] = MAX_DEBUG_RECORDS,
                  sanitize_log: Optional[bool] = None,
                  pythonic: Optional[bool] = None,
-                 environment: Optional[Dict[str, str]] = None
+                 environment: Optional[Dict[str, str]] = None,
+                 pool_connections: Optional[int] = None,
+                 pool_maxsize: Optional[int] = None,
+                 keep_alive: Optional[bool] = True,
+                 transport: Optional[Transport] = None,
+                 background_refresh: Optional[bool] = False,
+                 rate_limit: Optional[Union[bool, RateLimiter]] = False,
+                 retry: Optional[Union[bool, RetryPolicy]] = False,
+                 json_codec: Optional[Union[str, JSONCodec]] = None,
+                 cache: Optional[Union[bool, ResponseCache]] = False,
+                 coalesce: Optional[Union[bool, RequestCoalescer]] = False,
+                 telemetry: Optional[Union[bool, Callable, Iterable[Callable], Telemetry]] = None
                  ):
         """Construct an instance of the UberInterface class.
 
@@ -111,6 +125,24 @@ class UberInterface(FalconInterface):
                             Max: 5000
         sanitize_log: Enable / Disable log sanitization of client IDs, secrets and tokens.
                       Boolean. Defaults to enabled.
+        pool_connections: Number of per-host connection pools to cache. Integer. Default: 10
+        pool_maxsize: Maximum number of connections kept alive per host. Integer. Default: 10
+        keep_alive: Enable / Disable connection reuse between requests. Boolean. Defaults to enabled.
+        transport: Existing Transport object to share a connection pool with.
+        background_refresh: Renew tokens from a background thread before they become stale.
+                            Boolean. Defaults to disabled.
+        rate_limit: Pace requests using a client side rate limiter learned from the rate limit
+                    headers returned by the API. Boolean or RateLimiter. Defaults to disabled.
+        retry: Retry requests that fail for transient reasons using exponential backoff with jitter.
+               Boolean or RetryPolicy. Defaults to disabled.
+        json_codec: JSON library used to decode responses and encode request bodies (orjson, simdjson,
+                    ujson or json). String or JSONCodec. Defaults to the fastest installed library.
+        cache: Cache responses to read-mostly GET operations. Boolean or ResponseCache. Defaults to disabled.
+        coalesce: Share one API call between identical requests made while it is in flight.
+                  Boolean or RequestCoalescer. Defaults to disabled.
+        telemetry: Provide the measurements of every request to instrumentation hooks. True enables
+                   an in-process MetricsAggregator. Boolean, callable, list of callables or Telemetry.
+                   Defaults to disabled.
         This method only accepts keywords to specify arguments.
         """
         super().__init__(base_url=confirm_base_url(base_url),
@@ -128,11 +160,22 @@ class UberInterface(FalconInterface):
                          debug_record_count=debug_record_count,
                          sanitize_log=sanitize_log,
                          pythonic=pythonic,
-                         environment=environment
+                         environment=environment,
+                         pool_connections=pool_connections,
+                         pool_maxsize=pool_maxsize,
+                         keep_alive=keep_alive,
+                         transport=transport,
+                         background_refresh=background_refresh,
+                         rate_limit=rate_limit,
+                         retry=retry,
+                         json_codec=json_codec,
+                         cache=cache,
+                         coalesce=coalesce,
+                         telemetry=telemetry
                          )
 
-        # Complete list of available API operations.
-        self.commands = api_endpoints
+        # Complete list of available API operations, loaded on first use.
+        self.commands = _endpoint.api_endpoints
 
     # _  _ ____ ___ _  _ ____ ___  ____
     # |\/| |___  |  |__| |  | |  \ [__
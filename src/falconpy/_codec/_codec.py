@@ -0,0 +1,162 @@
+"""JSON codec.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+import json
+from functools import partial
+from importlib import import_module
+from typing import Any, Callable, Dict, Optional, Union
+from .._constant import JSON_CODECS
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    """Encode using the standard library, matching the encoding performed by requests."""
+    return json.dumps(obj, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+
+def _orjson_dumps(orjson_dumps: Callable[[Any], bytes], obj: Any) -> bytes:
+    """Encode using orjson, rejecting NaN and infinite floats like the standard library.
+
+    orjson encodes NaN and infinite floats as null instead of rejecting them. Rather than walking
+    the payload beforehand, documents containing null are encoded again by the standard library,
+    which raises a ValueError for non-finite floats and otherwise produces an equivalent document.
+    """
+    returned = orjson_dumps(obj)
+    if b"null" in returned:
+        returned = _stdlib_dumps(obj)
+    return returned
+
+
+class JSONCodec:
+    """This class represents the JSON library used to decode responses and encode request bodies.
+
+    When no codec is specified the fastest installed library is selected (orjson, simdjson
+    and then ujson), falling back to the json module from the standard library. Objects the
+    selected library cannot encode are encoded using the standard library. Every codec raises
+    a ValueError when encoding NaN or infinite floats, matching the standard library. Integers
+    wider than 64 bits are encoded exactly by every codec, but orjson decodes them as floats.
+    """
+
+    _loaded: Dict[str, "JSONCodec"] = {}
+
+    # ____ ____ _  _ ____ ___ ____ _  _ ____ ___ ____ ____
+    # |    |  | |\ | [__   |  |__/ |  | |     |  |  | |__/
+    # |___ |__| | \| ___]  |  |  \ |__| |___  |  |__| |  \
+    #
+    def __init__(self,
+                 name: str,
+                 loads: Callable[[Union[bytes, str]], Any],
+                 dumps: Optional[Callable[[Any], bytes]] = None
+                 ):
+        """Construct an instance of the JSONCodec class.
+
+        Keyword arguments
+        ----
+        name : str
+            Name of the codec.
+        loads : callable
+            Decodes a bytes or string JSON document.
+        dumps : callable
+            Encodes an object to a bytes JSON document. [Default: standard library]
+        """
+        self._name: str = name
+        self._loads: Callable[[Union[bytes, str]], Any] = loads
+        self._dumps: Callable[[Any], bytes] = dumps or _stdlib_dumps
+
+    @classmethod
+    def _create(cls, name: str) -> "JSONCodec":
+        """Create the codec for the named library, raising ImportError if it is not installed."""
+        if name == "orjson":
+            orjson = import_module("orjson")
+            returned = cls(name, orjson.loads, partial(_orjson_dumps, orjson.dumps))
+        elif name == "simdjson":
+            # simdjson only provides decoding.
+            returned = cls(name, import_module("simdjson").loads)
+        elif name == "ujson":
+            ujson = import_module("ujson")
+            returned = cls(name, ujson.loads, lambda obj: ujson.dumps(obj, ensure_ascii=False).encode("utf-8"))
+        elif name == "json":
+            returned = cls(name, json.loads)
+        else:
+            raise ValueError(f"Unsupported JSON codec: {name}. Available codecs: {', '.join(JSON_CODECS)}")
+
+        return returned
+
+    @classmethod
+    def get(cls, name: Optional[str] = None) -> "JSONCodec":
+        """Return the named codec, or the fastest installed codec when a name is not provided."""
+        key = name or "auto"
+        if key not in cls._loaded:
+            if name:
+                cls._loaded[key] = cls._create(name)
+            else:
+                for candidate in JSON_CODECS:
+                    try:
+                        cls._loaded[key] = cls._create(candidate)
+                        break
+                    except ImportError:
+                        continue
+
+        return cls._loaded[key]
+
+    # _  _ ____ ___ _  _ ____ ___  ____
+    # |\/| |___  |  |__| |  | |  \ [__
+    # |  | |___  |  |  | |__| |__/ ___]
+    #
+    def loads(self, content: Union[bytes, str]) -> Any:
+        """Decode a JSON document, raising a ValueError if it is not valid JSON."""
+        return self._loads(content)
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode an object as a UTF-8 JSON document."""
+        try:
+            return self._dumps(obj)
+        except (TypeError, OverflowError):
+            # Fall back to the standard library for types the codec does not support (ex: big integers).
+            return _stdlib_dumps(obj)
+
+    # ___  ____ ____ ___  ____ ____ ___ _ ____ ____
+    # |__] |__/ |  | |__] |___ |__/  |  | |___ [__
+    # |    |  \ |__| |    |___ |  \  |  | |___ ___]
+    #
+    @property
+    def name(self) -> str:
+        """Return the name of the codec."""
+        return self._name
+
+    def __repr__(self) -> str:
+        """Return a string representation of the codec."""
+        return f"JSONCodec({self._name})"
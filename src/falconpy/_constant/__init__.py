@@ -35,7 +35,7 @@ OTHER DEALINGS IN THE SOFTWARE.
 
 For more information, please refer to <https://unlicense.org>
 """
-from typing import List
+from typing import Dict, List, Tuple
 from .._version import version
 PREFER_NONETYPE: List[str] = [
     "report_executions_download_get", "report_executions_download.get",
@@ -63,3 +63,126 @@ GLOBAL_API_MAX_RETURN: int = 5000
 MAX_TOKEN_RENEW_WINDOW: int = 1200
 # Minimum available token renew window (in seconds).
 MIN_TOKEN_RENEW_WINDOW: int = 120
+# Number of seconds before the renew window opens that background token refreshes are performed.
+TOKEN_REFRESH_LEAD_TIME: int = 30
+# Number of seconds the background token refresher waits before checking again when no token is present.
+TOKEN_REFRESH_RETRY_INTERVAL: int = 10
+# Default number of per-host connection pools maintained by a transport.
+DEFAULT_POOL_CONNECTIONS: int = 10
+# Default maximum number of connections kept alive per host by a transport.
+DEFAULT_POOL_MAXSIZE: int = 10
+# Length (in seconds) of the period API rate limits are measured across.
+RATE_LIMIT_PERIOD: int = 60
+# Number of times a request rejected due to rate limiting is sent again.
+RATE_LIMIT_REQUEUE: int = 3
+# Maximum number of attempts (including the first) made for a request by the default retry policy.
+RETRY_MAX_ATTEMPTS: int = 3
+# Base delay (in seconds) used to calculate the exponential backoff between retries.
+RETRY_BACKOFF_FACTOR: float = 0.5
+# Largest delay (in seconds) waited between retries when the API does not specify one.
+RETRY_BACKOFF_MAX: float = 30.0
+# Response status codes considered transient and retried.
+RETRY_STATUSES: Tuple[int, ...] = (429, 500, 502, 503, 504)
+# HTTP methods that may be safely sent more than once.
+IDEMPOTENT_METHODS: Tuple[str, ...] = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+# Number of bytes read from the connection at a time when streaming a download.
+DOWNLOAD_CHUNK_SIZE: int = 1048576
+# Number of bytes read from the connection at a time when streaming the resources of a response.
+RESOURCE_STREAM_CHUNK_SIZE: int = 65536
+# Number of seconds cached responses remain fresh.
+CACHE_TTL: int = 300
+# Maximum number of responses held by a response cache.
+CACHE_MAX_ENTRIES: int = 1024
+# Maximum combined size (in bytes) of the response content held by a response cache.
+CACHE_MAX_SIZE: int = 33554432
+# Read-mostly operations cached by default when response caching is enabled.
+CACHED_OPERATIONS: Tuple[str, ...] = (
+    "get_firewall_fields", "query_firewall_fields", "get_platforms", "query_platforms",
+    "get_platformsMixin0", "query_platformsMixin0", "get_rule_types", "query_rule_types",
+    "GetIntelActorEntities", "fdrschema_entities_field_get", "fdrschema_queries_field_get",
+    "fdrschema_entities_event_get", "fdrschema_queries_event_get", "getHostGroups",
+    "queryCombinedSensorUpdateBuilds"
+    )
+# HTTP methods of requests coalesced when identical requests are already in flight.
+COALESCED_METHODS: Tuple[str, ...] = ("GET", "HEAD")
+# Read-only operations sent using POST that are also coalesced.
+COALESCED_OPERATIONS: Tuple[str, ...] = (
+    "PostDeviceDetailsV2", "GetIntelIndicatorEntities", "PostEntitiesAlertsV2", "GetDetectSummaries",
+    "GetIncidents", "GetBehaviors", "getChildrenV2", "GetCaseEntitiesByIDs"
+    )
+# JSON libraries used to decode responses and encode request bodies, in order of preference.
+JSON_CODECS: Tuple[str, ...] = ("orjson", "simdjson", "ujson", "json")
+# Number of IDs sent per detail request when an operation does not document a limit.
+DEFAULT_ID_BATCH_SIZE: int = 100
+# Keyword detail operations accept their IDs with, for operations not using the ids keyword.
+ID_KEYWORDS: Dict[str, str] = {
+    "PostEntitiesAlertsV1": "composite_ids", "PostEntitiesAlertsV2": "composite_ids"
+    }
+# Upper bounds (in seconds) of the latency histogram buckets maintained by the metrics aggregator.
+TELEMETRY_LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0
+    )
+# Number of seconds between Event Streams session refreshes when the stream does not provide an interval.
+EVENT_STREAM_REFRESH_INTERVAL: int = 1800
+# Number of seconds before the end of the refresh interval that Event Streams sessions are refreshed.
+EVENT_STREAM_REFRESH_MARGIN: int = 60
+# Maximum number of decoded batches of events waiting for delivery by an Event Streams consumer.
+EVENT_STREAM_QUEUE_SIZE: int = 64
+# Number of bytes read from an event stream at a time.
+EVENT_STREAM_CHUNK_SIZE: int = 65536
+# Number of events processed between checkpoints of Event Streams offsets.
+EVENT_STREAM_CHECKPOINT_EVENTS: int = 1000
+# Maximum number of seconds waited between attempts to reconnect to an event stream.
+EVENT_STREAM_MAX_BACKOFF: int = 30
+# Maximum number of hosts added to each RTR batch session by the batch orchestrator.
+RTR_BATCH_SIZE: int = 1000
+# Number of RTR batch sessions the batch orchestrator works with concurrently.
+RTR_BATCH_WORKERS: int = 8
+# Number of seconds between refreshes of RTR batch sessions, which expire after 10 minutes.
+RTR_BATCH_REFRESH_INTERVAL: int = 300
+# Number of seconds waited before the status of pending RTR commands is first checked.
+RTR_POLL_INTERVAL: float = 1.0
+# Maximum number of seconds waited between checks of the status of pending RTR commands.
+RTR_MAX_POLL_INTERVAL: float = 15.0
+# Number of seconds the batch orchestrator waits for hosts to complete an RTR command.
+RTR_COMMAND_TIMEOUT: int = 600
+# Maximum number of RTR command status checks in progress at the same time within each batch session.
+RTR_STATUS_WORKERS: int = 16
+# Maximum number of sequences an RTR command response is retrieved in.
+RTR_MAX_SEQUENCES: int = 1000
+# Number of files downloaded concurrently when retrieving files from RTR sessions.
+RTR_DOWNLOAD_WORKERS: int = 8
+# Password protecting the archives RTR extracted file contents are provided in.
+RTR_ARCHIVE_PASSWORD: str = "infected"
+# Maximum number of MalQuery requests in progress at the same time within a job runner.
+MALQUERY_MAX_PENDING: int = 20
+# Number of MalQuery requests submitted or checked concurrently by a job runner.
+MALQUERY_WORKERS: int = 8
+# Number of MalQuery sample archives downloaded concurrently by a job runner.
+MALQUERY_DOWNLOAD_WORKERS: int = 4
+# Maximum number of samples requested in each MalQuery multi-download.
+MALQUERY_DOWNLOAD_BATCH: int = 100
+# Number of seconds waited before the status of a MalQuery request is first checked.
+MALQUERY_POLL_INTERVAL: float = 2.0
+# Maximum number of seconds waited between checks of the status of a MalQuery request.
+MALQUERY_MAX_POLL_INTERVAL: float = 30.0
+# Number of seconds a job runner waits for a MalQuery request to complete.
+MALQUERY_JOB_TIMEOUT: int = 3600
+# Sandbox environment files are detonated in by a FalconX pipeline when not specified (Windows 10, 64-bit).
+FALCONX_ENVIRONMENT_ID: int = 160
+# Maximum number of FalconX submissions in progress at the same time within a pipeline.
+FALCONX_MAX_PENDING: int = 10
+# Number of files hashed, looked up, uploaded or submitted concurrently by a FalconX pipeline.
+FALCONX_WORKERS: int = 8
+# Number of FalconX reports and artifacts downloaded concurrently by a pipeline.
+FALCONX_DOWNLOAD_WORKERS: int = 4
+# Maximum number of FalconX submissions checked with each call to get_submissions.
+FALCONX_POLL_BATCH: int = 100
+# Number of seconds waited before the status of a FalconX submission is first checked.
+FALCONX_POLL_INTERVAL: float = 15.0
+# Maximum number of seconds waited between checks of the status of a FalconX submission.
+FALCONX_MAX_POLL_INTERVAL: float = 120.0
+# Number of seconds a pipeline waits for a FalconX submission to complete.
+FALCONX_SUBMISSION_TIMEOUT: int = 3600
+# Number of bytes read at a time when hashing files submitted to FalconX.
+FALCONX_HASH_CHUNK_SIZE: int = 1048576
@@ -0,0 +1,163 @@
+"""Operation index.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class Operation:
+    """This class represents a single API operation within the operation index."""
+
+    # ____ ___ ___ ____ _ ___  _  _ ___ ____ ____
+    # |__|  |   |  |__/ | |__] |  |  |  |___ [__
+    # |  |  |   |  |  \ | |__] |__|  |  |___ ___]
+    #
+    operation_id: str
+    method: str
+    path: str
+    path_variables: Tuple[str, ...] = ()
+    # Typed (non-body) parameters keyed by parameter name.
+    params: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    # Pagination style used by the operation: "after", "offset", "scroll" or None.
+    pagination: Optional[str] = None
+    # Maximum number of IDs accepted per request, when documented.
+    batch_size: Optional[int] = None
+
+    @classmethod
+    def from_endpoint(cls, endpoint: List[Any]) -> "Operation":
+        """Create an operation record from an endpoint module definition."""
+        params: Dict[str, Dict[str, Any]] = {}
+        for param in endpoint[5]:
+            # Body payload parameters do not have a type field
+            if "type" in param:
+                params.setdefault(param["name"], param)
+
+        return cls(operation_id=endpoint[0],
+                   method=endpoint[1],
+                   path=endpoint[2],
+                   path_variables=tuple(p["name"] for p in endpoint[5] if p.get("in") == "path"),
+                   params=params,
+                   pagination=pagination_style(params),
+                   batch_size=id_batch_size(endpoint)
+                   )
+
+
+def pagination_style(params: Dict[str, Dict[str, Any]]) -> Optional[str]:
+    """Determine the pagination style of an operation from its query string parameters.
+
+    Operations accepting an after token page using meta.pagination.after. Operations
+    accepting a string offset page using scroll tokens, while operations accepting an
+    integer offset page by record position.
+    """
+    returned = None
+    if params.get("after", {}).get("in") == "query":
+        returned = "after"
+    elif params.get("offset", {}).get("in") == "query":
+        returned = "scroll" if params["offset"].get("type") == "string" else "offset"
+
+    return returned
+
+
+# Matches documented ID limits such as "(max: 400)" or "Supports up to a maximum 5000 IDs".
+_ID_LIMIT = re.compile(r"(?:max(?:imum)?|up to)[\s:]*(?:of\s+)?(\d+)", re.IGNORECASE)
+# Limits are only accepted next to sentences referring to IDs, ignoring other documented
+# constraints such as "Length - min: 64, max: 64" or "Maximum 500 user groups allowed".
+_ID_WORDING = re.compile(r"\b(?:uu)?ids?\b|\bid(?:\(s\)|'s)", re.IGNORECASE)
+_SENTENCE = re.compile(r"(?<=[.!?])\s+")
+
+
+def id_batch_size(endpoint: List[Any]) -> Optional[int]:
+    """Determine the maximum number of IDs an operation accepts per request.
+
+    The maxItems attribute of the ids parameter is used when present, otherwise the limit
+    is taken from the ids or body parameter description, or the operation description,
+    when documented next to a sentence referring to IDs.
+    """
+    returned = None
+    id_params = [p for p in endpoint[5] if p.get("name") in ("ids", "body")]
+    for param in id_params:
+        if isinstance(param.get("maxItems"), int):
+            returned = param["maxItems"]
+            break
+    if returned is None and id_params:
+        for text in [p.get("description", "") for p in id_params] + [endpoint[3]]:
+            sentences = _SENTENCE.split(text or "")
+            # Limits may be documented in the sentence following the one describing the IDs.
+            for previous, sentence in zip([""] + sentences, sentences):
+                found = _ID_LIMIT.search(sentence)
+                if found and _ID_WORDING.search(f"{previous} {sentence}"):
+                    returned = int(found.group(1))
+                    break
+            if returned is not None:
+                break
+
+    return returned
+
+
+# Indexes are cached by the identity of the endpoint list they were built from. A reference
+# to the list is retained alongside the index so the identity can not be recycled.
+_INDEX_CACHE: Dict[int, Tuple[List[Any], int, Dict[str, Operation]]] = {}
+
+
+def build_operation_index(endpoints: List[Any]) -> Dict[str, Operation]:
+    """Build a mapping of operation ID to operation record for an endpoint list.
+
+    When an operation ID is defined more than once, the first definition is used.
+    """
+    index: Dict[str, Operation] = {}
+    for endpoint in endpoints:
+        if endpoint[0] not in index:
+            index[endpoint[0]] = Operation.from_endpoint(endpoint)
+
+    return index
+
+
+def operation_index(endpoints: List[Any]) -> Dict[str, Operation]:
+    """Retrieve the operation index for an endpoint list, building it on first use."""
+    cached = _INDEX_CACHE.get(id(endpoints))
+    if cached is None or cached[0] is not endpoints or cached[1] != len(endpoints):
+        cached = (endpoints, len(endpoints), build_operation_index(endpoints))
+        _INDEX_CACHE[id(endpoints)] = cached
+
+    return cached[2]
+
+
+def find_operation(endpoints: List[Any], operation_id: Optional[str]) -> Optional[Operation]:
+    """Return the operation record for an operation ID, or None if it is not present."""
+    return operation_index(endpoints).get(operation_id)
@@ -0,0 +1,378 @@
+"""Event Streams consumer.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+from urllib.parse import urlparse
+import requests
+from ._offset_store import OffsetStore
+from .._codec import JSONCodec
+from .._constant import (
+    EVENT_STREAM_CHECKPOINT_EVENTS,
+    EVENT_STREAM_CHUNK_SIZE,
+    EVENT_STREAM_MAX_BACKOFF,
+    EVENT_STREAM_QUEUE_SIZE,
+    EVENT_STREAM_REFRESH_INTERVAL,
+    EVENT_STREAM_REFRESH_MARGIN
+    )
+from .._endpoint import find_operation
+from .._endpoint._event_streams import _event_streams_endpoints
+from .._paginator import result_resources
+
+
+def stream_partition(feed_url: str) -> int:
+    """Return the partition of an event stream from its data feed URL."""
+    return int(urlparse(feed_url).path.rstrip("/").rsplit("/", 1)[-1])
+
+
+def event_offset(event: Dict[str, Any]) -> Optional[int]:
+    """Return the offset of an event, provided in either the json or flatjson format."""
+    metadata = event.get("metadata", None)
+    if isinstance(metadata, dict):
+        return metadata.get("offset", None)
+
+    return event.get("metadata.offset", None)
+
+
+class EventStreamConsumer:  # pylint: disable=R0902
+    """This class represents a consumer of every Event Streams partition available to an application.
+
+    Each partition is read on a shared thread pool while newline-delimited events are decoded
+    as they arrive. Events are delivered in batches through a bounded queue, pausing readers
+    when the consumer falls behind. Sessions are refreshed on schedule without closing the
+    stream connections, and the offset of the last event processed in each partition is
+    checkpointed to an offset store so a restarted consumer resumes where it stopped.
+    """
+
+    # ____ ____ _  _ ____ ___ ____ _  _ ____ ___ ____ ____
+    # |    |  | |\ | [__   |  |__/ |  | |     |  |  | |__/
+    # |___ |__| | \| ___]  |  |  \ |__| |___  |  |__| |  \
+    #
+    def __init__(self,
+                 service: Any,
+                 app_id: str,
+                 store: Optional[OffsetStore] = None,
+                 stream_format: str = "json",
+                 partitions: Optional[List[int]] = None,
+                 queue_size: int = EVENT_STREAM_QUEUE_SIZE,
+                 chunk_size: int = EVENT_STREAM_CHUNK_SIZE,
+                 checkpoint_every: int = EVENT_STREAM_CHECKPOINT_EVENTS,
+                 refresh_interval: Optional[float] = None
+                 ):
+        """Construct an instance of the EventStreamConsumer class.
+
+        Arguments
+        ----
+        service : EventStreams
+            Event Streams Service Class used to discover and refresh streams.
+        app_id : str
+            Label that identifies the connection, up to 32 alphanumeric characters.
+
+        Keyword arguments
+        ----
+        store : OffsetStore
+            Store the offsets of processed events are checkpointed to. [Default: in memory]
+        stream_format : str
+            Format of the streamed events, json or flatjson. [Default: json]
+        partitions : list
+            Partitions to read. [Default: every partition available]
+        queue_size : int
+            Maximum number of decoded batches waiting for delivery. [Default: 64]
+        chunk_size : int
+            Number of bytes read from a stream at a time. [Default: 65536]
+        checkpoint_every : int
+            Number of events processed between checkpoints. [Default: 1000]
+        refresh_interval : float
+            Seconds between session refreshes. [Default: the interval provided by the stream, less 60 seconds]
+        """
+        self._service = service
+        self._app_id: str = app_id
+        self._store: OffsetStore = store if store is not None else OffsetStore()
+        self._format: str = stream_format
+        self._partitions: Optional[List[int]] = partitions
+        self._queue: "queue.Queue[Tuple[int, Union[List[Dict[str, Any]], Exception]]]" = queue.Queue(
+            maxsize=max(1, queue_size)
+            )
+        self._chunk_size: int = chunk_size
+        self._checkpoint_every: int = max(1, checkpoint_every)
+        self._refresh_interval: Optional[float] = refresh_interval
+        self._codec: JSONCodec = getattr(service, "codec", None) or JSONCodec.get()
+        # Streams remain open indefinitely, only the connection attempt is limited by the timeout.
+        timeout = getattr(service, "timeout", None)
+        self._connect_timeout: Optional[float] = timeout[0] if isinstance(timeout, tuple) else timeout
+        transport = getattr(service, "transport", None)
+        self._session: requests.Session = transport.session if transport else requests.Session()
+        # Stream details returned by the API, keyed by partition.
+        self._streams: Dict[int, Dict[str, Any]] = {}
+        self._responses: Dict[int, requests.Response] = {}
+        # Offsets of the last event read and the last event processed, keyed by partition.
+        self._read: Dict[int, int] = {}
+        self._processed: Dict[int, int] = {}
+        self._uncommitted: int = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._metrics: Dict[str, int] = {"events": 0, "batches": 0, "reconnects": 0,
+                                         "refreshes": 0, "refresh_errors": 0, "checkpoints": 0
+                                         }
+
+    # _  _ ____ ___ _  _ ____ ___  ____
+    # |\/| |___  |  |__| |  | |  \ [__
+    # |  | |___  |  |  | |__| |__/ ___]
+    #
+    def _discover(self) -> Dict[int, Dict[str, Any]]:
+        """Retrieve the details of the streams available to the application, keyed by partition."""
+        result = self._service.list_available_streams(app_id=self._app_id, format=self._format)
+        resources, _ = result_resources(result, find_operation(_event_streams_endpoints, "listAvailableStreamsOAuth2"))
+        streams = {stream_partition(stream["dataFeedURL"]): stream for stream in resources}
+        with self._lock:
+            self._streams.update(streams)
+
+        return streams
+
+    def start(self) -> "EventStreamConsumer":
+        """Discover the available streams and begin reading every partition."""
+        if self._executor is None:
+            streams = self._discover()
+            partitions = [p for p in streams if self._partitions is None or p in self._partitions]
+            self._executor = ThreadPoolExecutor(max_workers=len(partitions) + 1,
+                                                thread_name_prefix="falconpy-event-stream"
+                                                )
+            for partition in partitions:
+                self._executor.submit(self._consume, partition)
+            self._executor.submit(self._refresh, partitions)
+
+        return self
+
+    def _connect(self, partition: int) -> requests.Response:
+        """Open the stream for a partition, resuming after the last event read or processed."""
+        with self._lock:
+            stream = self._streams[partition]
+        offset = self._read.get(partition, self._store.load(partition))
+        response = self._session.get(stream["dataFeedURL"],
+                                     params={"offset": offset + 1} if offset is not None else None,
+                                     headers={"Authorization": f"Token {stream['sessionToken']['token']}",
+                                              "Accept": "application/json"
+                                              },
+                                     stream=True,
+                                     timeout=(self._connect_timeout, None),
+                                     verify=getattr(self._service, "ssl_verify", True),
+                                     proxies=getattr(self._service, "proxy", None)
+                                     )
+        self._responses[partition] = response
+
+        return response
+
+    def _consume(self, partition: int):
+        """Read a partition until the consumer is closed, reconnecting when the stream ends."""
+        backoff = 0
+        while not self._stop.is_set():
+            received = False
+            try:
+                response = self._connect(partition)
+                if response.status_code in (401, 403, 404):
+                    # The session has expired, retrieve new session details.
+                    response.close()
+                    self._discover()
+                else:
+                    response.raise_for_status()
+                    for events in self._batches(response):
+                        received = True
+                        offset = event_offset(events[-1])
+                        if offset is not None:
+                            self._read[partition] = offset
+                        if not self._deliver((partition, events)):
+                            return
+            except Exception as failure:  # pylint: disable=W0718  # Failures are provided to the consumer
+                if self._stop.is_set():
+                    return
+                if not isinstance(failure, (requests.RequestException, ValueError)):
+                    self._deliver((partition, failure))
+                    return
+            finally:
+                self._responses.pop(partition, None)
+            with self._lock:
+                self._metrics["reconnects"] += 1
+            # Reconnect immediately after receiving events or the first failure, otherwise back off.
+            if received:
+                backoff = 0
+            else:
+                self._stop.wait(backoff)
+                backoff = min(max(backoff * 2, 1), EVENT_STREAM_MAX_BACKOFF)
+
+    def _batches(self, response: requests.Response) -> Iterator[List[Dict[str, Any]]]:
+        """Decode the newline-delimited events within each chunk read from the stream."""
+        loads: Callable[[bytes], Any] = self._codec.loads
+        pending = b""
+        for chunk in response.iter_content(chunk_size=self._chunk_size):
+            lines = (pending + chunk).split(b"\n")
+            pending = lines.pop()
+            # Blank lines are sent to keep the connection alive.
+            events = [loads(line) for line in lines if line.strip()]
+            if events:
+                yield events
+
+    def _deliver(self, item: Tuple[int, Union[List[Dict[str, Any]], Exception]]) -> bool:
+        """Add an item to the delivery queue, waiting while the queue is full."""
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+
+        return False
+
+    def _refresh(self, partitions: List[int]):
+        """Refresh the session of every partition on schedule."""
+        scheduled = {partition: time.monotonic() + self._interval(partition) for partition in partitions}
+        while scheduled and not self._stop.wait(max(0.0, min(scheduled.values()) - time.monotonic())):
+            for partition in [p for p, due in scheduled.items() if due <= time.monotonic()]:
+                try:
+                    result_resources(self._service.refresh_active_stream(partition=partition, app_id=self._app_id),
+                                     find_operation(_event_streams_endpoints, "refreshActiveStreamSession")
+                                     )
+                    metric = "refreshes"
+                    scheduled[partition] = time.monotonic() + self._interval(partition)
+                except Exception:  # pylint: disable=W0718  # Refreshes are attempted again
+                    metric = "refresh_errors"
+                    scheduled[partition] = time.monotonic() + min(self._interval(partition), EVENT_STREAM_MAX_BACKOFF)
+                with self._lock:
+                    self._metrics[metric] += 1
+
+    def _interval(self, partition: int) -> float:
+        """Return the number of seconds between session refreshes for a partition."""
+        if self._refresh_interval:
+            return self._refresh_interval
+        with self._lock:
+            interval = self._streams[partition].get("refreshActiveSessionInterval", EVENT_STREAM_REFRESH_INTERVAL)
+
+        return max(interval - EVENT_STREAM_REFRESH_MARGIN, 1)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """Yield every event read, checkpointing the offsets of the events processed.
+
+        An event is considered processed once the next event is requested.
+        """
+        self.start()
+        while not self._stop.is_set():
+            try:
+                partition, events = self._queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            if isinstance(events, Exception):
+                raise events
+            processed = 0
+            try:
+                for event in events:
+                    yield event
+                    processed += 1
+            finally:
+                if processed:
+                    offset = event_offset(events[processed - 1])
+                    if offset is not None:
+                        self._processed[partition] = offset
+                    with self._lock:
+                        self._metrics["events"] += processed
+                        self._metrics["batches"] += 1
+                    self._uncommitted += processed
+                    if self._uncommitted >= self._checkpoint_every:
+                        self.commit()
+
+    def commit(self):
+        """Checkpoint the offset of the last event processed in each partition."""
+        if self._processed:
+            self._store.save(dict(self._processed))
+            self._uncommitted = 0
+            with self._lock:
+                self._metrics["checkpoints"] += 1
+
+    def close(self):
+        """Stop reading every partition and checkpoint the offsets of the events processed."""
+        self._stop.set()
+        for response in list(self._responses.values()):
+            response.close()
+        if self._executor:
+            self._executor.shutdown(wait=True)
+        self.commit()
+
+    def __enter__(self) -> "EventStreamConsumer":
+        """Start the consumer when used as a context manager."""
+        return self.start()
+
+    def __exit__(self, *args):
+        """Close the consumer when leaving the context."""
+        self.close()
+
+    # ___  ____ ____ ___  ____ ____ ___ _ ____ ____
+    # |__] |__/ |  | |__] |___ |__/  |  | |___ [__
+    # |    |  \ |__| |    |___ |  \  |  | |___ ___]
+    #
+    @property
+    def app_id(self) -> str:
+        """Return the label identifying the connection."""
+        return self._app_id
+
+    @property
+    def store(self) -> OffsetStore:
+        """Return the store offsets are checkpointed to."""
+        return self._store
+
+    @property
+    def partitions(self) -> List[int]:
+        """Return the partitions of the streams discovered."""
+        with self._lock:
+            return sorted(self._streams)
+
+    @property
+    def offsets(self) -> Dict[int, int]:
+        """Return the offset of the last event processed in each partition."""
+        return dict(self._processed)
+
+    @property
+    def backlog(self) -> int:
+        """Return the number of batches waiting for delivery."""
+        return self._queue.qsize()
+
+    @property
+    def metrics(self) -> Dict[str, int]:
+        """Return the consumer metrics."""
+        with self._lock:
+            return dict(self._metrics)
@@ -0,0 +1,136 @@
+"""Event Streams offset stores.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+import json
+import os
+import tempfile
+import threading
+from typing import Dict, Optional
+
+
+class OffsetStore:
+    """This class represents a store holding the offset of the last event processed in each stream partition.
+
+    Offsets are held in memory. Subclasses persist offsets elsewhere by overriding the
+    load and save methods, allowing a restarted consumer to resume where it stopped.
+    """
+
+    # ____ ____ _  _ ____ ___ ____ _  _ ____ ___ ____ ____
+    # |    |  | |\ | [__   |  |__/ |  | |     |  |  | |__/
+    # |___ |__| | \| ___]  |  |  \ |__| |___  |  |__| |  \
+    #
+    def __init__(self, offsets: Optional[Dict[int, int]] = None):
+        """Construct an instance of the OffsetStore class.
+
+        Keyword arguments
+        ----
+        offsets : dict
+            Initial offsets keyed by partition.
+        """
+        self._offsets: Dict[int, int] = {int(key): int(value) for key, value in (offsets or {}).items()}
+        self._lock = threading.Lock()
+
+    # _  _ ____ ___ _  _ ____ ___  ____
+    # |\/| |___  |  |__| |  | |  \ [__
+    # |  | |___  |  |  | |__| |__/ ___]
+    #
+    def load(self, partition: int) -> Optional[int]:
+        """Return the offset of the last event processed in a partition, or None if there is not one."""
+        with self._lock:
+            return self._offsets.get(partition, None)
+
+    def save(self, offsets: Dict[int, int]):
+        """Record the offsets of the last events processed, keyed by partition."""
+        with self._lock:
+            self._offsets.update(offsets)
+
+    # ___  ____ ____ ___  ____ ____ ___ _ ____ ____
+    # |__] |__/ |  | |__] |___ |__/  |  | |___ [__
+    # |    |  \ |__| |    |___ |  \  |  | |___ ___]
+    #
+    @property
+    def offsets(self) -> Dict[int, int]:
+        """Return a copy of the offsets recorded, keyed by partition."""
+        with self._lock:
+            return dict(self._offsets)
+
+
+class FileOffsetStore(OffsetStore):
+    """This class represents an offset store persisted to a JSON file.
+
+    The file is replaced atomically whenever offsets are saved, so an interrupted write
+    never leaves a partially written checkpoint behind.
+    """
+
+    # ____ ____ _  _ ____ ___ ____ _  _ ____ ___ ____ ____
+    # |    |  | |\ | [__   |  |__/ |  | |     |  |  | |__/
+    # |___ |__| | \| ___]  |  |  \ |__| |___  |  |__| |  \
+    #
+    def __init__(self, path: str):
+        """Construct an instance of the FileOffsetStore class, reading any offsets already saved to the path."""
+        self._path: str = os.path.abspath(path)
+        saved: Dict[int, int] = {}
+        if os.path.exists(self._path):
+            with open(self._path, "r", encoding="utf-8") as checkpoint:
+                saved = json.load(checkpoint)
+        super().__init__(saved)
+
+    # _  _ ____ ___ _  _ ____ ___  ____
+    # |\/| |___  |  |__| |  | |  \ [__
+    # |  | |___  |  |  | |__| |__/ ___]
+    #
+    def save(self, offsets: Dict[int, int]):
+        """Record the offsets of the last events processed and write every offset to the file."""
+        with self._lock:
+            self._offsets.update(offsets)
+            handle, temporary = tempfile.mkstemp(dir=os.path.dirname(self._path), suffix=".tmp")
+            try:
+                with os.fdopen(handle, "w", encoding="utf-8") as checkpoint:
+                    json.dump({str(key): value for key, value in self._offsets.items()}, checkpoint)
+                os.replace(temporary, self._path)
+            except BaseException:
+                os.unlink(temporary)
+                raise
+
+    # ___  ____ ____ ___  ____ ____ ___ _ ____ ____
+    # |__] |__/ |  | |__] |___ |__/  |  | |___ [__
+    # |    |  \ |__| |    |___ |  \  |  | |___ ___]
+    #
+    @property
+    def path(self) -> str:
+        """Return the path of the checkpoint file."""
+        return self._path
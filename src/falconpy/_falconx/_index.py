@@ -0,0 +1,140 @@
+"""FalconX sandbox index.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+import json
+import os
+import tempfile
+import threading
+from typing import Dict, Optional
+
+
+class SandboxIndex:
+    """This class represents an index of the FalconX reports available for each file, keyed by SHA-256.
+
+    Report IDs are recorded for each sandbox environment and held in memory. Subclasses persist
+    the index elsewhere by overriding the find and record methods, allowing files analyzed by an
+    earlier pipeline to be skipped without calling the API.
+    """
+
+    # ____ ____ _  _ ____ ___ ____ _  _ ____ ___ ____ ____
+    # |    |  | |\ | [__   |  |__/ |  | |     |  |  | |__/
+    # |___ |__| | \| ___]  |  |  \ |__| |___  |  |__| |  \
+    #
+    def __init__(self, reports: Optional[Dict[str, Dict[str, str]]] = None):
+        """Construct an instance of the SandboxIndex class.
+
+        Keyword arguments
+        ----
+        reports : dict
+            Initial report IDs keyed by SHA-256, then by environment ID.
+        """
+        self._reports: Dict[str, Dict[str, str]] = {sha256.lower(): {str(environment): report_id
+                                                                     for environment, report_id in reports.items()}
+                                                    for sha256, reports in (reports or {}).items()
+                                                    }
+        self._lock = threading.Lock()
+
+    # _  _ ____ ___ _  _ ____ ___  ____
+    # |\/| |___  |  |__| |  | |  \ [__
+    # |  | |___  |  |  | |__| |__/ ___]
+    #
+    def find(self, sha256: str, environment_id: int) -> Optional[str]:
+        """Return the ID of the report for a file in an environment, or None if there is not one."""
+        with self._lock:
+            return self._reports.get(sha256.lower(), {}).get(str(environment_id), None)
+
+    def record(self, sha256: str, environment_id: int, report_id: str):
+        """Record the ID of the report for a file in an environment."""
+        with self._lock:
+            self._reports.setdefault(sha256.lower(), {})[str(environment_id)] = report_id
+
+    # ___  ____ ____ ___  ____ ____ ___ _ ____ ____
+    # |__] |__/ |  | |__] |___ |__/  |  | |___ [__
+    # |    |  \ |__| |    |___ |  \  |  | |___ ___]
+    #
+    @property
+    def reports(self) -> Dict[str, Dict[str, str]]:
+        """Return a copy of the report IDs recorded, keyed by SHA-256 and then by environment ID."""
+        with self._lock:
+            return {sha256: dict(reports) for sha256, reports in self._reports.items()}
+
+
+class FileSandboxIndex(SandboxIndex):
+    """This class represents a FalconX sandbox index persisted to a JSON file.
+
+    The file is replaced atomically whenever a report is recorded, so an interrupted write
+    never leaves a partially written index behind.
+    """
+
+    # ____ ____ _  _ ____ ___ ____ _  _ ____ ___ ____ ____
+    # |    |  | |\ | [__   |  |__/ |  | |     |  |  | |__/
+    # |___ |__| | \| ___]  |  |  \ |__| |___  |  |__| |  \
+    #
+    def __init__(self, path: str):
+        """Construct an instance of the FileSandboxIndex class, reading any reports already saved to the path."""
+        self._path: str = os.path.abspath(path)
+        saved: Dict[str, Dict[str, str]] = {}
+        if os.path.exists(self._path):
+            with open(self._path, "r", encoding="utf-8") as index:
+                saved = json.load(index)
+        super().__init__(saved)
+
+    # _  _ ____ ___ _  _ ____ ___  ____
+    # |\/| |___  |  |__| |  | |  \ [__
+    # |  | |___  |  |  | |__| |__/ ___]
+    #
+    def record(self, sha256: str, environment_id: int, report_id: str):
+        """Record the ID of the report for a file in an environment and write the index to the file."""
+        with self._lock:
+            self._reports.setdefault(sha256.lower(), {})[str(environment_id)] = report_id
+            handle, temporary = tempfile.mkstemp(dir=os.path.dirname(self._path), suffix=".tmp")
+            try:
+                with os.fdopen(handle, "w", encoding="utf-8") as index:
+                    json.dump(self._reports, index)
+                os.replace(temporary, self._path)
+            except BaseException:
+                os.unlink(temporary)
+                raise
+
+    # ___  ____ ____ ___  ____ ____ ___ _ ____ ____
+    # |__] |__/ |  | |__] |___ |__/  |  | |___ [__
+    # |    |  \ |__| |    |___ |  \  |  | |___ ___]
+    #
+    @property
+    def path(self) -> str:
+        """Return the path of the index file."""
+        return self._path
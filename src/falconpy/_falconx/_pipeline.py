@@ -0,0 +1,624 @@
+"""FalconX sandbox pipeline.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+import hashlib
+import heapq
+import itertools
+import json
+import os
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Set, Tuple
+from ._index import SandboxIndex
+from ._sample import SandboxSample
+from .._constant import (
+    FALCONX_DOWNLOAD_WORKERS,
+    FALCONX_ENVIRONMENT_ID,
+    FALCONX_HASH_CHUNK_SIZE,
+    FALCONX_MAX_PENDING,
+    FALCONX_MAX_POLL_INTERVAL,
+    FALCONX_POLL_BATCH,
+    FALCONX_POLL_INTERVAL,
+    FALCONX_SUBMISSION_TIMEOUT,
+    FALCONX_WORKERS
+    )
+from .. import _endpoint
+from .._error import APIError
+from .._paginator import result_resources
+from .._payload import falconx_payload
+from .._result import Result
+
+
+def falconx_operation(operation_id: str) -> Any:
+    """Return a FalconX sandbox operation record, loading the endpoint table on first access."""
+    return _endpoint.find_operation(getattr(_endpoint, "_falconx_sandbox_endpoints"), operation_id)
+
+
+def file_digest(path: str) -> Tuple[str, int]:
+    """Return the SHA-256 and size of a file, reading it in chunks."""
+    digest = hashlib.sha256()
+    size = 0
+    with open(path, "rb") as sample:
+        for chunk in iter(lambda: sample.read(FALCONX_HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+            size += len(chunk)
+
+    return digest.hexdigest(), size
+
+
+def artifact_ids(report: Any) -> Dict[str, str]:
+    """Return the ID of every artifact within a sandbox report, mapped to the field it was provided in."""
+    found: Dict[str, str] = {}
+    if isinstance(report, dict):
+        for key, value in report.items():
+            if key.endswith("artifact_id") and isinstance(value, str) and value:
+                found.setdefault(value, key[:-len("_artifact_id")] or "artifact")
+            else:
+                for artifact_id, name in artifact_ids(value).items():
+                    found.setdefault(artifact_id, name)
+    elif isinstance(report, list):
+        for item in report:
+            for artifact_id, name in artifact_ids(item).items():
+                found.setdefault(artifact_id, name)
+
+    return found
+
+
+def save_artifact(result: Any, target: str) -> int:
+    """Return the number of bytes of an artifact written to the target, writing JSON artifacts that were not streamed."""
+    if isinstance(result, Result):
+        result = result.full_return
+    if isinstance(result, bytes):
+        content = result
+    elif isinstance(result, dict):
+        body = result.get("body")
+        if result.get("status_code", 0) >= 400:
+            errors = (body.get("errors") if isinstance(body, dict) else None) or [{}]
+            raise APIError(result["status_code"], errors[0].get("message"), result.get("headers"))
+        streamed = body.get("resources") if isinstance(body, dict) else None
+        if streamed and isinstance(streamed[0], dict) and "bytes_written" in streamed[0]:
+            return streamed[0]["bytes_written"]
+        if isinstance(body, dict) and not body.get("meta") and set(body) == {"meta", "resources", "errors"}:
+            # Artifacts provided as a JSON list are returned as the resources of an empty response.
+            body = body["resources"]
+        # Artifacts provided as JSON (IOC packs and STIX bundles) are not streamed.
+        content = json.dumps(body).encode("utf-8")
+    else:
+        raise APIError(message="The artifact was not returned.")
+    with open(target, "wb") as artifact:
+        artifact.write(content)
+
+    return len(content)
+
+
+def failure_error(failure: Exception) -> Dict[str, Any]:
+    """Return the error recorded for a file when processing it raises an exception."""
+    if isinstance(failure, APIError):
+        return {"code": failure.code, "message": failure.message}
+
+    return {"code": 500, "message": str(failure) or type(failure).__name__}
+
+
+class FalconXSandboxPipeline:  # pylint: disable=R0902
+    """This class represents a pipeline detonating any number of files in the FalconX sandbox.
+
+    Each file is hashed locally. Files with a report in the sandbox index, or an existing report
+    found using query_reports, are not uploaded or submitted again, and files sharing a SHA-256
+    are only processed once. Remaining files are uploaded (unless query_sample shows the sample
+    already exists) and submitted while fewer than max_pending submissions are in progress and
+    the submission quota allows it. Every submission in progress is checked by a single scheduler
+    using batched get_submissions calls, with the interval between checks of each submission
+    doubling (up to max_poll_interval) while it remains in progress. Summary reports are retrieved
+    as each file completes and, when a destination is provided, full reports and artifacts are
+    downloaded in parallel, with artifacts streamed to disk.
+    """
+
+    # ____ ____ _  _ ____ ___ ____ _  _ ____ ___ ____ ____
+    # |    |  | |\ | [__   |  |__/ |  | |     |  |  | |__/
+    # |___ |__| | \| ___]  |  |  \ |__| |___  |  |__| |  \
+    #
+    def __init__(self,  # pylint: disable=R0913,R0914
+                 service: Any,
+                 destination: Optional[str] = None,
+                 environment_id: int = FALCONX_ENVIRONMENT_ID,
+                 index: Optional[SandboxIndex] = None,
+                 lookup: bool = True,
+                 artifacts: bool = True,
+                 max_pending: int = FALCONX_MAX_PENDING,
+                 max_workers: int = FALCONX_WORKERS,
+                 max_downloads: int = FALCONX_DOWNLOAD_WORKERS,
+                 poll_batch: int = FALCONX_POLL_BATCH,
+                 poll_interval: float = FALCONX_POLL_INTERVAL,
+                 max_poll_interval: float = FALCONX_MAX_POLL_INTERVAL,
+                 submission_timeout: float = FALCONX_SUBMISSION_TIMEOUT
+                 ):
+        """Construct an instance of the FalconXSandboxPipeline class.
+
+        Arguments
+        ----
+        service : FalconXSandbox
+            FalconX Sandbox Service Class used to upload, submit and retrieve reports.
+
+        Keyword arguments
+        ----
+        destination : str
+            Directory full reports and artifacts are written to, in a folder for each SHA-256.
+            Only summary reports are retrieved when not provided.
+        environment_id : int
+            Sandbox environment files are detonated in when not specified. [Default: 160]
+        index : SandboxIndex
+            Index of the reports available for each file. [Default: in memory]
+        lookup : bool
+            Search for existing reports using query_reports before submitting. [Default: True]
+        artifacts : bool
+            Download the artifacts within each full report. [Default: True]
+        max_pending : int
+            Maximum number of submissions in progress at the same time. [Default: 10]
+        max_workers : int
+            Number of files hashed, looked up, uploaded or submitted concurrently. [Default: 8]
+        max_downloads : int
+            Number of reports and artifacts downloaded concurrently. [Default: 4]
+        poll_batch : int
+            Maximum number of submissions checked with each call to get_submissions. [Default: 100]
+        poll_interval : float
+            Seconds waited before the status of a submission is first checked. [Default: 15]
+        max_poll_interval : float
+            Maximum seconds waited between checks of the status of a submission. [Default: 120]
+        submission_timeout : float
+            Seconds to wait for each submission to complete. [Default: 3600]
+        """
+        self._service = service
+        self._destination: Optional[str] = os.path.abspath(destination) if destination else None
+        self._environment_id: int = environment_id
+        self._index: SandboxIndex = index if index is not None else SandboxIndex()
+        self._lookup: bool = lookup
+        self._artifacts: bool = artifacts
+        self._max_pending: int = max(1, max_pending)
+        self._max_workers: int = max(1, max_workers)
+        self._max_downloads: int = max(1, max_downloads)
+        self._poll_batch: int = max(1, poll_batch)
+        self._poll_interval: float = poll_interval
+        self._max_poll_interval: float = max_poll_interval
+        self._submission_timeout: float = submission_timeout
+        self._samples: List[SandboxSample] = []
+        # Files waiting to be submitted, and submissions in progress ordered by when they are next checked.
+        self._waiting: Deque[SandboxSample] = deque()
+        self._polling: List[Tuple[float, int, SandboxSample, float]] = []
+        self._sequence = itertools.count()
+        self._started: Dict[int, float] = {}
+        # First file added for each SHA-256 and environment, and the files sharing its SHA-256.
+        self._primaries: Dict[Tuple[str, int], SandboxSample] = {}
+        self._duplicates: Dict[int, List[SandboxSample]] = {}
+        self._remaining: Dict[int, int] = {}
+        self._pending: int = 0
+        # Files holding one of the max_pending submission slots.
+        self._slots: Set[int] = set()
+        self._outstanding: int = 0
+        self._finished: "queue.Queue[SandboxSample]" = queue.Queue()
+        # Submissions remaining within the sandbox quota, None until a response provides the quota.
+        self._quota: Optional[int] = None
+        self._condition = threading.Condition()
+        self._stop = threading.Event()
+        self._scheduler: Optional[threading.Thread] = None
+        self._workers: Optional[ThreadPoolExecutor] = None
+        self._downloads: Optional[ThreadPoolExecutor] = None
+        self._metrics: Dict[str, int] = {"hashed": 0, "index_hits": 0, "report_hits": 0, "duplicates": 0, "uploads": 0,
+                                         "uploads_skipped": 0, "submitted": 0, "polls": 0, "poll_errors": 0,
+                                         "quota_rejections": 0, "reports": 0, "artifacts": 0, "bytes": 0,
+                                         "completed": 0, "failed": 0
+                                         }
+
+    # _  _ ____ ___ _  _ ____ ___  ____
+    # |\/| |___  |  |__| |  | |  \ [__
+    # |  | |___  |  |  | |__| |__/ ___]
+    #
+    def add(self, path: str, name: Optional[str] = None, environment_id: Optional[int] = None, **kwargs) -> SandboxSample:
+        """Add a file to the pipeline, accepting the same sandbox keywords as FalconXSandbox.submit."""
+        sample = SandboxSample(path=os.path.abspath(path),
+                               name=name or os.path.basename(path),
+                               environment_id=environment_id or self._environment_id,
+                               options=kwargs
+                               )
+        with self._condition:
+            self._samples.append(sample)
+            self._started[id(sample)] = time.monotonic()
+            self._outstanding += 1
+        self.start()
+        self._workers.submit(self._run, self._prepare, sample)
+
+        return sample
+
+    def start(self) -> "FalconXSandboxPipeline":
+        """Start the scheduler."""
+        with self._condition:
+            if self._scheduler is None:
+                self._workers = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="falconpy-falconx")
+                self._downloads = ThreadPoolExecutor(max_workers=self._max_downloads,
+                                                     thread_name_prefix="falconpy-falconx-download"
+                                                     )
+                self._scheduler = threading.Thread(target=self._schedule, name="falconpy-falconx-scheduler", daemon=True)
+                self._scheduler.start()
+
+        return self
+
+    def _run(self, work: Callable[..., None], sample: SandboxSample, *args):
+        """Perform work for a file, failing the file if the work raises an unexpected exception."""
+        try:
+            work(sample, *args)
+        except Exception as failure:  # pylint: disable=W0718  # Failures are provided to the caller
+            self._release(sample, [failure_error(failure)])
+
+    def _prepare(self, sample: SandboxSample):
+        """Hash a file, then find an existing report for it or queue it for submission."""
+        sample.status = "hashing"
+        try:
+            sample.sha256, sample.size = file_digest(sample.path)
+        except OSError as error:
+            self._finish(sample, [{"code": 400, "message": f"Unable to read {sample.path}: {error.strerror}"}])
+            return
+        key = (sample.sha256, sample.environment_id)
+        with self._condition:
+            self._metrics["hashed"] += 1
+            primary = self._primaries.get(key)
+            if primary is not None:
+                # Files sharing a SHA-256 are provided the outcome of the first one added.
+                sample.status = "duplicate"
+                self._duplicates[id(primary)].append(sample)
+                self._metrics["duplicates"] += 1
+                return
+            self._primaries[key] = sample
+            self._duplicates[id(sample)] = []
+        sample.report_id = self._index.find(sample.sha256, sample.environment_id)
+        if sample.report_id:
+            sample.source = "index"
+            self._count(index_hits=1)
+        elif self._lookup:
+            sample.report_id = self._existing(sample)
+            if sample.report_id:
+                sample.source = "report"
+                self._index.record(sample.sha256, sample.environment_id, sample.report_id)
+                self._count(report_hits=1)
+        if sample.report_id:
+            self._collect(sample)
+            return
+        with self._condition:
+            sample.status = "queued"
+            self._waiting.append(sample)
+            self._condition.notify_all()
+
+    def _existing(self, sample: SandboxSample) -> Optional[str]:
+        """Return the ID of the most recent report for a file in its environment, or None if there is not one."""
+        try:
+            resources, body = result_resources(
+                self._service.query_reports(filter=f"sandbox.sha256:'{sample.sha256}'"
+                                                   f"+sandbox.environment_id:{sample.environment_id}",
+                                            sort="created_timestamp.desc",
+                                            limit=1
+                                            ),
+                falconx_operation("QueryReports")
+                )
+        except APIError:
+            return None
+        self._update_quota(body)
+
+        return resources[0] if resources else None
+
+    def _schedule(self):
+        """Submit waiting files and dispatch batched checks of submissions in progress as they become due."""
+        with self._condition:
+            while not self._stop.is_set():
+                while self._waiting and self._pending < self._max_pending:
+                    sample = self._waiting.popleft()
+                    if self._quota is not None and self._quota <= 0:
+                        self._metrics["quota_rejections"] += 1
+                        self._finish(sample, [{"code": 429, "message": "The sandbox submission quota has been exhausted."}])
+                        continue
+                    if self._quota is not None:
+                        self._quota -= 1
+                    self._pending += 1
+                    self._slots.add(id(sample))
+                    sample.status = "submitting"
+                    self._workers.submit(self._run, self._submit, sample)
+                now = time.monotonic()
+                due: List[Tuple[SandboxSample, float]] = []
+                while self._polling and self._polling[0][0] <= now:
+                    _, _, sample, interval = heapq.heappop(self._polling)
+                    due.append((sample, interval))
+                for position in range(0, len(due), self._poll_batch):
+                    self._workers.submit(self._poll, due[position:position + self._poll_batch])
+                self._condition.wait(self._polling[0][0] - now if self._polling else None)
+
+    def _submit(self, sample: SandboxSample):
+        """Upload a file, unless the sample already exists, and submit it for analysis."""
+        try:
+            existing, _ = result_resources(self._service.query_sample(sha256s=[sample.sha256]),
+                                           falconx_operation("QuerySampleV1")
+                                           )
+            known = {(item.get("sha256") if isinstance(item, dict) else item) for item in existing}
+            if sample.sha256 in known:
+                self._count(uploads_skipped=1)
+            else:
+                with open(sample.path, "rb") as upload:
+                    result_resources(self._service.upload_sample(file_data=upload, file_name=sample.name),
+                                     falconx_operation("UploadSampleV2")
+                                     )
+                self._count(uploads=1)
+            resources, body = result_resources(
+                self._service.submit(body=falconx_payload(passed_keywords={**sample.options,
+                                                                           "sha256": sample.sha256,
+                                                                           "environment_id": sample.environment_id,
+                                                                           "submit_name": sample.name
+                                                                           })),
+                falconx_operation("Submit")
+                )
+        except APIError as error:
+            self._release(sample, [{"code": error.code, "message": error.message}])
+            return
+        except OSError as error:
+            self._release(sample, [{"code": 400, "message": f"Unable to read {sample.path}: {error.strerror}"}])
+            return
+        self._update_quota(body)
+        sample.submission_id = resources[0].get("id") if resources else None
+        if not sample.submission_id:
+            self._release(sample, [{"code": 500, "message": "The submission ID was not returned."}])
+            return
+        sample.source = "submitted"
+        sample.status = "running"
+        self._count(submitted=1)
+        self._reschedule(sample, self._poll_interval)
+
+    def _reschedule(self, sample: SandboxSample, interval: float):
+        """Check the status of a submission again once the interval has passed."""
+        with self._condition:
+            heapq.heappush(self._polling, (time.monotonic() + interval, next(self._sequence), sample, interval))
+            self._condition.notify_all()
+
+    def _poll(self, due: List[Tuple[SandboxSample, float]]):
+        """Check the status of a batch of submissions with a single call to get_submissions."""
+        states: Dict[str, str] = {}
+        try:
+            resources, _ = result_resources(self._service.get_submissions(ids=[sample.submission_id for sample, _ in due]),
+                                            falconx_operation("GetSubmissions")
+                                            )
+            states = {resource.get("id"): resource.get("state") for resource in resources}
+            self._count(polls=1)
+        except Exception:  # pylint: disable=W0718  # Submissions are checked again
+            self._count(poll_errors=1)
+        for sample, interval in due:
+            self._run(self._progress, sample, states.get(sample.submission_id), interval)
+
+    def _progress(self, sample: SandboxSample, state: Optional[str], interval: float):
+        """Process the state of a submission returned by get_submissions."""
+        sample.polls += 1
+        if state == "success":
+            self._free(sample)
+            # Reports share the ID of the submission they were created for.
+            sample.report_id = sample.submission_id
+            self._index.record(sample.sha256, sample.environment_id, sample.report_id)
+            self._collect(sample)
+        elif state == "error":
+            self._release(sample, [{"code": 500, "message": "The sandbox analysis failed."}])
+        elif time.monotonic() - self._started[id(sample)] >= self._submission_timeout:
+            self._release(sample, [{"code": 408, "message": "The submission did not complete before the timeout."}])
+        else:
+            # Submissions that remain in progress are checked less often.
+            self._reschedule(sample, min(interval * 2, self._max_poll_interval))
+
+    def _collect(self, sample: SandboxSample):
+        """Retrieve the reports of a file whose analysis has completed."""
+        sample.status = "collecting"
+        self._downloads.submit(self._run, self._report, sample)
+
+    def _report(self, sample: SandboxSample):
+        """Retrieve the summary report of a file, then write the full report and download its artifacts."""
+        try:
+            summaries, _ = result_resources(self._service.get_summary_reports(ids=sample.report_id),
+                                            falconx_operation("GetSummaryReports")
+                                            )
+            if summaries:
+                sample.summary = summaries[0]
+                sample.verdict = summaries[0].get("verdict")
+            if not self._destination:
+                self._finish(sample)
+                return
+            reports, _ = result_resources(self._service.get_reports(ids=sample.report_id),
+                                          falconx_operation("GetReports")
+                                          )
+        except APIError as error:
+            self._finish(sample, [{"code": error.code, "message": error.message}])
+            return
+        folder = os.path.join(self._destination, sample.sha256)
+        os.makedirs(folder, exist_ok=True)
+        sample.report = os.path.join(folder, f"report-{sample.report_id}.json")
+        with open(sample.report, "w", encoding="utf-8") as report:
+            json.dump(reports[0] if reports else {}, report)
+        self._count(reports=1)
+        found = artifact_ids(reports[0]) if self._artifacts and reports else {}
+        if not found:
+            self._finish(sample)
+            return
+        with self._condition:
+            self._remaining[id(sample)] = len(found)
+        for artifact_id, name in found.items():
+            self._downloads.submit(self._artifact, sample, artifact_id, name)
+
+    def _artifact(self, sample: SandboxSample, artifact_id: str, name: str):
+        """Stream an artifact of a report to disk, finishing the file once its last artifact is downloaded."""
+        target = os.path.join(self._destination, sample.sha256, f"{name}-{artifact_id}")
+        try:
+            written = save_artifact(self._service.get_artifacts(id=artifact_id, stream=True, target=target,
+                                                                hash_algorithm="sha256"
+                                                                ),
+                                    target
+                                    )
+            error = None
+        except Exception as failure:  # pylint: disable=W0718  # Failures are recorded for the file
+            written, error = 0, failure_error(failure)
+        with self._condition:
+            if error:
+                sample.errors.append(error)
+            else:
+                sample.artifacts[artifact_id] = target
+                self._metrics["artifacts"] += 1
+                self._metrics["bytes"] += written
+            self._remaining[id(sample)] -= 1
+            if not self._remaining[id(sample)]:
+                del self._remaining[id(sample)]
+                self._finish(sample, sample.errors)
+
+    def _update_quota(self, body: Dict[str, Any]):
+        """Record the submissions remaining within the sandbox quota provided in a response."""
+        quota = (body.get("meta") or {}).get("quota") or {}
+        if quota.get("total") is not None:
+            with self._condition:
+                self._quota = max(0, int(quota["total"]) - int(quota.get("used", 0)))
+                self._condition.notify_all()
+
+    def _count(self, **counts: int):
+        """Add to the pipeline metrics."""
+        with self._condition:
+            for metric, count in counts.items():
+                self._metrics[metric] += count
+
+    def _release(self, sample: SandboxSample, errors: List[Dict[str, Any]]):
+        """Fail a file whose submission is no longer in progress, allowing another to be submitted."""
+        with self._condition:
+            self._free(sample)
+            self._finish(sample, errors)
+
+    def _free(self, sample: SandboxSample):
+        """Release the submission slot held by a file, if it holds one."""
+        with self._condition:
+            if id(sample) in self._slots:
+                self._slots.discard(id(sample))
+                self._pending -= 1
+                self._condition.notify_all()
+
+    def _finish(self, sample: SandboxSample, errors: Optional[List[Dict[str, Any]]] = None):
+        """Record the outcome of a file, and of every file sharing its SHA-256, and provide them to the caller."""
+        with self._condition:
+            if sample.finished:
+                return
+            sample.errors = list(errors or [])
+            sample.status = "failed" if errors else "done"
+            if self._primaries.get((sample.sha256, sample.environment_id)) is sample:
+                del self._primaries[(sample.sha256, sample.environment_id)]
+            for duplicate in [sample] + self._duplicates.pop(id(sample), []):
+                if duplicate is not sample:
+                    duplicate.source = "duplicate"
+                    for attribute in ("submission_id", "report_id", "verdict", "summary", "report", "status"):
+                        setattr(duplicate, attribute, getattr(sample, attribute))
+                    duplicate.artifacts = dict(sample.artifacts)
+                    duplicate.errors = list(sample.errors)
+                duplicate.elapsed = time.monotonic() - self._started.pop(id(duplicate), time.monotonic())
+                self._metrics["failed" if errors else "completed"] += 1
+                self._outstanding -= 1
+                self._finished.put(duplicate)
+            self._condition.notify_all()
+
+    def as_completed(self) -> Iterator[SandboxSample]:
+        """Yield every file as it finishes."""
+        self.start()
+        while not self._stop.is_set():
+            with self._condition:
+                if not self._outstanding and self._finished.empty():
+                    return
+            try:
+                yield self._finished.get(timeout=0.1)
+            except queue.Empty:
+                continue
+
+    def wait(self) -> List[SandboxSample]:
+        """Wait for every file to finish, returning every file added."""
+        for _ in self.as_completed():
+            pass
+
+        return self.samples
+
+    def close(self):
+        """Stop the scheduler. Submissions in progress are no longer checked."""
+        self._stop.set()
+        with self._condition:
+            self._condition.notify_all()
+        if self._scheduler is not None:
+            self._scheduler.join()
+            self._workers.shutdown(wait=True)
+            self._downloads.shutdown(wait=True)
+
+    def __enter__(self) -> "FalconXSandboxPipeline":
+        """Start the pipeline when used as a context manager."""
+        return self.start()
+
+    def __exit__(self, *args):
+        """Close the pipeline when leaving the context."""
+        self.close()
+
+    # ___  ____ ____ ___  ____ ____ ___ _ ____ ____
+    # |__] |__/ |  | |__] |___ |__/  |  | |___ [__
+    # |    |  \ |__| |    |___ |  \  |  | |___ ___]
+    #
+    @property
+    def samples(self) -> List[SandboxSample]:
+        """Return every file added, in the order added."""
+        with self._condition:
+            return list(self._samples)
+
+    @property
+    def index(self) -> SandboxIndex:
+        """Return the sandbox index."""
+        return self._index
+
+    @property
+    def pending(self) -> int:
+        """Return the number of submissions in progress."""
+        with self._condition:
+            return self._pending
+
+    @property
+    def quota(self) -> Optional[int]:
+        """Return the number of submissions remaining within the sandbox quota, or None if it is not yet known."""
+        with self._condition:
+            return self._quota
+
+    @property
+    def metrics(self) -> Dict[str, int]:
+        """Return the pipeline metrics."""
+        with self._condition:
+            return dict(self._metrics)
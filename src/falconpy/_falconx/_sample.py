@@ -0,0 +1,92 @@
+"""FalconX sandbox sample.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+
+@dataclass
+class SandboxSample:  # pylint: disable=R0902
+    """This class represents a file detonated by a FalconX sandbox pipeline.
+
+    source describes where the report came from: index (a report recorded in the local
+    sample index), report (an existing report found using query_reports), duplicate (another
+    file with the same SHA-256 within the pipeline) or submitted (a new submission). reports
+    and artifacts provide the paths the full report and each artifact were written to.
+    elapsed is the number of seconds from adding the file until it finished.
+    """
+
+    # ____ ___ ___ ____ _ ___  _  _ ___ ____ ____
+    # |__|  |   |  |__/ | |__] |  |  |  |___ [__
+    # |  |  |   |  |  \ | |__] |__|  |  |___ ___]
+    #
+    path: str
+    name: str
+    environment_id: int
+    options: Dict[str, Any] = field(default_factory=dict)
+    sha256: Optional[str] = None
+    size: int = 0
+    status: str = "queued"
+    source: Optional[str] = None
+    submission_id: Optional[str] = None
+    report_id: Optional[str] = None
+    verdict: Optional[str] = None
+    summary: Dict[str, Any] = field(default_factory=dict)
+    report: Optional[str] = None
+    artifacts: Dict[str, str] = field(default_factory=dict)
+    errors: List[Dict[str, Any]] = field(default_factory=list)
+    polls: int = 0
+    elapsed: float = 0.0
+
+    # ___  ____ ____ ___  ____ ____ ___ _ ____ ____
+    # |__] |__/ |  | |__] |___ |__/  |  | |___ [__
+    # |    |  \ |__| |    |___ |  \  |  | |___ ___]
+    #
+    @property
+    def finished(self) -> bool:
+        """Return True once the sample has completed or failed."""
+        return self.status in ("done", "failed")
+
+    @property
+    def succeeded(self) -> bool:
+        """Return True when the sample completed without errors."""
+        return self.status == "done"
+
+    @property
+    def detonated(self) -> bool:
+        """Return True when the file was uploaded and submitted by the pipeline."""
+        return self.source == "submitted"
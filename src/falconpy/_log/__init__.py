@@ -36,5 +36,6 @@ OTHER DEALINGS IN THE SOFTWARE.
 For more information, please refer to <https://unlicense.org>
 """
 from ._facility import LogFacility
+from ._payload import LogPayload, redact
 
-__all__ = ["LogFacility"]
+__all__ = ["LogFacility", "LogPayload", "redact"]
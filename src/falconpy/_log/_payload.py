@@ -0,0 +1,93 @@
+"""Debug log payload formatting.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+from typing import Any
+from .._constant import MAX_DEBUG_RECORDS, GLOBAL_API_MAX_RETURN
+
+REDACTED_KEYS = ("access_token", "client_id", "client_secret", "member_cid", "token")
+
+
+def redact(payload: Any, record_max: int = MAX_DEBUG_RECORDS) -> Any:
+    """Return a copy of a logged payload with confidential data redacted and the resources list truncated.
+
+    Only the dictionaries that are changed are copied, and only the logged portion of the
+    resources list is copied. The provided payload is never modified.
+    """
+    if not isinstance(payload, dict):
+        return payload
+    cleaned = dict(payload)
+    for key in REDACTED_KEYS:
+        if key in cleaned:
+            cleaned[key] = "REDACTED"
+    body = cleaned.get("body", None)
+    if isinstance(body, dict):
+        body = dict(body)
+        for key in REDACTED_KEYS:
+            if key in body:
+                body[key] = "REDACTED"
+        resources = body.get("resources", None)
+        if resources and isinstance(resources, list):
+            # Log results are limited to record_max items within the resources list.
+            body["resources"] = resources[:max(1, min(record_max, GLOBAL_API_MAX_RETURN))]
+        cleaned["body"] = body
+    if "Authorization" in cleaned:
+        cleaned["Authorization"] = "Bearer REDACTED"
+
+    return cleaned
+
+
+class LogPayload:  # pylint: disable=R0903
+    """This class represents a payload written to the debug log.
+
+    Redaction, truncation and formatting are deferred until the log record is emitted,
+    so no work is performed for records filtered out by the logger or its handlers.
+    """
+
+    __slots__ = ["_payload", "_sanitize", "_record_max"]
+
+    def __init__(self, payload: Any, sanitize: bool = True, record_max: int = MAX_DEBUG_RECORDS):
+        """Construct an instance of the LogPayload class."""
+        self._payload: Any = payload
+        self._sanitize: bool = sanitize
+        self._record_max: int = record_max
+
+    def __str__(self) -> str:
+        """Return the (optionally sanitized) payload formatted for the log."""
+        if self._sanitize:
+            return str(redact(self._payload, self._record_max))
+
+        return str(self._payload)
@@ -0,0 +1,89 @@
+"""MalQuery job.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+
+@dataclass
+class MalQueryJob:  # pylint: disable=R0902
+    """This class represents a MalQuery request submitted by a job runner.
+
+    kind is the type of request: hunt, exact_search, fuzzy_search or download. Search jobs
+    provide the samples matched in resources, along with the download jobs created for them.
+    Download jobs provide the samples requested, and the path, size and SHA-256 of the sample
+    archive once it has been written to disk. elapsed is the number of seconds from submitting
+    the request until the job finished.
+    """
+
+    # ____ ___ ___ ____ _ ___  _  _ ___ ____ ____
+    # |__|  |   |  |__/ | |__] |  |  |  |___ [__
+    # |  |  |   |  |  \ | |__] |__|  |  |___ ___]
+    #
+    kind: str
+    name: Optional[str] = None
+    body: Dict[str, Any] = field(default_factory=dict)
+    request_id: Optional[str] = None
+    status: str = "queued"
+    resources: List[Dict[str, Any]] = field(default_factory=list)
+    samples: List[str] = field(default_factory=list)
+    downloads: List["MalQueryJob"] = field(default_factory=list)
+    path: Optional[str] = None
+    bytes_written: int = 0
+    sha256: Optional[str] = None
+    errors: List[Dict[str, Any]] = field(default_factory=list)
+    polls: int = 0
+    elapsed: float = 0.0
+
+    # ___  ____ ____ ___  ____ ____ ___ _ ____ ____
+    # |__] |__/ |  | |__] |___ |__/  |  | |___ [__
+    # |    |  \ |__| |    |___ |  \  |  | |___ ___]
+    #
+    @property
+    def finished(self) -> bool:
+        """Return True once the job has completed or failed."""
+        return self.status in ("done", "failed")
+
+    @property
+    def succeeded(self) -> bool:
+        """Return True when the job completed without errors."""
+        return self.status == "done"
+
+    @property
+    def matches(self) -> List[str]:
+        """Return the SHA-256 of every sample matched by a search job."""
+        return [resource["sha256"] for resource in self.resources if resource.get("sha256")]
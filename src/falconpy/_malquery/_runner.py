@@ -0,0 +1,455 @@
+"""MalQuery job runner.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+import heapq
+import itertools
+import os
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Set, Tuple
+from ._job import MalQueryJob
+from .._constant import (
+    MALQUERY_DOWNLOAD_BATCH,
+    MALQUERY_DOWNLOAD_WORKERS,
+    MALQUERY_JOB_TIMEOUT,
+    MALQUERY_MAX_PENDING,
+    MALQUERY_MAX_POLL_INTERVAL,
+    MALQUERY_POLL_INTERVAL,
+    MALQUERY_WORKERS
+    )
+from .. import _endpoint
+from .._error import APIError
+from .._paginator import result_resources
+from .._payload import malquery_exact_search_payload, malquery_fuzzy_payload, malquery_hunt_payload
+
+# Operation submitting each kind of job, and the quota the job counts against.
+MALQUERY_JOB_KINDS: Dict[str, Tuple[str, Optional[str]]] = {
+    "hunt": ("PostMalQueryHuntV1", "hunt"),
+    "exact_search": ("PostMalQueryExactSearchV1", None),
+    "fuzzy_search": ("PostMalQueryFuzzySearchV1", None),
+    "download": ("PostMalQueryEntitiesSamplesMultidownloadV1", "download")
+    }
+
+
+def malquery_operation(operation_id: str) -> Any:
+    """Return a MalQuery operation record, loading the endpoint table on first access."""
+    return _endpoint.find_operation(getattr(_endpoint, "_malquery_endpoints"), operation_id)
+
+
+class MalQueryJobRunner:  # pylint: disable=R0902
+    """This class represents a runner for any number of MalQuery searches and sample downloads.
+
+    Jobs are submitted while fewer than max_pending requests are in progress and the hunt and
+    download quotas returned by get_quotas allow it. Every request in progress is checked by a
+    single scheduler, with the interval between checks of each request doubling (up to
+    max_poll_interval) while it remains in progress. When a destination is provided, the samples
+    matched by each search are requested in multi-download batches as soon as the search completes,
+    and each sample archive is streamed to disk.
+    """
+
+    # ____ ____ _  _ ____ ___ ____ _  _ ____ ___ ____ ____
+    # |    |  | |\ | [__   |  |__/ |  | |     |  |  | |__/
+    # |___ |__| | \| ___]  |  |  \ |__| |___  |  |__| |  \
+    #
+    def __init__(self,  # pylint: disable=R0913
+                 service: Any,
+                 destination: Optional[str] = None,
+                 max_pending: int = MALQUERY_MAX_PENDING,
+                 max_workers: int = MALQUERY_WORKERS,
+                 max_downloads: int = MALQUERY_DOWNLOAD_WORKERS,
+                 download_batch: int = MALQUERY_DOWNLOAD_BATCH,
+                 poll_interval: float = MALQUERY_POLL_INTERVAL,
+                 max_poll_interval: float = MALQUERY_MAX_POLL_INTERVAL,
+                 job_timeout: float = MALQUERY_JOB_TIMEOUT
+                 ):
+        """Construct an instance of the MalQueryJobRunner class.
+
+        Arguments
+        ----
+        service : MalQuery
+            MalQuery Service Class used to submit, check and download requests.
+
+        Keyword arguments
+        ----
+        destination : str
+            Directory sample archives are written to. Samples are not downloaded when not provided.
+        max_pending : int
+            Maximum number of requests in progress at the same time. [Default: 20]
+        max_workers : int
+            Number of requests submitted or checked concurrently. [Default: 8]
+        max_downloads : int
+            Number of sample archives downloaded concurrently. [Default: 4]
+        download_batch : int
+            Maximum number of samples requested in each multi-download. [Default: 100]
+        poll_interval : float
+            Seconds waited before the status of a request is first checked. [Default: 2]
+        max_poll_interval : float
+            Maximum seconds waited between checks of the status of a request. [Default: 30]
+        job_timeout : float
+            Seconds to wait for each request to complete. [Default: 3600]
+        """
+        self._service = service
+        self._destination: Optional[str] = os.path.abspath(destination) if destination else None
+        self._max_pending: int = max(1, max_pending)
+        self._max_workers: int = max(1, max_workers)
+        self._max_downloads: int = max(1, max_downloads)
+        self._download_batch: int = max(1, download_batch)
+        self._poll_interval: float = poll_interval
+        self._max_poll_interval: float = max_poll_interval
+        self._job_timeout: float = job_timeout
+        self._jobs: List[MalQueryJob] = []
+        # Jobs waiting to be submitted, and requests in progress ordered by when they are next checked.
+        self._waiting: Deque[MalQueryJob] = deque()
+        self._polling: List[Tuple[float, int, MalQueryJob, float]] = []
+        self._sequence = itertools.count()
+        self._started: Dict[int, float] = {}
+        self._requested: Set[str] = set()
+        self._pending: int = 0
+        # Jobs holding one of the max_pending request slots.
+        self._slots: Set[int] = set()
+        self._outstanding: int = 0
+        self._finished: "queue.Queue[MalQueryJob]" = queue.Queue()
+        # Remaining hunt and download quota, None when the quotas could not be retrieved.
+        self._quotas: Optional[Dict[str, int]] = None
+        self._condition = threading.Condition()
+        self._stop = threading.Event()
+        self._scheduler: Optional[threading.Thread] = None
+        self._workers: Optional[ThreadPoolExecutor] = None
+        self._downloads: Optional[ThreadPoolExecutor] = None
+        self._metrics: Dict[str, int] = {"submitted": 0, "polls": 0, "poll_errors": 0, "completed": 0, "failed": 0,
+                                         "quota_rejections": 0, "samples": 0, "archives": 0, "bytes": 0
+                                         }
+
+    # _  _ ____ ___ _  _ ____ ___  ____
+    # |\/| |___  |  |__| |  | |  \ [__
+    # |  | |___  |  |  | |__| |__/ ___]
+    #
+    def hunt(self, name: Optional[str] = None, body: Optional[Dict[str, Any]] = None, **kwargs) -> MalQueryJob:
+        """Submit a YARA hunt, accepting the same keywords as MalQuery.hunt."""
+        return self.submit(MalQueryJob(kind="hunt", name=name, body=body or malquery_hunt_payload(passed_keywords=kwargs)))
+
+    def exact_search(self, name: Optional[str] = None, body: Optional[Dict[str, Any]] = None, **kwargs) -> MalQueryJob:
+        """Submit an exact search, accepting the same keywords as MalQuery.exact_search."""
+        return self.submit(MalQueryJob(kind="exact_search", name=name,
+                                       body=body or malquery_exact_search_payload(passed_keywords=kwargs)
+                                       ))
+
+    def fuzzy_search(self, name: Optional[str] = None, body: Optional[Dict[str, Any]] = None, **kwargs) -> MalQueryJob:
+        """Submit a fuzzy search, accepting the same keywords as MalQuery.fuzzy_search."""
+        return self.submit(MalQueryJob(kind="fuzzy_search", name=name,
+                                       body=body or malquery_fuzzy_payload(passed_keywords=kwargs)
+                                       ))
+
+    def download(self, samples: List[str], name: Optional[str] = None) -> List[MalQueryJob]:
+        """Submit multi-downloads for samples, in batches of up to download_batch samples."""
+        samples = list(dict.fromkeys(samples))
+        return [self.submit(MalQueryJob(kind="download", name=name, samples=samples[position:position + self._download_batch]))
+                for position in range(0, len(samples), self._download_batch)
+                ]
+
+    def submit(self, job: MalQueryJob) -> MalQueryJob:
+        """Add a job to the runner, submitting it as soon as capacity and quota allow."""
+        if job.kind not in MALQUERY_JOB_KINDS:
+            raise ValueError(f"Unknown MalQuery job kind '{job.kind}'. Use one of {', '.join(MALQUERY_JOB_KINDS)}.")
+        with self._condition:
+            if job.kind == "download":
+                self._requested.update(job.samples)
+            job.status = "queued"
+            self._jobs.append(job)
+            self._waiting.append(job)
+            self._outstanding += 1
+            self._condition.notify_all()
+        self.start()
+
+        return job
+
+    def start(self) -> "MalQueryJobRunner":
+        """Retrieve the quotas available and start the scheduler."""
+        with self._condition:
+            if self._scheduler is not None:
+                return self
+            self._workers = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="falconpy-malquery")
+            self._downloads = ThreadPoolExecutor(max_workers=self._max_downloads,
+                                                 thread_name_prefix="falconpy-malquery-download"
+                                                 )
+            self._scheduler = threading.Thread(target=self._schedule, name="falconpy-malquery-scheduler", daemon=True)
+        self._load_quotas()
+        self._scheduler.start()
+
+        return self
+
+    def _load_quotas(self):
+        """Retrieve the hunt and download quotas remaining using get_quotas."""
+        try:
+            _, body = result_resources(self._service.get_quotas(), malquery_operation("GetMalQueryQuotasV1"))
+        except APIError:
+            return
+        meta = body.get("meta") or {}
+        with self._condition:
+            self._quotas = {quota: max(0, int(meta[f"{quota}_limit"]) - int(meta.get(f"{quota}_count", 0)))
+                            for quota in ("hunt", "download") if meta.get(f"{quota}_limit") is not None
+                            }
+
+    def _reserve(self, job: MalQueryJob) -> bool:
+        """Deduct the quota used by a job, returning False when the quota remaining is insufficient."""
+        quota = MALQUERY_JOB_KINDS[job.kind][1]
+        if self._quotas is None or quota not in self._quotas:
+            return True
+        required = len(job.samples) if quota == "download" else 1
+        if self._quotas[quota] < required:
+            return False
+        self._quotas[quota] -= required
+
+        return True
+
+    def _schedule(self):
+        """Submit waiting jobs and dispatch the checks of requests in progress as they become due."""
+        with self._condition:
+            while not self._stop.is_set():
+                while self._waiting and self._pending < self._max_pending:
+                    job = self._waiting.popleft()
+                    if not self._reserve(job):
+                        self._metrics["quota_rejections"] += 1
+                        self._finish(job, [{"code": 429, "message": f"The MalQuery {MALQUERY_JOB_KINDS[job.kind][1]} "
+                                                                    "quota has been exhausted."}])
+                        continue
+                    self._pending += 1
+                    self._slots.add(id(job))
+                    job.status = "submitting"
+                    self._workers.submit(self._run, self._submit, job)
+                now = time.monotonic()
+                while self._polling and self._polling[0][0] <= now:
+                    _, _, job, interval = heapq.heappop(self._polling)
+                    self._workers.submit(self._run, self._poll, job, interval)
+                self._condition.wait(self._polling[0][0] - now if self._polling else None)
+
+    def _run(self, work: Callable[..., None], job: MalQueryJob, *args):
+        """Perform work for a job, failing the job if the work raises an unexpected exception."""
+        try:
+            work(job, *args)
+        except Exception as failure:  # pylint: disable=W0718  # Failures are provided to the caller
+            self._release(job, [{"code": 500, "message": str(failure) or type(failure).__name__}])
+
+    def _submit(self, job: MalQueryJob):
+        """Submit the request for a job."""
+        operation_id = MALQUERY_JOB_KINDS[job.kind][0]
+        self._started[id(job)] = time.monotonic()
+        try:
+            if job.kind == "download":
+                result = self._service.samples_multidownload(samples=job.samples)
+            else:
+                result = getattr(self._service, job.kind)(body=job.body)
+            resources, body = result_resources(result, malquery_operation(operation_id))
+        except APIError as error:
+            self._release(job, [{"code": error.code, "message": error.message}])
+            return
+        meta = body.get("meta") or {}
+        job.request_id = meta.get("reqid")
+        with self._condition:
+            self._metrics["submitted"] += 1
+        if job.kind == "fuzzy_search" or not job.request_id or meta.get("status") == "done":
+            # Fuzzy searches return their results immediately.
+            self._complete(job, resources)
+        else:
+            job.status = "running"
+            self._reschedule(job, self._poll_interval)
+
+    def _reschedule(self, job: MalQueryJob, interval: float):
+        """Check the status of a request again once the interval has passed."""
+        with self._condition:
+            heapq.heappush(self._polling, (time.monotonic() + interval, next(self._sequence), job, interval))
+            self._condition.notify_all()
+
+    def _poll(self, job: MalQueryJob, interval: float):
+        """Check the status of the request for a job."""
+        job.polls += 1
+        status, resources, body = "inprogress", [], {}
+        try:
+            resources, body = result_resources(self._service.get_request(ids=job.request_id),
+                                               malquery_operation("GetMalQueryRequestV1")
+                                               )
+            status = (body.get("meta") or {}).get("status", "inprogress")
+            metric = "polls"
+        except APIError:
+            metric = "poll_errors"
+        with self._condition:
+            self._metrics[metric] += 1
+        if status == "done":
+            self._complete(job, resources)
+        elif status == "failed":
+            self._release(job, body.get("errors") or [{"code": 500, "message": "The MalQuery request failed."}])
+        elif time.monotonic() - self._started[id(job)] >= self._job_timeout:
+            self._release(job, [{"code": 408, "message": "The MalQuery request did not complete before the timeout."}])
+        else:
+            # Requests that remain in progress are checked less often.
+            self._reschedule(job, min(interval * 2, self._max_poll_interval))
+
+    def _complete(self, job: MalQueryJob, resources: List[Dict[str, Any]]):
+        """Process the results of a completed request."""
+        if job.kind == "download":
+            self._free(job)
+            job.status = "downloading"
+            self._downloads.submit(self._run, self._fetch, job)
+            return
+        job.resources = resources
+        if self._destination:
+            with self._condition:
+                # Samples already requested by another job are not downloaded again.
+                samples = [sha256 for sha256 in dict.fromkeys(job.matches) if sha256 not in self._requested]
+                self._requested.update(samples)
+            job.downloads = self.download(samples, name=job.name) if samples else []
+        self._release(job)
+
+    def _fetch(self, job: MalQueryJob):
+        """Stream the sample archive of a completed multi-download to disk."""
+        os.makedirs(self._destination, exist_ok=True)
+        target = os.path.join(self._destination, f"{job.request_id}.zip")
+        try:
+            downloads, _ = result_resources(self._service.get_samples(ids=job.request_id, stream=True, target=target,
+                                                                      hash_algorithm="sha256"
+                                                                      ),
+                                            malquery_operation("GetMalQueryEntitiesSamplesFetchV1")
+                                            )
+        except APIError as error:
+            self._finish(job, [{"code": error.code, "message": error.message}])
+            return
+        if downloads and "bytes_written" in downloads[0]:
+            job.path = target
+            job.bytes_written = downloads[0]["bytes_written"]
+            job.sha256 = downloads[0].get("sha256")
+            with self._condition:
+                self._metrics["samples"] += len(job.samples)
+                self._metrics["archives"] += 1
+                self._metrics["bytes"] += job.bytes_written
+            self._finish(job)
+        else:
+            self._finish(job, [{"code": 500, "message": "The sample archive was not returned."}])
+
+    def _release(self, job: MalQueryJob, errors: Optional[List[Dict[str, Any]]] = None):
+        """Finish a job whose request is no longer in progress, allowing another to be submitted."""
+        with self._condition:
+            self._free(job)
+            self._finish(job, errors)
+
+    def _free(self, job: MalQueryJob):
+        """Release the request slot held by a job, if it holds one."""
+        with self._condition:
+            if id(job) in self._slots:
+                self._slots.discard(id(job))
+                self._pending -= 1
+                self._condition.notify_all()
+
+    def _finish(self, job: MalQueryJob, errors: Optional[List[Dict[str, Any]]] = None):
+        """Record the outcome of a job and provide it to the caller."""
+        with self._condition:
+            if job.finished:
+                return
+            job.errors = errors or []
+            job.status = "failed" if errors else "done"
+            job.elapsed = time.monotonic() - self._started.pop(id(job), time.monotonic())
+            self._metrics["failed" if errors else "completed"] += 1
+            self._outstanding -= 1
+            self._finished.put(job)
+            self._condition.notify_all()
+
+    def as_completed(self) -> Iterator[MalQueryJob]:
+        """Yield every job as it finishes, including the download jobs created for search results."""
+        self.start()
+        while not self._stop.is_set():
+            with self._condition:
+                if not self._outstanding and self._finished.empty():
+                    return
+            try:
+                yield self._finished.get(timeout=0.1)
+            except queue.Empty:
+                continue
+
+    def wait(self) -> List[MalQueryJob]:
+        """Wait for every job to finish, returning every job submitted."""
+        for _ in self.as_completed():
+            pass
+
+        return self.jobs
+
+    def close(self):
+        """Stop the scheduler. Requests in progress are no longer checked."""
+        self._stop.set()
+        with self._condition:
+            self._condition.notify_all()
+        if self._scheduler is not None:
+            self._scheduler.join()
+            self._workers.shutdown(wait=True)
+            self._downloads.shutdown(wait=True)
+
+    def __enter__(self) -> "MalQueryJobRunner":
+        """Start the runner when used as a context manager."""
+        return self.start()
+
+    def __exit__(self, *args):
+        """Close the runner when leaving the context."""
+        self.close()
+
+    # ___  ____ ____ ___  ____ ____ ___ _ ____ ____
+    # |__] |__/ |  | |__] |___ |__/  |  | |___ [__
+    # |    |  \ |__| |    |___ |  \  |  | |___ ___]
+    #
+    @property
+    def jobs(self) -> List[MalQueryJob]:
+        """Return every job submitted, in the order submitted."""
+        with self._condition:
+            return list(self._jobs)
+
+    @property
+    def pending(self) -> int:
+        """Return the number of requests in progress."""
+        with self._condition:
+            return self._pending
+
+    @property
+    def quotas(self) -> Optional[Dict[str, int]]:
+        """Return the hunt and download quota remaining, or None if the quotas could not be retrieved."""
+        with self._condition:
+            return dict(self._quotas) if self._quotas is not None else None
+
+    @property
+    def metrics(self) -> Dict[str, int]:
+        """Return the runner metrics."""
+        with self._condition:
+            return dict(self._metrics)
@@ -0,0 +1,201 @@
+"""Query-then-hydrate pipeline.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Deque, Iterable, Iterator, List, Optional, Set
+from ._paginator import result_resources
+from .._constant import DEFAULT_ID_BATCH_SIZE, DEFAULT_POOL_MAXSIZE, ID_KEYWORDS
+from .._endpoint import Operation
+
+
+class Hydrator:
+    """This class represents a query-then-hydrate pipeline.
+
+    IDs are read from the query side (typically a Paginator) as they are needed, grouped
+    into batches no larger than the detail operation accepts, and the details for each
+    batch are retrieved concurrently. The number of requests in flight is bounded, so
+    memory use does not grow with the size of the query result.
+    """
+
+    # ____ ____ _  _ ____ ___ ____ _  _ ____ ___ ____ ____
+    # |    |  | |\ | [__   |  |__/ |  | |     |  |  | |__/
+    # |___ |__| | \| ___]  |  |  \ |__| |___  |  |__| |  \
+    #
+    def __init__(self,
+                 ids: Iterable[str],
+                 call: Callable[..., Any],
+                 operation: Operation,
+                 batch_size: Optional[int] = None,
+                 max_workers: Optional[int] = None,
+                 ordered: bool = True,
+                 id_keyword: Optional[str] = None,
+                 **kwargs
+                 ):
+        """Construct an instance of the Hydrator class.
+
+        Arguments
+        ----
+        ids : Iterable
+            IDs to retrieve details for, such as a Paginator for a query operation.
+        call : Callable
+            Method performing the detail operation, called with the IDs keyword.
+        operation : Operation
+            Operation index record for the detail operation.
+
+        Keyword arguments
+        ----
+        batch_size : int
+            Number of IDs to send per request. [Default: the documented operation limit, or 100]
+        max_workers : int
+            Maximum number of detail requests in flight. [Default: 10]
+        ordered : bool
+            Return details in the order the IDs were received. When disabled, batches
+            are returned as soon as they complete. [Default: True]
+        id_keyword : str
+            Keyword the detail operation accepts IDs with. [Default: the keyword listed
+            for the operation in ID_KEYWORDS, or ids]
+        All other keywords are provided to the detail operation for every batch.
+        """
+        self._ids: Iterable[str] = ids
+        self._call: Callable[..., Any] = call
+        self._operation: Operation = operation
+        self._batch_size: int = DEFAULT_ID_BATCH_SIZE
+        if isinstance(operation.batch_size, int) and operation.batch_size > 0:
+            self._batch_size = operation.batch_size
+        if isinstance(batch_size, int) and batch_size > 0:
+            self._batch_size = batch_size
+        self._max_workers: int = DEFAULT_POOL_MAXSIZE
+        if isinstance(max_workers, int) and max_workers > 0:
+            self._max_workers = max_workers
+        self._ordered: bool = bool(ordered)
+        self._id_keyword: str = id_keyword or ID_KEYWORDS.get(operation.operation_id, "ids")
+        self._kwargs = kwargs
+        self._requests: int = 0
+
+    # _  _ ____ ___ _  _ ____ ___  ____
+    # |\/| |___  |  |__| |  | |  \ [__
+    # |  | |___  |  |  | |__| |__/ ___]
+    #
+    def _batches(self) -> Iterator[List[str]]:
+        """Group the incoming IDs into batches."""
+        batch: List[str] = []
+        for item in self._ids:
+            batch.append(item)
+            if len(batch) >= self._batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def _fetch(self, ids: List[str]) -> List[Any]:
+        """Retrieve the details for a batch of IDs."""
+        resources, _ = result_resources(self._call(**{self._id_keyword: ids}, **self._kwargs), self._operation)
+
+        return resources
+
+    def batches(self) -> Iterator[List[Any]]:
+        """Yield the details retrieved for each batch of IDs."""
+        executor = ThreadPoolExecutor(max_workers=self._max_workers)
+        pending: Deque[Future] = deque()
+        running: Set[Future] = set()
+        try:
+            for batch in self._batches():
+                if len(pending) >= self._max_workers:
+                    yield from self._completed(pending, running)
+                future = executor.submit(self._fetch, batch)
+                self._requests += 1
+                pending.append(future)
+                running.add(future)
+            while pending:
+                yield from self._completed(pending, running)
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    def _completed(self, pending: Deque[Future], running: Set[Future]) -> Iterator[List[Any]]:
+        """Wait for a request slot, yielding the batches that complete."""
+        if self._ordered:
+            future = pending.popleft()
+            running.discard(future)
+            yield future.result()
+        else:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                pending.remove(future)
+                running.discard(future)
+                yield future.result()
+
+    def __iter__(self) -> Iterator[Any]:
+        """Yield the details for every ID."""
+        for batch in self.batches():
+            yield from batch
+
+    # ___  ____ ____ ___  ____ ____ ___ _ ____ ____
+    # |__] |__/ |  | |__] |___ |__/  |  | |___ [__
+    # |    |  \ |__| |    |___ |  \  |  | |___ ___]
+    #
+    @property
+    def operation(self) -> Operation:
+        """Return the detail operation."""
+        return self._operation
+
+    @property
+    def id_keyword(self) -> str:
+        """Return the keyword the detail operation is provided IDs with."""
+        return self._id_keyword
+
+    @property
+    def batch_size(self) -> int:
+        """Return the number of IDs sent per request."""
+        return self._batch_size
+
+    @property
+    def max_workers(self) -> int:
+        """Return the maximum number of requests in flight."""
+        return self._max_workers
+
+    @property
+    def ordered(self) -> bool:
+        """Return a boolean indicating if details are returned in query order."""
+        return self._ordered
+
+    @property
+    def request_count(self) -> int:
+        """Return the number of detail requests submitted so far."""
+        return self._requests
@@ -0,0 +1,232 @@
+"""Pagination iterator.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+import sys
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+from .._endpoint import Operation, operation_index
+from .._error import APIError, InvalidOperation
+from .._result import Result
+
+
+def result_resources(result: Any, operation: Operation) -> Tuple[List[Any], Dict[str, Any]]:
+    """Return the resources and body of an operation result, raising an APIError for failed requests."""
+    if isinstance(result, Result):
+        result = result.full_return
+    if not isinstance(result, dict) or not isinstance(result.get("body"), dict):
+        raise APIError(message=f"Unable to retrieve resources from the {operation.operation_id} operation.")
+    body = result["body"]
+    if result.get("status_code", 0) >= 400:
+        errors = body.get("errors") or [{}]
+        raise APIError(result["status_code"], errors[0].get("message"), result.get("headers"))
+    resources = body.get("resources")
+    if resources is None:
+        resources = []
+    elif not isinstance(resources, list):
+        resources = [resources]
+
+    return resources, body
+
+
+class Paginator:
+    """This class represents an iterator over every result returned by a paginated API operation.
+
+    The pagination style (after token, scroll token or record offset) is taken from the
+    operation index. Only the current page, and the next page when prefetching, are held
+    in memory at any time.
+    """
+
+    # ____ ____ _  _ ____ ___ ____ _  _ ____ ___ ____ ____
+    # |    |  | |\ | [__   |  |__/ |  | |     |  |  | |__/
+    # |___ |__| | \| ___]  |  |  \ |__| |___  |  |__| |  \
+    #
+    def __init__(self,
+                 call: Callable[..., Any],
+                 operation: Operation,
+                 prefetch: bool = False,
+                 **kwargs
+                 ):
+        """Construct an instance of the Paginator class.
+
+        Arguments
+        ----
+        call : Callable
+            Method performing the operation, called with the provided keywords
+            and the pagination keyword for the requested page.
+        operation : Operation
+            Operation index record for the operation being paginated.
+
+        Keyword arguments
+        ----
+        prefetch : bool
+            Retrieve the next page on a background thread while the
+            current page is being processed. [Default: False]
+        All other keywords are provided to the operation on every request.
+        """
+        self._call: Callable[..., Any] = call
+        self._operation: Operation = operation
+        self._prefetch: bool = bool(prefetch)
+        self._kwargs: Dict[str, Any] = kwargs
+        self._retrieved: int = 0
+        self._pages: int = 0
+        self._total: Optional[int] = None
+
+    # _  _ ____ ___ _  _ ____ ___  ____
+    # |\/| |___  |  |__| |  | |  \ [__
+    # |  | |___  |  |  | |__| |__/ ___]
+    #
+    def _request(self, page: Dict[str, Any]) -> Any:
+        """Perform the operation for the requested page."""
+        return self._call(**{**self._kwargs, **page})
+
+    def _process(self, result: Any, page: Dict[str, Any]) -> Tuple[List[Any], Optional[Dict[str, Any]]]:
+        """Extract the resources from a page and determine the keywords for the following page."""
+        resources, body = result_resources(result, self._operation)
+        if not isinstance(body.get("resources"), (list, type(None))):
+            # Single objects are returned as one item and are never paginated.
+            return resources, None
+        pagination = (body.get("meta") or {}).get("pagination") or {}
+        self._pages += 1
+        self._retrieved += len(resources)
+        if isinstance(pagination.get("total"), int):
+            self._total = pagination["total"]
+
+        return resources, self._following(page, resources, pagination)
+
+    def _following(self, page: Dict[str, Any], resources: List[Any], pagination: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Return the keywords for the page after this one, or None if this is the last page."""
+        returned = None
+        style = self._operation.pagination
+        if style == "after":
+            token = pagination.get("after")
+            if resources and token and token != page.get("after"):
+                returned = {"after": token}
+        elif style in ("offset", "scroll") and resources:
+            token = pagination.get("offset")
+            if style == "scroll" and isinstance(token, str) and token and token != page.get("offset"):
+                # Scroll tokens are opaque, the total is the only reliable end of results marker.
+                if self._total is None or self._retrieved < self._total:
+                    returned = {"offset": token}
+            else:
+                position = int(page.get("offset", self._kwargs.get("offset")) or 0) + len(resources)
+                if self._total is None or position < self._total:
+                    returned = {"offset": position}
+
+        return returned
+
+    def pages(self) -> Iterator[List[Any]]:
+        """Yield each page of resources returned by the operation."""
+        executor = ThreadPoolExecutor(max_workers=1) if self._prefetch else None
+        try:
+            page: Optional[Dict[str, Any]] = {}
+            pending: Optional[Future] = None
+            while page is not None:
+                result = pending.result() if pending else self._request(page)
+                resources, page = self._process(result, page)
+                pending = executor.submit(self._request, page) if executor and page is not None else None
+                if resources:
+                    yield resources
+        finally:
+            if executor:
+                executor.shutdown(wait=True)
+
+    def __iter__(self) -> Iterator[Any]:
+        """Yield each resource returned by the operation, retrieving pages as they are required."""
+        for page in self.pages():
+            yield from page
+
+    # ___  ____ ____ ___  ____ ____ ___ _ ____ ____
+    # |__] |__/ |  | |__] |___ |__/  |  | |___ [__
+    # |    |  \ |__| |    |___ |  \  |  | |___ ___]
+    #
+    @property
+    def operation(self) -> Operation:
+        """Return the operation being paginated."""
+        return self._operation
+
+    @property
+    def style(self) -> Optional[str]:
+        """Return the pagination style used by the operation."""
+        return self._operation.pagination
+
+    @property
+    def total(self) -> Optional[int]:
+        """Return the total number of results reported by the API, if available."""
+        return self._total
+
+    @property
+    def retrieved(self) -> int:
+        """Return the number of resources retrieved so far."""
+        return self._retrieved
+
+    @property
+    def page_count(self) -> int:
+        """Return the number of pages retrieved so far."""
+        return self._pages
+
+
+def service_operation(service: object, operation: Union[str, Callable]) -> Tuple[Callable, Operation]:
+    """Return the bound method and operation index record for a Service Class operation.
+
+    The operation may be provided as the method itself, the method name or the operation ID.
+    """
+    name = operation if isinstance(operation, str) else getattr(operation, "__name__", None)
+    method = getattr(service, name, None) if name else None
+    # Service Class modules import the endpoint table for their collection as Endpoints.
+    index = operation_index(getattr(sys.modules.get(type(service).__module__), "Endpoints", []))
+    found = index.get(name)
+    if not found and method is not None:
+        # Methods are aliased to their operation ID within the Service Class.
+        for attribute, value in vars(type(service)).items():
+            if attribute in index and value is getattr(method, "__func__", None):
+                found = index[attribute]
+                break
+    if not found:
+        raise InvalidOperation
+
+    return method, found
+
+
+def service_paginator(service: object,
+                      operation: Union[str, Callable],
+                      prefetch: bool = False,
+                      **kwargs
+                      ) -> Paginator:
+    """Create a paginator for a Service Class method."""
+    method, found = service_operation(service, operation)
+
+    return Paginator(method, found, prefetch, **kwargs)
@@ -42,6 +42,8 @@ from ._response_component import ResponseComponent
 class BaseResource(ResponseComponent):
     """The base class for different resource types we can have within an API response."""
 
+    __slots__ = ("_pos",)
+
     #  _______  _____  __   _ _______ _______  ______ _     _ _______ _______  _____   ______
     #  |       |     | | \  | |______    |    |_____/ |     | |          |    |     | |_____/
     #  |_____  |_____| |  \_| ______|    |    |    \_ |_____| |_____     |    |_____| |    \_
@@ -95,8 +97,10 @@ class BaseResource(ResponseComponent):
     #  |_____] |_____/ |     | |_____] |______ |_____/    |      |   |______ |______
     #  |       |    \_ |_____| |       |______ |    \_    |    __|__ |______ ______|
     #
-    # Properties within a resource object are immutable once they are created.
+    # Properties within a resource object are not copied when they are accessed,
+    # so that iterating and indexing large results remains linear. Use copy()
+    # to retrieve a list that can be safely modified.
     @property
     def data(self) -> List[Optional[Union[str, int, float, dict]]]:
         """Return the contents of the underlying _data attribute."""
-        return list(self._data)
+        return self._data
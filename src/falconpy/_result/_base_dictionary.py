@@ -51,6 +51,8 @@ class UnsupportedPythonVersion(Exception):
 class BaseDictionary(ResponseComponent):
     """This class represents a dictionary component of an API response."""
 
+    __slots__ = ()
+
     #  _______ _______ _______ _     _  _____  ______  _______
     #  |  |  | |______    |    |_____| |     | |     \ |______
     #  |  |  | |______    |    |     | |_____| |_____/ ______|
@@ -108,5 +110,8 @@ class BaseDictionary(ResponseComponent):
                                       Dict[str, Union[str, dict, list]],
                                       List[Union[str, int, dict]]
                                       ]]:
-        """Return the contents of the _data attribute as a dictionary."""
-        return dict(self._data)
+        """Return the contents of the _data attribute as a dictionary.
+
+        The dictionary is not copied, use copy() to retrieve a dictionary that can be safely modified.
+        """
+        return self._data
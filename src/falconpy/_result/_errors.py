@@ -40,3 +40,5 @@ from .__base_resource import BaseResource
 
 class Errors(BaseResource):
     """This class represents the errors list within an API response."""
+
+    __slots__ = ()
@@ -42,6 +42,8 @@ from ._base_dictionary import BaseDictionary
 class Headers(BaseDictionary):
     """This class represents the headers of an API response."""
 
+    __slots__ = ()
+
     @property
     def content_encoding(self) -> Optional[str]:
         """Return the contents of the Content-Encoding key."""
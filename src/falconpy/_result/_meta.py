@@ -42,6 +42,8 @@ from ._base_dictionary import BaseDictionary
 class Meta(BaseDictionary):
     """Class to represent the metadata API response within a result."""
 
+    __slots__ = ()
+
     @property
     def pagination(self) -> Dict[str, Union[int, str, float]]:
         """Return the contents of the pagination branch."""
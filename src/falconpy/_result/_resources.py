@@ -43,6 +43,8 @@ from ._base_dictionary import BaseDictionary
 class Resources(BaseResource):
     """This class represents the resources branch of an API response."""
 
+    __slots__ = ()
+
     def contains(self, substr) -> list:
         """Search filter."""
         # May move this to __contains__
@@ -57,6 +59,8 @@ class Resources(BaseResource):
 class BinaryFile(ResponseComponent):
     """A binary file resource."""
 
+    __slots__ = ()
+
     def __bytes__(self):
         """Return the object in bytes."""
         return bytes(self._data)
@@ -64,3 +68,5 @@ class BinaryFile(ResponseComponent):
 
 class RawBody(BaseDictionary):
     """Class to represent a raw payload that does not match standard formatting."""
+
+    __slots__ = ()
@@ -41,6 +41,9 @@ from typing import Union, Optional
 class ResponseComponent:
     """Base class for all response object derivatives."""
 
+    # Response components are created for every result, avoid a per-instance dictionary.
+    __slots__ = ("_data",)
+
     #  _______  _____  __   _ _______ _______  ______ _     _ _______ _______  _____   ______
     #  |       |     | | \  | |______    |    |_____/ |     | |          |    |     | |_____/
     #  |_____  |_____| |  \_| ______|    |    |    \_ |_____| |_____     |    |_____| |    \_
@@ -78,6 +81,18 @@ class ResponseComponent:
 
         return _returned
 
+    def copy(self) -> Optional[Union[dict, bytes, list, str, int, float]]:
+        """Return a shallow copy of the underlying data attribute.
+
+        The data property returns a reference to the underlying data, use this
+        method when a copy that can be safely modified is required.
+        """
+        _returned = self._data
+        if isinstance(self._data, (dict, list)):
+            _returned = self._data.copy()
+
+        return _returned
+
     #   _____   ______  _____   _____  _______  ______ _______ _____ _______ _______
     #  |_____] |_____/ |     | |_____] |______ |_____/    |      |   |______ |______
     #  |       |    \_ |_____| |       |______ |    \_    |    __|__ |______ ______|
@@ -55,84 +55,111 @@ class BaseResult:
                  headers: Optional[Dict[str, Union[str, int, float]]] = None,
                  body: Optional[Dict[str, Union[str, dict, list, int, float, bytes]]] = None
                  ):
-        """Construct an instance of the class."""
+        """Construct an instance of the class.
+
+        Response components (headers, meta, errors, resources and raw) are not
+        created here, each one is parsed from the received response the first
+        time it is accessed.
+        """
         self._pos: int = 0
 
         # Configure defaults
         self.status_code = status_code  # Will default to 0
-        self.headers = Headers()
-        self.meta = Meta()
-        self.resources = Resources([])
-        self.errors = Errors()
-        self.raw = RawBody()
-        # RTR Batch session init and batch responses only
-        self.batch_id = None
-        self.batch_get_cmd_req_id = None
+        self._headers_rcv: Optional[Dict[str, Union[str, int, float]]] = None
+        self._body_rcv: Optional[Dict[str, Union[str, dict, list, int, float, bytes]]] = None
+        self._layout: Optional[Dict[str, Tuple[type, Union[dict, list, str, bytes]]]] = None
+        self._components: Dict[str, ResponseComponent] = {}
 
         if status_code and headers and body:
-            self.status_code = status_code
-            _headers = headers
-            if isinstance(_headers, CaseInsensitiveDict):
-                _headers = dict(headers)
-            self.headers = Headers(_headers)
-            self._parse_body(body_rcv=body)
-
-    def _parse_body(self, body_rcv: Dict[str, Union[str, dict, list, int, float, bytes]]):
+            self._headers_rcv = headers
+            self._body_rcv = body
+
+    @staticmethod
+    def _parse_body(body_rcv: Dict[str, Union[str, dict, list, int, float, bytes]]
+                    ) -> Dict[str, Tuple[type, Union[dict, list, str, bytes]]]:
+        """Determine the component type and content for each branch of the received body.
+
+        Returns a dictionary of component name to (component class, content). Components
+        not present in the dictionary are empty.
+        """
+        layout = {}
         if isinstance(body_rcv, list):
             # Specific to report_executions_download_get returning raw
             # JSON payloads as a list. There will be no Meta or Errors
             # branch in this response.
-            self.resources = Resources(body_rcv)  # pragma: no cover
+            layout["resources"] = (Resources, body_rcv)  # pragma: no cover
         elif isinstance(body_rcv, bytes):
             # Binary response
-            self.resources = BinaryFile(body_rcv)
-            self.meta = Meta()
-            self.errors = Errors()
+            layout["resources"] = (BinaryFile, body_rcv)
         elif isinstance(body_rcv, str):
             # Invalid or raw response
             if not body_rcv.strip():
                 body_rcv = {}
-            self.raw = RawBody(body_rcv)
-            self.meta = Meta()
-            self.resources = Resources()
-            self.errors = Errors()
+            layout["raw"] = (RawBody, body_rcv)
         elif body_rcv.get("access_token", None):
             # Authentication response
-            self.raw = RawBody(body_rcv)
-            self.meta = Meta()
-            self.resources = Resources()
-            self.errors = Errors()
+            layout["raw"] = (RawBody, body_rcv)
         else:
             # Standard responses, GraphQL and RTR
-            self.meta = Meta(body_rcv.get("meta", {}))
-            self.errors = Errors(body_rcv.get("errors", []))
+            layout["meta"] = (Meta, body_rcv.get("meta", {}))
+            layout["errors"] = (Errors, body_rcv.get("errors", []))
             # RTR Batch responses
             if body_rcv.get("batch_id", {}):
                 # Batch session init returns as a dictionary
-                self.raw = RawBody(body_rcv)
-                self.batch_id = body_rcv.get("batch_id")
-                self.resources = ResponseComponent(body_rcv.get("resources"))
+                layout["raw"] = (RawBody, body_rcv)
+                layout["resources"] = (ResponseComponent, body_rcv.get("resources"))
             elif body_rcv.get("combined", {}):
                 # Batch session results return as a dictionary.
-                self.batch_get_cmd_req_id = body_rcv.get("batch_get_cmd_req_id", None)
-                self.raw = RawBody(body_rcv)
-                self.resources = ResponseComponent(body_rcv.get("combined"))
+                layout["raw"] = (RawBody, body_rcv)
+                layout["resources"] = (ResponseComponent, body_rcv.get("combined"))
             elif body_rcv.get("data", {}):  # pragma: no cover
                 # GraphQL uses a custom response payload. Due to
                 # environment constraints, this is manually tested.
-                self.raw = RawBody(body_rcv)
-                self.resources = ResponseComponent(body_rcv)
+                layout["raw"] = (RawBody, body_rcv)
+                layout["resources"] = (ResponseComponent, body_rcv)
             elif body_rcv.get("resources", None) is None:
                 # No resources, this must be a raw dictionary
                 # Probably came from the container API
-                self.raw = RawBody(body_rcv)
+                layout["raw"] = (RawBody, body_rcv)
             elif isinstance(body_rcv.get("resources", []), dict):
                 # Catch unusual response payloads not explicitly handled
-                self.raw = RawBody(body_rcv)
-                self.resources = ResponseComponent(body_rcv.get("resources"))
+                layout["raw"] = (RawBody, body_rcv)
+                layout["resources"] = (ResponseComponent, body_rcv.get("resources"))
             else:
                 # Standard API responses
-                self.resources = Resources(body_rcv.get("resources", []))
+                layout["resources"] = (Resources, body_rcv.get("resources", []))
+
+        return layout
+
+    def _component(self, name: str, default: type) -> ResponseComponent:
+        """Return the named response component, creating it on first access."""
+        _returned = self._components.get(name, None)
+        if _returned is None:
+            if name == "headers":
+                _headers = self._headers_rcv
+                if isinstance(_headers, CaseInsensitiveDict):
+                    _headers = dict(_headers)
+                _returned = default(_headers)
+            else:
+                _class, _content = self._body_layout.get(name, (default, None))
+                _returned = _class(_content)
+            self._components[name] = _returned
+
+        return _returned
+
+    @property
+    def _body_layout(self) -> Dict[str, Tuple[type, Union[dict, list, str, bytes]]]:
+        """Return the layout of the received body, determining it on first access."""
+        if self._layout is None:
+            self._layout = self._parse_body(self._body_rcv) if self._body_rcv else {}
+        return self._layout
+
+    def _received(self, key: str):
+        """Return a key from the received body for RTR batch responses."""
+        _returned = None
+        if "raw" in self._body_layout and isinstance(self._body_rcv, dict):
+            _returned = self._body_rcv.get(key, None)
+        return _returned
 
     # Iteration handlers
     def __iter__(self):
@@ -214,6 +241,69 @@ class BaseResult:
             "body": _body
         })
 
+    @property
+    def headers(self) -> Headers:
+        """Return the Headers object for this result."""
+        return self._component("headers", Headers)
+
+    @headers.setter
+    def headers(self, value: Headers):
+        """Set the Headers object for this result."""
+        self._components["headers"] = value
+
+    @property
+    def meta(self) -> Meta:
+        """Return the Meta object for this result."""
+        return self._component("meta", Meta)
+
+    @meta.setter
+    def meta(self, value: Meta):
+        """Set the Meta object for this result."""
+        self._components["meta"] = value
+
+    @property
+    def errors(self) -> Errors:
+        """Return the Errors object for this result."""
+        return self._component("errors", Errors)
+
+    @errors.setter
+    def errors(self, value: Errors):
+        """Set the Errors object for this result."""
+        self._components["errors"] = value
+
+    @property
+    def resources(self) -> Union[Resources, BinaryFile, ResponseComponent]:
+        """Return the Resources object for this result."""
+        return self._component("resources", Resources)
+
+    @resources.setter
+    def resources(self, value: Union[Resources, BinaryFile, ResponseComponent]):
+        """Set the Resources object for this result."""
+        self._components["resources"] = value
+
+    @property
+    def raw(self) -> RawBody:
+        """Return the RawBody object for this result."""
+        return self._component("raw", RawBody)
+
+    @raw.setter
+    def raw(self, value: RawBody):
+        """Set the RawBody object for this result."""
+        self._components["raw"] = value
+
+    @property
+    def batch_id(self) -> Optional[str]:
+        """Return the batch ID from RTR batch session init responses."""
+        return self._received("batch_id") or None
+
+    @property
+    def batch_get_cmd_req_id(self) -> Optional[str]:
+        """Return the batch get command request ID from RTR batch get responses."""
+        _returned = None
+        if not self._received("batch_id") and self._received("combined"):
+            _returned = self._received("batch_get_cmd_req_id")
+        return _returned
+
     @property
     def data(self) -> list:
         """Return the contents of the data property from the underlying Resources object."""
@@ -425,7 +515,10 @@ class Result(BaseResult):
                     _body["meta"] = _meta
                     _body["resources"] = _resources
                     _body["errors"] = _errors
-            if self.headers:
+            if "headers" not in self._components:
+                # Copy the received headers directly, skipping the Headers object.
+                _headers = dict(self._headers_rcv or {})
+            elif self.headers:
                 _headers = dict(self.headers.data)
             if "meta" in _body:
                 _body = dict(_body)
@@ -0,0 +1,362 @@
+"""Real Time Response batch orchestrator.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, Union
+from ._result import RTRFileResult, RTRHostResult
+from ._retrieval import RTRFileRetriever
+from ._session import RTRBatchSession, rtr_endpoints
+from .._constant import (
+    RTR_BATCH_REFRESH_INTERVAL,
+    RTR_BATCH_SIZE,
+    RTR_BATCH_WORKERS,
+    RTR_COMMAND_TIMEOUT,
+    RTR_DOWNLOAD_WORKERS,
+    RTR_MAX_POLL_INTERVAL,
+    RTR_MAX_SEQUENCES,
+    RTR_POLL_INTERVAL,
+    RTR_STATUS_WORKERS
+    )
+from .. import _endpoint
+from .._error import APIError
+from .._paginator import result_resources
+
+# Batch command and command status methods and operations used for each RTR permission level.
+RTR_COMMAND_LEVELS: Dict[str, Tuple[str, str, str, str]] = {
+    "read_only": ("batch_command", "BatchCmd", "check_command_status", "RTR_CheckCommandStatus"),
+    "active_responder": ("batch_active_responder_command", "BatchActiveResponderCmd",
+                         "check_active_responder_command_status", "RTR_CheckActiveResponderCommandStatus"
+                         ),
+    "admin": ("batch_admin_command", "BatchAdminCmd", "check_admin_command_status", "RTR_CheckAdminCommandStatus")
+    }
+
+
+class RTRBatchOrchestrator:  # pylint: disable=R0902
+    """This class represents a Real Time Response command runner for any number of hosts.
+
+    Hosts are divided into shards, each held by an RTR batch session that is kept alive in the
+    background using batch_refresh_sessions. Commands are run on every shard concurrently, the
+    status of pending commands is checked with an adaptive backoff, and the result of each host
+    is provided as soon as it completes.
+    """
+
+    # ____ ____ _  _ ____ ___ ____ _  _ ____ ___ ____ ____
+    # |    |  | |\ | [__   |  |__/ |  | |     |  |  | |__/
+    # |___ |__| | \| ___]  |  |  \ |__| |___  |  |__| |  \
+    #
+    def __init__(self,
+                 service: Any,
+                 host_ids: List[str],
+                 batch_size: int = RTR_BATCH_SIZE,
+                 max_workers: int = RTR_BATCH_WORKERS,
+                 refresh_interval: float = RTR_BATCH_REFRESH_INTERVAL,
+                 queue_offline: bool = False,
+                 poll_interval: float = RTR_POLL_INTERVAL,
+                 max_poll_interval: float = RTR_MAX_POLL_INTERVAL,
+                 status_workers: int = RTR_STATUS_WORKERS
+                 ):
+        """Construct an instance of the RTRBatchOrchestrator class.
+
+        Arguments
+        ----
+        service : RealTimeResponse
+            Real Time Response Service Class used to initialize, refresh and run batch sessions.
+        host_ids : list
+            Host IDs commands are run on. Duplicate IDs are ignored.
+
+        Keyword arguments
+        ----
+        batch_size : int
+            Maximum number of hosts in each batch session. [Default: 1000]
+        max_workers : int
+            Number of batch sessions worked with concurrently. [Default: 8]
+        refresh_interval : float
+            Seconds between refreshes of every batch session. [Default: 300]
+        queue_offline : bool
+            Queue sessions for hosts that are offline. [Default: False]
+        poll_interval : float
+            Seconds waited before the status of pending commands is first checked. [Default: 1]
+        max_poll_interval : float
+            Maximum seconds waited between checks of the status of pending commands. [Default: 15]
+        status_workers : int
+            Maximum number of command status checks in progress at the same time within each
+            batch session. [Default: 16]
+        """
+        self._service = service
+        self._admin: Optional[Any] = None
+        host_ids = list(dict.fromkeys(host_ids))
+        size = max(1, batch_size)
+        self._shards: List[RTRBatchSession] = [
+            RTRBatchSession(shard, host_ids[position:position + size])
+            for shard, position in enumerate(range(0, len(host_ids), size))
+            ]
+        self._max_workers: int = max(1, min(max_workers, len(self._shards)))
+        self._refresh_interval: float = refresh_interval
+        self._queue_offline: bool = queue_offline
+        self._poll_interval: float = poll_interval
+        self._max_poll_interval: float = max_poll_interval
+        self._status_workers: int = max(1, status_workers)
+        self._stop = threading.Event()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._retrievers: List[RTRFileRetriever] = []
+
+    # _  _ ____ ___ _  _ ____ ___  ____
+    # |\/| |___  |  |__| |  | |  \ [__
+    # |  | |___  |  |  | |__| |__/ ___]
+    #
+    def start(self) -> "RTRBatchOrchestrator":
+        """Initialize every batch session concurrently and begin refreshing them in the background."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self._max_workers + 1,
+                                                thread_name_prefix="falconpy-rtr-batch"
+                                                )
+            list(self._executor.map(lambda shard: shard.initialize(self._service, queue_offline=self._queue_offline),
+                                    self._shards
+                                    ))
+            self._executor.submit(self._refresh)
+
+        return self
+
+    def _refresh(self):
+        """Refresh every batch session on schedule until the orchestrator is closed."""
+        while not self._stop.wait(self._refresh_interval):
+            for shard in self._shards:
+                if self._stop.is_set():
+                    break
+                shard.refresh(self._service)
+
+    def _level(self, level: str) -> Tuple[Callable[..., Dict[str, Any]], Callable[[str], List[Dict[str, Any]]]]:
+        """Return the callables sending a batch command and checking its status on a host for a permission level."""
+        if level not in RTR_COMMAND_LEVELS:
+            raise ValueError(f"Unknown RTR permission level '{level}'. Use one of {', '.join(RTR_COMMAND_LEVELS)}.")
+        command_method, command_id, status_method, status_id = RTR_COMMAND_LEVELS[level]
+        service, endpoints = self._service, rtr_endpoints()
+        if level == "admin":
+            if self._admin is None:
+                # Admin commands are provided by a separate Service Class sharing the same authentication.
+                from ..real_time_response_admin import RealTimeResponseAdmin  # pylint: disable=C0415
+                self._admin = RealTimeResponseAdmin(auth_object=self._service)
+            service, endpoints = self._admin, rtr_endpoints(admin=True)
+        command_call, status_call = getattr(service, command_method), getattr(service, status_method)
+        command_operation = _endpoint.find_operation(endpoints, command_id)
+        status_operation = _endpoint.find_operation(endpoints, status_id)
+
+        def command(**kwargs) -> Dict[str, Any]:
+            return result_resources(command_call(**kwargs), command_operation)[1]
+
+        def sequence(task_id: str, sequence_id: int) -> List[Dict[str, Any]]:
+            return result_resources(status_call(cloud_request_id=task_id, sequence_id=sequence_id), status_operation)[0]
+
+        def status(task_id: str) -> List[Dict[str, Any]]:
+            resources = sequence(task_id, 0)
+            if not resources or not resources[0].get("complete"):
+                return resources
+            # Command responses are chunked across sequences, retrieved until one is empty.
+            response = dict(resources[0])
+            for sequence_id in range(1, RTR_MAX_SEQUENCES):
+                try:
+                    chunk = sequence(task_id, sequence_id)
+                except APIError as error:
+                    if error.code == 404:
+                        break
+                    raise
+                if not chunk or not (chunk[0].get("stdout") or chunk[0].get("stderr")):
+                    break
+                for stream in ("stdout", "stderr"):
+                    response[stream] = (response.get(stream) or "") + (chunk[0].get(stream) or "")
+
+            return [response]
+
+        return command, status
+
+    def run(self,
+            command_string: str,
+            base_command: Optional[str] = None,
+            level: str = "read_only",
+            command_timeout: float = RTR_COMMAND_TIMEOUT,
+            **kwargs
+            ) -> Iterator[RTRHostResult]:
+        """Run a command on every host, yielding the result of each host as it completes.
+
+        Arguments
+        ----
+        command_string : str
+            Full command string, for example `ls C:/Windows`.
+
+        Keyword arguments
+        ----
+        base_command : str
+            Command type. [Default: the first word of the command string]
+        level : str
+            RTR permission level of the command, read_only, active_responder or admin. [Default: read_only]
+        command_timeout : float
+            Seconds to wait for every host to complete the command. [Default: 600]
+
+        Additional keywords (such as timeout, host_timeout_duration and persist_all) are
+        provided to the batch command operation.
+        """
+        command, status = self._level(level)
+        self.start()
+        kwargs["command_string"] = command_string
+        kwargs["base_command"] = base_command or command_string.split(" ", 1)[0]
+        results: "queue.Queue[Union[RTRHostResult, BaseException, None]]" = queue.Queue()
+
+        def execute(shard: RTRBatchSession):
+            try:
+                shard.execute(command, status, results.put, self._stop, command_timeout,
+                              self._poll_interval, self._max_poll_interval, self._status_workers, **kwargs
+                              )
+            except Exception as failure:  # pylint: disable=W0718  # Failures are provided to the caller
+                results.put(failure)
+            finally:
+                results.put(None)
+
+        for shard in self._shards:
+            self._executor.submit(execute, shard)
+        remaining = len(self._shards)
+        while remaining:
+            result = results.get()
+            if result is None:
+                remaining -= 1
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                yield result
+
+    def retrieve(self,
+                 file_path: str,
+                 destination: str,
+                 max_workers: int = RTR_DOWNLOAD_WORKERS,
+                 verify: bool = True,
+                 command_timeout: float = RTR_COMMAND_TIMEOUT,
+                 **kwargs
+                 ) -> Iterator[RTRFileResult]:
+        """Retrieve a file from every host, yielding the result of each host once the file is on disk.
+
+        The get command is run on every host. As each host completes it, the files of its session
+        are checked using list_files_v2 until the file has been uploaded, and the archive is then
+        streamed to destination/<host ID>/<SHA-256>.7z. Downloads are performed concurrently and
+        share the pooled connections of the Service Class.
+
+        Arguments
+        ----
+        file_path : str
+            Full path of the file on each host, for example `C:/Windows/Temp/evidence.log`.
+        destination : str
+            Directory archives are written to.
+
+        Keyword arguments
+        ----
+        max_workers : int
+            Number of files downloaded concurrently. [Default: 8]
+        verify : bool
+            Verify the file within each archive against the SHA-256 reported by the API. Requires
+            the optional py7zr package, files that can not be verified are failed. [Default: True]
+        command_timeout : float
+            Seconds to wait for every host to complete the get command, and then for each
+            host to upload the file. [Default: 600]
+
+        Additional keywords (such as timeout and host_timeout_duration) are provided to the
+        batch command operation.
+        """
+        retriever = RTRFileRetriever(self._service, file_path, destination, self._stop, command_timeout,
+                                     self._poll_interval, self._max_poll_interval, verify=verify
+                                     )
+        self._retrievers.append(retriever)
+        with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="falconpy-rtr-download") as downloads:
+            fetching: "Set[Future[RTRFileResult]]" = set()
+            for result in self.run(f"get {file_path}", base_command="get", level="active_responder",
+                                   command_timeout=command_timeout, **kwargs
+                                   ):
+                if result.succeeded:
+                    fetching.add(downloads.submit(retriever.fetch, result))
+                else:
+                    yield retriever.failed(result)
+                for fetched in [future for future in fetching if future.done()]:
+                    fetching.discard(fetched)
+                    yield fetched.result()
+            for fetched in as_completed(fetching):
+                yield fetched.result()
+
+    def close(self):
+        """Stop refreshing the batch sessions and checking the status of pending commands."""
+        self._stop.set()
+        if self._executor:
+            self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "RTRBatchOrchestrator":
+        """Initialize the batch sessions when used as a context manager."""
+        return self.start()
+
+    def __exit__(self, *args):
+        """Close the orchestrator when leaving the context."""
+        self.close()
+
+    # ___  ____ ____ ___  ____ ____ ___ _ ____ ____
+    # |__] |__/ |  | |__] |___ |__/  |  | |___ [__
+    # |    |  \ |__| |    |___ |  \  |  | |___ ___]
+    #
+    @property
+    def shards(self) -> List[RTRBatchSession]:
+        """Return the batch sessions holding each shard of the hosts."""
+        return list(self._shards)
+
+    @property
+    def progress(self) -> float:
+        """Return the fraction of hosts that have returned a result for the current command."""
+        hosts = sum(len(shard.host_ids) for shard in self._shards)
+        return sum(shard.progress * len(shard.host_ids) for shard in self._shards) / hosts if hosts else 1.0
+
+    @property
+    def metrics(self) -> Dict[str, Union[int, float]]:
+        """Return the metrics of every batch session combined."""
+        returned: Dict[str, Union[int, float]] = {}
+        for shard in self._shards:
+            for metric, value in shard.metrics.items():
+                if metric.endswith("_seconds"):
+                    # Batch sessions are worked concurrently, the slowest determines the time taken.
+                    returned[metric] = max(returned.get(metric, 0.0), value)
+                else:
+                    returned[metric] = returned.get(metric, 0) + value
+        for retriever in self._retrievers:
+            for metric, value in retriever.metrics.items():
+                returned[metric] = returned.get(metric, 0) + value
+        returned["shards"] = len(self._shards)
+
+        return returned
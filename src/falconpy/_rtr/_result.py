@@ -0,0 +1,129 @@
+"""Real Time Response batch host result.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+
+@dataclass
+class RTRHostResult:  # pylint: disable=R0902
+    """This class represents the result of an RTR command on a single host within a batch session.
+
+    elapsed is the number of seconds from sending the command until the result was received.
+    Hosts that could not be reached, or that did not complete the command before the timeout,
+    are returned with complete set to False and the reason provided in errors.
+    """
+
+    # ____ ___ ___ ____ _ ___  _  _ ___ ____ ____
+    # |__|  |   |  |__/ | |__] |  |  |  |___ [__
+    # |  |  |   |  |  \ | |__] |__|  |  |___ ___]
+    #
+    aid: str
+    batch_id: Optional[str] = None
+    shard: int = 0
+    session_id: Optional[str] = None
+    task_id: Optional[str] = None
+    base_command: Optional[str] = None
+    complete: bool = False
+    stdout: str = ""
+    stderr: str = ""
+    errors: List[Dict[str, Any]] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    # _  _ ____ ___ _  _ ____ ___  ____
+    # |\/| |___  |  |__| |  | |  \ [__
+    # |  | |___  |  |  | |__| |__/ ___]
+    #
+    def update(self, resource: Dict[str, Any]) -> "RTRHostResult":
+        """Update the result from a command or command status resource returned by the API."""
+        self.session_id = resource.get("session_id") or self.session_id
+        self.task_id = resource.get("task_id") or self.task_id
+        self.base_command = resource.get("base_command") or self.base_command
+        self.complete = bool(resource.get("complete", False))
+        self.stdout = resource.get("stdout") or ""
+        self.stderr = resource.get("stderr") or ""
+        self.errors = resource.get("errors") or []
+
+        return self
+
+    # ___  ____ ____ ___  ____ ____ ___ _ ____ ____
+    # |__] |__/ |  | |__] |___ |__/  |  | |___ [__
+    # |    |  \ |__| |    |___ |  \  |  | |___ ___]
+    #
+    @property
+    def succeeded(self) -> bool:
+        """Return True when the host completed the command without errors."""
+        return self.complete and not self.errors
+
+
+@dataclass
+class RTRFileResult:  # pylint: disable=R0902
+    """This class represents a file retrieved from a single host using RTR.
+
+    sha256 and size are reported by the API for the file retrieved from the host, which is
+    provided as a password protected 7z archive written to path. archive_sha256 is the hash
+    of the archive calculated as it was written. verified is True when the SHA-256 of the file
+    within the archive matches the reported SHA-256, False when it does not, and None when it
+    was not verified. Files that could not be verified (for example when the optional py7zr
+    package is not installed) are reported with an error instead of succeeding.
+    """
+
+    # ____ ___ ___ ____ _ ___  _  _ ___ ____ ____
+    # |__|  |   |  |__/ | |__] |  |  |  |___ [__
+    # |  |  |   |  |  \ | |__] |__|  |  |___ ___]
+    #
+    aid: str
+    file_path: str
+    session_id: Optional[str] = None
+    task_id: Optional[str] = None
+    sha256: Optional[str] = None
+    size: Optional[int] = None
+    path: Optional[str] = None
+    bytes_written: int = 0
+    archive_sha256: Optional[str] = None
+    verified: Optional[bool] = None
+    errors: List[Dict[str, Any]] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    # ___  ____ ____ ___  ____ ____ ___ _ ____ ____
+    # |__] |__/ |  | |__] |___ |__/  |  | |___ [__
+    # |    |  \ |__| |    |___ |  \  |  | |___ ___]
+    #
+    @property
+    def succeeded(self) -> bool:
+        """Return True when the file was written to disk without errors."""
+        return bool(self.path) and not self.errors
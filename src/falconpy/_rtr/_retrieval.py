@@ -0,0 +1,315 @@
+"""Real Time Response file retrieval.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+import hashlib
+import os
+import threading
+import time
+from importlib import import_module
+from typing import Any, Dict, Optional
+from ._result import RTRFileResult, RTRHostResult
+from ._session import rtr_endpoints
+from .._constant import RTR_ARCHIVE_PASSWORD
+from .. import _endpoint
+from .._error import APIError
+from .._paginator import result_resources
+
+
+class ArchiveMemberHash:
+    """This class represents the SHA-256 of a file within an archive, calculated as it is decompressed.
+
+    Provides the file interface py7zr writes extracted files to, without writing them to disk.
+    """
+
+    def __init__(self):
+        """Construct an instance of the ArchiveMemberHash class."""
+        self.hasher = hashlib.sha256()
+        self.written: int = 0
+
+    def write(self, content: bytes) -> int:
+        """Add decompressed content to the hash."""
+        self.hasher.update(content)
+        self.written += len(content)
+
+        return len(content)
+
+    def read(self, *_) -> bytes:
+        """Return no content, the decompressed content is not retained."""
+        return b""
+
+    def seekable(self) -> bool:
+        """Return False, the decompressed content can not be rewound."""
+        return False
+
+    def seek(self, *_) -> int:
+        """Return the number of bytes written, the decompressed content can not be rewound."""
+        return self.written
+
+    def size(self) -> int:
+        """Return the number of bytes written."""
+        return self.written
+
+    def flush(self):
+        """Flush nothing, the decompressed content is not buffered."""
+
+    def close(self):
+        """Close nothing, the hash remains available."""
+
+
+class ArchiveHashes:  # pylint: disable=R0903
+    """This class represents the factory py7zr uses to extract every file within an archive to a hash."""
+
+    def __init__(self):
+        """Construct an instance of the ArchiveHashes class."""
+        self.members: Dict[str, ArchiveMemberHash] = {}
+
+    def create(self, filename: str) -> ArchiveMemberHash:
+        """Return the hash the content of a file within the archive is written to."""
+        self.members[filename] = ArchiveMemberHash()
+
+        return self.members[filename]
+
+
+def archive_digest(path: str) -> Optional[str]:
+    """Return the SHA-256 of the file within an RTR extracted file archive.
+
+    The file is hashed as it is decompressed and never written to disk, so the retrieved (and
+    potentially malicious) file only exists within the password protected archive. Returns None
+    when the archive does not contain exactly one file. Raises ImportError when the optional
+    py7zr package (version 0.22 or newer) is not installed.
+    """
+    py7zr = import_module("py7zr")
+    hashes = ArchiveHashes()
+    with py7zr.SevenZipFile(path, mode="r", password=RTR_ARCHIVE_PASSWORD) as archive:
+        archive.extractall(factory=hashes)
+    returned = None
+    if len(hashes.members) == 1:
+        returned = next(iter(hashes.members.values())).hasher.hexdigest()
+
+    return returned
+
+
+def remote_name(file_path: str) -> str:
+    """Return the name of a file from its path on a Windows, Linux or Mac host."""
+    return file_path.replace("\\", "/").rstrip("/").rsplit("/", 1)[-1]
+
+
+class RTRFileRetriever:
+    """This class represents the retrieval of a file from hosts that have completed an RTR get command.
+
+    Each host's session is checked using list_files_v2 until the file has been uploaded, before
+    the archive is streamed to disk using get_extracted_file_contents and verified.
+    """
+
+    # ____ ____ _  _ ____ ___ ____ _  _ ____ ___ ____ ____
+    # |    |  | |\ | [__   |  |__/ |  | |     |  |  | |__/
+    # |___ |__| | \| ___]  |  |  \ |__| |___  |  |__| |  \
+    #
+    def __init__(self,  # pylint: disable=R0913
+                 service: Any,
+                 file_path: str,
+                 destination: str,
+                 stop: threading.Event,
+                 command_timeout: float,
+                 poll_interval: float,
+                 max_poll_interval: float,
+                 verify: bool = True
+                 ):
+        """Construct an instance of the RTRFileRetriever class.
+
+        Arguments
+        ----
+        service : RealTimeResponse
+            Real Time Response Service Class used to list and download files.
+        file_path : str
+            Path of the file retrieved from each host.
+        destination : str
+            Directory archives are written to, within a folder for each host.
+        stop : threading.Event
+            Stops waiting for files to be uploaded when set.
+        command_timeout : float
+            Seconds to wait for the file to be uploaded by each host.
+        poll_interval : float
+            Seconds waited before the files of a session are first checked. The interval
+            doubles (up to max_poll_interval) each time the file has not been uploaded.
+        max_poll_interval : float
+            Maximum seconds waited between checks of the files of a session.
+
+        Keyword arguments
+        ----
+        verify : bool
+            Verify the SHA-256 of the file within each archive. [Default: True]
+        """
+        self._service = service
+        self._file_path: str = file_path
+        self._destination: str = os.path.abspath(destination)
+        self._stop = stop
+        self._command_timeout: float = command_timeout
+        self._poll_interval: float = poll_interval
+        self._max_poll_interval: float = max_poll_interval
+        self._verify: bool = verify
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, int] = {"files": 0, "bytes": 0, "verified": 0, "mismatched": 0, "unverified": 0,
+                                         "download_errors": 0, "file_polls": 0
+                                         }
+
+    # _  _ ____ ___ _  _ ____ ___  ____
+    # |\/| |___  |  |__| |  | |  \ [__
+    # |  | |___  |  |  | |__| |__/ ___]
+    #
+    def _count(self, **increments: int):
+        """Increase the retrieval metrics by the amounts provided."""
+        with self._lock:
+            for metric, amount in increments.items():
+                self._metrics[metric] += amount
+
+    def failed(self, result: RTRHostResult) -> RTRFileResult:
+        """Return the file result of a host that did not complete the get command."""
+        self._count(download_errors=1)
+
+        return RTRFileResult(aid=result.aid,
+                             file_path=self._file_path,
+                             session_id=result.session_id,
+                             task_id=result.task_id,
+                             errors=result.errors or [{"code": 500, "message": result.stderr or "The get command failed."}],
+                             elapsed=result.elapsed
+                             )
+
+    def _uploaded(self, result: RTRHostResult) -> Optional[Dict[str, Any]]:
+        """Return the file uploaded by a host for the get command, waiting until it is available."""
+        operation = _endpoint.find_operation(rtr_endpoints(), "RTR_ListFilesV2")
+        deadline = time.perf_counter() + self._command_timeout
+        interval = self._poll_interval
+        while True:
+            try:
+                files, _ = result_resources(self._service.list_files_v2(session_id=result.session_id), operation)
+            except APIError:
+                files = []
+            self._count(file_polls=1)
+            # Files uploaded by earlier get commands for the same path are ignored.
+            for uploaded in files:
+                if uploaded.get("sha256") and not uploaded.get("deleted_at") \
+                        and uploaded.get("cloud_request_id") == result.task_id:
+                    return uploaded
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0 or self._stop.wait(min(interval, remaining)):
+                return None
+            interval = min(interval * 2, self._max_poll_interval)
+
+    def fetch(self, result: RTRHostResult) -> RTRFileResult:
+        """Wait for the file retrieved from a host to be uploaded, then stream it to disk and verify it."""
+        started = time.perf_counter()
+        returned = RTRFileResult(aid=result.aid, file_path=self._file_path, session_id=result.session_id,
+                                 task_id=result.task_id
+                                 )
+        uploaded = self._uploaded(result)
+        if uploaded is None:
+            returned.errors = [{"code": 408, "message": "The file was not uploaded before the timeout."}]
+        else:
+            returned.sha256 = uploaded["sha256"]
+            returned.size = uploaded.get("size")
+            self._download(returned)
+        returned.elapsed = result.elapsed + time.perf_counter() - started
+        self._count(files=int(returned.succeeded), download_errors=int(not returned.succeeded))
+
+        return returned
+
+    def _download(self, returned: RTRFileResult):
+        """Stream the archive of an uploaded file to disk, hashing it as it is written."""
+        folder = os.path.join(self._destination, returned.aid)
+        os.makedirs(folder, exist_ok=True)
+        target = os.path.join(folder, f"{returned.sha256}.7z")
+        try:
+            downloads, _ = result_resources(
+                self._service.get_extracted_file_contents(session_id=returned.session_id,
+                                                          sha256=returned.sha256,
+                                                          filename=remote_name(self._file_path),
+                                                          stream=True,
+                                                          target=target,
+                                                          hash_algorithm="sha256"
+                                                          ),
+                _endpoint.find_operation(rtr_endpoints(), "RTR_GetExtractedFileContents")
+                )
+        except APIError as error:
+            returned.errors = [{"code": error.code, "message": error.message}]
+            return
+        if not downloads or "bytes_written" not in downloads[0]:
+            returned.errors = [{"code": 500, "message": "The file contents were not returned."}]
+            return
+        returned.path = target
+        returned.bytes_written = downloads[0]["bytes_written"]
+        returned.archive_sha256 = downloads[0].get("sha256")
+        self._count(bytes=returned.bytes_written)
+        if self._verify:
+            self._check(returned)
+
+    def _check(self, returned: RTRFileResult):
+        """Verify the SHA-256 of the file within a downloaded archive, failing the file when it can not be verified."""
+        try:
+            digest = archive_digest(returned.path)
+        except ImportError:
+            returned.errors = [{"code": 501, "message": "The py7zr package (version 0.22 or newer) is required to "
+                                                        "verify retrieved files, install crowdstrike-falconpy[py7zr] "
+                                                        "or disable verification."}]
+        except Exception as failure:  # pylint: disable=W0718  # Damaged archives raise a variety of py7zr errors.
+            returned.errors = [{"code": 422, "message": f"The archive could not be read: {failure}"}]
+        else:
+            if digest is None:
+                returned.errors = [{"code": 422, "message": "The archive does not contain exactly one file."}]
+            else:
+                returned.verified = digest == returned.sha256.lower()
+                if not returned.verified:
+                    returned.errors = [{"code": 422, "message": "The SHA-256 of the file retrieved does not match."}]
+        self._count(verified=int(returned.verified is True),
+                    mismatched=int(returned.verified is False),
+                    unverified=int(returned.verified is None)
+                    )
+
+    # ___  ____ ____ ___  ____ ____ ___ _ ____ ____
+    # |__] |__/ |  | |__] |___ |__/  |  | |___ [__
+    # |    |  \ |__| |    |___ |  \  |  | |___ ___]
+    #
+    @property
+    def destination(self) -> str:
+        """Return the directory archives are written to."""
+        return self._destination
+
+    @property
+    def metrics(self) -> Dict[str, int]:
+        """Return the retrieval metrics."""
+        with self._lock:
+            return dict(self._metrics)
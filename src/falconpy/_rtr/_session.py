@@ -0,0 +1,300 @@
+"""Real Time Response batch session.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Union
+from ._result import RTRHostResult
+from .._constant import RTR_STATUS_WORKERS
+from .. import _endpoint
+from .._error import APIError
+from .._paginator import result_resources
+
+
+def rtr_endpoints(admin: bool = False) -> List[Any]:
+    """Return the Real Time Response (or Real Time Response Admin) endpoints, loaded on first access."""
+    return getattr(_endpoint, "_real_time_response_admin_endpoints" if admin else "_real_time_response_endpoints")
+
+
+class RTRBatchSession:
+    """This class represents a single RTR batch session holding one shard of the hosts being orchestrated.
+
+    The batch session tracks the RTR session initialized on each host, and the progress and
+    timing of the commands it has run.
+    """
+
+    # ____ ____ _  _ ____ ___ ____ _  _ ____ ___ ____ ____
+    # |    |  | |\ | [__   |  |__/ |  | |     |  |  | |__/
+    # |___ |__| | \| ___]  |  |  \ |__| |___  |  |__| |  \
+    #
+    def __init__(self, shard: int, host_ids: List[str]):
+        """Construct an instance of the RTRBatchSession class.
+
+        Arguments
+        ----
+        shard : int
+            Position of the batch session within the orchestrator.
+        host_ids : list
+            Host IDs included in the batch session.
+        """
+        self._shard: int = shard
+        self._host_ids: List[str] = list(host_ids)
+        self._batch_id: Optional[str] = None
+        # Session IDs of the hosts a session was initialized on, and the errors of the others.
+        self._sessions: Dict[str, str] = {}
+        self._errors: Dict[str, List[Dict[str, Any]]] = {}
+        self._completed: int = 0
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, Union[int, float]] = {
+            "hosts": len(self._host_ids), "sessions": 0, "commands": 0, "completed": 0, "failed": 0,
+            "pending": 0, "polls": 0, "poll_errors": 0, "refreshes": 0, "refresh_errors": 0,
+            "init_seconds": 0.0, "command_seconds": 0.0
+            }
+
+    # _  _ ____ ___ _  _ ____ ___  ____
+    # |\/| |___  |  |__| |  | |  \ [__
+    # |  | |___  |  |  | |__| |__/ ___]
+    #
+    def _count(self, **increments: Union[int, float]):
+        """Increase the batch session metrics by the amounts provided."""
+        with self._lock:
+            for metric, amount in increments.items():
+                self._metrics[metric] += amount
+
+    def initialize(self, service: Any, **kwargs):
+        """Initialize the batch session, opening an RTR session on each host using batch_init_sessions."""
+        started = time.perf_counter()
+        try:
+            _, body = result_resources(service.batch_init_sessions(host_ids=self._host_ids, **kwargs),
+                                       _endpoint.find_operation(rtr_endpoints(), "BatchInitSessions")
+                                       )
+            self._batch_id = body.get("batch_id")
+            resources = body.get("resources") or {}
+            failure = [{"code": 404, "message": "A session could not be initialized on the host."}]
+        except APIError as error:
+            resources = {}
+            failure = [{"code": error.code, "message": error.message}]
+        for aid in self._host_ids:
+            resource = resources.get(aid) or {}
+            if resource.get("session_id"):
+                self._sessions[aid] = resource["session_id"]
+            else:
+                self._errors[aid] = resource.get("errors") or failure
+        with self._lock:
+            self._metrics["sessions"] = len(self._sessions)
+            self._metrics["init_seconds"] = time.perf_counter() - started
+
+    def refresh(self, service: Any, **kwargs):
+        """Keep the RTR sessions of the batch session alive using batch_refresh_sessions."""
+        if self._batch_id:
+            try:
+                result_resources(service.batch_refresh_sessions(batch_id=self._batch_id, **kwargs),
+                                 _endpoint.find_operation(rtr_endpoints(), "BatchRefreshSessions")
+                                 )
+                self._count(refreshes=1)
+            except APIError:
+                self._count(refresh_errors=1)
+
+    def execute(self,  # pylint: disable=R0913,R0914
+                command: Callable[..., Dict[str, Any]],
+                status: Callable[[str], List[Dict[str, Any]]],
+                deliver: Callable[[RTRHostResult], None],
+                stop: threading.Event,
+                command_timeout: float,
+                poll_interval: float,
+                max_poll_interval: float,
+                status_workers: int = RTR_STATUS_WORKERS,
+                **kwargs
+                ):
+        """Run a command on every host in the batch session, delivering each host result as it completes.
+
+        Arguments
+        ----
+        command : callable
+            Sends the batch command and returns the response body.
+        status : callable
+            Returns the status resources of the command sent to a host, provided the task ID.
+        deliver : callable
+            Receives the result of each host.
+        stop : threading.Event
+            Stops checking the status of pending commands when set.
+        command_timeout : float
+            Seconds to wait for every host to complete the command.
+        poll_interval : float
+            Seconds waited before the status of pending commands is first checked. The interval
+            doubles (up to max_poll_interval) while no pending command completes.
+        max_poll_interval : float
+            Maximum seconds waited between checks of the status of pending commands.
+
+        Keyword arguments
+        ----
+        status_workers : int
+            Maximum number of status checks in progress at the same time. [Default: 16]
+        """
+        started = time.perf_counter()
+        deadline = started + command_timeout
+        with self._lock:
+            self._completed = 0
+            self._metrics["commands"] += 1
+            self._metrics["pending"] = len(self._host_ids)
+
+        def finish(result: RTRHostResult):
+            result.elapsed = time.perf_counter() - started
+            with self._lock:
+                self._completed += 1
+                self._metrics["completed" if result.succeeded else "failed"] += 1
+                self._metrics["pending"] = len(self._host_ids) - self._completed
+            deliver(result)
+
+        pending = self._send(command, finish, **kwargs)
+        interval = poll_interval
+
+        def check(result: RTRHostResult) -> Optional[List[Dict[str, Any]]]:
+            try:
+                return status(result.task_id)
+            except APIError:
+                return None
+
+        # The status of every pending host is checked concurrently, with a bound on requests in progress.
+        with ThreadPoolExecutor(max_workers=max(1, status_workers), thread_name_prefix="falconpy-rtr-status") as checks:
+            while pending and not stop.wait(max(0.0, min(interval, deadline - time.perf_counter()))):
+                progressed = False
+                checked = list(pending.values())
+                for result, resources in zip(checked, checks.map(check, checked)):
+                    if resources is None:
+                        self._count(polls=1, poll_errors=1)
+                        continue
+                    self._count(polls=1)
+                    if resources and (result.update(resources[0]).complete or result.errors):
+                        finish(pending.pop(result.aid))
+                        progressed = True
+                if time.perf_counter() >= deadline:
+                    break
+                # Check again quickly while hosts are completing, otherwise back off.
+                interval = poll_interval if progressed else min(interval * 2, max_poll_interval)
+
+        for result in pending.values():
+            result.complete = False
+            result.errors = [{"code": 408, "message": "The command did not complete before the timeout."}]
+            finish(result)
+        with self._lock:
+            self._metrics["command_seconds"] = time.perf_counter() - started
+
+    def _send(self,
+              command: Callable[..., Dict[str, Any]],
+              finish: Callable[[RTRHostResult], None],
+              **kwargs
+              ) -> Dict[str, RTRHostResult]:
+        """Send a command to the batch session, finishing the hosts that have completed it.
+
+        Returns the results of the hosts the command is still pending on, keyed by host ID.
+        """
+        base_command = kwargs.get("base_command")
+        # Hosts without a session fail without the command being sent.
+        for aid, errors in self._errors.items():
+            finish(self._result(aid, base_command=base_command, errors=errors))
+        resources: Dict[str, Dict[str, Any]] = {}
+        failure = [{"code": 404, "message": "No response was received from the host."}]
+        if self._sessions:
+            try:
+                body = command(batch_id=self._batch_id, **kwargs)
+                resources = (body.get("combined") or {}).get("resources") or {}
+            except APIError as error:
+                failure = [{"code": error.code, "message": error.message}]
+        pending: Dict[str, RTRHostResult] = {}
+        for aid in self._sessions:
+            result = self._result(aid, base_command=base_command)
+            if aid not in resources:
+                result.errors = failure
+                finish(result)
+            elif result.update(resources[aid]).complete or result.errors or not result.task_id:
+                finish(result)
+            else:
+                pending[aid] = result
+
+        return pending
+
+    def _result(self, aid: str, **kwargs) -> RTRHostResult:
+        """Return a new result for a host in the batch session."""
+        return RTRHostResult(aid=aid,
+                             batch_id=self._batch_id,
+                             shard=self._shard,
+                             session_id=self._sessions.get(aid),
+                             **kwargs
+                             )
+
+    # ___  ____ ____ ___  ____ ____ ___ _ ____ ____
+    # |__] |__/ |  | |__] |___ |__/  |  | |___ [__
+    # |    |  \ |__| |    |___ |  \  |  | |___ ___]
+    #
+    @property
+    def shard(self) -> int:
+        """Return the position of the batch session within the orchestrator."""
+        return self._shard
+
+    @property
+    def batch_id(self) -> Optional[str]:
+        """Return the batch ID, or None until the batch session is initialized."""
+        return self._batch_id
+
+    @property
+    def host_ids(self) -> List[str]:
+        """Return the host IDs included in the batch session."""
+        return list(self._host_ids)
+
+    @property
+    def sessions(self) -> Dict[str, str]:
+        """Return the RTR session ID of each host a session was initialized on."""
+        return dict(self._sessions)
+
+    @property
+    def errors(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Return the errors of each host a session could not be initialized on."""
+        return dict(self._errors)
+
+    @property
+    def progress(self) -> float:
+        """Return the fraction of hosts that have returned a result for the current command."""
+        with self._lock:
+            return self._completed / len(self._host_ids) if self._host_ids else 1.0
+
+    @property
+    def metrics(self) -> Dict[str, Union[int, float]]:
+        """Return the batch session metrics."""
+        with self._lock:
+            return dict(self._metrics)
@@ -0,0 +1,133 @@
+"""Asynchronous Service Class wrapper.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+import functools
+import inspect
+from typing import Any, Optional, Type
+from ._service_class import ServiceClass
+from .._auth_object._async_interface import AsyncFalconInterface
+
+
+class AsyncServiceClass:
+    """Asynchronous Service Class wrapper.
+
+    Wraps any Service Class, providing every API operation method as a coroutine. Requests
+    are prepared by the wrapped Service Class using the same endpoint definitions, payload
+    handlers and result processing as synchronous requests, and are then sent using the
+    asynchronous connection pool of the AsyncFalconInterface auth_object.
+
+        auth = AsyncFalconInterface(client_id=CLIENT_ID, client_secret=CLIENT_SECRET)
+        hosts = AsyncServiceClass(Hosts, auth_object=auth)
+        results = await asyncio.gather(*[hosts.get_device_details(ids=batch) for batch in batches])
+    """
+
+    # These Service Class methods do not perform requests and are not wrapped.
+    _SYNCHRONOUS_METHODS = ["authenticated", "token_expired"]
+
+    # ____ ____ _  _ ____ ___ ____ _  _ ____ ___ ____ ____
+    # |    |  | |\ | [__   |  |__/ |  | |     |  |  | |__/
+    # |___ |__| | \| ___]  |  |  \ |__| |___  |  |__| |  \
+    #
+    def __init__(self,
+                 service_class: Type[ServiceClass],
+                 auth_object: Optional[AsyncFalconInterface] = None,
+                 **kwargs
+                 ):
+        """Construct an instance of the AsyncServiceClass class.
+
+        Keyword arguments
+        ----
+        service_class : ServiceClass
+            The Service Class to wrap, for example Hosts.
+        auth_object : AsyncFalconInterface
+            Asynchronous interface to use for authentication and requests. When not provided,
+            one is created using the remaining keywords.
+
+        All remaining keywords are passed to the Service Class constructor.
+        """
+        if auth_object is not None and not isinstance(auth_object, AsyncFalconInterface):
+            raise ValueError("Asynchronous Service Classes require an AsyncFalconInterface auth_object.")
+        self._service: ServiceClass = service_class(auth_object=auth_object,
+                                                    default_auth_object_class=AsyncFalconInterface,
+                                                    **kwargs
+                                                    )
+
+    # _  _ ____ ___ _  _ ____ ___  ____
+    # |\/| |___  |  |__| |  | |  \ [__
+    # |  | |___  |  |  | |__| |__/ ___]
+    #
+    def __getattr__(self, name: str) -> Any:
+        """Provide Service Class methods as coroutines, all other attributes are returned as is."""
+        attribute = getattr(self._service, name)
+        if name.startswith("_") or name in self._SYNCHRONOUS_METHODS or not inspect.ismethod(attribute):
+            return attribute
+
+        @functools.wraps(attribute)
+        async def operation(*args, **kwargs):
+            return await self._service.auth_object.dispatch(attribute, *args, **kwargs)
+
+        return operation
+
+    async def login(self) -> dict:
+        """Login to the CrowdStrike API by requesting a new token."""
+        return await self._service.auth_object.login()
+
+    async def logout(self) -> dict:
+        """Logout from the CrowdStrike API by revoking the current token."""
+        return await self._service.auth_object.logout()
+
+    async def __aenter__(self):
+        """Allow for entry as an asynchronous context manager."""
+        return self
+
+    async def __aexit__(self, *args):
+        """Discard our token and close our connections when we exit the context."""
+        await self._service.auth_object.__aexit__(*args)
+
+    # ___  ____ ____ ___  ____ ____ ___ _ ____ ____
+    # |__] |__/ |  | |__] |___ |__/  |  | |___ [__
+    # |    |  \ |__| |    |___ |  \  |  | |___ ___]
+    #
+    @property
+    def service(self) -> ServiceClass:
+        """Return the wrapped Service Class."""
+        return self._service
+
+    @property
+    def auth_object(self) -> AsyncFalconInterface:
+        """Return the asynchronous interface used by this Service Class."""
+        return self._service.auth_object
@@ -42,6 +42,9 @@ from typing import Dict, Type, Union, Optional
 from .._constant import MAX_DEBUG_RECORDS
 from .._auth_object import FalconInterface, UberInterface
 from .._error import FunctionalityNotImplemented
+from .._transport import Transport, RateLimiter, RetryPolicy, ResponseCache, RequestCoalescer
+from .._codec import JSONCodec
+from .._telemetry import Telemetry
 
 
 class BaseServiceClass(ABC):
@@ -232,6 +235,46 @@ class BaseServiceClass(ABC):
         """Provide the renew_window from the auth_object."""
         return self.auth_object.renew_window
 
+    @property
+    def transport(self) -> Transport:
+        """Provide the HTTP transport from the auth_object."""
+        return self.auth_object.transport
+
+    @property
+    def codec(self) -> JSONCodec:
+        """Provide the JSON codec from the auth_object."""
+        return self.auth_object.codec
+
+    @property
+    def rate_limiter(self) -> Optional[RateLimiter]:
+        """Provide the client side rate limiter from the auth_object."""
+        return self.auth_object.rate_limiter
+
+    @property
+    def retry_policy(self) -> Optional[RetryPolicy]:
+        """Provide the retry policy from the auth_object."""
+        return self.auth_object.retry_policy
+
+    @property
+    def cache(self) -> Optional[ResponseCache]:
+        """Provide the response cache from the auth_object."""
+        return self.auth_object.cache
+
+    @property
+    def client_label(self) -> str:
+        """Provide the label identifying the credentials of the auth_object."""
+        return self.auth_object.client_label
+
+    @property
+    def coalescer(self) -> Optional[RequestCoalescer]:
+        """Provide the request coalescer from the auth_object."""
+        return self.auth_object.coalescer
+
+    @property
+    def telemetry(self) -> Optional[Telemetry]:
+        """Provide the telemetry hooks from the auth_object."""
+        return self.auth_object.telemetry
+
     @property
     def user_agent(self) -> int:
         """Provide the user_agent from the auth_object."""
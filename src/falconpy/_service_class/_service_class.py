@@ -35,13 +35,14 @@ OTHER DEALINGS IN THE SOFTWARE.
 
 For more information, please refer to <https://unlicense.org>
 """
-from typing import Dict, Type, Optional, Union
+from typing import Any, Callable, Dict, Iterable, Type, Optional, Union
 from ._base_service_class import BaseServiceClass
 from .._auth_object import FalconInterface
 from .._util import log_class_startup, perform_request, service_override_payload, deprecated_class
 from ..oauth2 import OAuth2
 from .._result import Result
 from .._endpoint import class_deprecation_mapping
+from .._paginator import Hydrator, Paginator, service_operation, service_paginator
 
 
 class ServiceClass(BaseServiceClass):
@@ -122,6 +123,41 @@ class ServiceClass(BaseServiceClass):
             Amount of time (in seconds) between now and the token expiration before
             a refresh of the token is performed. Default: 120, Max: 1200
             Values over 1200 will be reset to the maximum.
+        pool_connections : int
+            Number of per-host connection pools to cache. [Default: 10]
+            Ignored when an auth_object is provided.
+        pool_maxsize : int
+            Maximum number of connections kept alive per host. [Default: 10]
+            Ignored when an auth_object is provided.
+        keep_alive : bool
+            Flag specifying if connections should be reused between requests. [Default: True]
+            Ignored when an auth_object is provided.
+        background_refresh : bool
+            Flag specifying if tokens should be renewed from a background thread
+            before they become stale. [Default: False]
+            Ignored when an auth_object is provided.
+        rate_limit : bool or RateLimiter
+            Pace requests using a client side rate limiter learned from the rate limit
+            headers returned by the API. [Default: False]
+            Ignored when an auth_object is provided.
+        retry : bool or RetryPolicy
+            Retry requests that fail for transient reasons using exponential backoff
+            with jitter. [Default: False]
+            Ignored when an auth_object is provided.
+        json_codec : str or JSONCodec
+            JSON library used to decode responses and encode request bodies (orjson,
+            simdjson, ujson or json). [Default: Fastest installed library]
+            Ignored when an auth_object is provided.
+        cache : bool or ResponseCache
+            Cache responses to read-mostly GET operations. [Default: False]
+            Ignored when an auth_object is provided.
+        coalesce : bool or RequestCoalescer
+            Share one API call between identical requests made while it is in flight. [Default: False]
+            Ignored when an auth_object is provided.
+        telemetry : bool, callable, list of callables or Telemetry
+            Provide the measurements of every request to instrumentation hooks. True enables an
+            in-process MetricsAggregator. [Default: None]
+            Ignored when an auth_object is provided.
 
         Arguments
         ----
@@ -171,8 +207,9 @@ class ServiceClass(BaseServiceClass):
                 setattr(self, f"_override_{item}", kwargs.get(item))
 
         # Service Classes automatically log themselves in upon instantiation
-        # if no authentication status is present.
-        if not self.token_status:
+        # if no authentication status is present. Asynchronous auth_objects
+        # authenticate when the first request is awaited instead.
+        if not self.token_status and not getattr(self.auth_object, "asynchronous", False):
             self.login()
 
         # Detect if object authentication is being used to instantiate this class.
@@ -235,6 +272,71 @@ class ServiceClass(BaseServiceClass):
                                                           exp=expand_result
                                                           ))
 
+    def paginate(self, operation: Union[str, Callable], prefetch: bool = False, **kwargs) -> Paginator:
+        """Iterate over every result returned by a paginated operation.
+
+        Keyword arguments
+        ----
+        operation : str or Callable
+            Service Class method to paginate. The method name or operation ID are also accepted.
+        prefetch : bool
+            Retrieve the next page on a background thread while the current page is processed.
+        All other keywords are provided to the operation for every page requested.
+
+        Returns
+        ----
+        Paginator
+            Iterator yielding each resource. Use the pages method to iterate page by page.
+        """
+        return service_paginator(self, operation, prefetch, **kwargs)
+
+    def hydrate(self,
+                query: Union[str, Callable, Iterable[str]],
+                details: Union[str, Callable],
+                ordered: bool = True,
+                batch_size: Optional[int] = None,
+                max_workers: Optional[int] = None,
+                details_parameters: Optional[Dict[str, Any]] = None,
+                id_keyword: Optional[str] = None,
+                **kwargs
+                ) -> Hydrator:
+        """Retrieve the details for every ID returned by a query operation.
+
+        Keyword arguments
+        ----
+        query : str, Callable or Iterable
+            Service Class query method (or its name or operation ID) to paginate,
+            or an iterable of IDs to retrieve details for.
+        details : str or Callable
+            Service Class detail method, or its name or operation ID.
+        ordered : bool
+            Return details in the order IDs were returned by the query. [Default: True]
+        batch_size : int
+            Number of IDs to send per detail request. [Default: the documented operation limit]
+        max_workers : int
+            Maximum number of detail requests in flight. [Default: the transport pool size]
+        details_parameters : dict
+            Additional keywords provided to the detail operation.
+        id_keyword : str
+            Keyword the detail operation accepts IDs with. [Default: ids, or composite_ids for alerts]
+        All other keywords are provided to the query operation.
+
+        Returns
+        ----
+        Hydrator
+            Iterator yielding the details for each ID. Use the batches method to iterate batch by batch.
+        """
+        ids = query
+        if isinstance(query, str) or callable(query):
+            ids = service_paginator(self, query, kwargs.pop("prefetch", False), **kwargs)
+        method, operation = service_operation(self, details)
+        if max_workers is None and self.transport:
+            max_workers = self.transport.pool_maxsize
+
+        return Hydrator(ids, method, operation, batch_size, max_workers, ordered, id_keyword,
+                        **(details_parameters or {})
+                        )
+
     def __enter__(self):
         """Allow for entry as a context manager."""
         return self
@@ -0,0 +1,225 @@
+"""FalconPy telemetry metrics aggregator.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+import threading
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, List, Optional
+from .._constant import TELEMETRY_LATENCY_BUCKETS
+from ._event import RequestEvent
+
+
+class Histogram:
+    """This class represents a histogram of observed durations."""
+
+    __slots__ = ["_bounds", "_counts", "_count", "_sum"]
+
+    def __init__(self, bounds: Iterable[float] = TELEMETRY_LATENCY_BUCKETS):
+        """Construct an instance of the Histogram class."""
+        self._bounds: tuple = tuple(sorted(bounds))
+        # The final bucket holds observations larger than every bound.
+        self._counts: List[int] = [0] * (len(self._bounds) + 1)
+        self._count: int = 0
+        self._sum: float = 0.0
+
+    def observe(self, value: float):
+        """Add an observation to the histogram."""
+        self._counts[bisect_left(self._bounds, value)] += 1
+        self._count += 1
+        self._sum += value
+
+    def quantile(self, quantile: float) -> Optional[float]:
+        """Return the upper bound of the bucket containing the requested quantile, between 0 and 1."""
+        if not self._count:
+            return None
+        rank = quantile * self._count
+        seen = 0
+        for index, count in enumerate(self._counts):
+            seen += count
+            if seen >= rank and count:
+                return self._bounds[index] if index < len(self._bounds) else float("inf")
+
+        return float("inf")
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the count, sum and cumulative bucket counts of the histogram."""
+        buckets = {}
+        seen = 0
+        for bound, count in zip(self._bounds + (float("inf"),), self._counts):
+            seen += count
+            buckets["+Inf" if bound == float("inf") else str(bound)] = seen
+
+        return {"count": self._count, "sum": self._sum, "buckets": buckets,
+                "p50": self.quantile(0.5), "p95": self.quantile(0.95), "p99": self.quantile(0.99)
+                }
+
+    @property
+    def count(self) -> int:
+        """Return the number of observations."""
+        return self._count
+
+    @property
+    def sum(self) -> float:
+        """Return the sum of every observation."""
+        return self._sum
+
+
+class RequestMetrics:  # pylint: disable=R0902
+    """This class represents the counters and histograms maintained for an operation or auth_object."""
+
+    __slots__ = ["requests", "failures", "attempts", "cached", "coalesced",
+                 "request_bytes", "response_bytes", "statuses", "latency", "phases"
+                 ]
+
+    def __init__(self, bounds: Iterable[float] = TELEMETRY_LATENCY_BUCKETS):
+        """Construct an instance of the RequestMetrics class."""
+        self.requests: int = 0
+        self.failures: int = 0
+        self.attempts: int = 0
+        self.cached: int = 0
+        self.coalesced: int = 0
+        self.request_bytes: int = 0
+        self.response_bytes: int = 0
+        self.statuses: Dict[str, int] = {}
+        self.latency: Histogram = Histogram(bounds)
+        self.phases: Dict[str, Histogram] = {phase: Histogram(bounds) for phase in ("ttfb", "download", "decode")}
+
+    def record(self, event: RequestEvent):
+        """Add the measurements of a completed request."""
+        self.requests += 1
+        self.failures += int(event.failed)
+        self.attempts += event.attempts
+        self.cached += int(event.cached)
+        self.coalesced += int(event.coalesced)
+        self.request_bytes += event.request_bytes
+        self.response_bytes += event.response_bytes
+        status = str(event.status_code) if event.status_code else (event.error or "unknown")
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        self.latency.observe(event.duration)
+        # Requests that were not sent have no transfer measurements.
+        if event.attempts:
+            self.phases["ttfb"].observe(event.ttfb)
+            self.phases["download"].observe(event.download)
+            self.phases["decode"].observe(event.decode)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the metrics as a dictionary."""
+        return {"requests": self.requests,
+                "failures": self.failures,
+                "attempts": self.attempts,
+                "retries": max(0, self.attempts - (self.requests - self.cached - self.coalesced)),
+                "cached": self.cached,
+                "coalesced": self.coalesced,
+                "request_bytes": self.request_bytes,
+                "response_bytes": self.response_bytes,
+                "statuses": dict(self.statuses),
+                "latency": self.latency.to_dict(),
+                **{phase: histogram.to_dict() for phase, histogram in self.phases.items()}
+                }
+
+
+class MetricsAggregator:
+    """This class represents an in-process aggregator of request telemetry.
+
+    Counters and latency histograms are maintained per operation and per client (auth_object).
+    Aggregators are telemetry hooks, and may be shared by any number of interfaces.
+    """
+
+    # ____ ____ _  _ ____ ___ ____ _  _ ____ ___ ____ ____
+    # |    |  | |\ | [__   |  |__/ |  | |     |  |  | |__/
+    # |___ |__| | \| ___]  |  |  \ |__| |___  |  |__| |  \
+    #
+    def __init__(self, buckets: Optional[Iterable[float]] = TELEMETRY_LATENCY_BUCKETS):
+        """Construct an instance of the MetricsAggregator class.
+
+        Keyword arguments
+        ----
+        buckets : list
+            Upper bounds (in seconds) of the latency histogram buckets. [Default: TELEMETRY_LATENCY_BUCKETS]
+        """
+        self._bounds: tuple = tuple(buckets or TELEMETRY_LATENCY_BUCKETS)
+        self._lock: threading.Lock = threading.Lock()
+        self._operations: Dict[str, RequestMetrics] = {}
+        self._clients: Dict[str, RequestMetrics] = {}
+
+    def __call__(self, event: RequestEvent):
+        """Add the measurements of a completed request."""
+        operation = event.operation or f"{event.method} {event.endpoint}"
+        client = event.client or "default"
+        with self._lock:
+            for group, key in ((self._operations, operation), (self._clients, client)):
+                if key not in group:
+                    group[key] = RequestMetrics(self._bounds)
+                group[key].record(event)
+
+    # _  _ ____ ___ _  _ ____ ___  ____
+    # |\/| |___  |  |__| |  | |  \ [__
+    # |  | |___  |  |  | |__| |__/ ___]
+    #
+    def operation(self, operation: str) -> Optional[Dict[str, Any]]:
+        """Return the metrics recorded for an operation."""
+        with self._lock:
+            metrics = self._operations.get(operation, None)
+            return metrics.to_dict() if metrics else None
+
+    def client(self, client: str) -> Optional[Dict[str, Any]]:
+        """Return the metrics recorded for a client."""
+        with self._lock:
+            metrics = self._clients.get(client, None)
+            return metrics.to_dict() if metrics else None
+
+    def reset(self):
+        """Discard every recorded measurement."""
+        with self._lock:
+            self._operations.clear()
+            self._clients.clear()
+
+    # ___  ____ ____ ___  ____ ____ ___ _ ____ ____
+    # |__] |__/ |  | |__] |___ |__/  |  | |___ [__
+    # |    |  \ |__| |    |___ |  \  |  | |___ ___]
+    #
+    @property
+    def buckets(self) -> tuple:
+        """Return the upper bounds of the latency histogram buckets."""
+        return self._bounds
+
+    @property
+    def metrics(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Return the metrics recorded for every operation and client."""
+        with self._lock:
+            return {"operations": {key: value.to_dict() for key, value in self._operations.items()},
+                    "clients": {key: value.to_dict() for key, value in self._clients.items()}
+                    }
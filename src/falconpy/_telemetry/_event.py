@@ -0,0 +1,137 @@
+"""FalconPy request event class.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+import time
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+
+def payload_size(payload: Any) -> int:
+    """Return the size (in bytes) of an encoded payload, or zero when it cannot be determined."""
+    returned = 0
+    if isinstance(payload, (bytes, bytearray)):
+        returned = len(payload)
+    elif isinstance(payload, str):
+        returned = len(payload.encode("utf-8"))
+
+    return returned
+
+
+@dataclass
+class RequestEvent:  # pylint: disable=R0902
+    """This class represents the measurements taken for a single API request.
+
+    Events are populated as the request is sent and processed, and are provided to every
+    telemetry hook once the request completes. Durations are measured in seconds.
+
+    ttfb is the time from sending the request until the response headers are received,
+    including establishing a new connection when one is required. download is the time
+    spent reading the response content, and decode the time spent converting it into
+    the result returned to the caller. Timings describe the final attempt.
+    """
+
+    # ____ ___ ___ ____ _ ___  _  _ ___ ____ ____
+    # |__|  |   |  |__/ | |__] |  |  |  |___ [__
+    # |  |  |   |  |  \ | |__] |__|  |  |___ ___]
+    #
+    operation: Optional[str] = None
+    method: str = "GET"
+    endpoint: str = ""
+    client: Optional[str] = None
+    timestamp: float = field(default_factory=time.time)
+    started: float = field(default_factory=time.perf_counter)
+    status_code: Optional[int] = None
+    attempts: int = 0
+    duration: float = 0.0
+    ttfb: float = 0.0
+    download: float = 0.0
+    decode: float = 0.0
+    request_bytes: int = 0
+    response_bytes: int = 0
+    trace_id: Optional[str] = None
+    executed: bool = False
+    cached: bool = False
+    coalesced: bool = False
+    error: Optional[str] = None
+
+    # _  _ ____ ___ _  _ ____ ___  ____
+    # |\/| |___  |  |__| |  | |  \ [__
+    # |  | |___  |  |  | |__| |__/ ___]
+    #
+    def response_received(self, response: Any, elapsed: float, streamed: bool = False):
+        """Record the response received for an attempt and the number of seconds it took to receive."""
+        # requests measures the time taken to receive the response headers.
+        ttfb = getattr(response, "elapsed", None)
+        self.ttfb = min(ttfb.total_seconds(), elapsed) if ttfb is not None else elapsed
+        self.download = elapsed - self.ttfb
+        self.status_code = response.status_code
+        self.trace_id = response.headers.get("X-Cs-Traceid", None)
+        sent = payload_size(getattr(getattr(response, "request", None), "body", None))
+        if sent:
+            self.request_bytes = sent
+        if streamed:
+            try:
+                self.response_bytes = int(response.headers.get("Content-Length", 0))
+            except ValueError:
+                self.response_bytes = 0
+        else:
+            self.response_bytes = len(response.content or b"")
+
+    def finish(self, returned: Any = None):
+        """Complete the event using the value returned to (or raised to) the caller."""
+        self.duration = time.perf_counter() - self.started
+        # Requests answered by another in-flight request or by the response cache are not sent.
+        self.coalesced = not self.executed
+        self.cached = self.executed and (not self.attempts or self.status_code == 304)
+        status_code = None
+        if isinstance(returned, dict):
+            status_code = returned.get("status_code", None)
+        elif isinstance(returned, tuple) and returned:
+            status_code = returned[0]
+        elif returned is not None:
+            status_code = getattr(returned, "status_code", getattr(returned, "code", None))
+        if isinstance(status_code, int):
+            self.status_code = status_code
+
+    # ___  ____ ____ ___  ____ ____ ___ _ ____ ____
+    # |__] |__/ |  | |__] |___ |__/  |  | |___ [__
+    # |    |  \ |__| |    |___ |  \  |  | |___ ___]
+    #
+    @property
+    def failed(self) -> bool:
+        """Return a boolean indicating if the request raised an error or was not successful."""
+        return bool(self.error) or not self.status_code or self.status_code >= 400
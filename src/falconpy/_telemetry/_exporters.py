@@ -0,0 +1,210 @@
+"""FalconPy telemetry exporters.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+import threading
+from importlib import import_module
+from types import ModuleType
+from typing import Any, Dict, Optional, Tuple
+from .._constant import TELEMETRY_LATENCY_BUCKETS
+from .._version import _VERSION
+from ._event import RequestEvent
+
+
+def load_optional(name: str) -> Optional[ModuleType]:
+    """Import an optional instrumentation library, returning None when it is not installed."""
+    try:
+        return import_module(name)
+    except ImportError:
+        return None
+
+
+class PrometheusExporter:
+    """This class represents a telemetry hook exporting request metrics to Prometheus.
+
+    Metrics are registered with the provided registry (or the default registry). When the
+    prometheus_client package is not installed the exporter does nothing.
+    """
+
+    _registered: Dict[Tuple[int, str], Dict[str, Any]] = {}
+    _registry_lock: threading.Lock = threading.Lock()
+
+    def __init__(self, registry: Any = None, namespace: str = "falconpy"):
+        """Construct an instance of the PrometheusExporter class.
+
+        Keyword arguments
+        ----
+        registry : CollectorRegistry
+            Registry the metrics are registered with. [Default: prometheus_client.REGISTRY]
+        namespace : str
+            Prefix used for every metric name. [Default: falconpy]
+        """
+        self._metrics: Optional[Dict[str, Any]] = None
+        prometheus = load_optional("prometheus_client")
+        if prometheus:
+            registry = registry or prometheus.REGISTRY
+            # Metrics may only be registered once per registry.
+            with self._registry_lock:
+                key = (id(registry), namespace)
+                if key not in self._registered:
+                    self._registered[key] = self._create(prometheus, registry, namespace)
+                self._metrics = self._registered[key]
+
+    @staticmethod
+    def _create(prometheus: ModuleType, registry: Any, namespace: str) -> Dict[str, Any]:
+        """Create and register the exported metrics."""
+        return {
+            "requests": prometheus.Counter("requests", "API requests completed.",
+                                           ["operation", "method", "status", "client"],
+                                           namespace=namespace, registry=registry
+                                           ),
+            "attempts": prometheus.Counter("request_attempts", "API request attempts sent, including retries.",
+                                           ["operation", "client"], namespace=namespace, registry=registry
+                                           ),
+            "duration": prometheus.Histogram("request_duration_seconds", "API request latency.",
+                                             ["operation", "client"], namespace=namespace, registry=registry,
+                                             buckets=TELEMETRY_LATENCY_BUCKETS
+                                             ),
+            "phase": prometheus.Histogram("request_phase_seconds", "API request latency by phase.",
+                                          ["operation", "phase"], namespace=namespace, registry=registry,
+                                          buckets=TELEMETRY_LATENCY_BUCKETS
+                                          ),
+            "bytes": prometheus.Counter("request_bytes", "API request and response payload sizes.",
+                                        ["operation", "direction"], namespace=namespace, registry=registry
+                                        )
+        }
+
+    def __call__(self, event: RequestEvent):
+        """Export the measurements of a completed request."""
+        if not self._metrics:
+            return
+        operation = event.operation or event.endpoint
+        client = event.client or "default"
+        status = str(event.status_code) if event.status_code else (event.error or "unknown")
+        self._metrics["requests"].labels(operation, event.method, status, client).inc()
+        self._metrics["attempts"].labels(operation, client).inc(event.attempts)
+        self._metrics["duration"].labels(operation, client).observe(event.duration)
+        if event.attempts:
+            for phase in ("ttfb", "download", "decode"):
+                self._metrics["phase"].labels(operation, phase).observe(getattr(event, phase))
+        self._metrics["bytes"].labels(operation, "sent").inc(event.request_bytes)
+        self._metrics["bytes"].labels(operation, "received").inc(event.response_bytes)
+
+    @property
+    def enabled(self) -> bool:
+        """Return a boolean indicating if prometheus_client is installed and metrics are exported."""
+        return bool(self._metrics)
+
+
+class OpenTelemetryExporter:
+    """This class represents a telemetry hook exporting request metrics and spans to OpenTelemetry.
+
+    A client span is recorded for every request, along with request duration, attempt and
+    payload size instruments. When the opentelemetry-api package is not installed the
+    exporter does nothing.
+    """
+
+    def __init__(self, meter_provider: Any = None, tracer_provider: Any = None):
+        """Construct an instance of the OpenTelemetryExporter class.
+
+        Keyword arguments
+        ----
+        meter_provider : MeterProvider
+            Provider of the meter used to record metrics. [Default: Global meter provider]
+        tracer_provider : TracerProvider
+            Provider of the tracer used to record spans. [Default: Global tracer provider]
+        """
+        self._instruments: Optional[Dict[str, Any]] = None
+        self._tracer: Any = None
+        self._trace: Optional[ModuleType] = load_optional("opentelemetry.trace")
+        otel_metrics = load_optional("opentelemetry.metrics")
+        if otel_metrics:
+            meter = otel_metrics.get_meter("falconpy", _VERSION, meter_provider)
+            self._instruments = {
+                "duration": meter.create_histogram("falconpy.request.duration", unit="s",
+                                                   description="API request latency."
+                                                   ),
+                "attempts": meter.create_counter("falconpy.request.attempts",
+                                                 description="API request attempts sent, including retries."
+                                                 ),
+                "bytes": meter.create_counter("falconpy.request.bytes", unit="By",
+                                              description="API request and response payload sizes."
+                                              )
+            }
+        if self._trace:
+            self._tracer = self._trace.get_tracer("falconpy", _VERSION, tracer_provider)
+
+    @staticmethod
+    def attributes(event: RequestEvent) -> Dict[str, Any]:
+        """Return the attributes recorded for a request, omitting those that are not available."""
+        attributes = {"falconpy.operation": event.operation,
+                      "falconpy.client": event.client,
+                      "falconpy.trace_id": event.trace_id,
+                      "http.request.method": event.method,
+                      "http.response.status_code": event.status_code,
+                      "error.type": event.error
+                      }
+
+        return {key: value for key, value in attributes.items() if value is not None}
+
+    def __call__(self, event: RequestEvent):
+        """Export the measurements of a completed request."""
+        attributes = self.attributes(event)
+        if self._instruments:
+            self._instruments["duration"].record(event.duration, attributes)
+            self._instruments["attempts"].add(event.attempts, attributes)
+            self._instruments["bytes"].add(event.request_bytes, {**attributes, "falconpy.direction": "sent"})
+            self._instruments["bytes"].add(event.response_bytes, {**attributes, "falconpy.direction": "received"})
+        if self._tracer:
+            started = int(event.timestamp * 1e9)
+            span = self._tracer.start_span(event.operation or event.endpoint,
+                                           kind=self._trace.SpanKind.CLIENT,
+                                           attributes={**attributes, "url.full": event.endpoint,
+                                                       "falconpy.attempts": event.attempts,
+                                                       "falconpy.ttfb": event.ttfb,
+                                                       "falconpy.download": event.download,
+                                                       "falconpy.decode": event.decode
+                                                       },
+                                           start_time=started
+                                           )
+            if event.failed:
+                span.set_status(self._trace.Status(self._trace.StatusCode.ERROR))
+            span.end(end_time=started + int(event.duration * 1e9))
+
+    @property
+    def enabled(self) -> bool:
+        """Return a boolean indicating if opentelemetry-api is installed and telemetry is exported."""
+        return bool(self._instruments or self._tracer)
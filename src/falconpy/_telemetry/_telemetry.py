@@ -0,0 +1,197 @@
+"""FalconPy telemetry class.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+import copy
+import hashlib
+import threading
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Union
+from ._event import RequestEvent
+from ._aggregator import MetricsAggregator
+
+TelemetryHook = Callable[[RequestEvent], Any]
+
+
+class Telemetry:
+    """This class represents the instrumentation hooks called with the measurements of every API request.
+
+    Hooks are callables accepting a RequestEvent. They are called on the thread that made
+    the request once it completes, and should return quickly. Errors raised by hooks are
+    counted and otherwise ignored so instrumentation never changes the result of a request.
+
+    Telemetry is shared by every Service Class using the same auth_object. Each interface
+    labels the events it produces with a client identifier, allowing a single set of hooks
+    to be shared between interfaces while measurements are still attributed per auth_object.
+    """
+
+    # ____ ____ _  _ ____ ___ ____ _  _ ____ ___ ____ ____
+    # |    |  | |\ | [__   |  |__/ |  | |     |  |  | |__/
+    # |___ |__| | \| ___]  |  |  \ |__| |___  |  |__| |  \
+    #
+    def __init__(self,
+                 hooks: Optional[Union[TelemetryHook, Iterable[TelemetryHook]]] = None,
+                 client: Optional[str] = None
+                 ):
+        """Construct an instance of the Telemetry class.
+
+        Keyword arguments
+        ----
+        hooks : callable or list of callables
+            Hooks called with the RequestEvent of every completed request. [Default: None]
+        client : str
+            Label identifying the interface in the events produced. [Default: Derived from the API client ID]
+        """
+        if hooks is None:
+            hooks = []
+        elif callable(hooks):
+            hooks = [hooks]
+        self._hooks: List[TelemetryHook] = list(hooks)
+        self._client: Optional[str] = client
+        self._lock: threading.Lock = threading.Lock()
+        self._metrics: Dict[str, int] = {"events": 0, "hook_errors": 0}
+
+    @classmethod
+    def create(cls, telemetry: Union[bool, TelemetryHook, Iterable[TelemetryHook], "Telemetry"]) -> "Telemetry":
+        """Return the telemetry described by the telemetry keyword provided to an interface.
+
+        True enables an in-process MetricsAggregator, callables (or lists of them) are used as hooks.
+        """
+        if isinstance(telemetry, Telemetry):
+            return telemetry
+        if telemetry is True:
+            return cls(MetricsAggregator())
+
+        return cls(telemetry)
+
+    @staticmethod
+    def client_label(client_id: Optional[str], member_cid: Optional[str] = None) -> str:
+        """Return a label identifying API credentials without disclosing them."""
+        if not client_id:
+            return "default"
+        digest = hashlib.sha256(f"{client_id}:{member_cid or ''}".encode("utf-8")).hexdigest()
+
+        return digest[:12]
+
+    # _  _ ____ ___ _  _ ____ ___  ____
+    # |\/| |___  |  |__| |  | |  \ [__
+    # |  | |___  |  |  | |__| |__/ ___]
+    #
+    def bind(self, client: str) -> "Telemetry":
+        """Return telemetry sharing these hooks that labels the events it produces with the client provided."""
+        if self._client is not None:
+            return self
+        returned = copy.copy(self)
+        returned._client = client  # pylint: disable=W0212
+
+        return returned
+
+    def add_hook(self, hook: TelemetryHook):
+        """Add a hook called with the RequestEvent of every completed request."""
+        with self._lock:
+            self._hooks.append(hook)
+
+    def remove_hook(self, hook: TelemetryHook):
+        """Remove a previously added hook."""
+        with self._lock:
+            if hook in self._hooks:
+                self._hooks.remove(hook)
+
+    def start(self, operation: Optional[str], method: str, endpoint: str) -> RequestEvent:
+        """Return a new event for a request that is about to be sent."""
+        return RequestEvent(operation=operation, method=method.upper(), endpoint=endpoint, client=self._client)
+
+    def emit(self, event: RequestEvent, returned: Any = None):
+        """Complete the event using the value returned to the caller and provide it to every hook."""
+        event.finish(returned)
+        with self._lock:
+            hooks = tuple(self._hooks)
+            self._metrics["events"] += 1
+        for hook in hooks:
+            try:
+                hook(event)
+            except Exception:  # pylint: disable=W0703
+                with self._lock:
+                    self._metrics["hook_errors"] += 1
+
+    def observe(self, event: RequestEvent, call: Callable[[], Any]) -> Any:
+        """Return the result of the call, emitting the event once it returns or raises."""
+        try:
+            returned = call()
+        except Exception as failure:
+            event.error = event.error or type(failure).__name__
+            self.emit(event, failure)
+            raise
+        self.emit(event, returned)
+
+        return returned
+
+    async def async_observe(self, event: RequestEvent, call: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the awaited result of the call, emitting the event once it returns or raises."""
+        try:
+            returned = await call()
+        except Exception as failure:
+            event.error = event.error or type(failure).__name__
+            self.emit(event, failure)
+            raise
+        self.emit(event, returned)
+
+        return returned
+
+    # ___  ____ ____ ___  ____ ____ ___ _ ____ ____
+    # |__] |__/ |  | |__] |___ |__/  |  | |___ [__
+    # |    |  \ |__| |    |___ |  \  |  | |___ ___]
+    #
+    @property
+    def hooks(self) -> tuple:
+        """Return the hooks called with every completed request."""
+        with self._lock:
+            return tuple(self._hooks)
+
+    @property
+    def client(self) -> Optional[str]:
+        """Return the label identifying the interface in the events produced."""
+        return self._client
+
+    @property
+    def aggregator(self) -> Optional[MetricsAggregator]:
+        """Return the first in-process metrics aggregator used as a hook, if there is one."""
+        return next((hook for hook in self.hooks if isinstance(hook, MetricsAggregator)), None)
+
+    @property
+    def metrics(self) -> Dict[str, int]:
+        """Return the number of events emitted and errors raised by hooks."""
+        with self._lock:
+            return dict(self._metrics)
@@ -0,0 +1,207 @@
+"""Asynchronous HTTP Transport class.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+import ssl
+from importlib import import_module
+from types import ModuleType
+from typing import Any, Dict, List, Optional, Union
+from requests.compat import json as complexjson
+from requests.structures import CaseInsensitiveDict
+from .._constant import DEFAULT_POOL_MAXSIZE
+
+
+def load_httpx() -> ModuleType:
+    """Import httpx on first use, it is only required for asynchronous requests."""
+    try:
+        return import_module("httpx")
+    except ImportError as no_httpx:
+        raise ImportError("The httpx package is required for asynchronous requests. "
+                          "Install it with: python3 -m pip install crowdstrike-falconpy[async]"
+                          ) from no_httpx
+
+
+class TransportResponse:  # pylint: disable=R0903
+    """This class represents a response received by the asynchronous transport.
+
+    Provides the subset of the requests.Response interface used by the SDK to process results.
+    """
+
+    __slots__ = ["status_code", "headers", "content"]
+
+    def __init__(self, status_code: int, headers: Dict[str, str], content: bytes):
+        """Construct an instance of the TransportResponse class."""
+        self.status_code: int = status_code
+        self.headers: CaseInsensitiveDict = CaseInsensitiveDict(headers)
+        self.content: bytes = content
+
+    def json(self) -> Any:
+        """Decode the response content as JSON."""
+        return complexjson.loads(self.content)
+
+
+class AsyncTransport:
+    """This class represents the asynchronous HTTP connection pool used to communicate with the API.
+
+    Requires the httpx package. Connections are kept alive and shared by every
+    coroutine issuing requests through the same asynchronous interface.
+    """
+
+    # ____ ____ _  _ ____ ___ ____ _  _ ____ ___ ____ ____
+    # |    |  | |\ | [__   |  |__/ |  | |     |  |  | |__/
+    # |___ |__| | \| ___]  |  |  \ |__| |___  |  |__| |  \
+    #
+    def __init__(self,
+                 pool_maxsize: Optional[int] = None,
+                 keep_alive: Optional[bool] = True,
+                 verify: Optional[Union[bool, str]] = True,
+                 proxy: Optional[Dict[str, str]] = None
+                 ):
+        """Construct an instance of the AsyncTransport class.
+
+        Keyword arguments
+        ----
+        pool_maxsize : int
+            Maximum number of concurrent connections. [Default: 10]
+        keep_alive : bool
+            Reuse connections between requests. [Default: True]
+        verify : bool or str
+            Enable SSL certificate verification, or path to a CA bundle. [Default: True]
+        proxy : dict
+            Dictionary of proxies keyed by scheme, formatted as used by requests.
+        """
+        httpx = load_httpx()
+        self._pool_maxsize: int = DEFAULT_POOL_MAXSIZE
+        if isinstance(pool_maxsize, int) and pool_maxsize > 0:
+            self._pool_maxsize = pool_maxsize
+
+        self._keep_alive: bool = True
+        if isinstance(keep_alive, bool):
+            self._keep_alive = keep_alive
+
+        if isinstance(verify, str):
+            verify = ssl.create_default_context(cafile=verify)
+        mounts = None
+        if proxy:
+            mounts = {f"{scheme}://": httpx.AsyncHTTPTransport(proxy=url, verify=verify)
+                      for scheme, url in proxy.items()
+                      }
+        limits = httpx.Limits(max_connections=self._pool_maxsize,
+                              max_keepalive_connections=self._pool_maxsize if self._keep_alive else 0
+                              )
+        self._client = httpx.AsyncClient(verify=verify, limits=limits, mounts=mounts)
+
+    # _  _ ____ ___ _  _ ____ ___  ____
+    # |\/| |___  |  |__| |  | |  \ [__
+    # |  | |___  |  |  | |__| |__/ ___]
+    #
+    @staticmethod
+    def _timeout(timeout: Optional[Union[float, tuple]]):
+        """Convert a requests style timeout (total or connect / read tuple) to an httpx timeout."""
+        # Requests queue for a free pooled connection without a time limit.
+        if isinstance(timeout, tuple):
+            return load_httpx().Timeout(timeout[1], connect=timeout[0], pool=None)
+        return load_httpx().Timeout(timeout, pool=None)
+
+    async def request(self,
+                      method: str,
+                      url: str,
+                      params: Optional[Dict[str, Any]] = None,
+                      headers: Optional[Dict[str, str]] = None,
+                      json: Optional[Any] = None,
+                      data: Optional[Union[bytes, str, Dict[str, Any]]] = None,
+                      files: Optional[List[tuple]] = None,
+                      timeout: Optional[Union[float, tuple]] = None
+                      ) -> TransportResponse:
+        """Perform the HTTP request using a pooled connection.
+
+        Payload keywords are interpreted the same way requests interprets them.
+        """
+        content = None
+        if params:
+            params = {key: value for key, value in params.items() if value is not None}
+        if files:
+            # Multipart uploads, a JSON body is ignored.
+            json = None
+            data = data or None
+        elif data:
+            # Encoded data takes precedence over a JSON body.
+            json = None
+            if isinstance(data, (bytes, str)):
+                content = data
+                data = None
+        else:
+            data = None
+        response = await self._client.request(method, url, params=params, headers=headers, json=json,
+                                              data=data, content=content, files=files or None,
+                                              timeout=self._timeout(timeout)
+                                              )
+
+        # Preserve the header casing returned by the API, matching the synchronous transport.
+        headers = {key.decode("latin-1"): value.decode("latin-1") for key, value in response.headers.raw}
+
+        return TransportResponse(response.status_code, headers, response.content)
+
+    async def aclose(self):
+        """Close all pooled connections."""
+        await self._client.aclose()
+
+    async def __aenter__(self):
+        """Allow for entry as an asynchronous context manager."""
+        return self
+
+    async def __aexit__(self, *args):
+        """Close our pooled connections when we exit the context."""
+        await self.aclose()
+
+    # ___  ____ ____ ___  ____ ____ ___ _ ____ ____
+    # |__] |__/ |  | |__] |___ |__/  |  | |___ [__
+    # |    |  \ |__| |    |___ |  \  |  | |___ ___]
+    #
+    @property
+    def client(self):
+        """Return the underlying httpx client."""
+        return self._client
+
+    @property
+    def pool_maxsize(self) -> int:
+        """Return the maximum number of concurrent connections."""
+        return self._pool_maxsize
+
+    @property
+    def keep_alive(self) -> bool:
+        """Return the keep-alive setting."""
+        return self._keep_alive
@@ -0,0 +1,213 @@
+"""Single-flight coalescing of identical concurrent requests.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+import hashlib
+import json
+import threading
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Tuple
+from .._constant import COALESCED_METHODS, COALESCED_OPERATIONS
+from ._async_transport import TransportResponse
+
+
+class Flight:  # pylint: disable=R0903
+    """This class represents a request in flight, awaited by every identical request."""
+
+    __slots__ = ["done", "status_code", "headers", "content", "error"]
+
+    def __init__(self):
+        """Construct an instance of the Flight class."""
+        self.done: threading.Event = threading.Event()
+        self.status_code: int = 0
+        self.headers: Dict[str, str] = {}
+        self.content: bytes = b""
+        self.error: Optional[BaseException] = None
+
+    def response(self) -> TransportResponse:
+        """Return a new response object replaying the response received."""
+        return TransportResponse(self.status_code, self.headers, self.content)
+
+
+class RequestCoalescer:
+    """This class represents a single-flight layer sharing one API call between identical concurrent requests.
+
+    Requests are identical when they have the same method, endpoint, query string parameters,
+    headers (including the credentials authorizing them) and payload. When an identical request
+    is already in flight, the new request waits for it to complete and is given the same
+    response (or raises the same error) instead of being sent. Only the raw response (status
+    code, headers and content) is shared, and it is decoded for every caller, so results
+    returned to coalesced callers never share data with each other.
+
+    Requests using idempotent methods (GET and HEAD) are coalesced, along with read-only
+    operations sent using POST that are listed in COALESCED_OPERATIONS. Coalescers are
+    thread-safe and are shared by every Service Class using the same auth_object.
+    """
+
+    # ____ ____ _  _ ____ ___ ____ _  _ ____ ___ ____ ____
+    # |    |  | |\ | [__   |  |__/ |  | |     |  |  | |__/
+    # |___ |__| | \| ___]  |  |  \ |__| |___  |  |__| |  \
+    #
+    def __init__(self,
+                 operations: Optional[Iterable[str]] = COALESCED_OPERATIONS,
+                 exclude: Optional[Iterable[str]] = None,
+                 methods: Optional[Iterable[str]] = COALESCED_METHODS
+                 ):
+        """Construct an instance of the RequestCoalescer class.
+
+        Keyword arguments
+        ----
+        operations : list
+            Operation IDs coalesced regardless of their HTTP method. These operations must not
+            change data. [Default: Read-only POST operations listed in COALESCED_OPERATIONS]
+        exclude : list
+            Operation IDs that are never coalesced. [Default: None]
+        methods : list
+            HTTP methods of the requests coalesced. [Default: GET, HEAD]
+        """
+        self._lock: threading.Lock = threading.Lock()
+        self._flights: Dict[Tuple[Any, ...], Flight] = {}
+        self._operations: frozenset = frozenset(operations or [])
+        self._exclude: frozenset = frozenset(exclude or [])
+        self._methods: frozenset = frozenset(str(method).upper() for method in methods or [])
+        self._metrics: Dict[str, int] = {"requests": 0, "flights": 0, "coalesced": 0}
+
+    # _  _ ____ ___ _  _ ____ ___  ____
+    # |\/| |___  |  |__| |  | |  \ [__
+    # |  | |___  |  |  | |__| |__/ ___]
+    #
+    def coalesces(self, operation: Optional[str], method: str) -> bool:
+        """Return a boolean indicating if requests for the operation are coalesced."""
+        if operation in self._exclude:
+            return False
+
+        return method.upper() in self._methods or operation in self._operations
+
+    @staticmethod
+    def _digest(payload: Any) -> Optional[str]:
+        """Return a hash of a request payload, ignoring the order of dictionary keys."""
+        returned = None
+        if isinstance(payload, (bytes, bytearray)):
+            returned = hashlib.sha256(payload).hexdigest()
+        elif payload is not None:
+            returned = hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+        return returned
+
+    @classmethod
+    def key(cls,
+            method: str,
+            endpoint: str,
+            params: Optional[Mapping[str, Any]],
+            body: Any,
+            data: Any,
+            headers: Optional[Mapping[str, str]] = None
+            ) -> Tuple[Any, ...]:
+        """Return the key identifying a request.
+
+        Requests sent with different headers, such as the Authorization header of another
+        set of credentials, are never coalesced.
+        """
+        return (method.upper(), endpoint, cls._digest(params or None), cls._digest(body), cls._digest(data),
+                cls._digest(dict(headers) if headers else None)
+                )
+
+    def run(self, key: Tuple[Any, ...], send: Callable[[], Any]) -> Any:
+        """Return the response to a request, sharing it with every identical request made while it is in flight.
+
+        The send callable must return a response object providing status_code, headers and content.
+        Requests sharing the response are each given a new response object replaying it.
+        """
+        with self._lock:
+            self._metrics["requests"] += 1
+            flight = self._flights.get(key, None)
+            leader = flight is None
+            if leader:
+                flight = Flight()
+                self._flights[key] = flight
+                self._metrics["flights"] += 1
+            else:
+                self._metrics["coalesced"] += 1
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.response()
+        try:
+            response = send()
+            flight.status_code = response.status_code
+            flight.headers = dict(response.headers)
+            flight.content = response.content
+        except BaseException as failure:
+            flight.error = failure
+            raise
+        finally:
+            # Requests made from this point on are sent again.
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+        return response
+
+    # ___  ____ ____ ___  ____ ____ ___ _ ____ ____
+    # |__] |__/ |  | |__] |___ |__/  |  | |___ [__
+    # |    |  \ |__| |    |___ |  \  |  | |___ ___]
+    #
+    @property
+    def operations(self) -> frozenset:
+        """Return the operations coalesced regardless of their HTTP method."""
+        return self._operations
+
+    @property
+    def exclude(self) -> frozenset:
+        """Return the operations that are never coalesced."""
+        return self._exclude
+
+    @property
+    def methods(self) -> frozenset:
+        """Return the HTTP methods of the requests coalesced."""
+        return self._methods
+
+    @property
+    def in_flight(self) -> int:
+        """Return the number of requests currently in flight."""
+        with self._lock:
+            return len(self._flights)
+
+    @property
+    def metrics(self) -> Dict[str, int]:
+        """Return the number of requests, requests sent (flights) and requests coalesced into another."""
+        with self._lock:
+            return dict(self._metrics)
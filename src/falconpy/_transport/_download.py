@@ -0,0 +1,199 @@
+"""Streamed binary downloads.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+import hashlib
+import os
+from contextlib import contextmanager
+from typing import Any, BinaryIO, Dict, Iterator, Mapping, Optional, Union
+import requests
+from .._constant import DOWNLOAD_CHUNK_SIZE
+
+
+class StreamDownload:
+    """This class represents the destination of a binary download streamed straight to disk.
+
+    Response content is written in chunks as it arrives, so memory usage remains constant
+    regardless of the size of the file being downloaded. The content may optionally be hashed
+    as it is written, and interrupted downloads to a path may be resumed using a range request.
+    """
+
+    # ____ ____ _  _ ____ ___ ____ _  _ ____ ___ ____ ____
+    # |    |  | |\ | [__   |  |__/ |  | |     |  |  | |__/
+    # |___ |__| | \| ___]  |  |  \ |__| |___  |  |__| |  \
+    #
+    def __init__(self,
+                 target: Union[str, "os.PathLike[str]", BinaryIO],
+                 hash_algorithm: Optional[str] = None,
+                 resume: Optional[bool] = False,
+                 chunk_size: Optional[int] = DOWNLOAD_CHUNK_SIZE
+                 ):
+        """Construct an instance of the StreamDownload class.
+
+        Keyword arguments
+        ----
+        target : str, path or file-like object
+            Location the download is written to. File-like objects must be opened for binary writing.
+        hash_algorithm : str
+            Name of the hashlib algorithm used to hash the content as it is written (ex: sha256).
+        resume : bool
+            Resume a partial download to a path using a range request. [Default: False]
+        chunk_size : int
+            Number of bytes read from the connection at a time. [Default: 1048576]
+        """
+        self._path: Optional[str] = None
+        self._file: Optional[BinaryIO] = None
+        if isinstance(target, (str, os.PathLike)):
+            self._path = os.fspath(target)
+        else:
+            self._file = target
+        if hash_algorithm:
+            # Raise immediately for unsupported algorithms, before any request is sent.
+            hashlib.new(hash_algorithm)
+        self._hash_algorithm: Optional[str] = hash_algorithm
+        self._resume: bool = bool(resume) and self._path is not None
+        self._chunk_size: int = chunk_size if isinstance(chunk_size, int) and chunk_size > 0 else DOWNLOAD_CHUNK_SIZE
+        self._offset: int = 0
+
+    @classmethod
+    def from_keywords(cls, keywords: Optional[Mapping[str, Any]]) -> Optional["StreamDownload"]:
+        """Create a streamed download from the keywords provided to a method, if streaming was requested.
+
+        Streaming is requested by providing stream=True along with a target path or file-like object.
+        """
+        returned = None
+        if keywords and keywords.get("stream", False):
+            target = keywords.get("target", None)
+            if isinstance(target, cls):
+                returned = target
+            elif target is not None:
+                returned = cls(target,
+                               hash_algorithm=keywords.get("hash_algorithm", None),
+                               resume=keywords.get("resume", False),
+                               chunk_size=keywords.get("chunk_size", DOWNLOAD_CHUNK_SIZE)
+                               )
+
+        return returned
+
+    # _  _ ____ ___ _  _ ____ ___  ____
+    # |\/| |___  |  |__| |  | |  \ [__
+    # |  | |___  |  |  | |__| |__/ ___]
+    #
+    def range_headers(self) -> Dict[str, str]:
+        """Return the headers requesting the remainder of a partial download, if one is being resumed."""
+        returned = {}
+        self._offset = 0
+        if self._resume and os.path.isfile(self._path):
+            self._offset = os.path.getsize(self._path)
+        if self._offset:
+            returned["Range"] = f"bytes={self._offset}-"
+
+        return returned
+
+    def accepts(self, response: requests.Response) -> bool:
+        """Return a boolean indicating if the response contains content to be streamed to the target."""
+        content_type = response.headers.get("Content-Type", "")
+        if content_type.startswith(("application/json", "text/plain")):
+            # API responses (including errors) are processed normally.
+            return False
+
+        return response.status_code in (200, 206) or (response.status_code == 416 and self._offset > 0)
+
+    def _hasher(self, offset: int) -> Optional[Any]:
+        """Create the hash object, seeded with the portion of the file already downloaded."""
+        hasher = hashlib.new(self._hash_algorithm) if self._hash_algorithm else None
+        if hasher and offset:
+            with open(self._path, "rb") as existing:
+                for chunk in iter(lambda: existing.read(self._chunk_size), b""):
+                    hasher.update(chunk)
+
+        return hasher
+
+    @contextmanager
+    def _output(self, offset: int) -> Iterator[BinaryIO]:
+        """Open the target for writing, appending when a partial download is resumed."""
+        if self._file is not None:
+            yield self._file
+        else:
+            with open(self._path, "ab" if offset else "wb") as output:
+                yield output
+
+    def write(self, response: requests.Response) -> Dict[str, Union[str, int, None]]:
+        """Write the response content to the target as it arrives, returning the details of the download."""
+        offset = 0
+        if response.status_code in (206, 416):
+            offset = self._offset
+        written = 0
+        try:
+            hasher = self._hasher(offset)
+            if response.status_code != 416:  # The partial download was already complete.
+                with self._output(offset) as output:
+                    for chunk in response.iter_content(chunk_size=self._chunk_size):
+                        output.write(chunk)
+                        if hasher:
+                            hasher.update(chunk)
+                        written += len(chunk)
+        finally:
+            response.close()
+        returned = {"path": self._path, "bytes_written": written, "size": offset + written}
+        if hasher:
+            returned[self._hash_algorithm] = hasher.hexdigest()
+
+        return returned
+
+    # ___  ____ ____ ___  ____ ____ ___ _ ____ ____
+    # |__] |__/ |  | |__] |___ |__/  |  | |___ [__
+    # |    |  \ |__| |    |___ |  \  |  | |___ ___]
+    #
+    @property
+    def path(self) -> Optional[str]:
+        """Return the path the download is written to, if the target is a path."""
+        return self._path
+
+    @property
+    def hash_algorithm(self) -> Optional[str]:
+        """Return the algorithm used to hash the content."""
+        return self._hash_algorithm
+
+    @property
+    def resume(self) -> bool:
+        """Return the resume setting."""
+        return self._resume
+
+    @property
+    def chunk_size(self) -> int:
+        """Return the number of bytes read from the connection at a time."""
+        return self._chunk_size
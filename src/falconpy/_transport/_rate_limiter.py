@@ -0,0 +1,233 @@
+"""Client side rate limiter.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+import threading
+import time
+from typing import Any, Dict, Mapping, Optional, Tuple
+from .._constant import RATE_LIMIT_PERIOD, RATE_LIMIT_REQUEUE
+
+
+def _header_number(headers: Mapping[str, Any], name: str) -> Optional[float]:
+    """Return a numeric header value, or None if it is not present or not a number."""
+    try:
+        return float(headers.get(name))
+    except (TypeError, ValueError):
+        return None
+
+
+def retry_after(headers: Mapping[str, Any]) -> Optional[float]:
+    """Return the number of seconds the API has asked us to wait before retrying, if provided."""
+    returned = _header_number(headers, "X-RateLimit-RetryAfter")
+    if returned is not None and returned > 1000000000:
+        # X-RateLimit-RetryAfter is provided as an epoch timestamp.
+        returned = returned - time.time()
+    if returned is None:
+        returned = _header_number(headers, "Retry-After")
+
+    return max(returned, 0.0) if returned is not None else None
+
+
+class RateLimiter:
+    """This class represents a client side token bucket used to pace requests to the API.
+
+    The bucket learns the request budget from the X-RateLimit-Limit and X-RateLimit-Remaining
+    headers returned with every response. Requests wait for budget to become available rather
+    than being sent and rejected. When the API responds with a 429, all requests sharing the
+    limiter are paused until the time provided in the X-RateLimit-RetryAfter header.
+
+    Limiters are thread-safe and are shared by every interface using the same API client and
+    member CID, as the API enforces limits per client.
+    """
+
+    _registry: Dict[Tuple[Any, ...], "RateLimiter"] = {}
+    _registry_lock: threading.Lock = threading.Lock()
+
+    # ____ ____ _  _ ____ ___ ____ _  _ ____ ___ ____ ____
+    # |    |  | |\ | [__   |  |__/ |  | |     |  |  | |__/
+    # |___ |__| | \| ___]  |  |  \ |__| |___  |  |__| |  \
+    #
+    def __init__(self,
+                 limit: Optional[int] = None,
+                 period: Optional[float] = RATE_LIMIT_PERIOD,
+                 requeue_limit: Optional[int] = RATE_LIMIT_REQUEUE
+                 ):
+        """Construct an instance of the RateLimiter class.
+
+        Keyword arguments
+        ----
+        limit : int
+            Number of requests allowed per period. Learned from the API when not provided.
+        period : float
+            Length of the rate limit period in seconds. [Default: 60]
+        requeue_limit : int
+            Number of times a request rejected with a 429 is sent again. [Default: 3]
+        """
+        self._condition: threading.Condition = threading.Condition()
+        self._period: float = float(period) if period and period > 0 else RATE_LIMIT_PERIOD
+        # Capacity remains unknown (no pacing) until the API tells us our limit.
+        self._capacity: Optional[float] = float(limit) if limit and limit > 0 else None
+        self._tokens: float = self._capacity or 0.0
+        self._updated: float = time.monotonic()
+        self._blocked_until: float = 0.0
+        self._requeue_limit: int = requeue_limit if isinstance(requeue_limit, int) and requeue_limit >= 0 else 0
+        self._metrics: Dict[str, float] = {"requests": 0, "delayed": 0, "wait_time": 0.0,
+                                           "max_wait": 0.0, "throttled": 0, "requeued": 0
+                                           }
+
+    @classmethod
+    def shared(cls, *key) -> "RateLimiter":
+        """Return the limiter shared by every interface using the same key, creating it if necessary."""
+        with cls._registry_lock:
+            if key not in cls._registry:
+                cls._registry[key] = cls()
+
+            return cls._registry[key]
+
+    # _  _ ____ ___ _  _ ____ ___  ____
+    # |\/| |___  |  |__| |  | |  \ [__
+    # |  | |___  |  |  | |__| |__/ ___]
+    #
+    def _refill(self, now: float):
+        """Add the budget accrued since the last update."""
+        if self._capacity:
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._capacity / self._period)
+        self._updated = now
+
+    def _delay(self, now: float) -> float:
+        """Return the number of seconds until a request may be sent."""
+        returned = 0.0
+        if now < self._blocked_until:
+            returned = self._blocked_until - now
+        elif self._capacity and self._tokens < 1:
+            returned = (1 - self._tokens) * self._period / self._capacity
+
+        return returned
+
+    def acquire(self) -> float:
+        """Wait until the budget allows a request to be sent, returning the number of seconds waited."""
+        start = time.monotonic()
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                delay = self._delay(now)
+                if delay <= 0:
+                    break
+                self._condition.wait(delay)
+            if self._capacity:
+                self._tokens -= 1
+            waited = time.monotonic() - start
+            self._metrics["requests"] += 1
+            if waited > 0.001:
+                self._metrics["delayed"] += 1
+                self._metrics["wait_time"] += waited
+                self._metrics["max_wait"] = max(self._metrics["max_wait"], waited)
+
+        return waited
+
+    def update(self, status_code: int, headers: Mapping[str, Any]) -> bool:
+        """Update the budget using the rate limit headers of a response.
+
+        Returns a boolean indicating if the request was throttled and may be sent again.
+        """
+        limit = _header_number(headers, "X-RateLimit-Limit")
+        remaining = _header_number(headers, "X-RateLimit-Remaining")
+        wait = retry_after(headers)
+        with self._condition:
+            now = time.monotonic()
+            self._refill(now)
+            if limit and limit > 0:
+                if self._capacity is None:
+                    self._tokens = limit
+                self._capacity = limit
+            if remaining is not None and self._capacity:
+                # The API is authoritative, never assume more budget than it reports.
+                self._tokens = min(self._tokens, remaining)
+            throttled = status_code == 429
+            if throttled:
+                self._metrics["throttled"] += 1
+                delay = wait
+                if delay is None:
+                    delay = self._period / self._capacity if self._capacity else 1.0
+                self._blocked_until = max(self._blocked_until, now + delay)
+                if self._capacity:
+                    # Drain the bucket so exactly one request is allowed once the retry time has passed.
+                    self._tokens = 1.0 - (self._blocked_until - now) * self._capacity / self._period
+            self._condition.notify_all()
+
+        return throttled
+
+    def requeue(self, attempt: int) -> bool:
+        """Return a boolean indicating if a throttled request should be sent again."""
+        returned = attempt < self._requeue_limit
+        if returned:
+            with self._condition:
+                self._metrics["requeued"] += 1
+
+        return returned
+
+    # ___  ____ ____ ___  ____ ____ ___ _ ____ ____
+    # |__] |__/ |  | |__] |___ |__/  |  | |___ [__
+    # |    |  \ |__| |    |___ |  \  |  | |___ ___]
+    #
+    @property
+    def limit(self) -> Optional[int]:
+        """Return the number of requests allowed per period, if known."""
+        return int(self._capacity) if self._capacity else None
+
+    @property
+    def period(self) -> float:
+        """Return the length of the rate limit period in seconds."""
+        return self._period
+
+    @property
+    def remaining(self) -> Optional[float]:
+        """Return the estimated remaining budget, if known."""
+        with self._condition:
+            self._refill(time.monotonic())
+            return self._tokens if self._capacity else None
+
+    @property
+    def requeue_limit(self) -> int:
+        """Return the number of times a throttled request is sent again."""
+        return self._requeue_limit
+
+    @property
+    def metrics(self) -> Dict[str, float]:
+        """Return request, wait time and throttling statistics for this limiter."""
+        with self._condition:
+            return dict(self._metrics)
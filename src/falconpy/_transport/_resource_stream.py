@@ -0,0 +1,237 @@
+"""Incremental parser for the resources of a JSON API response.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+import codecs
+import re
+from json import JSONDecoder, JSONDecodeError
+from typing import Any, Dict, Iterator, List, Optional, Union
+import requests
+from .._constant import RESOURCE_STREAM_CHUNK_SIZE
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class ResourceStream:
+    """This class represents the resources of a JSON API response, parsed incrementally as they arrive.
+
+    Records within the resources list are decoded and yielded one at a time as the response is
+    read from the connection, so only one record (and the connection buffer) is held in memory
+    regardless of the size of the response. The remaining branches of the response body (meta,
+    errors, etc.) are collected as they are encountered.
+
+    The connection is returned to the pool once every record has been read, or when the stream
+    is closed. Streams should be fully consumed, closed, or used as a context manager.
+    """
+
+    # ____ ____ _  _ ____ ___ ____ _  _ ____ ___ ____ ____
+    # |    |  | |\ | [__   |  |__/ |  | |     |  |  | |__/
+    # |___ |__| | \| ___]  |  |  \ |__| |___  |  |__| |  \
+    #
+    def __init__(self, response: requests.Response, chunk_size: Optional[int] = RESOURCE_STREAM_CHUNK_SIZE):
+        """Construct an instance of the ResourceStream class.
+
+        Keyword arguments
+        ----
+        response : requests.Response
+            Response to parse, requested with stream=True so the content has not yet been read.
+        chunk_size : int
+            Number of bytes read from the connection at a time. [Default: 65536]
+        """
+        self._response = response
+        self._chunk_size: int = chunk_size if isinstance(chunk_size, int) and chunk_size > 0 \
+            else RESOURCE_STREAM_CHUNK_SIZE
+        self._chunks: Optional[Iterator[bytes]] = None
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._decoder = JSONDecoder()
+        self._buffer: str = ""
+        self._pos: int = 0
+        self._eof: bool = False
+        self._body: Dict[str, Any] = {}
+        self._count: int = 0
+        self._records: Optional[Iterator[Any]] = None
+
+    @staticmethod
+    def accepts(response: requests.Response) -> bool:
+        """Return a boolean indicating if the resources of the response can be streamed.
+
+        Only successful JSON responses are streamed, errors are processed normally.
+        """
+        content_type = response.headers.get("Content-Type", "")
+        return response.status_code < 400 and content_type.startswith("application/json")
+
+    #  _______ _______ _______ _     _  _____  ______  _______
+    #  |  |  | |______    |    |_____| |     | |     \ |______
+    #  |  |  | |______    |    |     | |_____| |_____/ ______|
+    #
+    def __iter__(self) -> Iterator[Any]:
+        """Return the iterator yielding the records within the resources list."""
+        if self._records is None:
+            self._records = self._parse()
+        return self._records
+
+    def __next__(self) -> Any:
+        """Return the next record within the resources list."""
+        return next(iter(self))
+
+    def __enter__(self) -> "ResourceStream":
+        """Open a context manager for the stream."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Close the stream when the context manager exits."""
+        self.close()
+
+    def close(self):
+        """Stop reading the response and release the connection."""
+        if self._records is not None:
+            self._records.close()
+        self._response.close()
+
+    def _fill(self) -> bool:
+        """Read the next chunk of the response into the buffer, returning False when the response is exhausted."""
+        if self._eof:
+            return False
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            self._eof = True
+            chunk = b""
+        # Discard everything already decoded before appending the new content.
+        self._buffer = self._buffer[self._pos:] + self._text.decode(chunk, final=self._eof)
+        self._pos = 0
+
+        return not self._eof or bool(self._buffer)
+
+    def _skip(self) -> str:
+        """Skip whitespace, returning the next significant character (or an empty string at the end of the response)."""
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if self._eof or not self._fill():
+                return ""
+
+    def _expect(self, expected: str) -> str:
+        """Consume the next significant character, which must be one of the expected characters."""
+        found = self._skip()
+        if not found or found not in expected:
+            raise JSONDecodeError(f"Expecting one of {expected!r}", self._buffer, self._pos)
+        self._pos += 1
+
+        return found
+
+    def _value(self) -> Any:
+        """Decode the next complete value, reading more of the response until it has fully arrived."""
+        self._skip()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+                # A value ending with the buffer may be incomplete (ex: a number split across chunks).
+                if end < len(self._buffer) or self._eof:
+                    self._pos = end
+                    return value
+            except JSONDecodeError:
+                if self._eof:
+                    raise
+            self._fill()
+
+    def _resources(self) -> Iterator[Any]:
+        """Yield each record within the resources list, consuming the list."""
+        self._expect("[")
+        if self._skip() == "]":
+            self._pos += 1
+        else:
+            while True:
+                record = self._value()
+                self._count += 1
+                yield record
+                if self._expect(",]") == "]":
+                    break
+
+    def _parse(self) -> Iterator[Any]:
+        """Parse the response body, yielding each record within the resources list."""
+        try:
+            self._chunks = self._response.iter_content(chunk_size=self._chunk_size)
+            self._expect("{")
+            if self._skip() == "}":
+                return
+            while True:
+                key = self._value()
+                if not isinstance(key, str):
+                    raise JSONDecodeError("Expecting property name", self._buffer, self._pos)
+                self._expect(":")
+                if key == "resources" and self._skip() == "[":
+                    yield from self._resources()
+                else:
+                    self._body[key] = self._value()
+                if self._expect(",}") == "}":
+                    break
+        finally:
+            self._response.close()
+
+    # ___  ____ ____ ___  ____ ____ ___ _ ____ ____
+    # |__] |__/ |  | |__] |___ |__/  |  | |___ [__
+    # |    |  \ |__| |    |___ |  \  |  | |___ ___]
+    #
+    @property
+    def status_code(self) -> int:
+        """Return the status code of the response."""
+        return self._response.status_code
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        """Return the headers of the response."""
+        return dict(self._response.headers)
+
+    @property
+    def meta(self) -> Dict[str, Any]:
+        """Return the meta branch of the response, once it has been read."""
+        return self._body.get("meta", {})
+
+    @property
+    def errors(self) -> List[Dict[str, Union[str, int]]]:
+        """Return the errors branch of the response, once it has been read."""
+        return self._body.get("errors", None) or []
+
+    @property
+    def body(self) -> Dict[str, Any]:
+        """Return the branches of the response body read so far, excluding the resources list."""
+        return self._body
+
+    @property
+    def count(self) -> int:
+        """Return the number of records yielded so far."""
+        return self._count
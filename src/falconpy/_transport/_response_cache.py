@@ -0,0 +1,261 @@
+"""Response cache for read-mostly GET operations.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Tuple, Union
+from .._constant import CACHE_TTL, CACHE_MAX_ENTRIES, CACHE_MAX_SIZE, CACHED_OPERATIONS
+from ._async_transport import TransportResponse
+
+
+class CacheEntry:  # pylint: disable=R0903
+    """This class represents a response held by the response cache."""
+
+    __slots__ = ["status_code", "headers", "content", "etag", "expires"]
+
+    def __init__(self, status_code: int, headers: Dict[str, str], content: bytes, expires: float):
+        """Construct an instance of the CacheEntry class."""
+        self.status_code: int = status_code
+        self.headers: Dict[str, str] = headers
+        self.content: bytes = content
+        self.etag: Optional[str] = headers.get("ETag", headers.get("Etag", None))
+        self.expires: float = expires
+
+    def response(self) -> TransportResponse:
+        """Return a new response object replaying the cached response."""
+        return TransportResponse(self.status_code, self.headers, self.content)
+
+
+class ResponseCache:
+    """This class represents a cache of responses received for read-mostly GET operations.
+
+    Responses are keyed on the operation ID, the endpoint, the normalized query string
+    parameters and a label identifying the client ID and member CID of the interface, so a
+    cache shared by interfaces using different credentials never returns one tenant's
+    response to another. The label does not change when tokens are refreshed, so cached
+    responses remain usable (and revalidate) across token refreshes. Responses remain fresh
+    for the time-to-live configured for the operation. The least recently used responses are
+    evicted once the cache exceeds its entry or size limits. Stale
+    responses received with an ETag may optionally be revalidated using If-None-Match, in which
+    case a 304 response renews the cached response without transferring it again.
+
+    The cached response content is decoded for every request, so results returned to callers
+    never share data with the cache or each other. Caches are thread-safe and are shared by
+    every Service Class using the same auth_object.
+    """
+
+    # ____ ____ _  _ ____ ___ ____ _  _ ____ ___ ____ ____
+    # |    |  | |\ | [__   |  |__/ |  | |     |  |  | |__/
+    # |___ |__| | \| ___]  |  |  \ |__| |___  |  |__| |  \
+    #
+    def __init__(self,
+                 ttl: Optional[float] = CACHE_TTL,
+                 operations: Optional[Union[Iterable[str], Mapping[str, float]]] = CACHED_OPERATIONS,
+                 max_entries: Optional[int] = CACHE_MAX_ENTRIES,
+                 max_size: Optional[int] = CACHE_MAX_SIZE,
+                 revalidate: Optional[bool] = True
+                 ):
+        """Construct an instance of the ResponseCache class.
+
+        Keyword arguments
+        ----
+        ttl : float
+            Number of seconds responses remain fresh, unless specified for the operation. [Default: 300]
+        operations : list or dict
+            Operation IDs to cache. Provide a dictionary to specify the time-to-live of each
+            operation in seconds. [Default: Read-mostly operations listed in CACHED_OPERATIONS]
+        max_entries : int
+            Maximum number of responses held. [Default: 1024]
+        max_size : int
+            Maximum combined size of the response content held in bytes. [Default: 32 MiB]
+        revalidate : bool
+            Revalidate stale responses received with an ETag using If-None-Match. [Default: True]
+        """
+        self._lock: threading.Lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[Any, ...], CacheEntry]" = OrderedDict()
+        self._ttl: float = float(ttl) if ttl and ttl > 0 else CACHE_TTL
+        if isinstance(operations, Mapping):
+            self._ttls: Dict[str, float] = {str(oper): float(oper_ttl) for oper, oper_ttl in operations.items()}
+        else:
+            self._ttls = {str(oper): self._ttl for oper in operations or []}
+        self._max_entries: int = max_entries if isinstance(max_entries, int) and max_entries > 0 else CACHE_MAX_ENTRIES
+        self._max_size: int = max_size if isinstance(max_size, int) and max_size > 0 else CACHE_MAX_SIZE
+        self._revalidate: bool = bool(revalidate)
+        self._size: int = 0
+        self._metrics: Dict[str, int] = {"hits": 0, "misses": 0, "revalidated": 0, "evicted": 0}
+
+    # _  _ ____ ___ _  _ ____ ___  ____
+    # |\/| |___  |  |__| |  | |  \ [__
+    # |  | |___  |  |  | |__| |__/ ___]
+    #
+    def ttl_for(self, operation: Optional[str], method: str) -> Optional[float]:
+        """Return the time-to-live of responses for an operation, or None if it is not cached."""
+        returned = None
+        if method.upper() == "GET":
+            returned = self._ttls.get(operation, None)
+
+        return returned
+
+    @staticmethod
+    def key(operation: Optional[str],
+            endpoint: str,
+            params: Optional[Mapping[str, Any]],
+            client: Optional[str] = None
+            ) -> Tuple[Any, ...]:
+        """Return the cache key for a request, ignoring the order of query string parameters."""
+        normalized = []
+        for param, value in (params or {}).items():
+            if isinstance(value, (list, tuple, set)):
+                value = tuple(str(item) for item in value)
+            else:
+                value = str(value)
+            normalized.append((param, value))
+
+        return (operation, endpoint, tuple(sorted(normalized)), client)
+
+    def _evict(self):
+        """Evict the least recently used responses until the cache is within its limits."""
+        while self._entries and (len(self._entries) > self._max_entries or self._size > self._max_size):
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= len(evicted.content)
+            self._metrics["evicted"] += 1
+
+    def _store(self, key: Tuple[Any, ...], entry: CacheEntry):
+        """Add a response to the cache, replacing any previous response for the key."""
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous.content)
+            self._entries[key] = entry
+            self._size += len(entry.content)
+            self._evict()
+
+    def fetch(self,
+              operation: Optional[str],
+              endpoint: str,
+              params: Optional[Mapping[str, Any]],
+              headers: Dict[str, str],
+              send: Callable[..., Any],
+              client: Optional[str] = None
+              ) -> Any:
+        """Return the cached response for a GET request, sending it using the provided callable when required.
+
+        The send callable must accept the request headers as a keyword argument. The client label
+        identifies the credentials (and member CID) the request is sent with.
+        """
+        ttl = self.ttl_for(operation, "GET")
+        if ttl is None:
+            return send(headers=headers)
+        key = self.key(operation, endpoint, params, client)
+        with self._lock:
+            entry = self._entries.get(key, None)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                if entry.expires > time.monotonic():
+                    self._metrics["hits"] += 1
+                    return entry.response()
+        if entry is not None and entry.etag and self._revalidate:
+            headers = {**headers, "If-None-Match": entry.etag}
+        response = send(headers=headers)
+        if entry is not None and response.status_code == 304:
+            response.close()
+            with self._lock:
+                self._metrics["revalidated"] += 1
+                entry.expires = time.monotonic() + ttl
+            return entry.response()
+        with self._lock:
+            self._metrics["misses"] += 1
+        content_type = response.headers.get("Content-Type", "")
+        if response.status_code == 200 and content_type.startswith("application/json"):
+            self._store(key, CacheEntry(response.status_code,
+                                        dict(response.headers),
+                                        response.content,
+                                        time.monotonic() + ttl
+                                        ))
+
+        return response
+
+    def invalidate(self, operation: Optional[str] = None):
+        """Remove the cached responses for an operation, or every cached response when no operation is provided."""
+        with self._lock:
+            for key in [key for key in self._entries if operation is None or key[0] == operation]:
+                self._size -= len(self._entries.pop(key).content)
+
+    def clear(self):
+        """Remove every cached response."""
+        self.invalidate()
+
+    # ___  ____ ____ ___  ____ ____ ___ _ ____ ____
+    # |__] |__/ |  | |__] |___ |__/  |  | |___ [__
+    # |    |  \ |__| |    |___ |  \  |  | |___ ___]
+    #
+    @property
+    def ttl(self) -> float:
+        """Return the default number of seconds responses remain fresh."""
+        return self._ttl
+
+    @property
+    def operations(self) -> Dict[str, float]:
+        """Return the cached operations and the time-to-live of their responses."""
+        return dict(self._ttls)
+
+    @property
+    def max_entries(self) -> int:
+        """Return the maximum number of responses held."""
+        return self._max_entries
+
+    @property
+    def max_size(self) -> int:
+        """Return the maximum combined size of the response content held in bytes."""
+        return self._max_size
+
+    @property
+    def revalidate(self) -> bool:
+        """Return the revalidation setting."""
+        return self._revalidate
+
+    @property
+    def size(self) -> int:
+        """Return the combined size of the response content held in bytes."""
+        return self._size
+
+    @property
+    def metrics(self) -> Dict[str, int]:
+        """Return hit, miss, revalidation and eviction counts for this cache, along with the number of entries held."""
+        with self._lock:
+            return {**self._metrics, "entries": len(self._entries)}
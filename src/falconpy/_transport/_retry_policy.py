@@ -0,0 +1,239 @@
+"""Retry policy for transient request failures.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional
+from requests.exceptions import ConnectionError as RequestsConnectionError, ConnectTimeout, SSLError, Timeout
+from .._constant import (
+    RETRY_MAX_ATTEMPTS,
+    RETRY_BACKOFF_FACTOR,
+    RETRY_BACKOFF_MAX,
+    RETRY_STATUSES,
+    IDEMPOTENT_METHODS
+    )
+from ._rate_limiter import retry_after
+
+
+class RetryPolicy:
+    """This class represents the policy used to retry requests that fail for transient reasons.
+
+    Requests failing due to a connection error, or receiving a response with a retryable status
+    code, are sent again after an exponential backoff with jitter. When the API specifies how long
+    to wait using the X-RateLimit-RetryAfter or Retry-After headers, that delay is used instead.
+
+    Requests that may have been processed by the API are only retried for idempotent methods.
+    Requests that never reached the API (connection timeouts) and requests rejected due to
+    rate limiting (429) are retried regardless of method.
+    """
+
+    # ____ ____ _  _ ____ ___ ____ _  _ ____ ___ ____ ____
+    # |    |  | |\ | [__   |  |__/ |  | |     |  |  | |__/
+    # |___ |__| | \| ___]  |  |  \ |__| |___  |  |__| |  \
+    #
+    def __init__(self,
+                 max_attempts: Optional[int] = RETRY_MAX_ATTEMPTS,
+                 backoff_factor: Optional[float] = RETRY_BACKOFF_FACTOR,
+                 backoff_max: Optional[float] = RETRY_BACKOFF_MAX,
+                 jitter: Optional[bool] = True,
+                 statuses: Optional[Iterable[int]] = RETRY_STATUSES,
+                 methods: Optional[Iterable[str]] = IDEMPOTENT_METHODS,
+                 respect_retry_after: Optional[bool] = True,
+                 on_retry: Optional[Callable[[Optional[str], int, float, Any], None]] = None
+                 ):
+        """Construct an instance of the RetryPolicy class.
+
+        Keyword arguments
+        ----
+        max_attempts : int
+            Maximum number of times a request is sent, including the first attempt. [Default: 3]
+        backoff_factor : float
+            Delay in seconds before the first retry, doubled for every subsequent retry. [Default: 0.5]
+        backoff_max : float
+            Largest delay in seconds calculated by the backoff. [Default: 30]
+        jitter : bool
+            Randomize the backoff delay to spread out retries from concurrent requests. [Default: True]
+        statuses : list of int
+            Response status codes that are retried. [Default: 429, 500, 502, 503, 504]
+        methods : list of str
+            Idempotent HTTP methods that may be retried once the request has reached the API.
+            [Default: GET, HEAD, OPTIONS, PUT, DELETE]
+        respect_retry_after : bool
+            Wait for the delay specified by the API in the X-RateLimit-RetryAfter or Retry-After
+            response headers when provided. [Default: True]
+        on_retry : callable
+            Called before every retry with the operation ID, the attempt number, the delay in seconds
+            and the status code or exception that caused the retry.
+        """
+        self._max_attempts: int = RETRY_MAX_ATTEMPTS
+        if isinstance(max_attempts, int) and max_attempts > 0:
+            self._max_attempts = max_attempts
+        self._backoff_factor: float = float(backoff_factor) if backoff_factor and backoff_factor > 0 else 0.0
+        self._backoff_max: float = float(backoff_max) if backoff_max and backoff_max > 0 else RETRY_BACKOFF_MAX
+        self._jitter: bool = bool(jitter)
+        self._statuses: frozenset = frozenset(statuses or [])
+        self._methods: frozenset = frozenset(method.upper() for method in methods or [])
+        self._respect_retry_after: bool = bool(respect_retry_after)
+        self.on_retry: Optional[Callable[[Optional[str], int, float, Any], None]] = on_retry
+        self._lock: threading.Lock = threading.Lock()
+        self._retries: Dict[Optional[str], int] = {}
+
+    # _  _ ____ ___ _  _ ____ ___  ____
+    # |\/| |___  |  |__| |  | |  \ [__
+    # |  | |___  |  |  | |__| |__/ ___]
+    #
+    def retryable(self,
+                  method: str,
+                  attempt: int,
+                  status_code: Optional[int] = None,
+                  error: Optional[Exception] = None
+                  ) -> bool:
+        """Return a boolean indicating if a failed attempt should be retried.
+
+        Keyword arguments
+        ----
+        method : str
+            HTTP method of the request.
+        attempt : int
+            Number of attempts already made for this request.
+        status_code : int
+            Status code of the response received, if one was received.
+        error : Exception
+            Exception raised while sending the request, if one was raised.
+        """
+        returned = False
+        if attempt < self._max_attempts:
+            idempotent = method.upper() in self._methods
+            if error is not None:
+                # Connection timeouts happen before the request is sent. Certificate
+                # failures are not transient and are never retried.
+                if isinstance(error, ConnectTimeout):
+                    returned = True
+                elif isinstance(error, (RequestsConnectionError, Timeout)) and not isinstance(error, SSLError):
+                    returned = idempotent
+            elif status_code in self._statuses:
+                # Throttled requests are rejected before they are processed.
+                returned = idempotent or status_code == 429
+
+        return returned
+
+    def delay(self, attempt: int, headers: Optional[Mapping[str, Any]] = None) -> float:
+        """Return the number of seconds to wait before sending the next attempt.
+
+        Keyword arguments
+        ----
+        attempt : int
+            Number of attempts already made for this request.
+        headers : dict
+            Headers of the response received, if one was received.
+        """
+        returned = None
+        if self._respect_retry_after and headers:
+            returned = retry_after(headers)
+        if returned is None:
+            returned = min(self._backoff_max, self._backoff_factor * 2 ** max(attempt - 1, 0))
+            if self._jitter:
+                returned = random.uniform(0, returned)  # nosec - Not used for cryptographic purposes
+
+        return returned
+
+    def backoff(self,
+                attempt: int,
+                operation: Optional[str] = None,
+                headers: Optional[Mapping[str, Any]] = None,
+                cause: Any = None
+                ) -> float:
+        """Record a retry for the operation and wait before it is sent, returning the number of seconds waited."""
+        wait = self.delay(attempt, headers)
+        with self._lock:
+            self._retries[operation] = self._retries.get(operation, 0) + 1
+        if self.on_retry:
+            self.on_retry(operation, attempt, wait, cause)
+        time.sleep(wait)
+
+        return wait
+
+    def reset(self):
+        """Reset the retry counters."""
+        with self._lock:
+            self._retries = {}
+
+    # ___  ____ ____ ___  ____ ____ ___ _ ____ ____
+    # |__] |__/ |  | |__] |___ |__/  |  | |___ [__
+    # |    |  \ |__| |    |___ |  \  |  | |___ ___]
+    #
+    @property
+    def max_attempts(self) -> int:
+        """Return the maximum number of attempts made for a request."""
+        return self._max_attempts
+
+    @property
+    def backoff_factor(self) -> float:
+        """Return the delay before the first retry."""
+        return self._backoff_factor
+
+    @property
+    def backoff_max(self) -> float:
+        """Return the largest delay calculated by the backoff."""
+        return self._backoff_max
+
+    @property
+    def jitter(self) -> bool:
+        """Return the jitter setting."""
+        return self._jitter
+
+    @property
+    def statuses(self) -> frozenset:
+        """Return the status codes that are retried."""
+        return self._statuses
+
+    @property
+    def methods(self) -> frozenset:
+        """Return the idempotent methods that are retried."""
+        return self._methods
+
+    @property
+    def respect_retry_after(self) -> bool:
+        """Return the setting for waiting the delay specified by the API."""
+        return self._respect_retry_after
+
+    @property
+    def retries(self) -> Dict[Optional[str], int]:
+        """Return the number of retries performed per operation ID."""
+        with self._lock:
+            return dict(self._retries)
@@ -0,0 +1,278 @@
+"""HTTP Transport class.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+import time
+from http.cookiejar import DefaultCookiePolicy
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+import requests
+from requests.adapters import HTTPAdapter
+from requests.exceptions import RequestException
+from .._constant import DEFAULT_POOL_CONNECTIONS, DEFAULT_POOL_MAXSIZE
+from ._rate_limiter import RateLimiter
+from ._retry_policy import RetryPolicy
+from .._telemetry import RequestEvent
+
+
+def payload_positions(data: Any = None, files: Any = None) -> Optional[List[Tuple[Any, int]]]:
+    """Return the file objects sent with a request and their current positions.
+
+    None is returned when a payload is consumed by sending it and cannot be rewound
+    (unseekable file objects and generators), in which case the request cannot be resent.
+    """
+    payloads = [data]
+    for field in (files.items() if isinstance(files, Mapping) else files or []):
+        value = field[1] if isinstance(field, (tuple, list)) and len(field) > 1 else field
+        if isinstance(value, (tuple, list)):
+            # Files provided as a tuple of the file name, content and optional content type.
+            value = value[1] if len(value) > 1 else None
+        payloads.append(value)
+    returned = []
+    for payload in payloads:
+        if hasattr(payload, "read"):
+            try:
+                if not payload.seekable():
+                    return None
+                returned.append((payload, payload.tell()))
+            except (AttributeError, OSError, ValueError):
+                return None
+        elif payload is not None and not isinstance(payload, (str, bytes, bytearray, Mapping, list, tuple)):
+            return None
+
+    return returned
+
+
+def dispatch(requester: Callable[..., requests.Response],
+             method: str,
+             url: str,
+             retry_policy: Optional[RetryPolicy] = None,
+             rate_limiter: Optional[RateLimiter] = None,
+             operation: Optional[str] = None,
+             event: Optional[RequestEvent] = None,
+             **kwargs
+             ) -> requests.Response:
+    """Send a request using the provided requester, applying the rate limiter and retry policy.
+
+    Requests are paced by the rate limiter when one is provided, and throttled requests are
+    requeued up to the requeue limit of the rate limiter. Requests failing for transient
+    reasons are then retried as allowed by the retry policy. File objects sent with the
+    request are rewound before it is sent again, and requests sending payloads that cannot
+    be rewound are never resent. Every attempt is recorded to the telemetry event when one
+    is provided.
+    """
+    attempt = 0
+    requeued = 0
+    positions = payload_positions(kwargs.get("data", None), kwargs.get("files", None))
+    while True:
+        for payload, position in positions or []:
+            payload.seek(position)
+        if rate_limiter:
+            rate_limiter.acquire()
+        attempt += 1
+        if event:
+            event.attempts += 1
+        sent = time.perf_counter()
+        try:
+            response = requester(method, url, **kwargs)
+        except RequestException as failure:
+            if positions is None or not retry_policy or not retry_policy.retryable(method, attempt, error=failure):
+                raise
+            retry_policy.backoff(attempt, operation, cause=failure)
+            continue
+        if event:
+            event.response_received(response, time.perf_counter() - sent, kwargs.get("stream", False))
+        if rate_limiter and rate_limiter.update(response.status_code, response.headers):
+            if positions is not None and rate_limiter.requeue(requeued):
+                # The rate limiter has already paused until the API will accept the request.
+                requeued += 1
+                attempt -= 1
+                response.close()
+                continue
+        if positions is not None and retry_policy \
+                and retry_policy.retryable(method, attempt, status_code=response.status_code):
+            # Return the connection to the pool before waiting.
+            response.close()
+            retry_policy.backoff(attempt, operation, headers=response.headers, cause=response.status_code)
+            continue
+
+        return response
+
+
+class Transport:
+    """This class represents the persistent HTTP connection pool used to communicate with the API.
+
+    A single transport is attached to every interface configuration and is shared by
+    every Service Class leveraging the same auth_object. Connections are kept alive and
+    reused between requests, removing the TCP and TLS handshake from every API call.
+    """
+
+    # ____ ____ _  _ ____ ___ ____ _  _ ____ ___ ____ ____
+    # |    |  | |\ | [__   |  |__/ |  | |     |  |  | |__/
+    # |___ |__| | \| ___]  |  |  \ |__| |___  |  |__| |  \
+    #
+    def __init__(self,
+                 pool_connections: Optional[int] = None,
+                 pool_maxsize: Optional[int] = None,
+                 pool_block: Optional[bool] = False,
+                 keep_alive: Optional[bool] = True
+                 ):
+        """Construct an instance of the Transport class.
+
+        Keyword arguments
+        ----
+        pool_connections : int
+            Number of individual host connection pools to cache. [Default: 10]
+        pool_maxsize : int
+            Maximum number of connections to keep alive per host. [Default: 10]
+        pool_block : bool
+            Block when no free connections are available instead of opening
+            a temporary connection. [Default: False]
+        keep_alive : bool
+            Reuse connections between requests. [Default: True]
+        """
+        self._pool_connections: int = DEFAULT_POOL_CONNECTIONS
+        if isinstance(pool_connections, int) and pool_connections > 0:
+            self._pool_connections = pool_connections
+
+        self._pool_maxsize: int = DEFAULT_POOL_MAXSIZE
+        if isinstance(pool_maxsize, int) and pool_maxsize > 0:
+            self._pool_maxsize = pool_maxsize
+
+        self._pool_block: bool = False
+        if isinstance(pool_block, bool):
+            self._pool_block = pool_block
+
+        self._keep_alive: bool = True
+        if isinstance(keep_alive, bool):
+            self._keep_alive = keep_alive
+
+        self._session: requests.Session = self._create_session()
+
+    # _  _ ____ ___ _  _ ____ ___  ____
+    # |\/| |___  |  |__| |  | |  \ [__
+    # |  | |___  |  |  | |__| |__/ ___]
+    #
+    def _create_session(self) -> requests.Session:
+        """Create the underlying session and mount our pooled adapter."""
+        session = requests.Session()
+        # The CrowdStrike API does not leverage cookies, do not carry them between requests.
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        adapter = HTTPAdapter(pool_connections=self._pool_connections,
+                              pool_maxsize=self._pool_maxsize,
+                              pool_block=self._pool_block
+                              )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        return session
+
+    def request(self,
+                method: str,
+                url: str,
+                headers: Optional[Dict[str, str]] = None,
+                retry_policy: Optional[RetryPolicy] = None,
+                rate_limiter: Optional[RateLimiter] = None,
+                operation: Optional[str] = None,
+                **kwargs
+                ) -> requests.Response:
+        """Perform the HTTP request using a pooled connection.
+
+        Retries performed by the retry policy reuse connections from the pool.
+        Accepts the same keywords as requests.Session.request.
+        """
+        if not self._keep_alive:
+            headers = {**headers} if headers else {}
+            headers["Connection"] = "close"
+
+        return dispatch(self._session.request, method, url,
+                        retry_policy=retry_policy,
+                        rate_limiter=rate_limiter,
+                        operation=operation,
+                        headers=headers,
+                        **kwargs
+                        )
+
+    def close(self):
+        """Close all pooled connections."""
+        self._session.close()
+
+    def reset(self):
+        """Discard all pooled connections and create a fresh session."""
+        self.close()
+        self._session = self._create_session()
+
+    def __enter__(self):
+        """Allow for entry as a context manager."""
+        return self
+
+    def __exit__(self, *args):
+        """Close our pooled connections when we exit the context."""
+        self.close()
+
+    # ___  ____ ____ ___  ____ ____ ___ _ ____ ____
+    # |__] |__/ |  | |__] |___ |__/  |  | |___ [__
+    # |    |  \ |__| |    |___ |  \  |  | |___ ___]
+    #
+    # Pool sizing is fixed once the adapter is mounted, use reset to apply changes.
+    @property
+    def session(self) -> requests.Session:
+        """Return the underlying session."""
+        return self._session
+
+    @property
+    def pool_connections(self) -> int:
+        """Return the number of host connection pools cached."""
+        return self._pool_connections
+
+    @property
+    def pool_maxsize(self) -> int:
+        """Return the maximum number of connections kept per host."""
+        return self._pool_maxsize
+
+    @property
+    def pool_block(self) -> bool:
+        """Return the pool blocking setting."""
+        return self._pool_block
+
+    @property
+    def keep_alive(self) -> bool:
+        """Return the keep-alive setting."""
+        return self._keep_alive
+
+    @keep_alive.setter
+    def keep_alive(self, value: bool):
+        """Enable or disable connection reuse."""
+        self._keep_alive = value
@@ -41,8 +41,10 @@ from ._functions import (
     generate_b64cred,
     handle_single_argument,
     force_default,
+    caller_settings,
     service_request,
     perform_request,
+    submit_request,
     generate_error_result,
     generate_ok_result,
     get_default,
@@ -59,8 +61,14 @@ from ._functions import (
     deprecated_operation,
     deprecated_class,
     params_to_keywords,
+    process_response,
+    execute_request,
+    handle_request_failure,
+    capture_requests,
     _ALLOWED_METHODS
 )
+from ._send import encode_payloads, send_request, process_stream
+from ._plan import RequestPlan, request_plan, find_plan, container_base_url
 from ._service import service_override_payload
 from ._uber import (
     create_uber_header_payload,
@@ -79,5 +87,9 @@ __all__ = ["create_uber_header_payload", "handle_body_payload_ids", "scrub_targe
            "_ALLOWED_METHODS", "login_payloads", "logout_payloads", "sanitize_dictionary",
            "calc_content_return", "log_class_startup", "service_override_payload",
            "deprecated_operation", "deprecated_class", "review_provided_credentials",
-           "params_to_keywords"
+           "params_to_keywords", "process_response", "send_request", "handle_request_failure",
+           "encode_payloads", "process_stream", "execute_request",
+           "capture_requests",
+           "caller_settings", "submit_request", "RequestPlan", "request_plan", "find_plan",
+           "container_base_url"
            ]
@@ -0,0 +1,137 @@
+"""Asynchronous request dispatch functions.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+import asyncio
+import functools
+import time
+from typing import Any, Callable
+from .._api_request import DeferredRequest
+from .._error import APIError, SDKError, NoContentWarning
+from .._transport import AsyncTransport
+from .._telemetry._event import payload_size
+from ._functions import capture_requests, perform_request, process_response, handle_request_failure, log_api_payloads
+from ._send import encode_payloads
+
+
+async def send_deferred(deferred: DeferredRequest, transport: AsyncTransport) -> Any:
+    """Send a deferred request using the asynchronous transport and process the response.
+
+    Measurements are provided to the telemetry hooks of the request once it completes.
+    """
+    if deferred.api.telemetry:
+        return await deferred.api.telemetry.async_observe(deferred.api.event,
+                                                          functools.partial(transmit_deferred, deferred, transport)
+                                                          )
+
+    return await transmit_deferred(deferred, transport)
+
+
+async def transmit_deferred(deferred: DeferredRequest, transport: AsyncTransport) -> Any:
+    """Transmit a deferred request using the asynchronous transport and process the response.
+
+    Error handling mirrors the handling performed by force_default for synchronous requests.
+    """
+    api = deferred.api
+    event = api.event
+    response = None
+    try:
+        try:
+            # Log our payloads if debugging is enabled
+            log_api_payloads(api, deferred.headers)
+            headers, body_payload, data_payload = encode_payloads(api, deferred.headers)
+            if event:
+                event.executed = True
+                event.attempts += 1
+                event.request_bytes = payload_size(data_payload)
+            sent = time.perf_counter()
+            response = await transport.request(api.method.upper(), api.endpoint, params=api.param_payload,
+                                               headers=headers, json=body_payload,
+                                               data=data_payload, files=api.files, timeout=api.timeout
+                                               )
+            decoding = time.perf_counter()
+            returned = process_response(api, response, deferred.pythonic)
+            if event:
+                event.response_received(response, decoding - sent)
+                event.decode = time.perf_counter() - decoding
+        except asyncio.CancelledError:  # pylint: disable=W0706
+            # Always allow the task to be cancelled (CancelledError subclasses Exception in Python 3.7).
+            raise
+        except Exception as havoc:  # pylint: disable=W0703
+            if event:
+                event.error = type(havoc).__name__
+            returned = handle_request_failure(api, havoc, response, deferred.pythonic)
+    except NoContentWarning as no_content_received:
+        returned = no_content_received.result
+    except APIError as api_error:
+        # Should only receive this in pythonic mode
+        raise api_error
+    except SDKError as bad_sdk_command:
+        returned = bad_sdk_command.result
+
+    return returned
+
+
+async def dispatch_deferred(async_transport: AsyncTransport, func: Callable, *args, **kwargs) -> Any:
+    """Run a synchronous SDK method with request capture enabled and send the captured request.
+
+    The SDK method prepares the request exactly as it would when called synchronously. Methods
+    that return without issuing a request (for example, a payload validation failure) return
+    their result directly. Methods that issue more than one request, or inspect the result of
+    their own request, are run synchronously in the default executor instead.
+    """
+    returned = None
+    with capture_requests() as captured:
+        try:
+            returned = func(*args, **kwargs)
+        except Exception:  # pylint: disable=W0703
+            if not captured:
+                raise
+    if len(captured) == 1 and returned is captured[0]:
+        returned = await send_deferred(captured[0], async_transport)
+    elif captured:
+        loop = asyncio.get_running_loop()
+        returned = await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
+
+    return returned
+
+
+async def async_perform_request(async_transport: AsyncTransport, **kwargs) -> Any:
+    """Perform the requested API operation using the asynchronous transport.
+
+    Accepts the same keywords as perform_request.
+    """
+    return await dispatch_deferred(async_transport, perform_request, **kwargs)
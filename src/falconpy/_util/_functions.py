@@ -38,28 +38,27 @@ For more information, please refer to <https://unlicense.org>
 from __future__ import annotations
 import base64
 import functools
+import time
+from contextlib import contextmanager
 from warnings import warn
 from json import loads
 try:
     from simplejson import JSONDecodeError
 except (ImportError, ModuleNotFoundError):  # Support import as a module
     from json.decoder import JSONDecodeError
-from typing import Dict, Any, Union, Optional, List, TYPE_CHECKING
-from copy import deepcopy
-from logging import Logger
+from typing import Dict, Any, Iterator, Union, Optional, List, TYPE_CHECKING
+from logging import Logger, DEBUG
 import requests
 import urllib3
 from urllib3.exceptions import InsecureRequestWarning
-from .._api_request import APIRequest
+from .._api_request import APIRequest, DeferredRequest, DEFERRED_REQUESTS
 from .._endpoint import operation_deprecation_mapping
-from .._enum import BaseURL, ContainerBaseURL
+from .._enum import BaseURL
 from .._constant import (
     PREFER_NONETYPE,
-    MOCK_OPERATIONS,
     ALLOWED_METHODS as _ALLOWED_METHODS,
     USER_AGENT as _USER_AGENT,
-    MAX_DEBUG_RECORDS,
-    GLOBAL_API_MAX_RETURN
+    MAX_DEBUG_RECORDS
 )
 from .._error import (
     RegionSelectError,
@@ -71,11 +70,15 @@ from .._error import (
     PayloadValidationError,
     InvalidBaseURL,
     SSLDisabledWarning,
-    UnnecessaryEncodingUsed,
     DeprecatedOperation,
     DeprecatedClass
     )
 from .._result import Result
+from .._codec import JSONCodec
+from .._log import LogPayload, redact
+from ._send import send_request, process_stream
+from ._plan import request_plan, find_plan, container_base_url
+from .._transport import StreamDownload, ResourceStream
 if TYPE_CHECKING:  # pragma: no cover
     from .._auth_object import FalconInterface
     from .._service_class import ServiceClass
@@ -143,6 +146,24 @@ def handle_single_argument(passed_arguments: tuple,
     return passed_keywords
 
 
+def get_default(types: list, position: int) -> Union[list, str, int, dict, bool]:
+    """I determine the requested default data type and return it."""
+    default_value_names = ["list", "str", "int", "dict", "bool"]
+    default_value_types = [[], "", 0, {}, False]
+    value_count = 0
+    retval = {}  # Default to dictionary data type as that is our most often used
+    for type_ in default_value_names:
+        try:
+            if type_ in types[position]:
+                retval = default_value_types[value_count]
+        except IndexError:
+            # Data type not specified, fall back to dictionary
+            pass
+        value_count += 1
+
+    return retval
+
+
 def force_default(defaults: List[str], default_types: List[str] = None):
     """Force default values.
 
@@ -156,6 +177,8 @@ def force_default(defaults: List[str], default_types: List[str] = None):
     """
     if not default_types:
         default_types = []
+    # Default data types are resolved once, each call receives a new empty value of the type.
+    factories = [(element, type(get_default(default_types, position))) for position, element in enumerate(defaults)]
 
     def wrapper(func):
         """Inner wrapper."""
@@ -168,18 +191,11 @@ def force_default(defaults: List[str], default_types: List[str] = None):
             as specified in our "defaults" list that is passed to the parent wrapper.
             It also wraps the protected method with an error handler.
             """
-            element_count = 0   # Tracker so we can retrieve matching data types
             # Loop through every element specified in our defaults list
-            for element in defaults:
-                if element in kwargs:
-                    # It exists but it's a NoneType
-                    if kwargs.get(element) is None:
-                        kwargs[element] = get_default(default_types, element_count)
-                else:
-                    # Not present whatsoever
-                    kwargs[element] = get_default(default_types, element_count)
-                # Increment our tracker for our sibling default_types list
-                element_count += 1
+            for element, default_type in factories:
+                # Not present whatsoever, or it exists but it's a NoneType
+                if kwargs.get(element) is None:
+                    kwargs[element] = default_type()
 
             try:
                 # created = func(*args, **kwargs)
@@ -203,58 +219,40 @@ def force_default(defaults: List[str], default_types: List[str] = None):
     return wrapper
 
 
-def service_request(caller: ServiceClass = None, **kwargs) -> Union[Dict[str, Union[int, dict, list]], bytes]:
-    """Prepare and then perform the request (Service Classes only).
+def caller_settings(caller: ServiceClass) -> Dict[str, Any]:
+    """Retrieve the connection and logging settings of the calling object for a request.
 
-    Inbound caller argument should be a ServiceClass class or derivative.
+    Legacy callers may not provide every setting, missing settings default to None.
     """
-    if caller:
-        # EAFP
-        try:
-            proxy: Optional[Dict[str, str]] = caller.proxy
-        except AttributeError:
-            proxy = None
+    return {
+        "proxy": getattr(caller, "proxy", None),
+        "timeout": getattr(caller, "timeout", None),
+        "user_agent": getattr(caller, "user_agent", None),
+        "log_util": getattr(caller, "log", None),
+        "debug_record_count": getattr(caller, "debug_record_count", None),
+        "sanitize": getattr(caller, "sanitize_log", None),
+        "transport": getattr(caller, "transport", None),
+        "rate_limiter": getattr(caller, "rate_limiter", None),
+        "retry_policy": getattr(caller, "retry_policy", None),
+        "codec": getattr(caller, "codec", None),
+        "cache": getattr(caller, "cache", None),
+        "client_label": getattr(caller, "client_label", None),
+        "coalescer": getattr(caller, "coalescer", None),
+        "telemetry": getattr(caller, "telemetry", None)
+    }
 
-        try:
-            timeout: Optional[int] = caller.timeout
-        except AttributeError:
-            timeout = None
 
-        try:
-            user_agent: Optional[str] = caller.user_agent
-        except AttributeError:
-            user_agent = None
+def service_request(caller: ServiceClass = None, **kwargs) -> Union[Dict[str, Union[int, dict, list]], bytes]:
+    """Prepare and then perform the request (Service Classes only).
 
-        try:
-            log_utility: Optional[Logger] = caller.log
-        except AttributeError:
-            log_utility = None
+    Inbound caller argument should be a ServiceClass class or derivative.
+    """
+    settings = caller_settings(caller) if caller else {}
+    # Allow pythonic behaviors to be enabled / disabled per request
+    if not isinstance(kwargs.get("pythonic", None), bool):
+        kwargs["pythonic"] = getattr(caller, "pythonic", None)
 
-        try:
-            debug_count: Optional[int] = caller.debug_record_count
-        except AttributeError:
-            debug_count = None
-        try:
-            do_sanitize: Optional[bool] = caller.sanitize_log
-        except AttributeError:
-            do_sanitize = None
-        try:
-            # Allow pythonic behaviors to be enabled / disabled per request
-            do_pythonic: Optional[bool] = kwargs.get("pythonic", None)
-            if not isinstance(do_pythonic, bool):
-                kwargs["pythonic"] = caller.pythonic
-            # do_pythonic: Optional[bool] = caller.pythonic
-        except AttributeError:
-            kwargs["pythonic"] = None
-    # pylint: disable=E0606
-    return perform_request(proxy=proxy,
-                           timeout=timeout,
-                           user_agent=user_agent,
-                           log_util=log_utility,
-                           debug_record_count=debug_count,
-                           sanitize=do_sanitize,
-                           **kwargs
-                           )
+    return perform_request(**settings, **kwargs)
 
 
 # pylint: disable=R0912  # I don't disagree, but this will work for now.
@@ -263,8 +261,15 @@ def calc_content_return(resp: requests.Response,
                         auth: bool,
                         log: Logger,
                         pythonic_mode: bool,
-                        ) -> Union[dict, bytes]:
-    """Calculate the returned content based upon the results from the call to requests."""
+                        codec: Optional[JSONCodec] = None,
+                        as_result: bool = False
+                        ) -> Union[dict, bytes, Result]:
+    """Calculate the returned content based upon the results from the call to requests.
+
+    When as_result is True, the Result object is returned as is instead of being
+    converted into a dictionary.
+    """
+    codec = codec or JSONCodec.get()
     returned = {}
     returned_content_type = resp.headers.get('content-type', None)
     if not returned_content_type:
@@ -274,8 +279,8 @@ def calc_content_return(resp: requests.Response,
     if returned_content_type.startswith("application/json"):  # Issue 708
         json_resp: Union[dict, Result] = {}
         try:
-            json_resp = resp.json()
-        except JSONDecodeError:
+            json_resp = codec.loads(resp.content)
+        except ValueError:
             # It says JSON in the headers but it came back to us as a binary string.
             json_resp = loads(resp.content.decode("ascii"))
         finally:
@@ -283,15 +288,15 @@ def calc_content_return(resp: requests.Response,
             returned = Result(status_code=resp.status_code,
                               headers=resp.headers,
                               body=json_resp
-                              ).full_return
+                              )
     elif returned_content_type.startswith("text/plain"):
         # Assuming UTF-8 for now
         returned = Result(resp.status_code,
                           resp.headers,
-                          loads(resp.content.decode("utf-8"))
-                          ).full_return
+                          codec.loads(resp.content.decode("utf-8"))
+                          )
     elif contain:
-        returned = Result(resp.status_code, resp.headers, resp.json()).full_return
+        returned = Result(resp.status_code, resp.headers, codec.loads(resp.content))
     else:
         # Binary response
         if not resp.content:
@@ -304,13 +309,19 @@ def calc_content_return(resp: requests.Response,
             returned = resp.content
         else:
             # returned = resp.content
-            returned = Result(resp.status_code, resp.headers, resp.content).full_return
+            returned = Result(resp.status_code, resp.headers, resp.content)
+
+    if isinstance(returned, Result) and not as_result:
+        returned = returned.full_return
 
     # Catch and log API response errors
     try:
         if resp.status_code >= 400:
             _message = None
-            _errors = returned.get("body", {}).get("errors", [])
+            if isinstance(returned, Result):
+                _errors = returned.errors.data
+            else:
+                _errors = returned.get("body", {}).get("errors", [])
             if _errors:
                 _message = f"ERROR: {_errors[0]['message']}"
             raise APIError(code=resp.status_code, message=_message, headers=resp.headers)
@@ -324,6 +335,17 @@ def calc_content_return(resp: requests.Response,
     return returned, returned_content_type
 
 
+@contextmanager
+def capture_requests() -> Iterator[List[DeferredRequest]]:
+    """Capture the requests prepared by perform_request within this context instead of sending them."""
+    captured: List[DeferredRequest] = []
+    token = DEFERRED_REQUESTS.set(captured)
+    try:
+        yield captured
+    finally:
+        DEFERRED_REQUESTS.reset(token)
+
+
 # pylint: disable=R0915
 @force_default(defaults=["headers"], default_types=["dict"])
 def perform_request(endpoint: str = "",
@@ -368,14 +390,29 @@ def perform_request(endpoint: str = "",
     log_util: Logger - Logging utility
     debug_record_count: int - Maximum number of records to log in debug logs
     authenticating: bool - This request is driving a token request
+    transport: Transport - Persistent connection pool to use for the request
+    rate_limiter: RateLimiter - Client side rate limiter used to pace the request
+    retry_policy: RetryPolicy - Policy used to retry the request when it fails for transient reasons
+    codec: JSONCodec - JSON library used to decode the response and encode the body payload
+    cache: ResponseCache - Cache holding responses to read-mostly GET operations
+    coalescer: RequestCoalescer - Single-flight layer sharing one call between identical concurrent requests
+    telemetry: Telemetry - Instrumentation hooks called with the measurements of the request
+    operation: str - Operation ID of the request, used to attribute retries
+    stream: StreamDownload - Destination binary content is streamed to instead of being returned
+    stream_resources: bool - Return a ResourceStream parsing the resources of the response as they arrive
     """
-    # Shortcut for now
-    pythonic = kwargs.get("pythonic", False)
-    api: APIRequest = APIRequest(endpoint, kwargs)
+    return submit_request(APIRequest(endpoint, kwargs), headers, kwargs.get("pythonic", False))
+
+
+def submit_request(api: APIRequest,
+                   headers: Dict[str, str],
+                   pythonic: bool = False
+                   ) -> Union[Dict[str, Union[int, Dict[str, str], Dict[str, Dict]]], bytes]:
+    """Validate a prepared request, then perform it or hand it back when request capture is active."""
     if not api.verify:
         ssl_disabled = SSLDisabledWarning()
         if pythonic:
-            warn(ssl_disabled.message, SSLDisabledWarning, stacklevel=2)
+            warn(ssl_disabled.message, SSLDisabledWarning, stacklevel=3)
         else:
             api.log_warning(msg=ssl_disabled.message)
 
@@ -402,102 +439,154 @@ def perform_request(endpoint: str = "",
                 for param, param_value in api.param_payload.items():
                     if isinstance(param_value, bool):
                         api.param_payload[param] = str(param_value).lower()
-            try:
-                # Log our payloads if debugging is enabled
-                log_api_payloads(api, headers)
-                response = requests.request(api.method.upper(), endpoint, params=api.param_payload,
-                                            headers=headers, json=api.body_payload, data=api.data_payload,
-                                            files=api.files, verify=api.verify,
-                                            proxies=api.proxy, timeout=api.timeout
-                                            )
-                api.debug_headers = response.headers
-                content_return, returning_content_type = calc_content_return(response,
-                                                                             api.container,
-                                                                             api.authenticating,
-                                                                             api.log_util,
-                                                                             pythonic
-                                                                             )
-                # Expanded results allow for status code and
-                # header checks on binary returns.
-                # Maintained for < v1.3 syntax compatibility
-                if api.expand_result:
-                    returned = Result(response.status_code, response.headers, content_return).tupled
-                else:
-                    returned = content_return
-
-                # Log our response if debugging is enabled
-                log_api_activity(content_return, returning_content_type, api)
-
-                # !!! EXPERIMENTAL !!!
-                # This functionality is new in v1.3.0 and still experimental, mileage may vary.
-                if pythonic:
-                    if isinstance(returned, bytes):
-                        returned = Result(response.status_code, response.headers, returned)
-                    else:
-                        returned = Result(full=returned)
-
-            except RegionSelectError as bad_region:
-                # More than likely they tried to autoselect to GovCloud
-                returned = bad_region.result
-                api.log_error(returned.get("status_code"), bad_region.message, returned)
-
-            except JSONDecodeError as json_decode_error:
-                # No response content, but a successful request was made
-                api.log_warning("WARNING: No content was received for this request.")
-                raise NoContentWarning(headers=response.headers,
-                                       code=response.status_code
-                                       ) from json_decode_error
-
-            except Exception as havoc:  # pylint: disable=W0703
-                # General catch-all for anything coming          ____ ____ _ _      \\       o   o
-                # out of requests or the library itself.         |___ |--<  Y        ||      |\O/|
-                # Pass this error up to the parent try/catch                          \\      \Y/
-                # block residing within our decorator        _  _ ____ _  _ ____ ____         /W\
-                # (force_default) for handling.              |--| |--|  \/  [__] |___  !!   _|WWW|_
-                if pythonic:
-                    # Oh wait, we're pythonic, lets generate
-                    # a regular python error condition instead.
-                    raise havoc
-
-                raise SDKError(message=f"{str(havoc)}", headers=api.debug_headers) from havoc
+            captured: Optional[List[DeferredRequest]] = DEFERRED_REQUESTS.get()
+            if captured is not None:
+                # Request capture is active, hand the prepared request
+                # back to the caller instead of sending it.
+                returned = DeferredRequest(api=api, headers=headers, pythonic=bool(pythonic))
+                captured.append(returned)
+            else:
+                call = functools.partial(execute_request, api, headers, pythonic)
+                # Measurements are provided to the telemetry hooks once the request completes.
+                returned = api.telemetry.observe(api.event, call) if api.telemetry else call()
     else:
         raise InvalidMethod
 
     return returned
 
 
+def execute_request(api: APIRequest,
+                    headers: Dict[str, str],
+                    pythonic: bool = False
+                    ) -> Union[Dict[str, Union[int, Dict[str, str], Dict[str, Dict]]], bytes, Result, tuple]:
+    """Send a prepared request and process the response received."""
+    response = None
+    event = api.event
+    if event:
+        event.executed = True
+    try:
+        # Log our payloads if debugging is enabled
+        log_api_payloads(api, headers)
+        response = send_request(api, headers)
+        if api.stream and api.stream.accepts(response):
+            returned = process_stream(api, response, pythonic)
+        elif api.stream_resources and ResourceStream.accepts(response):
+            api.debug_headers = response.headers
+            returned = ResourceStream(response)
+        else:
+            decoding = time.perf_counter()
+            returned = process_response(api, response, pythonic)
+            if event:
+                event.decode = time.perf_counter() - decoding
+    except Exception as havoc:  # pylint: disable=W0703
+        if event:
+            event.error = type(havoc).__name__
+        returned = handle_request_failure(api, havoc, response, pythonic)
+
+    return returned
+
+
+def process_response(api: APIRequest,
+                     response: requests.Response,
+                     pythonic: bool = False
+                     ) -> Union[Dict[str, Union[int, Dict[str, str], Dict[str, Dict]]], bytes, Result, tuple]:
+    """Convert the response received for an API request into the value returned to the caller.
+
+    Accepts any response object providing status_code, headers, content and json.
+    """
+    api.debug_headers = response.headers
+    # Pythonic results are returned directly instead of being built twice.
+    content_return, returning_content_type = calc_content_return(response,
+                                                                 api.container,
+                                                                 api.authenticating,
+                                                                 api.log_util,
+                                                                 pythonic,
+                                                                 api.codec,
+                                                                 pythonic and not api.expand_result
+                                                                 )
+    # Expanded results allow for status code and
+    # header checks on binary returns.
+    # Maintained for < v1.3 syntax compatibility
+    if api.expand_result:
+        returned = Result(response.status_code, response.headers, content_return).tupled
+    else:
+        returned = content_return
+
+    # Log our response if debugging is enabled
+    log_api_activity(content_return, returning_content_type, api)
+
+    # !!! EXPERIMENTAL !!!
+    # This functionality is new in v1.3.0 and still experimental, mileage may vary.
+    if pythonic and not isinstance(returned, Result):
+        if isinstance(returned, bytes):
+            returned = Result(response.status_code, response.headers, returned)
+        else:
+            returned = Result(full=returned)
+
+    return returned
+
+
+def handle_request_failure(api: APIRequest,
+                           havoc: Exception,
+                           response: Optional[requests.Response] = None,
+                           pythonic: bool = False
+                           ) -> dict:
+    """Handle an error raised while sending a request or processing the response."""
+    if isinstance(havoc, RegionSelectError):
+        # More than likely they tried to autoselect to GovCloud
+        returned = havoc.result
+        api.log_error(returned.get("status_code"), havoc.message, returned)
+        return returned
+
+    if isinstance(havoc, JSONDecodeError):
+        # No response content, but a successful request was made
+        api.log_warning("WARNING: No content was received for this request.")
+        raise NoContentWarning(headers=response.headers,
+                               code=response.status_code
+                               ) from havoc
+
+    # General catch-all for anything coming          ____ ____ _ _      \\       o   o
+    # out of requests or the library itself.         |___ |--<  Y        ||      |\O/|
+    # Pass this error up to the parent try/catch                          \\      \Y/
+    # block residing within our decorator        _  _ ____ _  _ ____ ____         /W\
+    # (force_default) for handling.              |--| |--|  \/  [__] |___  !!   _|WWW|_
+    if pythonic:
+        # Oh wait, we're pythonic, lets generate
+        # a regular python error condition instead.
+        raise havoc
+
+    raise SDKError(message=f"{str(havoc)}", headers=api.debug_headers) from havoc
+
+
 def log_api_payloads(api: APIRequest, headers: dict):
-    """Log the payloads and API response to the debug log."""
-    if api.log_util:
-        _headers = headers
-        _param_payload = api.param_payload
-        _body_payload = api.body_payload
-        _data_payload = api.data_payload
-        if api.sanitize_log:
-            _headers = sanitize_dictionary(deepcopy(headers))
-            _param_payload = sanitize_dictionary(deepcopy(api.param_payload))
-            _body_payload = sanitize_dictionary(deepcopy(api.body_payload))
-            _data_payload = sanitize_dictionary(deepcopy(api.data_payload))
+    """Log the payloads and API response to the debug log.
+
+    Payloads are only sanitized and formatted when the debug log record is emitted.
+    """
+    if api.log_util and api.log_util.isEnabledFor(DEBUG):
+        _sanitize = api.sanitize_log
         api.log_util.debug("ENDPOINT: %s (%s)", api.endpoint, api.method)
-        api.log_util.debug("HEADERS: %s", _headers)
-        api.log_util.debug("PARAMETERS: %s", _param_payload)
-        api.log_util.debug("BODY: %s", _body_payload)
-        api.log_util.debug("DATA: %s", _data_payload)
+        api.log_util.debug("HEADERS: %s", LogPayload(headers, _sanitize))
+        api.log_util.debug("PARAMETERS: %s", LogPayload(api.param_payload, _sanitize))
+        api.log_util.debug("BODY: %s", LogPayload(api.body_payload, _sanitize))
+        api.log_util.debug("DATA: %s", LogPayload(api.data_payload, _sanitize))
 
 
 def log_api_activity(content_return: Union[dict, bytes], content_type: str, api: APIRequest):
-    """Log the payloads and API response to the debug log."""
-    if api.log_util:
+    """Log the payloads and API response to the debug log.
+
+    The response is truncated and redacted without copying it, and only when the debug log record is emitted.
+    """
+    if api.log_util and api.log_util.isEnabledFor(DEBUG):
+        if isinstance(content_return, Result):
+            content_return = content_return.full_return
         if isinstance(content_return, dict):
             _status_code = content_return.get("status_code", None)
             if _status_code:
                 api.log_util.debug("STATUS CODE: %i", _status_code)
 
         if content_type.startswith("application/json"):
-            if api.sanitize_log:
-                api.log_util.debug("RESULT: %s", sanitize_dictionary(deepcopy(content_return), api.max_debug))
-            else:
-                api.log_util.debug("RESULT: %s", content_return)
+            api.log_util.debug("RESULT: %s", LogPayload(content_return, api.sanitize_log, api.max_debug))
         elif content_type.startswith("text/plain"):
             api.log_util.debug("RESULT: %s", content_return)
         else:
@@ -520,24 +609,6 @@ def generate_ok_result(message: str = "Request returned with success", code: int
     return Result()(status_code=code, headers=return_headers, body={"message": message, "resources": []})
 
 
-def get_default(types: list, position: int) -> Union[list, str, int, dict, bool]:
-    """I determine the requested default data type and return it."""
-    default_value_names = ["list", "str", "int", "dict", "bool"]
-    default_value_types = [[], "", 0, {}, False]
-    value_count = 0
-    retval = {}  # Default to dictionary data type as that is our most often used
-    for type_ in default_value_names:
-        try:
-            if type_ in types[position]:
-                retval = default_value_types[value_count]
-        except IndexError:
-            # Data type not specified, fall back to dictionary
-            pass
-        value_count += 1
-
-    return retval
-
-
 def args_to_params(payload: dict,
                    passed_arguments: dict,
                    endpoints: list,
@@ -570,37 +641,13 @@ def args_to_params(payload: dict,
     Returns: dictionary representing QueryString parameters.
     """
     returned_payload = {}
-    if epname != "Manual":  # pylint: disable=R1702
+    if epname != "Manual":
         if epname in operation_deprecation_mapping:
             deprecated_operation(pyth, log_utl, epname, operation_deprecation_mapping[epname])
-        for arg in passed_arguments:
-            eps = [ep[5] for ep in endpoints if epname == ep[0]][0]
-            try:
-                argument = [param for param in eps if param["name"] == arg][0]
-                if argument:
-                    arg_name = argument["name"]
-                    if "type" in argument:  # Body payload parameters do not have a type field
-                        if argument["type"] == "array":
-                            if isinstance(passed_arguments[arg_name], (str)):
-                                passed_arguments[arg_name] = passed_arguments[arg_name].split(",")
-                        # Check for unnecessarily URLEncoded strings by finding an encoded ":", Issue #850
-                        if isinstance(passed_arguments[arg_name], str):
-                            if "%3A" in passed_arguments[arg_name]:
-                                msg = " ".join([arg_name,
-                                                "argument contains potentially urlencoded string of",
-                                                f"'{passed_arguments[arg_name]}'."
-                                                ])
-                                if pyth:
-                                    warn(msg, UnnecessaryEncodingUsed, stacklevel=5)
-                                else:
-                                    if log_utl:
-                                        log_utl.warning(msg)
-
-                        # More data type validation can go here
-                        payload[arg_name] = passed_arguments[arg_name]
-            except IndexError:
-                # Unrecognized argument
-                pass
+        plan = find_plan(endpoints, epname)
+        # Body payload parameters are not present in the plan and are skipped.
+        if plan:
+            plan.bind_params(payload, passed_arguments, log_utl, pyth)
 
     # Clean up reserved word conversions when passing in an invalid raw payload
     if payload:
@@ -613,7 +660,7 @@ def args_to_params(payload: dict,
     return returned_payload
 
 
-def process_service_request(calling_object: ServiceClass,  # pylint: disable=R0914 # (19/15)
+def process_service_request(calling_object: ServiceClass,
                             endpoints: List[List[Union[str, List[Dict[str, Any]]]]],
                             operation_id: str,
                             **kwargs
@@ -644,9 +691,10 @@ def process_service_request(calling_object: ServiceClass,  # pylint: disable=R09
     object_key -- Object Key [PATH] (Custom Objects API)
     path_id -- ASPM ID path variable [PATH] (ASPM API)
     """
+    settings = caller_settings(calling_object)
     # Log the operation ID if we have logging enabled.
-    if calling_object.log:
-        calling_object.log.debug("OPERATION: %s", operation_id)
+    if settings["log_util"]:
+        settings["log_util"].debug("OPERATION: %s", operation_id)
     # We have to create our headers dictionary first, as authentication happens here.
     # For scenarios where cloud region autodiscovery is leveraged, we cannot create
     # the target URL for our call to requests until we know our correct base_url.
@@ -655,39 +703,41 @@ def process_service_request(calling_object: ServiceClass,  # pylint: disable=R09
         ** calling_object.headers,
         ** passed_headers
     }
-    target_endpoint = [ep for ep in endpoints if operation_id == ep[0]][0]
+    # The method, route and parameter details of the operation are compiled on first use.
+    plan = request_plan(endpoints, operation_id)
     base_url = calling_object.base_url
     container = False
     # Check if this operation requires the custom container base URL.
-    if operation_id in MOCK_OPERATIONS:
-        for base in [burl for burl in dir(BaseURL) if "__" not in burl]:
-            if BaseURL[base].value == calling_object.base_url.replace("https://", ""):
-                base_url = f"https://{ContainerBaseURL[base].value}"
-                container = True
+    if plan.container:
+        container_url = container_base_url(base_url)
+        if container_url:
+            base_url = container_url
+            container = True
+    target_url = f"{base_url}{plan.path}"
     # Handle any provided PATH variables, should happen before query string argument abstraction.
-    target_url = handle_path_variables(passed=kwargs, route_url=f"{base_url}{target_endpoint[2]}")
+    if plan.templated:
+        target_url = handle_path_variables(passed=kwargs, route_url=target_url)
     # Retrieve our keyword arguments
     passed_keywords = kwargs.get("keywords", {})  # Changed from None in v1.3.3
     passed_params = kwargs.get("params", None)
+    pythonic = calling_object.pythonic
     # Starting in v1.3.3, Service Classes will pass an empty parameters dictionary
     # instead of a NoneType when no query string arguments are specified.
     parameter_payload = args_to_params(passed_params,
                                        passed_keywords,
                                        endpoints,
                                        operation_id,
-                                       calling_object.log,
-                                       calling_object.pythonic
+                                       settings["log_util"],
+                                       pythonic
                                        )
     expand_result = passed_keywords.get("expand_result", False) if passed_keywords else kwargs.get("expand_result", False)
-    do_pythonic = calling_object.pythonic
-    if passed_keywords.get("pythonic", None) is not None:
-        do_pythonic = passed_keywords.get("pythonic")
-    new_keywords = {
-        "caller": calling_object,
-        "method": target_endpoint[1],
-        "endpoint": target_url,
+    # Allow pythonic behaviors to be enabled / disabled per request
+    if isinstance(passed_keywords.get("pythonic", None), bool):
+        pythonic = passed_keywords["pythonic"]
+
+    settings.update({
+        "method": plan.method,
         "verify": calling_object.ssl_verify,
-        "headers": joined_headers,
         "params": parameter_payload,
         "body": kwargs.get("body", None),
         "data": kwargs.get("data", None),
@@ -696,11 +746,13 @@ def process_service_request(calling_object: ServiceClass,  # pylint: disable=R09
         "body_required": kwargs.get("body_required", None),
         "expand_result": expand_result,
         "container": container,
-        "pythonic": do_pythonic,
-        "perform": True
-    }
+        "perform": True,
+        "operation": operation_id,
+        "stream": StreamDownload.from_keywords(passed_keywords),
+        "stream_resources": passed_keywords.get("stream_resources", False)
+    })
 
-    return service_request(**new_keywords)
+    return submit_request(APIRequest(target_url, settings), joined_headers, pythonic)
 
 
 def handle_path_variables(passed: dict, route_url: str):
@@ -808,29 +860,11 @@ def autodiscover_region(provided_base_url: str, auth_result: dict):
 
 
 def sanitize_dictionary(dirty: Any, record_max: int = MAX_DEBUG_RECORDS) -> dict:
-    """Strip confidential data from logged dictionaries."""
-    cleaned = dirty
-    if isinstance(dirty, dict):  # pylint: disable=R1702
-        # cleaned = deepcopy(dict(dirty))
-        redacted = ["access_token", "client_id", "client_secret", "member_cid", "token"]
-        for redact in redacted:
-            if redact in cleaned:
-                cleaned[redact] = "REDACTED"
-            if "body" in cleaned:
-                if redact in cleaned["body"]:
-                    cleaned["body"][redact] = "REDACTED"
-                if "resources" in cleaned["body"]:
-                    # Log results are limited to MAX_DEBUG_RECORDS
-                    # number of items within the resources list
-                    if cleaned["body"]["resources"]:
-                        if isinstance(cleaned["body"]["resources"], list):
-                            del cleaned["body"]["resources"][max(1, min(record_max,
-                                                                        GLOBAL_API_MAX_RETURN
-                                                                        )):]
-        if "Authorization" in cleaned:
-            cleaned["Authorization"] = "Bearer REDACTED"
-
-    return cleaned
+    """Strip confidential data from logged dictionaries.
+
+    Returns a sanitized copy, the provided dictionary is not modified.
+    """
+    return redact(dirty, record_max)
 
 
 def log_class_startup(interface: Union[FalconInterface, ServiceClass, APIHarness, APIHarnessV2, OAuth2],
@@ -0,0 +1,146 @@
+"""Precompiled request plans for Service Class operations.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+from dataclasses import dataclass, field
+from logging import Logger
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+from warnings import warn
+from .._constant import MOCK_OPERATIONS
+from .._endpoint import Operation, operation_index
+from .._enum import BaseURL, ContainerBaseURL
+from .._error import UnnecessaryEncodingUsed
+
+
+@dataclass(frozen=True)
+class RequestPlan:
+    """This class represents an API operation compiled for dispatch.
+
+    Everything that can be resolved from the operation definition alone is calculated once,
+    leaving only the arguments of each call to be bound when a request is made.
+    """
+
+    # ____ ___ ___ ____ _ ___  _  _ ___ ____ ____
+    # |__|  |   |  |__/ | |__] |  |  |  |___ [__
+    # |  |  |   |  |  \ | |__] |__|  |  |___ ___]
+    #
+    operation_id: str
+    method: str = "GET"
+    path: str = ""
+    # Path variables must be substituted into the route.
+    templated: bool = False
+    # Query string (non-body) parameters accepted by the operation, keyed by name.
+    params: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    # Array parameters, which accept comma-delimited strings.
+    arrays: FrozenSet[str] = frozenset()
+    # The operation is sent to the container registry host for the region.
+    container: bool = False
+
+    @classmethod
+    def compile(cls, operation: Operation) -> "RequestPlan":
+        """Compile the plan for an operation record."""
+        return cls(operation_id=operation.operation_id,
+                   method=operation.method,
+                   path=operation.path,
+                   templated="{" in operation.path,
+                   params=operation.params,
+                   arrays=frozenset(name for name, param in operation.params.items() if param["type"] == "array"),
+                   container=operation.operation_id in MOCK_OPERATIONS
+                   )
+
+    def bind_params(self, payload: dict, keywords: dict, log: Optional[Logger] = None, pythonic: bool = False) -> dict:
+        """Add the keywords accepted as query string parameters by the operation to the payload.
+
+        Comma-delimited strings are converted to lists for array parameters, and a warning is
+        issued for strings that appear to be unnecessarily URL encoded (Issue #850).
+        """
+        accepted = self.params
+        for arg in keywords:
+            if arg in accepted:  # Unrecognized arguments are skipped
+                value = keywords[arg]
+                if isinstance(value, str):
+                    if arg in self.arrays:
+                        value = keywords[arg] = value.split(",")
+                    elif "%3A" in value:
+                        msg = " ".join([arg, "argument contains potentially urlencoded string of", f"'{value}'."])
+                        if pythonic:
+                            warn(msg, UnnecessaryEncodingUsed, stacklevel=6)
+                        elif log:
+                            log.warning(msg)
+                payload[arg] = value
+
+        return payload
+
+
+def container_base_url(base_url: str) -> Optional[str]:
+    """Return the container registry base URL for the region of an API base URL, if there is one."""
+    if not _CONTAINER_HOSTS:
+        _CONTAINER_HOSTS.update({BaseURL[name].value: f"https://{ContainerBaseURL[name].value}"
+                                 for name in ContainerBaseURL.__members__
+                                 })
+
+    return _CONTAINER_HOSTS.get(base_url.replace("https://", ""), None)
+
+
+def request_plan(endpoints: List[Any], operation_id: str) -> RequestPlan:
+    """Retrieve the plan for an operation within an endpoint list, compiling it on first use.
+
+    Raises KeyError when the operation is not present in the endpoint list.
+    """
+    cached = _PLAN_CACHE.get(id(endpoints))
+    if cached is None or cached[0] is not endpoints or cached[1] != len(endpoints):
+        cached = (endpoints, len(endpoints), {})
+        _PLAN_CACHE[id(endpoints)] = cached
+    plan = cached[2].get(operation_id)
+    if plan is None:
+        plan = cached[2][operation_id] = RequestPlan.compile(operation_index(endpoints)[operation_id])
+
+    return plan
+
+
+def find_plan(endpoints: List[Any], operation_id: Optional[str]) -> Optional[RequestPlan]:
+    """Return the plan for an operation ID, or None if it is not present."""
+    try:
+        return request_plan(endpoints, operation_id)
+    except KeyError:
+        return None
+
+
+# Region API hosts mapped to the matching container registry base URL, populated on first use.
+_CONTAINER_HOSTS: Dict[str, str] = {}
+# Plans are cached by the identity of the endpoint list they were compiled from, mirroring
+# the operation index. A reference to the list is retained so the identity can not be recycled.
+_PLAN_CACHE: Dict[int, Tuple[List[Any], int, Dict[str, RequestPlan]]] = {}
@@ -0,0 +1,126 @@
+"""Request sending and streaming helpers.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+import functools
+from typing import Any, Dict, Tuple, Union
+import requests
+from .._api_request import APIRequest
+from .._result import Result
+from .._transport import RequestCoalescer, dispatch
+
+
+def encode_payloads(api: APIRequest, headers: Dict[str, str]) -> Tuple[Dict[str, str], Any, Any]:
+    """Encode the body payload using the JSON codec, returning the headers, body and data payloads to send.
+
+    Body payloads are only sent when no data payload or files are provided, matching requests.
+    """
+    body_payload = api.body_payload
+    data_payload = api.data_payload
+    if body_payload is not None and not data_payload and not api.files:
+        data_payload = api.codec.dumps(body_payload)
+        body_payload = None
+        if not any(key.lower() == "content-type" for key in headers):
+            headers = {**headers, "Content-Type": "application/json"}
+
+    return headers, body_payload, data_payload
+
+
+def send_request(api: APIRequest, headers: Dict[str, str]) -> requests.Response:
+    """Send the request, applying the request coalescer, response cache, rate limiter and retry policy when configured.
+
+    Requests rejected by the API due to rate limiting are sent again once the rate limiter
+    allows, and requests failing for transient reasons are retried as the retry policy allows.
+    Fresh cached responses are returned without sending the request, and identical requests
+    already in flight share the response received. Every attempt is recorded to the telemetry
+    event of the request when telemetry is enabled.
+    """
+    headers, body_payload, data_payload = encode_payloads(api, headers)
+    if api.stream:
+        # Request the remainder of any partial download being resumed.
+        headers = {**headers, **api.stream.range_headers()}
+    # Use the pooled transport when one is available, otherwise fall back
+    # to a single use session (legacy Uber Class and direct calls).
+    if api.transport:
+        requester = api.transport.request
+    else:
+        requester = functools.partial(dispatch, requests.request)
+    send = functools.partial(requester, api.method.upper(), api.endpoint, params=api.param_payload,
+                             json=body_payload, data=data_payload,
+                             files=api.files, verify=api.verify,
+                             proxies=api.proxy, timeout=api.timeout,
+                             stream=bool(api.stream) or api.stream_resources,
+                             retry_policy=api.retry_policy,
+                             rate_limiter=api.rate_limiter,
+                             operation=api.operation,
+                             event=api.event
+                             )
+    if api.cache and not (api.stream or api.stream_resources) \
+            and api.cache.ttl_for(api.operation, api.method) is not None:
+        # Read-mostly operations may be answered (or revalidated) using the response cache.
+        send = functools.partial(api.cache.fetch, api.operation, api.endpoint, api.param_payload,
+                                 send=send, client=api.client_label
+                                 )
+    if api.coalescer and not (api.stream or api.stream_resources or api.files) \
+            and api.coalescer.coalesces(api.operation, api.method):
+        # Identical requests already in flight share the response received, decoded by each caller.
+        key = RequestCoalescer.key(api.method, api.endpoint, api.param_payload, body_payload, data_payload, headers)
+        return api.coalescer.run(key, functools.partial(send, headers=headers))
+
+    return send(headers=headers)
+
+
+def process_stream(api: APIRequest,
+                   response: requests.Response,
+                   pythonic: bool = False
+                   ) -> Union[Dict[str, Union[int, Dict[str, str], Dict[str, Dict]]], Result]:
+    """Write binary content to the streamed download destination as it arrives.
+
+    Returns a result describing the download in place of the content.
+    """
+    api.debug_headers = response.headers
+    download = api.stream.write(response)
+    if api.log_util:
+        api.log_util.debug("STREAMED: %s bytes written to %s", download["bytes_written"], download["path"] or "file object")
+    # A range request for a download that is already complete is still a success.
+    status_code = 200 if response.status_code == 416 else response.status_code
+    body = {"meta": {}, "resources": [download], "errors": []}
+    if pythonic:
+        returned = Result(status_code, response.headers, body)
+    else:
+        returned = Result()(status_code=status_code, headers=response.headers, body=body)
+
+    return returned
@@ -65,5 +65,14 @@ def service_override_payload(caller: object,
         "log_util": caller.log,
         "debug_record_count": caller.debug_record_count,
         "sanitize": caller.sanitize_log,
-        "pythonic": caller.pythonic
+        "pythonic": caller.pythonic,
+        "transport": caller.transport,
+        "rate_limiter": caller.rate_limiter,
+        "retry_policy": caller.retry_policy,
+        "codec": caller.codec,
+        "cache": caller.cache,
+        "client_label": caller.client_label,
+        "coalescer": caller.coalescer,
+        "telemetry": caller.telemetry,
+        "operation": "Manual"
     }
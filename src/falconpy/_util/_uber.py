@@ -38,7 +38,8 @@ For more information, please refer to <https://unlicense.org>
 from typing import Tuple
 from ._functions import args_to_params, return_preferred_default
 from .._constant import PREFER_IDS_IN_BODY, MOCK_OPERATIONS
-from .._enum import BaseURL, ContainerBaseURL
+from ._plan import container_base_url
+from .._transport import StreamDownload
 
 
 def create_uber_header_payload(hdrs: dict, passed_arguments: dict) -> dict:
@@ -131,10 +132,10 @@ def handle_container_operations(kwa: dict, base_string: str) -> Tuple[dict, str,
     # Default to non-container registry operations
     do_container = False
     if kwa.get("api_operation", None) in MOCK_OPERATIONS:
-        for base in [burl for burl in dir(BaseURL) if "__" not in burl]:
-            if BaseURL[base].value == base_string.replace("https://", ""):
-                base_string = f"https://{ContainerBaseURL[base].value}"
-                do_container = True
+        container_url = container_base_url(base_string)
+        if container_url:
+            base_string = container_url
+            do_container = True
         if kwa.get("api_operation", None) == "ImageMatchesPolicy":
             if "parameters" not in kwa:
                 kwa["parameters"] = {}
@@ -173,5 +174,16 @@ def uber_request_keywords(caller,
         "log_util": caller.log,
         "debug_record_count": caller.debug_record_count,
         "sanitize": caller.sanitize_log,
-        "pythonic": caller.pythonic
+        "pythonic": caller.pythonic,
+        "transport": caller.transport,
+        "rate_limiter": caller.rate_limiter,
+        "retry_policy": caller.retry_policy,
+        "codec": caller.codec,
+        "cache": caller.cache,
+        "client_label": caller.client_label,
+        "coalescer": caller.coalescer,
+        "telemetry": caller.telemetry,
+        "operation": oper,
+        "stream": StreamDownload.from_keywords(kwa),
+        "stream_resources": kwa.get("stream_resources", False)
     }
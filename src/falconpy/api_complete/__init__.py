@@ -44,7 +44,21 @@ OTHER DEALINGS IN THE SOFTWARE.
 
 For more information, please refer to <https://unlicense.org>
 """
+from importlib import import_module as _import_module
+import typing as _typing
 from ._legacy import APIHarness
 from ._advanced import APIHarnessV2
+if _typing.TYPE_CHECKING:
+    from ._async import AsyncAPIHarnessV2
 
-__all__ = ["APIHarness", "APIHarnessV2"]
+__all__ = ["APIHarness", "APIHarnessV2", "AsyncAPIHarnessV2"]
+
+
+def __getattr__(name: str) -> _typing.Any:
+    """Import the asynchronous Uber Class (and asyncio) when it is first requested."""
+    if name == "AsyncAPIHarnessV2":
+        loaded = _import_module("._async", __name__).AsyncAPIHarnessV2
+        globals()[name] = loaded
+        return loaded
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
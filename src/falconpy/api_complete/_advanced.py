@@ -36,12 +36,14 @@ OTHER DEALINGS IN THE SOFTWARE.
 For more information, please refer to <https://unlicense.org>
 """
 import functools
-from typing import Dict, Union, Callable
-from .._constant import ALLOWED_METHODS
+from typing import Any, Dict, Iterable, Optional, Union, Callable
+from .._constant import ALLOWED_METHODS, ID_KEYWORDS
 from .._util import (
     perform_request
     )
 from .._auth_object import UberInterface
+from .._endpoint import Operation, find_operation
+from .._paginator import Hydrator, Paginator
 from .._util import (
     handle_body_payload_ids,
     scrub_target,
@@ -188,14 +190,15 @@ class APIHarnessV2(UberInterface):
                 kwargs["api_operation"] = args[0]
         except IndexError:
             pass  # They didn't specify an action, try for an override instead.
-        uber_command = [a for a in self.commands if a[0] == kwargs.get("api_operation", None)]
+        uber_command = find_operation(self.commands, kwargs.get("api_operation", None))
         if kwargs.get("override", None):
-            uber_command = [["Manual"] + kwargs["override"].split(",")]
+            override = kwargs["override"].split(",")
+            uber_command = Operation(operation_id="Manual", method=override[0], path=override[1])
         if uber_command:
             # Which API operation to perform.
-            operation = uber_command[0][0]
+            operation = uber_command.operation_id
             # Which HTTP method to execute
-            method = uber_command[0][1].upper()
+            method = uber_command.method.upper()
             # Check the headers. If we've not logged in yet, this will force our base_url
             # to point to the correct cloud region.
             _ = self.auth_headers
@@ -203,7 +206,7 @@ class APIHarnessV2(UberInterface):
             kwargs, url_base, container = handle_container_operations(kwargs, self.base_url)
             # Retrieve the endpoint from the command list and append to our base URL and
             # then perform any outstanding string replacements on the target endpoint URL.
-            target = scrub_target(operation, f"{url_base}{uber_command[0][2]}", kwargs)
+            target = scrub_target(operation, f"{url_base}{uber_command.path}", kwargs)
             # Handle any IDs that are in the wrong payload
             kwargs = handle_body_payload_ids(kwargs)
             # Only accept allowed HTTP methods
@@ -238,3 +241,84 @@ class APIHarnessV2(UberInterface):
             raise InvalidOperation
 
         return returned
+
+    def paginate(self, api_operation: str, prefetch: bool = False, **kwargs) -> Paginator:
+        """Iterate over every result returned by a paginated operation.
+
+        Keyword arguments
+        ----
+        api_operation : str
+            API Operation ID to paginate.
+        prefetch : bool
+            Retrieve the next page on a background thread while the current page is processed.
+        All other keywords are provided to the command method for every page requested.
+
+        Returns
+        ----
+        Paginator
+            Iterator yielding each resource. Use the pages method to iterate page by page.
+        """
+        uber_command = find_operation(self.commands, api_operation)
+        if not uber_command:
+            raise InvalidOperation
+
+        return Paginator(functools.partial(self.command, api_operation), uber_command, prefetch, **kwargs)
+
+    def hydrate(self,
+                query: Union[str, Iterable[str]],
+                details: str,
+                ordered: bool = True,
+                batch_size: Optional[int] = None,
+                max_workers: Optional[int] = None,
+                details_parameters: Optional[Dict[str, Any]] = None,
+                id_keyword: Optional[str] = None,
+                **kwargs
+                ) -> Hydrator:
+        """Retrieve the details for every ID returned by a query operation.
+
+        Keyword arguments
+        ----
+        query : str or Iterable
+            Query operation ID to paginate, or an iterable of IDs to retrieve details for.
+        details : str
+            Detail operation ID.
+        ordered : bool
+            Return details in the order IDs were returned by the query. [Default: True]
+        batch_size : int
+            Number of IDs to send per detail request. [Default: the documented operation limit]
+        max_workers : int
+            Maximum number of detail requests in flight. [Default: the transport pool size]
+        details_parameters : dict
+            Additional keywords provided to the detail operation.
+        id_keyword : str
+            Keyword the detail operation accepts IDs with. [Default: ids, or composite_ids for alerts]
+        All other keywords are provided to the query operation.
+
+        Returns
+        ----
+        Hydrator
+            Iterator yielding the details for each ID. Use the batches method to iterate batch by batch.
+        """
+        ids = query
+        if isinstance(query, str):
+            ids = self.paginate(query, kwargs.pop("prefetch", False), **kwargs)
+        detail_command = find_operation(self.commands, details)
+        if not detail_command:
+            raise InvalidOperation
+        if max_workers is None and self.transport:
+            max_workers = self.transport.pool_maxsize
+        keyword = id_keyword or ID_KEYWORDS.get(detail_command.operation_id, "ids")
+        call = functools.partial(self.command, details)
+        if keyword != "ids":
+            # Only the ids keyword is moved into the body payload by the command method.
+            call = functools.partial(self._body_ids, details, keyword)
+
+        return Hydrator(ids, call, detail_command, batch_size, max_workers, ordered, keyword,
+                        **(details_parameters or {})
+                        )
+
+    def _body_ids(self, action: str, keyword: str, **kwargs) -> Union[Dict[str, Union[int, dict]], bytes]:
+        """Perform an operation, providing the IDs keyword within the body payload."""
+        kwargs["body"] = {**(kwargs.get("body", None) or {}), keyword: kwargs.pop(keyword)}
+
+        return self.command(action, **kwargs)
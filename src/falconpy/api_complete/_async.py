@@ -0,0 +1,80 @@
+"""All-in-one CrowdStrike Falcon OAuth2 API harness, asynchronous version.
+
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+from typing import Dict, Union
+from ._advanced import APIHarnessV2
+from .._auth_object._async_interface import AsyncFalconInterface
+from .._result import Result
+
+
+class AsyncAPIHarnessV2(AsyncFalconInterface, APIHarnessV2):
+    """The FalconPy Uber Class, asynchronous version.
+
+    Accepts the same keywords as APIHarnessV2. The command, login and logout methods are
+    coroutines. Requests are prepared by the Uber Class exactly as they are for synchronous
+    usage, and are sent using an asynchronous connection pool.
+
+        async with AsyncAPIHarnessV2(client_id=CLIENT_ID, client_secret=CLIENT_SECRET) as uber:
+            result = await uber.command("QueryDevicesByFilter", limit=100)
+    """
+
+    async def command(self, *args, **kwargs) -> Union[Dict[str, Union[int, dict]], bytes, Result]:  # pylint: disable=W0236
+        """Perform the specified API operation.
+
+        Accepts the same arguments and keywords as APIHarnessV2.command.
+        """
+        operation = kwargs.get("action", kwargs.get("api_operation", args[0] if args else None))
+        if not kwargs.get("override", None):
+            # Token operations do not alter the authentication state of the Uber Class.
+            if operation == "oauth2AccessToken":
+                return await self._async_login_handler(stateful=False)
+            if operation == "oauth2RevokeToken" and kwargs.get("token_value", None):
+                return await self._async_logout_handler(token_value=kwargs.get("token_value"), stateful=False)
+
+        return await self.dispatch(super().command, *args, **kwargs)
+
+    async def login(self) -> bool:
+        """Generate an authorization token."""
+        await self._async_login_handler()
+
+        return self.token_valid
+
+    async def logout(self) -> bool:
+        """Revoke the current authorization token."""
+        result = await self._async_logout_handler()
+
+        return bool(result["status_code"] == 200)
@@ -57,7 +57,7 @@ from .._util import (
     )
 from .._enum import BaseURL, ContainerBaseURL, TokenFailReason
 from .._constant import PREFER_IDS_IN_BODY, MOCK_OPERATIONS
-from .._endpoint import api_endpoints
+from .._endpoint import api_endpoints, Operation, find_operation
 from .._log import LogFacility
 
 
@@ -349,16 +349,17 @@ class APIHarness:
         except IndexError:
             pass  # They didn't specify an action, use the default and try for an override instead
 
-        uber_command = [a for a in self.commands if a[0] == kwargs.get("action", None)]
+        uber_command = find_operation(self.commands, kwargs.get("action", None))
         if kwargs.get("override", None):
-            uber_command = [["Manual"] + kwargs["override"].split(",")]
+            override = kwargs["override"].split(",")
+            uber_command = Operation(operation_id="Manual", method=override[0], path=override[1])
         if uber_command:
             # Retrieve our default base URL
             url_base = self.base_url
             # Alter keywords and base URL if we are performing a container registry operation
             kwargs, url_base, container = self._handle_container_operations(kwargs, url_base)
             # Retrieve the endpoint URL from the command list and append to our base URL
-            target = f"{url_base}{uber_command[0][2]}"
+            target = f"{url_base}{uber_command.path}"
             # Container image ID
             target = self._handle_container_image_id(target, kwargs)
             # Partition
@@ -370,8 +371,8 @@ class APIHarness:
             # Check for authentication
             if self.authenticated:
                 # Which HTTP method to execute
-                selected_method = uber_command[0][1].upper()
-                selected_operation = uber_command[0][0]
+                selected_method = uber_command.method.upper()
+                selected_operation = uber_command.operation_id
                 # Log the operation we're performing if enabled.
                 if self.log:
                     self.log.debug("OPERATION: %s", selected_operation)
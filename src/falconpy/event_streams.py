@@ -35,8 +35,9 @@ OTHER DEALINGS IN THE SOFTWARE.
 
 For more information, please refer to <https://unlicense.org>
 """
-from typing import Dict, Union
+from typing import Dict, List, Optional, Union
 from ._util import force_default, process_service_request
+from ._event_stream import EventStreamConsumer, OffsetStore
 from ._service_class import ServiceClass
 from ._endpoint._event_streams import _event_streams_endpoints as Endpoints
 
@@ -127,6 +128,41 @@ class EventStreams(ServiceClass):
             params=parameters
             )
 
+    def consume(self: object,
+                app_id: str,
+                store: Optional[OffsetStore] = None,
+                partitions: Optional[List[int]] = None,
+                **kwargs
+                ) -> EventStreamConsumer:
+        """Consume the events of every stream available to an application.
+
+        Every partition is read concurrently and sessions are refreshed automatically. The
+        offset of the last event processed in each partition is checkpointed to the store,
+        and reading resumes from the checkpointed offsets when the consumer is restarted.
+
+        Keyword arguments:
+        app_id -- Label that identifies your connection. 32 character alphanumeric.
+        store -- OffsetStore offsets are checkpointed to. Defaults to an in memory store.
+        partitions -- List of partitions to read. Defaults to every partition available.
+        format -- Format for streaming events. Either 'json' or 'flatjson'.
+        queue_size -- Maximum number of decoded batches of events waiting for delivery.
+        chunk_size -- Number of bytes read from each stream at a time.
+        checkpoint_every -- Number of events processed between checkpoints.
+        refresh_interval -- Seconds between session refreshes. Defaults to the interval
+                            provided by the stream, less 60 seconds.
+
+        Returns: EventStreamConsumer, an iterator of events. Close the consumer (or use it as
+        a context manager) to stop reading and checkpoint the final offsets.
+
+            with falcon.consume(app_id="siem") as consumer:
+                for event in consumer:
+                    ship(event)
+        """
+        if "format" in kwargs:
+            kwargs["stream_format"] = kwargs.pop("format")
+
+        return EventStreamConsumer(self, app_id, store=store, partitions=partitions, **kwargs)
+
     # These method names align to the operation IDs in the API but
     # do not conform to snake_case / PEP8 and are defined here for
     # backwards compatibility / ease of use purposes
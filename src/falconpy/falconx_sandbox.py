@@ -46,6 +46,7 @@ from ._util import (
     )
 from ._payload import generic_payload_list, falconx_payload
 from ._service_class import ServiceClass
+from ._falconx import FalconXSandboxPipeline
 from ._endpoint._falconx_sandbox import _falconx_sandbox_endpoints as Endpoints
 
 
@@ -649,6 +650,39 @@ class FalconXSandbox(ServiceClass):
             body=body
             )
 
+    def pipeline(self: object, destination: str = None, **kwargs) -> FalconXSandboxPipeline:
+        """Detonate any number of files in the sandbox, skipping files that were already analyzed.
+
+        Each file is hashed locally and checked against the sandbox index and query_reports
+        before being uploaded and submitted. Submissions are checked by a single scheduler,
+        and reports and artifacts are retrieved in parallel as each file completes.
+
+        Keyword arguments:
+        destination -- Directory full reports and artifacts are written to. Only summary
+                       reports are retrieved when not provided.
+        environment_id -- Sandbox environment files are detonated in. Default: 160
+        index -- SandboxIndex (or FileSandboxIndex) recording the report for each file.
+        lookup -- Boolean indicating if existing reports should be found using query_reports.
+        artifacts -- Boolean indicating if the artifacts within each report should be downloaded.
+        max_pending -- Maximum number of submissions in progress at the same time. Default: 10
+        max_workers -- Number of files hashed, looked up or submitted concurrently. Default: 8
+        max_downloads -- Number of reports and artifacts downloaded concurrently. Default: 4
+        poll_batch -- Maximum number of submissions checked with each call. Default: 100
+        poll_interval -- Seconds waited before the status of a submission is first checked. Default: 15
+        max_poll_interval -- Maximum seconds waited between checks of a submission. Default: 120
+        submission_timeout -- Seconds to wait for each submission to complete. Default: 3600
+
+        Returns: FalconXSandboxPipeline. Close the pipeline (or use it as a context manager)
+        to stop the scheduler.
+
+            with falcon.pipeline(destination="./reports", index=FileSandboxIndex("index.json")) as sandbox:
+                for path in files:
+                    sandbox.add(path, action_script="default")
+                for sample in sandbox.as_completed():
+                    print(sample.name, sample.sha256, sample.source, sample.verdict)
+        """
+        return FalconXSandboxPipeline(self, destination=destination, **kwargs)
+
     # These method names align to the operation IDs in the API but
     # do not conform to snake_case / PEP8 and are defined here for
     # backwards compatibility / ease of use purposes
@@ -40,6 +40,7 @@ from ._util import process_service_request, force_default, handle_single_argumen
 from ._payload import malquery_fuzzy_payload, generic_payload_list
 from ._payload import malquery_exact_search_payload, malquery_hunt_payload
 from ._service_class import ServiceClass
+from ._malquery import MalQueryJobRunner
 from ._endpoint._malquery import _malquery_endpoints as Endpoints
 
 
@@ -392,6 +393,36 @@ class MalQuery(ServiceClass):
             body=body
             )
 
+    def runner(self: object, destination: str = None, **kwargs) -> MalQueryJobRunner:
+        """Run any number of MalQuery searches and sample downloads concurrently.
+
+        Every request in progress is checked by a single scheduler, with the interval between
+        checks of each request doubling while it remains in progress. Hunts and downloads are
+        only submitted while the quotas returned by get_quotas allow it. When a destination is
+        provided, the samples matched by each search are downloaded as soon as it completes.
+
+        Keyword arguments:
+        destination -- Directory sample archives are written to. Samples are not downloaded
+                       when not provided.
+        max_pending -- Maximum number of requests in progress at the same time. Default: 20
+        max_workers -- Number of requests submitted or checked concurrently. Default: 8
+        max_downloads -- Number of sample archives downloaded concurrently. Default: 4
+        download_batch -- Maximum number of samples requested in each multi-download. Default: 100
+        poll_interval -- Seconds waited before the status of a request is first checked. Default: 2
+        max_poll_interval -- Maximum seconds waited between checks of a request. Default: 30
+        job_timeout -- Seconds to wait for each request to complete. Default: 3600
+
+        Returns: MalQueryJobRunner. Close the runner (or use it as a context manager)
+        to stop the scheduler.
+
+            with falcon.runner(destination="./samples") as jobs:
+                for rule in rules:
+                    jobs.hunt(yara_rule=rule, limit=100)
+                for job in jobs.as_completed():
+                    print(job.kind, job.status, job.matches or job.path)
+        """
+        return MalQueryJobRunner(self, destination=destination, **kwargs)
+
     # These method names align to the operation IDs in the API but
     # do not conform to snake_case / PEP8 and are defined here for
     # backwards compatibility / ease of use purposes
@@ -35,9 +35,12 @@ OTHER DEALINGS IN THE SOFTWARE.
 
 For more information, please refer to <https://unlicense.org>
 """
-# pylint: disable=R0902,R0913
-from typing import Dict, Optional, Union
+# pylint: disable=R0902,R0913,R0914,R0917
+from typing import Callable, Dict, Iterable, Optional, Union
 from ._auth_object import FalconInterface
+from ._transport import Transport, RateLimiter, RetryPolicy, ResponseCache, RequestCoalescer
+from ._codec import JSONCodec
+from ._telemetry import Telemetry
 from ._error import CannotRevokeToken
 from ._util import (
     confirm_base_url,
@@ -81,7 +84,18 @@ class OAuth2(FalconInterface):
                  debug_record_count: Optional[int] = None,
                  sanitize_log: Optional[bool] = None,
                  pythonic: Optional[bool] = None,
-                 environment: Optional[Dict[str, str]] = None
+                 environment: Optional[Dict[str, str]] = None,
+                 pool_connections: Optional[int] = None,
+                 pool_maxsize: Optional[int] = None,
+                 keep_alive: Optional[bool] = True,
+                 transport: Optional[Transport] = None,
+                 background_refresh: Optional[bool] = False,
+                 rate_limit: Optional[Union[bool, RateLimiter]] = False,
+                 retry: Optional[Union[bool, RetryPolicy]] = False,
+                 json_codec: Optional[Union[str, JSONCodec]] = None,
+                 cache: Optional[Union[bool, ResponseCache]] = False,
+                 coalesce: Optional[Union[bool, RequestCoalescer]] = False,
+                 telemetry: Optional[Union[bool, Callable, Iterable[Callable], Telemetry]] = None
                  ):
         """Construct an instance of the class.
 
@@ -112,6 +126,36 @@ class OAuth2(FalconInterface):
             Amount of time (in seconds) between now and the token expiration before
             a refresh of the token is performed. Default: 120, Max: 1200
             Values over 1200 will be reset to the maximum.
+        pool_connections : int
+            Number of per-host connection pools to cache. [Default: 10]
+        pool_maxsize : int
+            Maximum number of connections kept alive per host. [Default: 10]
+        keep_alive : bool
+            Flag specifying if connections should be reused between requests. [Default: True]
+        transport : Transport
+            Existing Transport object to share a connection pool with.
+        background_refresh : bool
+            Flag specifying if tokens should be renewed from a background thread
+            before they become stale. [Default: False]
+        rate_limit : bool or RateLimiter
+            Pace requests using a client side rate limiter learned from the rate limit
+            headers returned by the API. [Default: False]
+        retry : bool or RetryPolicy
+            Retry requests that fail for transient reasons using exponential backoff
+            with jitter. [Default: False]
+        json_codec : str or JSONCodec
+            JSON library used to decode responses and encode request bodies (orjson,
+            simdjson, ujson or json). [Default: Fastest installed library]
+        cache : bool or ResponseCache
+            Cache responses to read-mostly GET operations, shared by every Service Class
+            using this authentication object. [Default: False]
+        coalesce : bool or RequestCoalescer
+            Share one API call (and result) between identical requests made while it is
+            in flight. [Default: False]
+        telemetry : bool, callable, list of callables or Telemetry
+            Provide the measurements of every request (operation, status, attempts, latency
+            and payload sizes) to instrumentation hooks. True enables an in-process
+            MetricsAggregator. [Default: None]
 
         Arguments
         ----
@@ -137,7 +181,18 @@ class OAuth2(FalconInterface):
                          debug_record_count=debug_record_count,
                          sanitize_log=sanitize_log,
                          pythonic=pythonic,
-                         environment=environment
+                         environment=environment,
+                         pool_connections=pool_connections,
+                         pool_maxsize=pool_maxsize,
+                         keep_alive=keep_alive,
+                         transport=transport,
+                         background_refresh=background_refresh,
+                         rate_limit=rate_limit,
+                         retry=retry,
+                         json_codec=json_codec,
+                         cache=cache,
+                         coalesce=coalesce,
+                         telemetry=telemetry
                          )
 
     def logout(self) -> Dict[str, Union[int, dict]]:
@@ -35,10 +35,11 @@ OTHER DEALINGS IN THE SOFTWARE.
 
 For more information, please refer to <https://unlicense.org>
 """
-# pylint: disable=R0904  # Aligning method count to API service collection operation count
-from typing import Dict, Union
+# pylint: disable=R0904,C0302  # Aligning method count to API service collection operation count
+from typing import Dict, List, Union
 from ._util import force_default, process_service_request, handle_single_argument
 from ._payload import aggregate_payload, command_payload, generic_payload_list
+from ._rtr import RTRBatchOrchestrator
 from ._service_class import ServiceClass
 from ._endpoint._real_time_response import _real_time_response_endpoints as Endpoints
 
@@ -965,6 +966,38 @@ class RealTimeResponse(ServiceClass):
             params=parameters
             )
 
+    def orchestrate(self: object, host_ids: List[str], **kwargs) -> RTRBatchOrchestrator:
+        """Run RTR commands on any number of hosts using batch sessions.
+
+        Hosts are divided into shards of up to batch_size hosts, each initialized as a batch
+        session using batch_init_sessions and kept alive in the background using
+        batch_refresh_sessions. Commands are run on every shard concurrently and the result
+        of each host is provided as soon as it completes.
+
+        Keyword arguments:
+        host_ids -- List of host agent IDs to run commands on.
+        batch_size -- Maximum number of hosts in each batch session. Default: 1000
+        max_workers -- Number of batch sessions worked with concurrently. Default: 8
+        refresh_interval -- Seconds between batch session refreshes. Default: 300
+        queue_offline -- Boolean indicating if sessions should be queued for offline hosts.
+        poll_interval -- Seconds waited before the status of pending commands is first checked.
+                         Doubles while no pending command completes. Default: 1
+        max_poll_interval -- Maximum seconds waited between checks of pending commands. Default: 15
+        status_workers -- Maximum number of command status checks in progress at the same time
+                          within each batch session. Default: 16
+
+        Returns: RTRBatchOrchestrator. Close the orchestrator (or use it as a context manager)
+        to stop refreshing the batch sessions.
+
+            with falcon.orchestrate(host_ids=hosts) as rtr:
+                for result in rtr.run("ps"):
+                    print(result.aid, result.stdout)
+                for retrieved in rtr.retrieve("C:/Windows/Temp/evidence.log", "./evidence"):
+                    print(retrieved.aid, retrieved.path, retrieved.verified)
+                print(rtr.metrics)
+        """
+        return RTRBatchOrchestrator(self, host_ids, **kwargs)
+
     # These method names align to the operation IDs in the API but
     # do not conform to snake_case / PEP8 and are defined here for
     # backwards compatibility / ease of use purposes
@@ -150,6 +150,12 @@ class SensorDownload(ServiceClass):
         Swagger URL
         https://assets.falcon.crowdstrike.com/support/api/swagger.html#/sensor-download/DownloadSensorInstallerById
         """
+        if file_name and download_path:
+            os.makedirs(download_path, exist_ok=True)
+            # stream the newly downloaded sensor straight into the
+            # aforementioned directory with provided file name
+            kwargs["stream"] = True
+            kwargs["target"] = os.path.join(download_path, file_name)
         returned = process_service_request(
                         calling_object=self,
                         endpoints=Endpoints,
@@ -157,12 +163,7 @@ class SensorDownload(ServiceClass):
                         keywords=kwargs,
                         params=handle_single_argument(args, parameters, "ids")
                         )
-        if file_name and download_path and isinstance(returned, bytes):
-            os.makedirs(download_path, exist_ok=True)
-            # write the newly downloaded sensor into the
-            # aforementioned directory with provided file name
-            with open(os.path.join(download_path, file_name), "wb") as sensor:
-                sensor.write(returned)
+        if file_name and download_path and isinstance(returned, dict) and returned.get("status_code") == 200:
             returned = generate_ok_result(message="Download successful")
 
         return returned
@@ -195,6 +196,12 @@ class SensorDownload(ServiceClass):
         Swagger URL
         https://assets.falcon.crowdstrike.com/support/api/swagger.html#/sensor-download/DownloadSensorInstallerByIdV2
         """
+        if file_name and download_path:
+            os.makedirs(download_path, exist_ok=True)
+            # stream the newly downloaded sensor straight into the
+            # aforementioned directory with provided file name
+            kwargs["stream"] = True
+            kwargs["target"] = os.path.join(download_path, file_name)
         returned = process_service_request(
                         calling_object=self,
                         endpoints=Endpoints,
@@ -202,12 +209,7 @@ class SensorDownload(ServiceClass):
                         keywords=kwargs,
                         params=handle_single_argument(args, parameters, "ids")
                         )
-        if file_name and download_path and isinstance(returned, bytes):
-            os.makedirs(download_path, exist_ok=True)
-            # write the newly downloaded sensor into the
-            # aforementioned directory with provided file name
-            with open(os.path.join(download_path, file_name), "wb") as sensor:
-                sensor.write(returned)
+        if file_name and download_path and isinstance(returned, dict) and returned.get("status_code") == 200:
             returned = generate_ok_result(message="Download successful")
 
         return returned
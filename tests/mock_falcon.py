@@ -0,0 +1,205 @@
+"""
+mock_falcon.py - Local stub of the CrowdStrike Falcon API
+
+Serves canned responses over HTTP or HTTPS from a background thread so that
+SDK behavior (connection pooling, retries, pagination, etc.) can be tested
+and benchmarked without access to a live tenant.
+
+    with MockFalcon() as mock:
+        mock.route("GET", "/devices/queries/devices/v1", {"resources": ["123"]})
+        hosts = Hosts(client_id="x", client_secret="y", base_url=mock.base_url)
+"""
+import json
+import os
+import shutil
+import ssl
+import subprocess
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+TOKEN_ROUTE = "/oauth2/token"
+REVOKE_ROUTE = "/oauth2/revoke"
+
+
+class MockRequest:
+    """A request received by the mock server."""
+
+    def __init__(self, method, path, query, headers, body):
+        self.method = method
+        self.path = path
+        self.query = query
+        self.headers = headers
+        self.body = body
+
+    @property
+    def json(self):
+        try:
+            return json.loads(self.body.decode("utf-8")) if self.body else {}
+        except ValueError:
+            return {}
+
+
+def falcon_body(resources=None, meta=None, errors=None):
+    """Return a standard Falcon API response body."""
+    return {
+        "meta": meta if meta is not None else {"query_time": 0.001, "trace_id": "mock-trace-id"},
+        "resources": resources if resources is not None else [],
+        "errors": errors if errors is not None else []
+    }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Buffer responses and disable Nagle so keep-alive round trips are not delayed.
+    wbufsize = -1
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        self.server.mock.record_connection()
+
+    def log_message(self, *args):  # Keep test output quiet
+        pass
+
+    def _dispatch(self):
+        parsed = urlparse(self.path)
+        length = int(self.headers.get("Content-Length", 0) or 0)
+        body = self.rfile.read(length) if length else b""
+        request = MockRequest(self.command,
+                              parsed.path,
+                              parse_qs(parsed.query),
+                              dict(self.headers),
+                              body
+                              )
+        status, headers, payload = self.server.mock.respond(request)
+        if self.headers.get("Connection", "").lower() == "close":
+            headers["Connection"] = "close"
+        if isinstance(payload, (dict, list)):
+            payload = json.dumps(payload).encode("utf-8")
+            headers.setdefault("Content-Type", "application/json")
+        elif isinstance(payload, str):
+            payload = payload.encode("utf-8")
+            headers.setdefault("Content-Type", "text/plain")
+        if isinstance(payload, bytes):
+            headers.setdefault("Content-Type", "application/octet-stream")
+            headers["Content-Length"] = str(len(payload))
+            self.send_response(status)
+            for key, value in headers.items():
+                self.send_header(key, value)
+            self.end_headers()
+            self.wfile.write(payload)
+        else:
+            # Any other iterable is streamed using chunked transfer encoding.
+            headers.setdefault("Content-Type", "application/octet-stream")
+            headers["Transfer-Encoding"] = "chunked"
+            self.send_response(status)
+            for key, value in headers.items():
+                self.send_header(key, value)
+            self.end_headers()
+            try:
+                for chunk in payload:
+                    if chunk:
+                        self.wfile.write(f"{len(chunk):X}\r\n".encode("ascii") + chunk + b"\r\n")
+                        self.wfile.flush()
+                self.wfile.write(b"0\r\n\r\n")
+            except (BrokenPipeError, ConnectionResetError):
+                self.close_connection = True
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _dispatch
+
+
+class MockFalcon:
+    """Threaded stub of the Falcon API."""
+
+    def __init__(self, tls: bool = False, token_lifetime: int = 1799):
+        self.tls = tls
+        self.token_lifetime = token_lifetime
+        self.routes = {}
+        self.requests = []
+        self.connections = 0
+        self.token_requests = 0
+        self._lock = threading.Lock()
+        self._tempdir = None
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self._server.daemon_threads = True
+        self._server.mock = self
+        if tls:
+            self._wrap_tls()
+        self._thread = threading.Thread(target=self._server.serve_forever, args=(0.05,), daemon=True)
+        self.route("POST", TOKEN_ROUTE, self._token)
+        self.route("POST", REVOKE_ROUTE, lambda req: (200, {}, falcon_body()))
+
+    def _wrap_tls(self):
+        if not shutil.which("openssl"):
+            raise RuntimeError("openssl is required to generate a certificate for the TLS mock server.")
+        self._tempdir = tempfile.mkdtemp()
+        cert = os.path.join(self._tempdir, "cert.pem")
+        key = os.path.join(self._tempdir, "key.pem")
+        subprocess.run(["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-keyout", key,
+                        "-out", cert, "-days", "1", "-subj", "/CN=localhost"],
+                       check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+                       )
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(cert, key)
+        self._server.socket = context.wrap_socket(self._server.socket, server_side=True)
+
+    def _token(self, request):
+        with self._lock:
+            self.token_requests += 1
+        return 201, {}, {"access_token": f"mock-token-{self.token_requests}",
+                         "expires_in": self.token_lifetime,
+                         "token_type": "bearer"
+                         }
+
+    def route(self, method: str, path: str, response):
+        """Register a response for a route.
+
+        The response may be a body (dict, list, str or bytes), a (status, headers, body)
+        tuple, or a callable receiving a MockRequest and returning such a tuple.
+        """
+        self.routes[(method.upper(), path)] = response
+
+    def record_connection(self):
+        with self._lock:
+            self.connections += 1
+
+    def respond(self, request: MockRequest):
+        with self._lock:
+            self.requests.append(request)
+        handler = self.routes.get((request.method, request.path))
+        if handler is None:
+            return 404, {}, falcon_body(errors=[{"code": 404, "message": "Not found"}])
+        if callable(handler):
+            handler = handler(request)
+        if isinstance(handler, tuple):
+            status, headers, payload = handler
+            return status, dict(headers), payload
+        return 200, {}, handler
+
+    def calls(self, path: str):
+        """Return the requests received for a path."""
+        with self._lock:
+            return [req for req in self.requests if req.path == path]
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"{'https' if self.tls else 'http'}://{host}:{port}"
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._tempdir:
+            shutil.rmtree(self._tempdir, ignore_errors=True)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
@@ -0,0 +1,127 @@
+"""
+test_async.py -  This class tests the asynchronous interface, Service Class wrapper and Uber Class
+"""
+import asyncio
+import os
+import sys
+import time
+import pytest
+from tests.mock_falcon import MockFalcon, falcon_body
+
+# Import our sibling src folder into the path
+sys.path.append(os.path.abspath('src'))
+# Classes to test - manually imported from sibling folder
+from falconpy import (
+    AsyncAPIHarnessV2,
+    AsyncFalconInterface,
+    AsyncServiceClass,
+    Hosts,
+    OAuth2,
+    Result
+    )
+from falconpy._error import APIError
+
+pytest.importorskip("httpx")
+
+
+def echo_ids(request):
+    return 200, {}, falcon_body(resources=request.json.get("ids", []))
+
+
+@pytest.fixture
+def mock():
+    with MockFalcon() as server:
+        server.route("GET", "/devices/queries/devices/v1", falcon_body(resources=["abc", "def"]))
+        server.route("POST", "/devices/entities/devices/v2", echo_ids)
+        server.route("GET", "/devices/entities/online-state/v1",
+                     (403, {}, falcon_body(errors=[{"code": 403, "message": "access denied"}]))
+                     )
+        yield server
+
+
+async def gather_details(mock, count):
+    async with AsyncServiceClass(Hosts,
+                                 auth_object=AsyncFalconInterface(client_id="whatever",
+                                                                  client_secret="whatever",
+                                                                  base_url=mock.base_url,
+                                                                  pool_maxsize=4
+                                                                  )
+                                 ) as hosts:
+        return await asyncio.gather(*[hosts.get_device_details(ids=[f"device{num}"]) for num in range(count)])
+
+
+class TestAsync:
+    def test_concurrent_requests_share_one_token(self, mock):
+        results = asyncio.run(gather_details(mock, 100))
+        assert [res["body"]["resources"] for res in results] == [[f"device{num}"] for num in range(100)]
+        assert mock.token_requests == 1
+        assert mock.connections <= 5  # Four pooled connections plus the token request
+
+    def test_stale_token_refreshed_once(self, mock):
+        async def scenario():
+            auth = AsyncFalconInterface(client_id="whatever", client_secret="whatever", base_url=mock.base_url)
+            hosts = AsyncServiceClass(Hosts, auth_object=auth)
+            await hosts.query_devices_by_filter()
+            auth.token_time = time.time() - auth.token_expiration
+            await asyncio.gather(*[hosts.query_devices_by_filter() for _ in range(25)])
+            await auth.aclose()
+            return auth.token_value
+
+        assert asyncio.run(scenario()) == "mock-token-2"
+        assert mock.token_requests == 2
+
+    def test_validation_failure_sends_no_request(self, mock):
+        async def scenario():
+            async with AsyncServiceClass(Hosts, client_id="whatever", client_secret="whatever",
+                                         base_url=mock.base_url
+                                         ) as hosts:
+                return await hosts.perform_action(action_name="not_an_action", ids="12345")
+
+        assert asyncio.run(scenario())["status_code"] == 500
+        assert not mock.calls("/devices/entities/devices-actions/v2")
+
+    def test_expand_result(self, mock):
+        async def scenario():
+            async with AsyncServiceClass(Hosts, client_id="whatever", client_secret="whatever",
+                                         base_url=mock.base_url
+                                         ) as hosts:
+                return await hosts.query_devices_by_filter(expand_result=True)
+
+        status_code, headers, body = asyncio.run(scenario())
+        assert status_code == 200 and headers["Content-Type"] == "application/json"
+        assert body["body"]["resources"] == ["abc", "def"]
+        assert mock.calls("/oauth2/revoke")
+
+    def test_pythonic(self, mock):
+        async def scenario():
+            async with AsyncServiceClass(Hosts, client_id="whatever", client_secret="whatever",
+                                         base_url=mock.base_url, pythonic=True
+                                         ) as hosts:
+                result = await hosts.query_devices_by_filter()
+                with pytest.raises(APIError):
+                    await hosts.get_online_state(ids="abc")
+                return result
+
+        result = asyncio.run(scenario())
+        assert isinstance(result, Result) and result.data == ["abc", "def"]
+
+    def test_uber_class(self, mock):
+        async def scenario():
+            async with AsyncAPIHarnessV2(client_id="whatever", client_secret="whatever", base_url=mock.base_url) as uber:
+                queried = await uber.command("QueryDevicesByFilter")
+                details = await uber.command("PostDeviceDetailsV2", body={"ids": queried["body"]["resources"]})
+                token = await uber.command("oauth2AccessToken")
+                missing = await uber.command("NotARealOperation")
+                return details, token, missing, uber.authenticated()
+
+        details, token, missing, authenticated = asyncio.run(scenario())
+        assert details["body"]["resources"] == ["abc", "def"]
+        assert token["status_code"] == 201
+        assert missing["status_code"] == 418
+        assert authenticated
+
+    def test_requires_async_auth_object(self, mock):
+        with pytest.raises(ValueError):
+            AsyncServiceClass(Hosts, auth_object=OAuth2(client_id="whatever", client_secret="whatever",
+                                                        base_url=mock.base_url
+                                                        ))
@@ -0,0 +1,151 @@
+"""
+test_coalesce.py -  This class tests coalescing of identical concurrent requests
+"""
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from tests.mock_falcon import MockFalcon, falcon_body
+
+# Import our sibling src folder into the path
+sys.path.append(os.path.abspath('src'))
+# Classes to test - manually imported from sibling folder
+from falconpy import Hosts, Intel, OAuth2, APIHarnessV2, RequestCoalescer
+from falconpy._error import APIError
+
+DETAILS = "/devices/entities/devices/v2"
+INDICATORS = "/intel/entities/indicators/GET/v1"
+
+
+class GatedRoute:
+    """Route holding every response until the expected number of requests reached the coalescer."""
+
+    def __init__(self, payload=None):
+        self.coalescer = None
+        self.expected = 0
+        self.payload = payload
+
+    def __call__(self, request):
+        deadline = time.time() + 5
+        while self.coalescer.metrics["requests"] < self.expected and time.time() < deadline:
+            time.sleep(0.005)
+        if callable(self.payload):
+            return self.payload(request)
+        if self.payload:
+            return self.payload
+        return 200, {}, falcon_body(resources=[{"device_id": item} for item in request.json.get("ids", [])])
+
+
+def concurrently(count, call):
+    with ThreadPoolExecutor(max_workers=count) as pool:
+        futures = [pool.submit(call, num) for num in range(count)]
+    return futures
+
+
+@pytest.fixture
+def mock():
+    with MockFalcon() as server:
+        server.gate = GatedRoute()
+        server.route("POST", DETAILS, server.gate)
+        server.route("POST", INDICATORS, server.gate)
+        server.route("POST", "/devices/entities/devices-actions/v2", falcon_body(resources=["abc"]))
+        yield server
+
+
+class TestCoalesce:
+    def test_identical_requests_share_one_call(self, mock):
+        hosts = Hosts(client_id="whatever", client_secret="whatever", base_url=mock.base_url, coalesce=True)
+        mock.gate.coalescer, mock.gate.expected = hosts.coalescer, 20
+        futures = concurrently(20, lambda _: hosts.get_device_details(ids=["a", "b"]))
+        results = [future.result() for future in futures]
+        assert len(mock.calls(DETAILS)) == 1
+        assert all(result == results[0] for result in results)
+        assert results[0]["body"]["resources"] == [{"device_id": "a"}, {"device_id": "b"}]
+        # Every caller is given their own copy of the result.
+        results[0]["body"]["resources"].clear()
+        assert all(result["body"]["resources"] == [{"device_id": "a"}, {"device_id": "b"}] for result in results[1:])
+        assert len({id(result) for result in results}) == 20
+        assert hosts.coalescer.metrics == {"requests": 20, "flights": 1, "coalesced": 19}
+        assert hosts.coalescer.in_flight == 0
+        # Once complete, the same request is sent again.
+        mock.gate.expected = 0
+        assert hosts.get_device_details(ids=["a", "b"])["status_code"] == 200
+        assert len(mock.calls(DETAILS)) == 2
+
+    def test_distinct_requests(self, mock):
+        auth = OAuth2(client_id="whatever", client_secret="whatever", base_url=mock.base_url, coalesce=True)
+        hosts, hosts_pythonic = Hosts(auth_object=auth), Hosts(auth_object=auth, pythonic=True)
+        mock.gate.coalescer, mock.gate.expected = auth.coalescer, 13
+        futures = concurrently(13, lambda num: hosts.get_device_details(ids=[f"device{num % 3}"]) if num < 12
+                               else hosts_pythonic.get_device_details(ids=["device0"])
+                               )
+        # Three distinct payloads, the pythonic request shares the response to the first.
+        assert len(mock.calls(DETAILS)) == 3
+        assert sorted(future.result()["body"]["resources"][0]["device_id"] for future in futures[:12]) \
+            == sorted(f"device{num % 3}" for num in range(12))
+        assert futures[-1].result().data == [{"device_id": "device0"}]
+
+    def test_credentials(self, mock):
+        mock.gate.payload = lambda request: falcon_body(resources=[request.headers["Authorization"]])
+        coalescer = RequestCoalescer()
+        first = Hosts(client_id="tenant one", client_secret="whatever", base_url=mock.base_url, coalesce=coalescer)
+        second = Hosts(client_id="tenant two", client_secret="whatever", base_url=mock.base_url,
+                       member_cid="child", coalesce=coalescer
+                       )
+        first.login()
+        second.login()
+        mock.gate.coalescer, mock.gate.expected = coalescer, 8
+        futures = concurrently(8, lambda num: (first if num % 2 else second).get_device_details(ids="a"))
+        assert len(mock.calls(DETAILS)) == 2
+        for num, future in enumerate(futures):
+            assert future.result()["body"]["resources"] == [(first if num % 2 else second).headers["Authorization"]]
+
+    def test_pythonic_copies(self, mock):
+        hosts = Hosts(client_id="whatever", client_secret="whatever", base_url=mock.base_url,
+                      coalesce=True, pythonic=True
+                      )
+        mock.gate.coalescer, mock.gate.expected = hosts.coalescer, 6
+        results = [future.result() for future in concurrently(6, lambda _: hosts.get_device_details(ids="a"))]
+        assert len(mock.calls(DETAILS)) == 1 and len({id(result) for result in results}) == 6
+        results[0].data.append("modified")
+        assert all(result.data == [{"device_id": "a"}] for result in results[1:])
+
+    def test_configured_operations(self, mock):
+        coalescer = RequestCoalescer(exclude=["PostDeviceDetailsV2"])
+        auth = OAuth2(client_id="whatever", client_secret="whatever", base_url=mock.base_url, coalesce=coalescer)
+        assert auth.coalescer is coalescer
+        assert coalescer.coalesces("GetIntelIndicatorEntities", "POST")
+        assert not coalescer.coalesces("PostDeviceDetailsV2", "POST")
+        assert not coalescer.coalesces("PerformActionV2", "POST")
+        assert coalescer.coalesces("QueryDevicesByFilter", "get")
+        mock.gate.coalescer, mock.gate.expected = coalescer, 5
+        intel = Intel(auth_object=auth)
+        futures = concurrently(5, lambda _: intel.get_indicator_entities(ids=["x"]))
+        assert len(mock.calls(INDICATORS)) == 1 and futures[0].result()["status_code"] == 200
+        hosts = Hosts(auth_object=auth)
+        mock.gate.expected = 0
+        concurrently(4, lambda _: hosts.get_device_details(ids="a"))
+        concurrently(4, lambda _: hosts.perform_action(action_name="contain", ids="a"))
+        assert len(mock.calls(DETAILS)) == 4
+        assert len(mock.calls("/devices/entities/devices-actions/v2")) == 4
+
+    def test_errors_are_shared(self, mock):
+        mock.gate.payload = (403, {}, falcon_body(errors=[{"code": 403, "message": "access denied"}]))
+        hosts = Hosts(client_id="whatever", client_secret="whatever", base_url=mock.base_url,
+                      coalesce=True, pythonic=True
+                      )
+        mock.gate.coalescer, mock.gate.expected = hosts.coalescer, 6
+        futures = concurrently(6, lambda _: hosts.get_device_details(ids="a"))
+        for future in futures:
+            with pytest.raises(APIError):
+                future.result()
+        assert len(mock.calls(DETAILS)) == 1
+
+    def test_uber_class(self, mock):
+        uber = APIHarnessV2(client_id="whatever", client_secret="whatever", base_url=mock.base_url, coalesce=True)
+        mock.gate.coalescer, mock.gate.expected = uber.coalescer, 8
+        futures = concurrently(8, lambda _: uber.command("PostDeviceDetailsV2", body={"ids": ["a"]}))
+        assert len(mock.calls(DETAILS)) == 1
+        assert all(future.result()["body"]["resources"] == [{"device_id": "a"}] for future in futures)
+        assert Hosts(client_id="whatever", client_secret="whatever", base_url=mock.base_url).coalescer is None
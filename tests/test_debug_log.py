@@ -0,0 +1,79 @@
+"""
+test_debug_log.py -  This class tests lazy sanitization and truncation of the debug log
+"""
+import logging
+import os
+import sys
+import pytest
+from tests.mock_falcon import MockFalcon, falcon_body
+
+# Import our sibling src folder into the path
+sys.path.append(os.path.abspath('src'))
+# Classes to test - manually imported from sibling folder
+from falconpy import Hosts, OAuth2
+from falconpy._log import LogPayload, redact
+from falconpy._util import sanitize_dictionary
+
+LOGGER = "falconpy"
+RECORDS = [f"id{num}" for num in range(250)]
+
+
+@pytest.fixture
+def mock():
+    with MockFalcon() as server:
+        server.route("GET", "/devices/queries/devices/v1", falcon_body(resources=RECORDS))
+        yield server
+
+
+def logged(caplog, prefix):
+    return [rec.getMessage() for rec in caplog.records if rec.getMessage().startswith(prefix)]
+
+
+class TestDebugLog:
+    def test_redact_does_not_modify_payload(self):
+        payload = {"client_secret": "secret", "Authorization": "Bearer abc",
+                   "body": {"access_token": "abc", "resources": list(RECORDS)}
+                   }
+        cleaned = redact(payload, 10)
+        assert cleaned["client_secret"] == "REDACTED" and cleaned["body"]["access_token"] == "REDACTED"
+        assert cleaned["Authorization"] == "Bearer REDACTED"
+        assert cleaned["body"]["resources"] == RECORDS[:10]
+        assert payload["client_secret"] == "secret" and payload["body"]["access_token"] == "abc"
+        assert payload["body"]["resources"] == RECORDS
+        assert sanitize_dictionary(payload, 0)["body"]["resources"] == RECORDS[:1]
+        assert redact(b"binary") == b"binary"
+
+    def test_log_payload(self):
+        payload = {"client_id": "whatever", "body": {"resources": list(RECORDS)}}
+        assert "whatever" not in str(LogPayload(payload, True, 2))
+        assert str(LogPayload(payload, False)) == str(payload)
+
+    def test_sanitized_response(self, mock, caplog):
+        hosts = Hosts(client_id="whatever", client_secret="whatever", base_url=mock.base_url,
+                      debug=True, debug_record_count=5
+                      )
+        with caplog.at_level(logging.DEBUG, logger=LOGGER):
+            result = hosts.query_devices_by_filter()
+        assert result["body"]["resources"] == RECORDS
+        results = logged(caplog, "RESULT:")
+        assert len(results) == 1 and "'id4'" in results[0] and "'id5'" not in results[0]
+        assert all("mock-token" not in msg for msg in logged(caplog, "HEADERS:"))
+
+    def test_unsanitized_response(self, mock, caplog):
+        hosts = Hosts(client_id="whatever", client_secret="whatever", base_url=mock.base_url,
+                      debug=True, debug_record_count=5, sanitize_log=False
+                      )
+        with caplog.at_level(logging.DEBUG, logger=LOGGER):
+            hosts.query_devices_by_filter()
+        assert "'id249'" in logged(caplog, "RESULT:")[0]
+
+    def test_not_formatted_when_filtered(self, mock, caplog, monkeypatch):
+        formatted = []
+        monkeypatch.setattr(LogPayload, "__str__", lambda self: formatted.append(self) or "")
+        auth = OAuth2(client_id="whatever", client_secret="whatever", base_url=mock.base_url, debug=True)
+        with caplog.at_level(logging.INFO, logger=LOGGER):
+            assert Hosts(auth_object=auth).query_devices_by_filter()["status_code"] == 200
+        assert not formatted
+        with caplog.at_level(logging.DEBUG, logger=LOGGER):
+            Hosts(auth_object=auth).query_devices_by_filter()
+        assert formatted
@@ -0,0 +1,179 @@
+"""
+test_event_stream_consumer.py -  This class tests the Event Streams consumer
+"""
+import os
+import sys
+import threading
+import time
+import pytest
+from tests.mock_falcon import MockFalcon, falcon_body
+
+# Import our sibling src folder into the path
+sys.path.append(os.path.abspath('src'))
+# Classes to test - manually imported from sibling folder
+from falconpy import EventStreams, EventStreamConsumer, OffsetStore, FileOffsetStore
+from falconpy._error import APIError
+
+FEED = "/sensors/entities/datafeed/v1/{}"
+REFRESH = "/sensors/entities/datafeed-actions/v1/{}"
+
+
+EVENT = b'{"metadata": {"offset": %d, "eventType": "DetectionSummaryEvent"}, "event": {"DetectId": "ldt:%d"}}\n'
+
+
+def event_lines(start, count):
+    """Return newline-delimited events, starting at an offset."""
+    return b"".join(EVENT % (offset, offset) for offset in range(start, start + count))
+
+
+class FeedRoute:
+    """Chunked event stream beginning at the offset requested, ending after a number of events."""
+
+    def __init__(self, total, batch=1000, delay=0.0):
+        self.total = total
+        self.batch = batch
+        self.delay = delay
+        self.offsets = []
+        self.produced = 0
+
+    def __call__(self, request):
+        start = int(request.query.get("offset", ["0"])[0])
+        self.offsets.append(start)
+
+        def stream():
+            # Keep alive newlines are interleaved with the events.
+            yield b"\n"
+            for position in range(start, self.total, self.batch):
+                self.produced += 1
+                yield event_lines(position, min(self.batch, self.total - position))
+                if self.delay:
+                    time.sleep(self.delay)
+
+        return 200, {"Content-Type": "application/json"}, stream()
+
+
+def streams_route(mock, partitions, interval=1800):
+    def route(request):
+        return 200, {}, falcon_body(resources=[{
+            "dataFeedURL": f"{mock.base_url}{FEED.format(partition)}?appId={request.query['appId'][0]}",
+            "sessionToken": {"token": f"session-{partition}", "expiration": "2099-01-01T00:00:00Z"},
+            "refreshActiveSessionURL": f"{mock.base_url}{REFRESH.format(partition)}",
+            "refreshActiveSessionInterval": interval
+        } for partition in partitions])
+    return route
+
+
+@pytest.fixture
+def mock():
+    with MockFalcon() as server:
+        server.route("GET", "/sensors/entities/datafeed/v2", streams_route(server, [0, 1]))
+        for partition in [0, 1]:
+            server.route("POST", REFRESH.format(partition), falcon_body())
+        yield server
+
+
+def consume(consumer, count):
+    events = []
+    for event in consumer:
+        events.append(event)
+        if len(events) == count:
+            break
+    return events
+
+
+class TestEventStreamConsumer:
+    def test_millions_of_events(self, mock):
+        feeds = [FeedRoute(1000000), FeedRoute(1000000)]
+        for partition, feed in enumerate(feeds):
+            mock.route("GET", FEED.format(partition), feed)
+        streams = EventStreams(client_id="whatever", client_secret="whatever", base_url=mock.base_url)
+        with streams.consume(app_id="millions", checkpoint_every=50000) as consumer:
+            assert isinstance(consumer, EventStreamConsumer)
+            count = 0
+            for _ in consumer:
+                count += 1
+                if count == 2000000:
+                    break
+            assert consumer.partitions == [0, 1]
+        assert count == 2000000
+        # The last event delivered had not been processed when the consumer stopped.
+        assert sorted(consumer.store.offsets.values()) == [999998, 999999]
+        assert consumer.metrics["events"] == 1999999
+        assert consumer.metrics["checkpoints"] >= 40
+        assert all(request.headers["Authorization"] == f"Token session-{partition}"
+                   for partition in [0, 1] for request in mock.calls(FEED.format(partition))
+                   )
+
+    def test_resume_from_checkpoint(self, mock, tmp_path):
+        feed = FeedRoute(100, batch=10)
+        mock.route("GET", FEED.format(0), feed)
+        path = str(tmp_path / "offsets.json")
+        FileOffsetStore(path).save({0: 49})
+        streams = EventStreams(client_id="whatever", client_secret="whatever", base_url=mock.base_url)
+        with streams.consume(app_id="resume", store=FileOffsetStore(path), partitions=[0]) as consumer:
+            events = consume(consumer, 20)
+        assert [event["metadata"]["offset"] for event in events] == list(range(50, 70))
+        assert feed.offsets[0] == 50
+        # The last event delivered had not been processed when the consumer stopped.
+        assert FileOffsetStore(path).offsets == {0: 68}
+
+    def test_refresh_keeps_connection(self, mock):
+        feed = FeedRoute(60, batch=1, delay=0.02)
+        mock.route("GET", FEED.format(0), feed)
+        streams = EventStreams(client_id="whatever", client_secret="whatever", base_url=mock.base_url)
+        with streams.consume(app_id="refresh", partitions=[0], refresh_interval=0.2) as consumer:
+            assert len(consume(consumer, 50)) == 50
+        refreshes = mock.calls(REFRESH.format(0))
+        assert len(refreshes) >= 2 and consumer.metrics["refreshes"] == len(refreshes)
+        assert all(request.query["action_name"] == ["refresh_active_stream_session"] for request in refreshes)
+        assert len(mock.calls(FEED.format(0))) == 1
+
+    def test_backpressure(self, mock):
+        feed = FeedRoute(10000000, batch=1000)
+        mock.route("GET", FEED.format(0), feed)
+        streams = EventStreams(client_id="whatever", client_secret="whatever", base_url=mock.base_url)
+        with streams.consume(app_id="slow", partitions=[0], queue_size=2, chunk_size=4096) as consumer:
+            consume(consumer, 1)
+            time.sleep(0.5)
+            produced = feed.produced
+            time.sleep(0.5)
+            assert consumer.backlog <= 2
+            # Reading pauses while the queue is full.
+            assert feed.produced == produced
+
+    def test_expired_session(self, mock):
+        attempts = []
+        feed = FeedRoute(10, batch=10)
+
+        def expiring(request):
+            attempts.append(request)
+            if len(attempts) == 1:
+                return 401, {}, falcon_body(errors=[{"code": 401, "message": "session expired"}])
+            return feed(request)
+
+        mock.route("GET", FEED.format(0), expiring)
+        streams = EventStreams(client_id="whatever", client_secret="whatever", base_url=mock.base_url)
+        with streams.consume(app_id="expired", partitions=[0], store=OffsetStore({0: 4})) as consumer:
+            assert [event["metadata"]["offset"] for event in consume(consumer, 5)] == [5, 6, 7, 8, 9]
+        assert len(mock.calls("/sensors/entities/datafeed/v2")) == 2
+        assert consumer.metrics["reconnects"] >= 1
+
+    def test_discovery_failure(self, mock):
+        mock.route("GET", "/sensors/entities/datafeed/v2",
+                   (403, {}, falcon_body(errors=[{"code": 403, "message": "access denied"}]))
+                   )
+        streams = EventStreams(client_id="whatever", client_secret="whatever", base_url=mock.base_url)
+        consumer = streams.consume(app_id="denied")
+        with pytest.raises(APIError) as failure:
+            next(iter(consumer))
+        assert failure.value.code == 403
+        consumer.close()
+
+    def test_close_stops_readers(self, mock):
+        mock.route("GET", FEED.format(0), FeedRoute(10000000, delay=0.01))
+        streams = EventStreams(client_id="whatever", client_secret="whatever", base_url=mock.base_url)
+        consumer = streams.consume(app_id="close", partitions=[0])
+        consume(consumer, 10)
+        consumer.close()
+        assert not [thread for thread in threading.enumerate() if thread.name.startswith("falconpy-event-stream")]
+        assert consumer.offsets == {0: 8}
@@ -0,0 +1,288 @@
+"""
+test_falconx_pipeline.py -  This class tests the FalconX sandbox pipeline
+"""
+import hashlib
+import json
+import os
+import re
+import sys
+import threading
+import time
+import pytest
+from tests.mock_falcon import MockFalcon, falcon_body
+
+# Import our sibling src folder into the path
+sys.path.append(os.path.abspath('src'))
+# Classes to test - manually imported from sibling folder
+from falconpy import FalconXSandbox, FalconXSandboxPipeline, SandboxIndex, FileSandboxIndex, SandboxSample
+
+QUERY_REPORTS = "/falconx/queries/reports/v1"
+QUERY_SAMPLE = "/samples/queries/samples/GET/v1"
+UPLOAD = "/samples/entities/samples/v2"
+SUBMISSIONS = "/falconx/entities/submissions/v1"
+SUMMARIES = "/falconx/entities/report-summaries/v1"
+REPORTS = "/falconx/entities/reports/v1"
+ARTIFACTS = "/falconx/entities/artifacts/v1"
+
+
+def sha256(content):
+    return hashlib.sha256(content).hexdigest()
+
+
+class FakeSandbox:
+    """Samples, submissions, reports and artifacts of a FalconX sandbox stub."""
+
+    def __init__(self, reports=None, samples=(), ready_after=2, failing=(), quota=None):
+        # Report IDs already available for each SHA-256.
+        self.reports = dict(reports or {})
+        self.samples = set(samples)
+        self.ready_after = ready_after
+        self.failing = set(failing)
+        self.quota = quota
+        self.submissions = {}
+        self.checks = {}
+        self.lock = threading.Lock()
+
+    def meta(self):
+        meta = {"query_time": 0.001, "trace_id": "mock-trace-id"}
+        if self.quota is not None:
+            meta["quota"] = {"total": self.quota, "used": len(self.submissions), "in_progress": 0}
+        return meta
+
+    def query_reports(self, request):
+        digest = re.search(r"sandbox\.sha256:'([0-9a-f]+)'", request.query["filter"][0]).group(1)
+        found = [self.reports[digest]] if digest in self.reports else []
+        return 200, {}, falcon_body(resources=found, meta=self.meta())
+
+    def query_sample(self, request):
+        return 200, {}, falcon_body(resources=[digest for digest in request.json["sha256s"] if digest in self.samples])
+
+    def upload(self, request):
+        return 200, {}, falcon_body(resources=[{"file_name": "uploaded"}])
+
+    def submit(self, request):
+        digest = request.json["sandbox"][0]["sha256"]
+        with self.lock:
+            submission_id = f"submission-{len(self.submissions)}"
+            self.submissions[submission_id] = digest
+            self.checks[submission_id] = 0
+        return 200, {}, falcon_body(resources=[{"id": submission_id, "state": "created"}], meta=self.meta())
+
+    def status(self, request):
+        resources = []
+        with self.lock:
+            for submission_id in request.query["ids"]:
+                self.checks[submission_id] += 1
+                if self.submissions[submission_id] in self.failing:
+                    state = "error"
+                else:
+                    state = "success" if self.checks[submission_id] >= self.ready_after else "running"
+                resources.append({"id": submission_id, "state": state})
+        return 200, {}, falcon_body(resources=resources)
+
+    def summary(self, request):
+        report_id = request.query["ids"][0]
+        return 200, {}, falcon_body(resources=[{"id": report_id, "verdict": "malicious"}])
+
+    def report(self, request):
+        report_id = request.query["ids"][0]
+        return 200, {}, falcon_body(resources=[{
+            "id": report_id,
+            "verdict": "malicious",
+            "sandbox": [{
+                "pcap_report_artifact_id": f"pcap-{report_id}",
+                "ioc_report_strict_json_artifact_id": f"ioc-{report_id}",
+                "memory_dumps": [{"artifact_id": f"dump-{report_id}"}]
+            }]
+        }])
+
+    def artifact(self, request):
+        artifact_id = request.query["id"][0]
+        if artifact_id.startswith("ioc-"):
+            return 200, {}, [{"type": "domain", "value": "example.com"}]
+        content = artifact_id.encode() * 20000
+
+        def stream():
+            for position in range(0, len(content), 65536):
+                yield content[position:position + 65536]
+
+        return 200, {"Content-Type": "application/octet-stream"}, stream()
+
+    def install(self, mock):
+        mock.route("GET", QUERY_REPORTS, self.query_reports)
+        mock.route("POST", QUERY_SAMPLE, self.query_sample)
+        mock.route("POST", UPLOAD, self.upload)
+        mock.route("POST", SUBMISSIONS, self.submit)
+        mock.route("GET", SUBMISSIONS, self.status)
+        mock.route("GET", SUMMARIES, self.summary)
+        mock.route("GET", REPORTS, self.report)
+        mock.route("GET", ARTIFACTS, self.artifact)
+
+
+@pytest.fixture
+def mock():
+    with MockFalcon() as server:
+        yield server
+
+
+def service(mock):
+    return FalconXSandbox(client_id="whatever", client_secret="whatever", base_url=mock.base_url)
+
+
+def files(folder, count, prefix="sample"):
+    paths = []
+    for number in range(count):
+        path = folder / f"{prefix}-{number}.bin"
+        path.write_bytes(f"{prefix} {number}".encode() * 100)
+        paths.append(str(path))
+    return paths
+
+
+class TestFalconXSandboxPipeline:
+    def test_many_files_detonated(self, mock, tmp_path):
+        stub = FakeSandbox()
+        stub.install(mock)
+        paths = files(tmp_path, 50)
+        with service(mock).pipeline(max_pending=10, poll_interval=0.01, max_poll_interval=0.05) as sandbox:
+            assert isinstance(sandbox, FalconXSandboxPipeline)
+            for path in paths:
+                sandbox.add(path, action_script="default")
+            finished = list(sandbox.as_completed())
+        assert len(finished) == 50 and all(isinstance(sample, SandboxSample) and sample.succeeded for sample in finished)
+        assert all(sample.detonated and sample.verdict == "malicious" for sample in finished)
+        assert {sample.sha256 for sample in finished} == {sha256(open(path, "rb").read()) for path in paths}
+        assert len(mock.calls(UPLOAD)) == 50 and len(mock.calls(SUBMISSIONS)) > 50
+        submitted = [request.json["sandbox"][0] for request in mock.calls(SUBMISSIONS) if request.method == "POST"]
+        assert all(entry["environment_id"] == 160 and entry["action_script"] == "default" for entry in submitted)
+        # Submissions in progress are checked together.
+        assert sandbox.metrics["polls"] < 100
+        assert max(len(request.query["ids"]) for request in mock.calls(SUBMISSIONS) if request.method == "GET") > 1
+        assert sandbox.metrics["submitted"] == 50 and sandbox.pending == 0
+        assert len(sandbox.index.reports) == 50
+
+    def test_known_hashes_skipped(self, mock, tmp_path):
+        paths = files(tmp_path, 4)
+        digests = [sha256(open(path, "rb").read()) for path in paths]
+        stub = FakeSandbox(reports={digests[1]: "report-1"}, samples={digests[2]})
+        stub.install(mock)
+        index = SandboxIndex({digests[0]: {"160": "report-0"}})
+        with service(mock).pipeline(index=index, poll_interval=0.01) as sandbox:
+            samples = [sandbox.add(path) for path in paths]
+            sandbox.wait()
+        assert [sample.source for sample in samples] == ["index", "report", "submitted", "submitted"]
+        assert [sample.report_id for sample in samples[:2]] == ["report-0", "report-1"]
+        # Only files without a report are submitted, and only samples that do not exist are uploaded.
+        assert len([request for request in mock.calls(SUBMISSIONS) if request.method == "POST"]) == 2
+        assert len(mock.calls(UPLOAD)) == 1 and sandbox.metrics["uploads_skipped"] == 1
+        assert len(mock.calls(QUERY_REPORTS)) == 3
+        assert index.find(digests[1], 160) == "report-1" and index.find(digests[3], 160) == samples[3].report_id
+        assert sandbox.metrics["index_hits"] == 1 and sandbox.metrics["report_hits"] == 1
+
+    def test_duplicates_processed_once(self, mock, tmp_path):
+        FakeSandbox().install(mock)
+        paths = files(tmp_path, 1) * 3 + files(tmp_path, 1, prefix="copy")
+        with service(mock).pipeline(poll_interval=0.01) as sandbox:
+            samples = [sandbox.add(path) for path in paths]
+            sandbox.wait()
+        assert all(sample.succeeded for sample in samples)
+        assert len(mock.calls(UPLOAD)) == 2 and sandbox.metrics["duplicates"] == 2
+        assert len({sample.report_id for sample in samples[:3]}) == 1
+        assert sorted(sample.source for sample in samples[:3]) == ["duplicate", "duplicate", "submitted"]
+
+    def test_reports_and_artifacts_downloaded(self, mock, tmp_path):
+        FakeSandbox().install(mock)
+        paths = files(tmp_path, 3)
+        destination = tmp_path / "reports"
+        with service(mock).pipeline(destination=str(destination), poll_interval=0.01, max_downloads=6) as sandbox:
+            samples = [sandbox.add(path) for path in paths]
+            sandbox.wait()
+        for sample in samples:
+            assert sample.succeeded and os.path.dirname(sample.report) == str(destination / sample.sha256)
+            with open(sample.report, "r", encoding="utf-8") as report:
+                assert json.load(report)["id"] == sample.report_id
+            assert sorted(sample.artifacts) == sorted(f"{kind}-{sample.report_id}" for kind in ("pcap", "ioc", "dump"))
+            with open(sample.artifacts[f"pcap-{sample.report_id}"], "rb") as pcap:
+                assert pcap.read() == f"pcap-{sample.report_id}".encode() * 20000
+            with open(sample.artifacts[f"ioc-{sample.report_id}"], "r", encoding="utf-8") as ioc:
+                assert json.load(ioc) == [{"type": "domain", "value": "example.com"}]
+            assert os.path.basename(sample.artifacts[f"dump-{sample.report_id}"]).startswith("artifact-")
+        assert sandbox.metrics["artifacts"] == 9 and sandbox.metrics["reports"] == 3
+
+    def test_persistent_index(self, mock, tmp_path):
+        FakeSandbox().install(mock)
+        paths = files(tmp_path, 2)
+        path = str(tmp_path / "index.json")
+        with service(mock).pipeline(index=FileSandboxIndex(path), lookup=False, poll_interval=0.01) as sandbox:
+            first = [sandbox.add(sample) for sample in paths]
+            sandbox.wait()
+        with service(mock).pipeline(index=FileSandboxIndex(path), lookup=False, poll_interval=0.01) as sandbox:
+            second = [sandbox.add(sample) for sample in paths]
+            sandbox.wait()
+        assert [sample.source for sample in second] == ["index", "index"]
+        assert [sample.report_id for sample in second] == [sample.report_id for sample in first]
+        assert len([request for request in mock.calls(SUBMISSIONS) if request.method == "POST"]) == 2
+        assert not mock.calls(QUERY_REPORTS)
+
+    def test_quota(self, mock, tmp_path):
+        FakeSandbox(quota=3).install(mock)
+        with service(mock).pipeline(max_pending=1, poll_interval=0.01) as sandbox:
+            samples = [sandbox.add(path) for path in files(tmp_path, 5)]
+            sandbox.wait()
+        assert sum(sample.succeeded for sample in samples) == 3
+        assert [sample.errors[0]["code"] for sample in samples if not sample.succeeded] == [429, 429]
+        assert sandbox.metrics["quota_rejections"] == 2 and sandbox.quota == 0
+
+    def test_failures(self, mock, tmp_path):
+        paths = files(tmp_path, 2)
+        FakeSandbox(failing={sha256(open(paths[0], "rb").read())}).install(mock)
+        with service(mock).pipeline(poll_interval=0.01) as sandbox:
+            failed = sandbox.add(paths[0])
+            missing = sandbox.add(str(tmp_path / "missing.bin"))
+            succeeded = sandbox.add(paths[1])
+            sandbox.wait()
+        assert failed.errors[0]["code"] == 500 and missing.errors[0]["code"] == 400
+        assert succeeded.succeeded and sandbox.metrics["failed"] == 2
+
+    def test_unwritable_destination(self, mock, tmp_path):
+        FakeSandbox().install(mock)
+        blocked = tmp_path / "file"
+        blocked.write_bytes(b"")
+        paths = files(tmp_path, 2)
+        with service(mock).pipeline(destination=str(blocked / "reports"), poll_interval=0.01) as sandbox:
+            samples = [sandbox.add(path) for path in paths + paths[:1]]
+            sandbox.wait()
+        assert all(sample.status == "failed" and sample.errors[0]["code"] == 500 for sample in samples)
+        assert samples[2].source == "duplicate" and sandbox.pending == 0
+
+    def test_unexpected_exception(self, mock, tmp_path):
+        FakeSandbox().install(mock)
+
+        class BrokenIndex(SandboxIndex):
+            def find(self, sha256, environment_id):
+                raise KeyError(sha256)
+
+        with service(mock).pipeline(index=BrokenIndex(), poll_interval=0.01) as sandbox:
+            sample = sandbox.add(files(tmp_path, 1)[0])
+            sandbox.wait()
+        assert sample.status == "failed" and sample.errors[0]["code"] == 500
+        assert not mock.calls(UPLOAD)
+
+    def test_adaptive_backoff(self, mock, tmp_path):
+        FakeSandbox(ready_after=1000).install(mock)
+        with service(mock).pipeline(poll_interval=0.01, max_poll_interval=0.08, submission_timeout=0.5) as sandbox:
+            sample = sandbox.add(files(tmp_path, 1)[0])
+            sandbox.wait()
+        # Checks 0.01, 0.02, 0.04 and then 0.08 seconds apart, until the timeout.
+        assert 5 <= sample.polls <= 10
+        assert sample.status == "failed" and sample.errors[0]["code"] == 408
+
+    def test_close_stops_scheduler(self, mock, tmp_path):
+        FakeSandbox(ready_after=1000).install(mock)
+        sandbox = service(mock).pipeline(poll_interval=0.01)
+        sandbox.add(files(tmp_path, 1)[0])
+        time.sleep(0.1)
+        sandbox.close()
+        polls = len(mock.calls(SUBMISSIONS))
+        time.sleep(0.1)
+        assert len(mock.calls(SUBMISSIONS)) == polls
+        assert not [thread for thread in threading.enumerate() if thread.name.startswith("falconpy-falconx")]
@@ -0,0 +1,120 @@
+"""
+test_hydrator.py -  This class tests the query-then-hydrate pipeline
+"""
+import os
+import sys
+import random
+import threading
+import time
+import pytest
+from tests.mock_falcon import MockFalcon, falcon_body
+
+# Import our sibling src folder into the path
+sys.path.append(os.path.abspath('src'))
+# Classes to test - manually imported from sibling folder
+from falconpy import Alerts, Hosts, SpotlightVulnerabilities, APIHarnessV2, Hydrator
+from falconpy._error import APIError
+
+RECORDS = [f"id{num}" for num in range(50)]
+
+
+class DetailRoute:
+    """Detail endpoint that records concurrency and responds after a random delay."""
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+        self.batches = []
+        self.lock = threading.Lock()
+
+    def __call__(self, request):
+        ids = request.json.get("ids") or request.json.get("composite_ids") or request.query.get("ids", [])
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            self.batches.append(ids)
+        time.sleep(random.uniform(0.01, 0.05))
+        with self.lock:
+            self.active -= 1
+        return 200, {}, falcon_body(resources=[{"device_id": item} for item in ids])
+
+
+def query_route(request):
+    offset = int(request.query.get("offset", ["0"])[0])
+    limit = int(request.query.get("limit", ["20"])[0])
+    return 200, {}, falcon_body(resources=RECORDS[offset:offset + limit],
+                                meta={"pagination": {"total": len(RECORDS), "offset": offset, "limit": limit}}
+                                )
+
+
+@pytest.fixture
+def mock():
+    with MockFalcon() as server:
+        server.details = DetailRoute()
+        server.route("GET", "/devices/queries/devices/v1", query_route)
+        server.route("POST", "/devices/entities/devices/v2", server.details)
+        server.route("GET", "/spotlight/entities/vulnerabilities/v2", server.details)
+        server.route("GET", "/alerts/queries/alerts/v2", query_route)
+        server.route("POST", "/alerts/entities/alerts/v2", server.details)
+        yield server
+
+
+class TestHydrator:
+    def test_ordered(self, mock):
+        hosts = Hosts(client_id="whatever", client_secret="whatever", base_url=mock.base_url)
+        hydrator = hosts.hydrate(hosts.query_devices_by_filter, hosts.get_device_details,
+                                 batch_size=4, max_workers=3, limit=20
+                                 )
+        assert isinstance(hydrator, Hydrator)
+        assert [item["device_id"] for item in hydrator] == RECORDS
+        assert hydrator.request_count == 13
+        assert all(len(batch) <= 4 for batch in mock.details.batches)
+        assert mock.details.peak <= 3
+
+    def test_unordered(self, mock):
+        hosts = Hosts(client_id="whatever", client_secret="whatever", base_url=mock.base_url)
+        hydrator = hosts.hydrate("QueryDevicesByFilter", "PostDeviceDetailsV2",
+                                 ordered=False, batch_size=5, max_workers=4
+                                 )
+        assert sorted(item["device_id"] for item in hydrator) == sorted(RECORDS)
+        assert mock.details.peak <= 4
+
+    def test_documented_batch_size(self, mock):
+        spotlight = SpotlightVulnerabilities(client_id="whatever", client_secret="whatever", base_url=mock.base_url)
+        ids = [f"vuln{num}" for num in range(1000)]
+        hydrator = spotlight.hydrate(ids, spotlight.get_vulnerabilities)
+        assert hydrator.batch_size == 400
+        assert len(list(hydrator)) == 1000
+        assert sorted(len(batch) for batch in mock.details.batches) == [200, 400, 400]
+
+    def test_composite_ids(self, mock):
+        alerts = Alerts(client_id="whatever", client_secret="whatever", base_url=mock.base_url)
+        hydrator = alerts.hydrate("query_alerts_v2", "get_alerts_v2", batch_size=20)
+        assert hydrator.id_keyword == "composite_ids"
+        assert [item["device_id"] for item in hydrator] == RECORDS
+        requests = mock.calls("/alerts/entities/alerts/v2")
+        assert len(requests) == 3 and all("composite_ids" in request.json for request in requests)
+        uber = APIHarnessV2(client_id="whatever", client_secret="whatever", base_url=mock.base_url)
+        hydrator = uber.hydrate("GetQueriesAlertsV2", "PostEntitiesAlertsV2", batch_size=20,
+                                details_parameters={"include_hidden": False}
+                                )
+        assert [item["device_id"] for item in hydrator] == RECORDS
+        assert mock.calls("/alerts/entities/alerts/v2")[-1].query == {"include_hidden": ["false"]}
+        assert Hosts(client_id="whatever", client_secret="whatever").hydrate(RECORDS, "get_device_details",
+                                                                             id_keyword="device_ids"
+                                                                             ).id_keyword == "device_ids"
+
+    def test_uber_class(self, mock):
+        uber = APIHarnessV2(client_id="whatever", client_secret="whatever", base_url=mock.base_url)
+        hydrator = uber.hydrate("QueryDevicesByFilter", "PostDeviceDetailsV2", batch_size=10, prefetch=True)
+        assert [item["device_id"] for item in hydrator] == RECORDS
+        assert hydrator.max_workers == uber.transport.pool_maxsize
+
+    def test_detail_failure(self, mock):
+        mock.route("POST", "/devices/entities/devices/v2",
+                   (429, {}, falcon_body(errors=[{"code": 429, "message": "API rate limit exceeded."}]))
+                   )
+        hosts = Hosts(client_id="whatever", client_secret="whatever", base_url=mock.base_url)
+        with pytest.raises(APIError) as failure:
+            list(hosts.hydrate(RECORDS, hosts.get_device_details, batch_size=10))
+        assert failure.value.code == 429
@@ -0,0 +1,106 @@
+"""
+test_json_codec.py -  This class tests the pluggable JSON codec
+"""
+import json
+import os
+import sys
+import pytest
+from tests.mock_falcon import MockFalcon, falcon_body
+
+# Import our sibling src folder into the path
+sys.path.append(os.path.abspath('src'))
+# Classes to test - manually imported from sibling folder
+from falconpy import Hosts, IOC, APIHarnessV2, JSONCodec
+
+
+class CountingCodec(JSONCodec):
+    """Standard library codec recording every call."""
+
+    def __init__(self):
+        self.decoded = 0
+        self.encoded = []
+        super().__init__("counting", self._count_loads, self._count_dumps)
+
+    def _count_loads(self, content):
+        self.decoded += 1
+        return json.loads(content)
+
+    def _count_dumps(self, obj):
+        self.encoded.append(obj)
+        return json.dumps(obj).encode("utf-8")
+
+
+def echo_ids(request):
+    return 200, {}, falcon_body(resources=request.json.get("ids", []))
+
+
+@pytest.fixture
+def mock():
+    with MockFalcon() as server:
+        server.route("GET", "/devices/queries/devices/v1", falcon_body(resources=["abc", "def"]))
+        server.route("POST", "/devices/entities/devices/v2", echo_ids)
+        server.route("POST", "/iocs/entities/indicators/v1", lambda req: (201, {}, falcon_body(resources=req.json["indicators"])))
+        yield server
+
+
+class TestJSONCodec:
+    def test_auto_selection(self):
+        pytest.importorskip("orjson")
+        assert JSONCodec.get().name == "orjson"
+        assert Hosts(client_id="whatever", client_secret="whatever").codec is JSONCodec.get()
+
+    def test_decode_and_encode(self, mock):
+        codec = CountingCodec()
+        hosts = Hosts(client_id="whatever", client_secret="whatever", base_url=mock.base_url, json_codec=codec)
+        assert hosts.query_devices_by_filter()["body"]["resources"] == ["abc", "def"]
+        assert hosts.get_device_details(ids=["abc", "def"])["body"]["resources"] == ["abc", "def"]
+        # Token, query and detail responses were decoded, only the detail body was encoded.
+        assert codec.decoded == 3
+        assert codec.encoded == [{"ids": ["abc", "def"]}]
+        request = mock.calls("/devices/entities/devices/v2")[0]
+        assert request.headers["Content-Type"] == "application/json"
+
+    @pytest.mark.parametrize("name", ["json", "orjson"])
+    def test_named_codec(self, mock, name):
+        if name != "json":
+            pytest.importorskip(name)
+        indicators = [{"type": "domain", "value": f"bad{num}.example.com", "action": "detect"} for num in range(2000)]
+        ioc = IOC(client_id="whatever", client_secret="whatever", base_url=mock.base_url, json_codec=name)
+        assert ioc.codec.name == name
+        result = ioc.indicator_create(indicators=indicators)
+        assert result["status_code"] == 201 and result["body"]["resources"] == indicators
+
+    @pytest.mark.parametrize("name", ["json", "orjson", "ujson"])
+    @pytest.mark.parametrize("value", [float("nan"), float("inf"), float("-inf")])
+    def test_non_finite_floats(self, name, value):
+        if name != "json":
+            pytest.importorskip(name)
+        codec = JSONCodec.get(name)
+        with pytest.raises(ValueError):
+            codec.dumps({"filter": [{"score": value}]})
+        assert json.loads(codec.dumps({"score": [1.5, (2, 0.0)]})) == {"score": [1.5, [2, 0.0]]}
+
+    @pytest.mark.parametrize("name", ["json", "orjson"])
+    def test_null_values(self, name):
+        if name != "json":
+            pytest.importorskip(name)
+        codec = JSONCodec.get(name)
+        body = {"filter": None, "ids": ["abc"], "score": 1.5, "total": 2 ** 70}
+        assert json.loads(codec.dumps(body)) == body
+
+    def test_uber_class(self, mock):
+        codec = CountingCodec()
+        uber = APIHarnessV2(client_id="whatever", client_secret="whatever", base_url=mock.base_url, json_codec=codec)
+        result = uber.command("PostDeviceDetailsV2", body={"ids": ["abc"]}, content_type="application/json; charset=utf-8")
+        assert result["body"]["resources"] == ["abc"]
+        assert codec.encoded == [{"ids": ["abc"]}]
+        request = mock.calls("/devices/entities/devices/v2")[0]
+        assert request.headers["Content-Type"] == "application/json; charset=utf-8"
+
+    def test_unsupported_types_fall_back(self):
+        codec = JSONCodec.get()
+        assert json.loads(codec.dumps({"big": 2 ** 70})) == {"big": 2 ** 70}
+        with pytest.raises(ValueError):
+            codec.loads(b"not json")
+        with pytest.raises(ValueError):
+            JSONCodec.get("not_a_codec")
@@ -0,0 +1,82 @@
+"""
+test_lazy_import.py -  This class tests lazy loading of Service Classes and endpoint tables
+"""
+import os
+import subprocess
+import sys
+import pytest
+
+# Import our sibling src folder into the path
+sys.path.append(os.path.abspath('src'))
+# Classes to test - manually imported from sibling folder
+import falconpy
+from falconpy import _endpoint
+from falconpy._endpoint import deprecated
+
+
+def loaded_modules(statement: str) -> set:
+    """Return the falconpy modules loaded by a statement in a fresh interpreter."""
+    probe = f"import sys; {statement}; print(' '.join(m for m in sys.modules if m.startswith('falconpy')))"
+    result = subprocess.run([sys.executable, "-c", probe],
+                            env={**os.environ, "PYTHONPATH": os.path.abspath("src")},
+                            capture_output=True, text=True, check=True
+                            )
+    return set(result.stdout.split())
+
+
+class TestLazyImport:
+    def test_import_loads_core_only(self):
+        modules = loaded_modules("import falconpy")
+        assert "falconpy.hosts" not in modules
+        assert "falconpy.api_complete" not in modules
+        assert "falconpy._endpoint._hosts" not in modules
+        assert "falconpy._endpoint.deprecated._hosts" not in modules
+
+    def test_import_skips_helpers(self):
+        modules = loaded_modules("import falconpy")
+        assert "falconpy._util._async" not in modules
+        assert "falconpy._auth_object._async_interface" not in modules
+        for helper in ("_rtr", "_malquery", "_falconx", "_event_stream"):
+            assert f"falconpy.{helper}" not in modules
+        modules = loaded_modules("import sys; from falconpy import APIHarnessV2, Hosts; assert 'asyncio' not in sys.modules")
+        assert "falconpy.api_complete._async" not in modules
+        modules = loaded_modules("from falconpy import AsyncAPIHarnessV2, RTRBatchOrchestrator")
+        assert {"falconpy.api_complete._async", "falconpy._util._async", "falconpy._rtr"} <= modules
+
+    def test_service_class_loads_own_endpoints(self):
+        modules = loaded_modules("from falconpy import Hosts")
+        assert {"falconpy.hosts", "falconpy._endpoint._hosts"} <= modules
+        assert "falconpy._endpoint._alerts" not in modules
+
+    def test_every_public_name_resolves(self):
+        for name in falconpy.__all__:
+            assert getattr(falconpy, name) is not None
+        assert falconpy.Hosts is falconpy.hosts.Hosts
+        assert "Hosts" in dir(falconpy)
+
+    def test_submodule_access(self):
+        modules = loaded_modules("import falconpy; falconpy.hosts.Hosts")
+        assert "falconpy.hosts" in modules and "falconpy.alerts" not in modules
+        assert falconpy.real_time_response.RealTimeResponse is falconpy.RealTimeResponse
+        assert "hosts" in dir(falconpy)
+
+    def test_private_imports(self):
+        for name in ("import_module", "Any", "Dict", "List", "TYPE_CHECKING"):
+            assert not hasattr(falconpy, name) and name not in dir(falconpy)
+
+    def test_unknown_attribute(self):
+        with pytest.raises(AttributeError):
+            falconpy.NotAServiceClass
+        with pytest.raises(AttributeError):
+            _endpoint._not_a_collection_endpoints
+        with pytest.raises(AttributeError):
+            deprecated._not_a_collection_deprecated
+
+    def test_endpoint_tables(self):
+        from falconpy._endpoint._hosts import _hosts_endpoints
+        assert _endpoint._hosts_endpoints is _hosts_endpoints
+        assert _endpoint._hosts_deprecated is deprecated._hosts_endpoints
+        assert len(_endpoint.api_endpoints) == sum(
+            len(getattr(_endpoint, f"_{name}_endpoints")) for name in _endpoint._ENDPOINT_MODULES
+            ) + len(_endpoint.deprecated_endpoints)
+        assert set(_endpoint.api_operations) == {ep[0] for ep in _endpoint.api_endpoints}
@@ -0,0 +1,268 @@
+"""
+test_malquery_runner.py -  This class tests the MalQuery job runner
+"""
+import hashlib
+import os
+import sys
+import threading
+import time
+import pytest
+from tests.mock_falcon import MockFalcon, falcon_body
+
+# Import our sibling src folder into the path
+sys.path.append(os.path.abspath('src'))
+# Classes to test - manually imported from sibling folder
+from falconpy import MalQuery, MalQueryJob, MalQueryJobRunner
+
+QUOTAS = "/malquery/aggregates/quotas/v1"
+FUZZY = "/malquery/combined/fuzzy-search/v1"
+REQUESTS = "/malquery/entities/requests/v1"
+SAMPLES = "/malquery/entities/samples-fetch/v1"
+MULTIDOWNLOAD = "/malquery/entities/samples-multidownload/v1"
+EXACT = "/malquery/queries/exact-search/v1"
+HUNT = "/malquery/queries/hunt/v1"
+
+
+def sample(number):
+    return hashlib.sha256(f"sample-{number}".encode()).hexdigest()
+
+
+class FakeMalQuery:
+    """Searches, multi-downloads and quotas of a MalQuery stub."""
+
+    def __init__(self, matches=None, ready_after=2, failing=(), hunt_limit=None, download_limit=None):
+        # Samples matched by each YARA rule, available after a number of status checks.
+        self.matches = matches or {}
+        self.ready_after = ready_after
+        self.failing = set(failing)
+        self.hunt_limit = hunt_limit
+        self.download_limit = download_limit
+        self.requests = {}
+        self.checks = {}
+        self.lock = threading.Lock()
+
+    def search(self, kind):
+        def route(request):
+            rule = request.json.get("yara_rule") or request.json["patterns"][0]["value"]
+            with self.lock:
+                reqid = f"{kind}-{len(self.requests)}"
+                self.requests[reqid] = [{"sha256": sha256} for sha256 in self.matches.get(rule, [])]
+                self.checks[reqid] = 0
+            return 200, {}, falcon_body(meta={"reqid": reqid, "status": "inprogress"})
+        return route
+
+    def fuzzy(self, request):
+        rule = request.json["patterns"][0]["value"]
+        return 200, {}, falcon_body(resources=[{"sha256": sha256} for sha256 in self.matches.get(rule, [])],
+                                    meta={"reqid": "fuzzy", "status": "done"}
+                                    )
+
+    def multidownload(self, request):
+        with self.lock:
+            reqid = f"download-{len(self.requests)}"
+            self.requests[reqid] = [{"sha256": sha256} for sha256 in request.json["samples"]]
+            self.checks[reqid] = 0
+        return 200, {}, falcon_body(meta={"reqid": reqid, "status": "inprogress"})
+
+    def status(self, request):
+        reqid = request.query["ids"][0]
+        with self.lock:
+            self.checks[reqid] += 1
+            checks = self.checks[reqid]
+        if reqid in self.failing:
+            return 200, {}, falcon_body(meta={"reqid": reqid, "status": "failed"},
+                                        errors=[{"code": 500, "message": "search failed"}]
+                                        )
+        if checks < self.ready_after:
+            return 200, {}, falcon_body(meta={"reqid": reqid, "status": "inprogress"})
+        return 200, {}, falcon_body(resources=self.requests[reqid], meta={"reqid": reqid, "status": "done"})
+
+    def archive(self, request):
+        reqid = request.query["ids"][0]
+        content = "".join(resource["sha256"] for resource in self.requests[reqid]).encode() * 1000
+
+        def stream():
+            for position in range(0, len(content), 65536):
+                yield content[position:position + 65536]
+
+        return 200, {"Content-Type": "application/zip"}, stream()
+
+    def quotas(self, _):
+        meta = {"query_time": 0.001, "trace_id": "mock-trace-id", "hunt_count": 0, "download_count": 0}
+        if self.hunt_limit is not None:
+            meta["hunt_limit"] = self.hunt_limit
+        if self.download_limit is not None:
+            meta["download_limit"] = self.download_limit
+        return 200, {}, falcon_body(meta=meta)
+
+    def install(self, mock):
+        mock.route("GET", QUOTAS, self.quotas)
+        mock.route("POST", HUNT, self.search("hunt"))
+        mock.route("POST", EXACT, self.search("exact"))
+        mock.route("POST", FUZZY, self.fuzzy)
+        mock.route("POST", MULTIDOWNLOAD, self.multidownload)
+        mock.route("GET", REQUESTS, self.status)
+        mock.route("GET", SAMPLES, self.archive)
+
+
+@pytest.fixture
+def mock():
+    with MockFalcon() as server:
+        yield server
+
+
+def service(mock):
+    return MalQuery(client_id="whatever", client_secret="whatever", base_url=mock.base_url)
+
+
+class TestMalQueryJobRunner:
+    def test_hundreds_of_hunts(self, mock):
+        stub = FakeMalQuery(matches={f"rule {number}": [sample(number)] for number in range(200)})
+        stub.install(mock)
+        with service(mock).runner(max_pending=25, poll_interval=0.01, max_poll_interval=0.05) as jobs:
+            assert isinstance(jobs, MalQueryJobRunner)
+            for number in range(200):
+                jobs.hunt(name=f"rule {number}", yara_rule=f"rule {number}", limit=10)
+            finished = list(jobs.as_completed())
+        assert len(finished) == 200 and all(isinstance(job, MalQueryJob) and job.succeeded for job in finished)
+        assert {job.name: job.matches for job in finished} == {f"rule {number}": [sample(number)] for number in range(200)}
+        assert all(job.polls == 2 for job in finished)
+        assert jobs.metrics["submitted"] == 200 and jobs.metrics["polls"] == 400
+        assert mock.calls(HUNT)[0].json["options"]["limit"] == 10
+        assert jobs.pending == 0
+
+    def test_pending_limit(self, mock):
+        stub = FakeMalQuery(ready_after=3)
+        stub.install(mock)
+        active = []
+
+        def status(request):
+            with stub.lock:
+                active.append(len(stub.requests) - sum(1 for checks in stub.checks.values() if checks >= 3))
+            return stub.status(request)
+
+        mock.route("GET", REQUESTS, status)
+        with service(mock).runner(max_pending=5, poll_interval=0.01) as jobs:
+            for number in range(20):
+                jobs.exact_search(patterns=[{"type": "ascii", "value": f"pattern {number}"}])
+            assert len(jobs.wait()) == 20
+        assert max(active) <= 5
+
+    def test_adaptive_backoff(self, mock):
+        FakeMalQuery(ready_after=1000).install(mock)
+        with service(mock).runner(poll_interval=0.01, max_poll_interval=0.08, job_timeout=0.5) as jobs:
+            job = jobs.hunt(yara_rule="rule slow")
+            list(jobs.as_completed())
+        # Checks 0.01, 0.02, 0.04 and then 0.08 seconds apart, until the timeout.
+        assert 5 <= job.polls <= 10
+        assert job.status == "failed" and job.errors[0]["code"] == 408
+
+    def test_hunt_quota(self, mock):
+        FakeMalQuery(hunt_limit=3).install(mock)
+        with service(mock).runner(poll_interval=0.01) as jobs:
+            hunts = [jobs.hunt(yara_rule=f"rule {number}") for number in range(5)]
+            exact = jobs.exact_search(patterns=[{"type": "ascii", "value": "pattern"}])
+            jobs.wait()
+        assert [job.succeeded for job in hunts] == [True, True, True, False, False]
+        assert hunts[4].errors[0]["code"] == 429 and exact.succeeded
+        assert len(mock.calls(HUNT)) == 3 and jobs.metrics["quota_rejections"] == 2
+        assert jobs.quotas == {"hunt": 0}
+
+    def test_samples_downloaded(self, mock, tmp_path):
+        shared = sample(0)
+        stub = FakeMalQuery(matches={"rule a": [shared] + [sample(number) for number in range(1, 6)],
+                                     "rule b": [shared, sample(6)]
+                                     })
+        stub.install(mock)
+        with service(mock).runner(destination=str(tmp_path), download_batch=4, poll_interval=0.01) as jobs:
+            first = jobs.hunt(yara_rule="rule a")
+            second = jobs.hunt(yara_rule="rule b")
+            finished = list(jobs.as_completed())
+        downloads = first.downloads + second.downloads
+        assert len(finished) == 2 + len(downloads)
+        # Samples matched by more than one search are only downloaded once.
+        requested = [sha256 for job in downloads for sha256 in job.samples]
+        assert sorted(requested) == sorted(sample(number) for number in range(7))
+        assert max(len(job.samples) for job in downloads) == 4
+        for job in downloads:
+            assert job.succeeded and os.path.exists(job.path)
+            with open(job.path, "rb") as archive:
+                content = archive.read()
+            assert len(content) == job.bytes_written and hashlib.sha256(content).hexdigest() == job.sha256
+        assert jobs.metrics["samples"] == 7 and jobs.metrics["archives"] == len(downloads)
+        assert jobs.metrics["bytes"] == sum(job.bytes_written for job in downloads)
+
+    def test_concurrent_searches_share_samples(self, mock, tmp_path):
+        shared = [sample(number) for number in range(3)]
+        FakeMalQuery(matches={f"rule {number}": shared for number in range(20)}).install(mock)
+        with service(mock).runner(destination=str(tmp_path), max_workers=20, poll_interval=0.01) as jobs:
+            for number in range(20):
+                jobs.hunt(yara_rule=f"rule {number}")
+            jobs.wait()
+        requested = [sha256 for request in mock.calls(MULTIDOWNLOAD) for sha256 in request.json["samples"]]
+        assert sorted(requested) == sorted(shared)
+
+    def test_unwritable_destination(self, mock, tmp_path):
+        FakeMalQuery(matches={"rule a": [sample(1)]}).install(mock)
+        blocked = tmp_path / "file"
+        blocked.write_bytes(b"")
+        with service(mock).runner(destination=str(blocked / "samples"), poll_interval=0.01) as jobs:
+            search = jobs.hunt(yara_rule="rule a")
+            jobs.wait()
+        assert search.succeeded and len(search.downloads) == 1
+        assert search.downloads[0].status == "failed" and search.downloads[0].errors[0]["code"] == 500
+        assert jobs.pending == 0 and jobs.metrics["failed"] == 1
+
+    def test_unexpected_exception(self, mock):
+        FakeMalQuery().install(mock)
+        malquery = service(mock)
+
+        def broken(**_):
+            raise KeyError("meta")
+
+        malquery.get_request = broken
+        with malquery.runner(poll_interval=0.01) as jobs:
+            job = jobs.hunt(yara_rule="rule a")
+            jobs.wait()
+        assert job.status == "failed" and job.errors == [{"code": 500, "message": "'meta'"}]
+        assert jobs.pending == 0
+
+    def test_download_quota(self, mock, tmp_path):
+        FakeMalQuery(download_limit=5).install(mock)
+        with service(mock).runner(destination=str(tmp_path), download_batch=4, poll_interval=0.01) as jobs:
+            batches = jobs.download([sample(number) for number in range(8)])
+            jobs.wait()
+        assert [job.succeeded for job in batches] == [True, False]
+        assert len(mock.calls(MULTIDOWNLOAD)) == 1 and jobs.quotas == {"download": 1}
+
+    def test_fuzzy_search(self, mock):
+        FakeMalQuery(matches={"needle": [sample(1), sample(2)]}).install(mock)
+        with service(mock).runner() as jobs:
+            job = jobs.fuzzy_search(patterns=[{"type": "ascii", "value": "needle"}])
+            jobs.wait()
+        assert job.succeeded and job.matches == [sample(1), sample(2)] and job.polls == 0
+        assert not mock.calls(REQUESTS)
+
+    def test_failures(self, mock):
+        FakeMalQuery(failing={"hunt-0"}).install(mock)
+        mock.route("POST", EXACT, (400, {}, falcon_body(errors=[{"code": 400, "message": "invalid pattern"}])))
+        with service(mock).runner(poll_interval=0.01) as jobs:
+            hunt = jobs.hunt(yara_rule="rule broken")
+            exact = jobs.exact_search(patterns=[{"type": "ascii", "value": "pattern"}])
+            jobs.wait()
+            with pytest.raises(ValueError):
+                jobs.submit(MalQueryJob(kind="yara"))
+        assert hunt.errors == [{"code": 500, "message": "search failed"}]
+        assert exact.errors[0]["code"] == 400
+        assert jobs.metrics["failed"] == 2 and jobs.pending == 0
+
+    def test_close_stops_scheduler(self, mock):
+        FakeMalQuery(ready_after=1000).install(mock)
+        jobs = service(mock).runner(poll_interval=0.01)
+        jobs.hunt(yara_rule="rule forever")
+        time.sleep(0.1)
+        jobs.close()
+        polls = len(mock.calls(REQUESTS))
+        time.sleep(0.1)
+        assert len(mock.calls(REQUESTS)) == polls
+        assert not [thread for thread in threading.enumerate() if thread.name.startswith("falconpy-malquery")]
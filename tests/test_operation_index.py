@@ -0,0 +1,79 @@
+"""
+test_operation_index.py -  This class tests the operation index used for dispatch
+"""
+import os
+import sys
+import pytest
+from tests.mock_falcon import MockFalcon, falcon_body
+
+# Import our sibling src folder into the path
+sys.path.append(os.path.abspath('src'))
+# Classes to test - manually imported from sibling folder
+from falconpy import APIHarnessV2, APIHarness, Hosts, InvalidOperation
+from falconpy._endpoint import api_endpoints, api_operations, operation_index, find_operation
+from falconpy._endpoint._hosts import _hosts_endpoints
+from falconpy._util import args_to_params
+
+
+@pytest.fixture
+def mock():
+    with MockFalcon() as server:
+        server.route("GET", "/devices/entities/devices/v2", lambda req: (200, {}, falcon_body(resources=req.query["ids"])))
+        server.route("GET", "/devices/queries/devices/v1", falcon_body())
+        server.route("POST", "/sensors/entities/datafeed-actions/v1/0", falcon_body())
+        yield server
+
+
+class TestOperationIndex:
+    def test_index_covers_every_operation(self):
+        assert set(api_operations) == {ep[0] for ep in api_endpoints}
+        assert operation_index(api_endpoints) is api_operations
+
+    def test_first_definition_wins(self):
+        for operation_id, operation in api_operations.items():
+            first = [ep for ep in api_endpoints if ep[0] == operation_id][0]
+            assert (operation.method, operation.path) == (first[1], first[2])
+
+    def test_operation_record(self):
+        operation = find_operation(api_endpoints, "refreshActiveStreamSession")
+        assert operation.method == "POST"
+        assert operation.path_variables == ("partition",)
+        assert operation.params["appId"]["type"] == "string"
+        # Body payload parameters are not indexed
+        assert "body" not in find_operation(_hosts_endpoints, "QueryDeviceLoginHistory").params
+        assert find_operation(_hosts_endpoints, "NotAnOperation") is None
+
+    def test_documented_batch_size(self):
+        assert api_operations["getVulnerabilities"].batch_size == 400
+        assert api_operations["PostDeviceDetailsV2"].batch_size == 5000
+        assert api_operations["get_applications"].batch_size == 100
+        assert api_operations["BatchInitSessions"].batch_size == 10000
+        # Limits documented for anything other than IDs are ignored.
+        assert api_operations["CreateIOC"].batch_size is None
+        assert api_operations["createUserGroups"].batch_size is None
+
+    def test_index_is_rebuilt_when_list_grows(self):
+        endpoints = [list(ep) for ep in _hosts_endpoints]
+        assert "Custom" not in operation_index(endpoints)
+        endpoints.append(["Custom", "GET", "/custom/v1", "", "custom", []])
+        assert operation_index(endpoints)["Custom"].path == "/custom/v1"
+
+    def test_args_to_params(self):
+        params = args_to_params({}, {"ids": "1,2", "body": {}, "bogus": 1}, _hosts_endpoints, "GetDeviceDetailsV2")
+        assert params == {"ids": ["1", "2"]}
+
+    def test_uber_dispatch(self, mock):
+        uber = APIHarnessV2(client_id="whatever", client_secret="whatever", base_url=mock.base_url)
+        assert uber.command("GetDeviceDetailsV2", ids="a,b")["body"]["resources"] == ["a", "b"]
+        assert uber.command("refreshActiveStreamSession", partition=0, action_name="x", appId="y")["status_code"] == 200
+        assert uber.command(override="GET,/devices/entities/devices/v2", parameters={"ids": "c"})["status_code"] == 200
+        assert uber.command("NotAnOperation")["status_code"] == InvalidOperation().code
+
+    def test_legacy_uber_dispatch(self, mock):
+        uber = APIHarness(client_id="whatever", client_secret="whatever", base_url=mock.base_url)
+        assert uber.command("GetDeviceDetailsV2", ids="a")["body"]["resources"] == ["a"]
+
+    def test_service_class_dispatch(self, mock):
+        hosts = Hosts(client_id="whatever", client_secret="whatever", base_url=mock.base_url)
+        assert hosts.query_devices_by_filter(limit=5, filter="hostname:'x'", bogus=1)["status_code"] == 200
+        assert mock.calls("/devices/queries/devices/v1")[0].query == {"limit": ["5"], "filter": ["hostname:'x'"]}
@@ -0,0 +1,130 @@
+"""
+test_paginator.py -  This class tests the pagination iterators
+"""
+import os
+import sys
+import threading
+import time
+import pytest
+from tests.mock_falcon import MockFalcon, falcon_body
+
+# Import our sibling src folder into the path
+sys.path.append(os.path.abspath('src'))
+# Classes to test - manually imported from sibling folder
+from falconpy import Hosts, Alerts, SpotlightVulnerabilities, APIHarnessV2, Paginator
+from falconpy._error import APIError, InvalidOperation
+
+RECORDS = [f"id{num}" for num in range(23)]
+
+
+def page_meta(total, **pagination):
+    return {"query_time": 0.001, "trace_id": "mock-trace-id", "pagination": {"total": total, **pagination}}
+
+
+def offset_route(request):
+    offset = int(request.query.get("offset", ["0"])[0])
+    limit = int(request.query.get("limit", ["10"])[0])
+    return 200, {}, falcon_body(resources=RECORDS[offset:offset + limit],
+                                meta=page_meta(len(RECORDS), offset=offset, limit=limit)
+                                )
+
+
+def scroll_route(request):
+    position = int(request.query.get("offset", ["token-0"])[0].split("-")[1])
+    limit = int(request.query.get("limit", ["10"])[0])
+    # Scroll tokens are returned even after the last page.
+    return 200, {}, falcon_body(resources=RECORDS[position:position + limit],
+                                meta=page_meta(len(RECORDS), offset=f"token-{position + limit}")
+                                )
+
+
+def after_route(request):
+    position = int(request.query.get("after", ["0"])[0])
+    limit = int(request.query.get("limit", ["10"])[0])
+    after = str(position + limit) if position + limit < len(RECORDS) else ""
+    return 200, {}, falcon_body(resources=[{"id": rec} for rec in RECORDS[position:position + limit]],
+                                meta=page_meta(len(RECORDS), after=after)
+                                )
+
+
+@pytest.fixture
+def mock():
+    with MockFalcon() as server:
+        server.route("GET", "/alerts/queries/alerts/v2", offset_route)
+        server.route("GET", "/devices/queries/devices-scroll/v1", scroll_route)
+        server.route("GET", "/spotlight/combined/vulnerabilities/v1", after_route)
+        yield server
+
+
+class TestPaginator:
+    def test_offset(self, mock):
+        alerts = Alerts(client_id="whatever", client_secret="whatever", base_url=mock.base_url)
+        paginator = alerts.paginate(alerts.query_alerts_v2, limit=10)
+        assert paginator.style == "offset"
+        assert list(paginator) == RECORDS
+        assert paginator.page_count == 3 and paginator.total == 23
+        assert len(mock.calls("/alerts/queries/alerts/v2")) == 3
+
+    def test_scroll(self, mock):
+        hosts = Hosts(client_id="whatever", client_secret="whatever", base_url=mock.base_url)
+        paginator = hosts.paginate("QueryDevicesByFilterScroll", limit=10)
+        assert paginator.style == "scroll"
+        assert [len(page) for page in paginator.pages()] == [10, 10, 3]
+        offsets = [req.query.get("offset") for req in mock.calls("/devices/queries/devices-scroll/v1")]
+        assert offsets == [None, ["token-10"], ["token-20"]]
+
+    def test_after(self, mock):
+        spotlight = SpotlightVulnerabilities(client_id="whatever", client_secret="whatever", base_url=mock.base_url)
+        items = list(spotlight.paginate("query_vulnerabilities_combined", filter="status:'open'", limit=10))
+        assert [item["id"] for item in items] == RECORDS
+        assert all(req.query["filter"] == ["status:'open'"]
+                   for req in mock.calls("/spotlight/combined/vulnerabilities/v1")
+                   )
+
+    def test_uber_class(self, mock):
+        uber = APIHarnessV2(client_id="whatever", client_secret="whatever", base_url=mock.base_url)
+        assert list(uber.paginate("GetQueriesAlertsV2", parameters={"limit": 5})) == RECORDS
+        assert list(uber.paginate("QueryDevicesByFilterScroll", prefetch=True)) == RECORDS
+        with pytest.raises(InvalidOperation):
+            uber.paginate("NotARealOperation")
+
+    def test_prefetch(self, mock):
+        released = threading.Event()
+
+        def gated(request):
+            if request.query.get("offset", ["0"])[0] != "0":
+                released.wait(5)
+            return offset_route(request)
+
+        mock.route("GET", "/alerts/queries/alerts/v2", gated)
+        alerts = Alerts(client_id="whatever", client_secret="whatever", base_url=mock.base_url)
+        pages = alerts.paginate("query_alerts_v2", prefetch=True, limit=10).pages()
+        assert next(pages) == RECORDS[:10]
+        # The second page is requested before the caller asks for it.
+        deadline = time.time() + 5
+        while len(mock.calls("/alerts/queries/alerts/v2")) < 2 and time.time() < deadline:
+            time.sleep(0.01)
+        assert len(mock.calls("/alerts/queries/alerts/v2")) == 2
+        released.set()
+        assert [len(page) for page in pages] == [10, 3]
+
+    def test_stop_early(self, mock):
+        alerts = Alerts(client_id="whatever", client_secret="whatever", base_url=mock.base_url)
+        for item in alerts.paginate(alerts.query_alerts_v2, limit=10):
+            if item == "id3":
+                break
+        assert len(mock.calls("/alerts/queries/alerts/v2")) == 1
+
+    def test_error(self, mock):
+        mock.route("GET", "/alerts/queries/alerts/v2",
+                   (403, {}, falcon_body(errors=[{"code": 403, "message": "access denied"}]))
+                   )
+        alerts = Alerts(client_id="whatever", client_secret="whatever", base_url=mock.base_url)
+        with pytest.raises(APIError) as failure:
+            list(alerts.paginate(alerts.query_alerts_v2))
+        assert failure.value.code == 403 and failure.value.message == "access denied"
+
+    def test_pythonic(self, mock):
+        alerts = Alerts(client_id="whatever", client_secret="whatever", base_url=mock.base_url, pythonic=True)
+        assert isinstance(alerts.paginate(alerts.query_alerts_v2), Paginator)
+        assert list(alerts.paginate(alerts.query_alerts_v2, limit=10)) == RECORDS
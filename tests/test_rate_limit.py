@@ -0,0 +1,107 @@
+"""
+test_rate_limit.py -  This class tests the client side rate limiter
+"""
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from tests.mock_falcon import MockFalcon, falcon_body
+
+# Import our sibling src folder into the path
+sys.path.append(os.path.abspath('src'))
+# Classes to test - manually imported from sibling folder
+from falconpy import Hosts, OAuth2, APIHarnessV2, RateLimiter
+
+
+class LimitedRoute:
+    """Route enforcing a fixed window rate limit and returning CrowdStrike rate limit headers."""
+
+    def __init__(self, limit, window):
+        self.limit = limit
+        self.window = window
+        self.started = time.time()
+        self.used = 0
+        self.rejected = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, request):
+        with self.lock:
+            now = time.time()
+            if now - self.started >= self.window:
+                self.started = now
+                self.used = 0
+            reset = self.started + self.window
+            if self.used >= self.limit:
+                self.rejected += 1
+                return 429, {"X-RateLimit-Limit": str(self.limit),
+                             "X-RateLimit-Remaining": "0",
+                             "X-RateLimit-RetryAfter": str(reset)
+                             }, falcon_body(errors=[{"code": 429, "message": "API rate limit exceeded."}])
+            self.used += 1
+            remaining = self.limit - self.used
+        return 200, {"X-RateLimit-Limit": str(self.limit),
+                     "X-RateLimit-Remaining": str(remaining)
+                     }, falcon_body(resources=["abc"])
+
+
+@pytest.fixture
+def mock():
+    with MockFalcon() as server:
+        yield server
+
+
+class TestRateLimit:
+    def test_requests_are_paced(self, mock):
+        route = LimitedRoute(limit=10, window=0.5)
+        mock.route("GET", "/devices/queries/devices/v1", route)
+        limiter = RateLimiter(period=0.5)
+        hosts = Hosts(client_id="whatever", client_secret="whatever", base_url=mock.base_url, rate_limit=limiter)
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda _: hosts.query_devices_by_filter()["status_code"], range(40)))
+        assert results == [200] * 40
+        assert limiter.limit == 10
+        metrics = limiter.metrics
+        assert metrics["requests"] >= 40
+        assert metrics["delayed"] > 0 and metrics["wait_time"] > 0
+        assert metrics["max_wait"] <= metrics["wait_time"]
+
+    def test_throttled_request_is_requeued(self, mock):
+        route = LimitedRoute(limit=1, window=0.3)
+        route.used = 1
+        mock.route("GET", "/devices/queries/devices/v1", route)
+        uber = APIHarnessV2(client_id="whatever", client_secret="whatever", base_url=mock.base_url,
+                            rate_limit=RateLimiter()
+                            )
+        start = time.time()
+        assert uber.command("QueryDevicesByFilter")["status_code"] == 200
+        assert time.time() - start >= 0.2
+        assert uber.rate_limiter.metrics["throttled"] == 1
+        assert uber.rate_limiter.metrics["requeued"] == 1
+
+    def test_requeue_limit(self, mock):
+        mock.route("GET", "/devices/queries/devices/v1",
+                   (429, {"Retry-After": "0"}, falcon_body(errors=[{"code": 429, "message": "API rate limit exceeded."}]))
+                   )
+        hosts = Hosts(client_id="whatever", client_secret="whatever", base_url=mock.base_url,
+                      rate_limit=RateLimiter(requeue_limit=2)
+                      )
+        assert hosts.query_devices_by_filter()["status_code"] == 429
+        assert len(mock.calls("/devices/queries/devices/v1")) == 3
+
+    def test_shared_per_client(self, mock):
+        first = OAuth2(client_id="shared", client_secret="whatever", base_url=mock.base_url, rate_limit=True)
+        second = Hosts(client_id="shared", client_secret="whatever", base_url=mock.base_url, rate_limit=True)
+        child = Hosts(client_id="shared", client_secret="whatever", member_cid="child",
+                      base_url=mock.base_url, rate_limit=True
+                      )
+        assert first.rate_limiter is second.rate_limiter
+        assert child.rate_limiter is not first.rate_limiter
+        assert Hosts(auth_object=first).rate_limiter is first.rate_limiter
+
+    def test_disabled_by_default(self, mock):
+        mock.route("GET", "/devices/queries/devices/v1", falcon_body(resources=["abc"]))
+        hosts = Hosts(client_id="whatever", client_secret="whatever", base_url=mock.base_url)
+        assert hosts.rate_limiter is None
+        assert hosts.query_devices_by_filter()["status_code"] == 200
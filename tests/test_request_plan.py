@@ -0,0 +1,82 @@
+"""
+test_request_plan.py -  This class tests the precompiled request plans used for Service Class dispatch
+"""
+import os
+import sys
+import pytest
+
+# Import our sibling src folder into the path
+sys.path.append(os.path.abspath('src'))
+# Classes to test - manually imported from sibling folder
+from falconpy import Hosts, EventStreams, FalconContainer, APIHarnessV2, UnnecessaryEncodingUsed
+from falconpy._endpoint._hosts import _hosts_endpoints
+from falconpy._endpoint._event_streams import _event_streams_endpoints
+from falconpy._endpoint._falcon_container import _falcon_container_endpoints
+from falconpy._util import capture_requests, request_plan, find_plan, process_service_request, force_default
+
+
+def captured(call):
+    with capture_requests() as requests:
+        call()
+    return requests[0]
+
+
+class TestRequestPlan:
+    def test_compiled_once(self):
+        plan = request_plan(_hosts_endpoints, "QueryDevicesByFilter")
+        assert plan is request_plan(_hosts_endpoints, "QueryDevicesByFilter")
+        assert (plan.method, plan.path) == ("GET", "/devices/queries/devices/v1")
+        assert not plan.templated and not plan.container
+        assert "filter" in plan.params and "limit" in plan.params
+        assert "ids" in request_plan(_hosts_endpoints, "GetDeviceDetailsV2").arrays
+
+    def test_unknown_operation(self):
+        assert find_plan(_hosts_endpoints, "NotARealOperation") is None
+        with pytest.raises(KeyError):
+            request_plan(_hosts_endpoints, "NotARealOperation")
+        hosts = Hosts(access_token="whatever")
+        with pytest.raises(KeyError):
+            process_service_request(hosts, _hosts_endpoints, "NotARealOperation")
+
+    def test_bound_request(self):
+        hosts = Hosts(access_token="whatever", base_url="https://api.crowdstrike.com")
+        request = captured(lambda: hosts.get_device_details_v1(ids="abc,def", unknown="skipped"))
+        assert request.api.method == "GET"
+        assert request.api.endpoint == "https://api.crowdstrike.com/devices/entities/devices/v1"
+        assert request.api.param_payload == {"ids": ["abc", "def"]}
+        assert request.api.operation == "GetDeviceDetailsV1"
+
+    def test_path_variables(self):
+        streams = EventStreams(access_token="whatever")
+        request = captured(lambda: streams.refresh_active_stream(partition=3, app_id="app"))
+        assert request.api.endpoint.endswith("/sensors/entities/datafeed-actions/v1/3")
+        assert request_plan(_event_streams_endpoints, "refreshActiveStreamSession").templated
+
+    def test_container_host(self):
+        assert request_plan(_falcon_container_endpoints, "GetImageAssessmentReport").container
+        container = FalconContainer(access_token="whatever", base_url="us2")
+        request = captured(lambda: container.get_assessment(repository="repo", tag="latest"))
+        assert request.api.endpoint.startswith("https://container-upload.us-2.crowdstrike.com/")
+        assert request.api.container
+        uber = APIHarnessV2(access_token="whatever", base_url="eu1")
+        request = captured(lambda: uber.command("GetImageAssessmentReport", repository="repo", tag="latest"))
+        assert request.api.endpoint.startswith("https://container-upload.eu-1.crowdstrike.com/")
+
+    def test_encoding_warning(self):
+        hosts = Hosts(access_token="whatever", pythonic=True)
+        with pytest.warns(UnnecessaryEncodingUsed):
+            captured(lambda: hosts.query_devices_by_filter(filter="hostname%3A%27falconpy%27"))
+
+    def test_pythonic_per_request(self):
+        hosts = Hosts(access_token="whatever")
+        assert captured(lambda: hosts.query_devices_by_filter(pythonic=True)).pythonic
+        assert not captured(hosts.query_devices_by_filter).pythonic
+
+    def test_defaults_are_not_shared(self):
+        @force_default(defaults=["parameters", "body"], default_types=["dict", "list"])
+        def defaulted(parameters=None, body=None):
+            return parameters, body
+
+        first, second = defaulted(), defaulted(body=None)
+        assert first == ({}, []) and second == ({}, [])
+        assert first[0] is not second[0] and first[1] is not second[1]
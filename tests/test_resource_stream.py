@@ -0,0 +1,132 @@
+"""
+test_resource_stream.py -  This class tests incremental parsing of response resources
+"""
+import json
+import os
+import sys
+import tracemalloc
+import pytest
+from tests.mock_falcon import MockFalcon, falcon_body
+
+# Import our sibling src folder into the path
+sys.path.append(os.path.abspath('src'))
+# Classes to test - manually imported from sibling folder
+from falconpy import Discover, ContainerImages, APIHarnessV2, ResourceStream
+from falconpy._error import APIError
+
+JSON = {"Content-Type": "application/json"}
+
+
+def record(num):
+    return {"id": f"asset{num}", "hostname": f"host-{num}", "tags": ["a", "b]", "c}\"d"], "score": num * 1.5,
+            "details": {"nested": [[num], {"x": None}], "text": "café ☃" * 8}
+            }
+
+
+def chunked_body(count, chunk_size=4096):
+    """Serialize a standard response body in chunks without building it in memory."""
+    def generate():
+        yield b'{"meta": {"query_time": 0.01, "pagination": {"total": %d}}, "resources": [' % count
+        pending = b""
+        for num in range(count):
+            pending += (b"," if num else b"") + json.dumps(record(num)).encode("utf-8")
+            if len(pending) >= chunk_size:
+                yield pending
+                pending = b""
+        yield pending + b'], "errors": []}'
+    return generate()
+
+
+class FakeResponse:
+    """Response serving content in fixed size chunks."""
+
+    def __init__(self, content, chunk_size):
+        self.status_code = 200
+        self.headers = JSON
+        self.content = content
+        self.chunk_size = chunk_size
+        self.closed = False
+
+    def iter_content(self, chunk_size=None):
+        for pos in range(0, len(self.content), self.chunk_size):
+            yield self.content[pos:pos + self.chunk_size]
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def mock():
+    with MockFalcon() as server:
+        server.route("GET", "/discover/combined/hosts/v1", lambda request: (200, dict(JSON), chunked_body(500)))
+        yield server
+
+
+class TestResourceStream:
+    def test_service_class(self, mock):
+        discover = Discover(client_id="whatever", client_secret="whatever", base_url=mock.base_url)
+        stream = discover.query_combined_hosts(filter="entity_type:'managed'", stream_resources=True)
+        assert isinstance(stream, ResourceStream) and stream.status_code == 200
+        records = list(stream)
+        assert records == [record(num) for num in range(500)]
+        assert stream.count == 500 and stream.meta["pagination"]["total"] == 500 and stream.errors == []
+        assert mock.calls("/discover/combined/hosts/v1")[0].query["filter"] == ["entity_type:'managed'"]
+
+    def test_bounded_memory(self, mock):
+        mock.route("GET", "/discover/combined/hosts/v1", lambda request: (200, dict(JSON), chunked_body(20000)))
+        discover = Discover(client_id="whatever", client_secret="whatever", base_url=mock.base_url, pythonic=True)
+        tracemalloc.start()
+        try:
+            with discover.query_combined_hosts(stream_resources=True) as stream:
+                count = sum(1 for _ in stream)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        # The full response is roughly 8 MiB.
+        assert count == 20000
+        assert peak < 2 * 1024 * 1024
+
+    def test_chunk_boundaries(self):
+        body = {"meta": {"trace_id": "abc"}, "resources": [record(num) for num in range(20)] + [12345, "x", None],
+                "errors": None, "batch_id": ""
+                }
+        content = json.dumps(body, indent=2).encode("utf-8")
+        for chunk_size in (1, 2, 7, 1024):
+            response = FakeResponse(content, chunk_size)
+            stream = ResourceStream(response)
+            assert list(stream) == body["resources"]
+            assert stream.meta == {"trace_id": "abc"} and stream.errors == []
+            assert stream.body == {"meta": {"trace_id": "abc"}, "errors": None, "batch_id": ""}
+            assert response.closed
+
+    def test_unusual_bodies(self):
+        for body in ({}, {"resources": []}, {"resources": None, "meta": {}}, {"resources": {"a": 1}}):
+            stream = ResourceStream(FakeResponse(json.dumps(body).encode("utf-8"), 3))
+            assert list(stream) == []
+            assert stream.body == {key: value for key, value in body.items() if value != []}
+        for content in (b'{"resources": [1, 2', b'{"resources": [1 2]}', b"[1, 2]", b'{1: 2}'):
+            with pytest.raises(json.JSONDecodeError):
+                list(ResourceStream(FakeResponse(content, 4)))
+
+    def test_close_early(self):
+        response = FakeResponse(json.dumps({"resources": list(range(100))}).encode("utf-8"), 8)
+        with ResourceStream(response) as stream:
+            assert next(stream) == 0 and next(stream) == 1
+        assert response.closed and stream.count == 2
+
+    def test_errors_not_streamed(self, mock):
+        mock.route("GET", "/container-security/combined/image-assessment/images/v1",
+                   (403, {}, falcon_body(errors=[{"code": 403, "message": "access denied"}]))
+                   )
+        images = ContainerImages(client_id="whatever", client_secret="whatever", base_url=mock.base_url)
+        result = images.get_combined_images(stream_resources=True)
+        assert result["status_code"] == 403 and result["body"]["errors"][0]["message"] == "access denied"
+        images = ContainerImages(client_id="whatever", client_secret="whatever", base_url=mock.base_url, pythonic=True)
+        with pytest.raises(APIError):
+            images.get_combined_images(stream_resources=True)
+
+    def test_uber_class(self, mock):
+        uber = APIHarnessV2(client_id="whatever", client_secret="whatever", base_url=mock.base_url)
+        with uber.command("combined_hosts", stream_resources=True) as stream:
+            assert [item["id"] for item in stream][-1] == "asset499"
+        assert isinstance(uber.command("combined_hosts"), dict)
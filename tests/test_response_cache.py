@@ -0,0 +1,141 @@
+"""
+test_response_cache.py -  This class tests the response cache
+"""
+import os
+import sys
+import time
+import pytest
+from tests.mock_falcon import MockFalcon, falcon_body
+
+# Import our sibling src folder into the path
+sys.path.append(os.path.abspath('src'))
+# Classes to test - manually imported from sibling folder
+from falconpy import FirewallManagement, HostGroup, Hosts, OAuth2, APIHarnessV2, ResponseCache
+
+FIELDS = "/fwmgr/entities/firewall-fields/v1"
+GROUPS = "/devices/entities/host-groups/v1"
+
+
+class ETagRoute:
+    """Route returning an ETag and honoring If-None-Match."""
+
+    def __init__(self):
+        self.version = 1
+
+    def __call__(self, request):
+        etag = f'"v{self.version}"'
+        if request.headers.get("If-None-Match") == etag:
+            return 304, {"ETag": etag}, b""
+        ids = request.query.get("ids", [])
+        return 200, {"ETag": etag}, falcon_body(resources=[{"id": item, "version": self.version} for item in ids])
+
+
+@pytest.fixture
+def mock():
+    with MockFalcon() as server:
+        server.route("GET", FIELDS, lambda request: falcon_body(resources=request.query.get("ids", [])))
+        server.groups = ETagRoute()
+        server.route("GET", GROUPS, server.groups)
+        server.route("GET", "/devices/queries/devices/v1", falcon_body(resources=["abc"]))
+        yield server
+
+
+class TestResponseCache:
+    def test_shared_by_auth_object(self, mock):
+        auth = OAuth2(client_id="whatever", client_secret="whatever", base_url=mock.base_url, cache=True)
+        firewall = FirewallManagement(auth_object=auth)
+        assert firewall.get_firewall_fields(ids=["a", "b"])["body"]["resources"] == ["a", "b"]
+        other = FirewallManagement(auth_object=auth)
+        assert other.cache is firewall.cache is auth.cache
+        assert other.get_firewall_fields(parameters={"ids": ["a", "b"]})["body"]["resources"] == ["a", "b"]
+        assert other.get_firewall_fields(ids="c")["body"]["resources"] == ["c"]
+        assert len(mock.calls(FIELDS)) == 2
+        assert auth.cache.metrics == {"hits": 1, "misses": 2, "revalidated": 0, "evicted": 0, "entries": 2}
+
+    def test_shared_by_credentials(self, mock):
+        mock.route("GET", FIELDS, lambda request: falcon_body(resources=[request.headers["Authorization"]]))
+        cache = ResponseCache()
+        first = FirewallManagement(client_id="tenant one", client_secret="whatever", base_url=mock.base_url, cache=cache)
+        second = FirewallManagement(client_id="tenant two", client_secret="whatever", base_url=mock.base_url,
+                                    member_cid="child", cache=cache
+                                    )
+        assert first.cache is second.cache
+        for _ in range(2):
+            assert first.get_firewall_fields(ids="a")["body"]["resources"] == [first.headers["Authorization"]]
+            assert second.get_firewall_fields(ids="a")["body"]["resources"] == [second.headers["Authorization"]]
+        assert first.headers["Authorization"] != second.headers["Authorization"]
+        assert len(mock.calls(FIELDS)) == 2
+        assert cache.metrics["hits"] == 2 and cache.metrics["entries"] == 2
+
+    def test_token_refresh(self, mock):
+        groups = HostGroup(client_id="whatever", client_secret="whatever", base_url=mock.base_url, cache=True)
+        groups.get_host_groups(ids="g1")
+        token = groups.headers["Authorization"]
+        groups.login()
+        assert groups.headers["Authorization"] != token
+        # Cached responses are keyed on the credentials, not the token they were requested with.
+        assert groups.get_host_groups(ids="g1")["body"]["resources"][0]["version"] == 1
+        assert len(mock.calls(GROUPS)) == 1
+        assert groups.cache.metrics["hits"] == 1 and groups.cache.metrics["entries"] == 1
+
+    def test_results_are_independent(self, mock):
+        firewall = FirewallManagement(client_id="whatever", client_secret="whatever", base_url=mock.base_url,
+                                      cache=True, pythonic=True
+                                      )
+        first = firewall.get_firewall_fields(ids="a")
+        first.data.append("modified")
+        assert firewall.get_firewall_fields(ids="a").data == ["a"]
+        assert len(mock.calls(FIELDS)) == 1
+
+    def test_ttl_and_revalidation(self, mock):
+        cache = ResponseCache(operations={"getHostGroups": 0.2})
+        groups = HostGroup(client_id="whatever", client_secret="whatever", base_url=mock.base_url, cache=cache)
+        assert groups.get_host_groups(ids="g1")["body"]["resources"][0]["version"] == 1
+        time.sleep(0.25)
+        # Stale, revalidated with the server without transferring the response again.
+        result = groups.get_host_groups(ids="g1")
+        assert result["status_code"] == 200 and result["body"]["resources"][0]["version"] == 1
+        assert mock.calls(GROUPS)[-1].headers["If-None-Match"] == '"v1"'
+        assert groups.get_host_groups(ids="g1")["status_code"] == 200
+        assert len(mock.calls(GROUPS)) == 2
+        mock.groups.version = 2
+        time.sleep(0.25)
+        assert groups.get_host_groups(ids="g1")["body"]["resources"][0]["version"] == 2
+        assert cache.metrics["revalidated"] == 1 and cache.metrics["hits"] == 1
+
+    def test_eviction(self, mock):
+        cache = ResponseCache(max_entries=2)
+        firewall = FirewallManagement(client_id="whatever", client_secret="whatever", base_url=mock.base_url, cache=cache)
+        for ids in ("a", "b", "a", "c", "a", "b"):
+            firewall.get_firewall_fields(ids=ids)
+        # "b" was the least recently used entry when "c" was added.
+        assert [call.query["ids"] for call in mock.calls(FIELDS)] == [["a"], ["b"], ["c"], ["b"]]
+        assert cache.metrics["evicted"] == 2 and cache.metrics["entries"] == 2
+        sized = ResponseCache(max_size=1)
+        sized_firewall = FirewallManagement(auth_object=OAuth2(client_id="whatever", client_secret="whatever",
+                                                               base_url=mock.base_url, cache=sized
+                                                               ))
+        sized_firewall.get_firewall_fields(ids="a")
+        assert sized.metrics["entries"] == 0 and sized.size == 0
+
+    def test_uncached_requests(self, mock):
+        mock.route("GET", FIELDS, (500, {}, falcon_body(errors=[{"code": 500, "message": "failure"}])))
+        firewall = FirewallManagement(client_id="whatever", client_secret="whatever", base_url=mock.base_url, cache=True)
+        hosts = Hosts(auth_object=firewall.auth_object)
+        for _ in range(2):
+            assert firewall.get_firewall_fields(ids="a")["status_code"] == 500
+            assert hosts.query_devices_by_filter()["status_code"] == 200
+        assert len(mock.calls(FIELDS)) == 2 and len(mock.calls("/devices/queries/devices/v1")) == 2
+        assert firewall.cache.metrics["entries"] == 0
+        assert Hosts(client_id="whatever", client_secret="whatever", base_url=mock.base_url).cache is None
+
+    def test_uber_class(self, mock):
+        uber = APIHarnessV2(client_id="whatever", client_secret="whatever", base_url=mock.base_url, cache=True)
+        for _ in range(3):
+            assert uber.command("get_firewall_fields", ids="a")["body"]["resources"] == ["a"]
+        assert len(mock.calls(FIELDS)) == 1
+        uber.cache.invalidate("get_firewall_fields")
+        assert uber.command("get_firewall_fields", ids="a")["status_code"] == 200
+        assert len(mock.calls(FIELDS)) == 2
+        uber.cache.clear()
+        assert uber.cache.metrics["entries"] == 0 and uber.cache.size == 0
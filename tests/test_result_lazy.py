@@ -0,0 +1,70 @@
+"""
+test_result_lazy.py -  This class tests lazy creation of Result components
+"""
+import os
+import sys
+import pytest
+from requests.structures import CaseInsensitiveDict
+from tests.mock_falcon import MockFalcon, falcon_body
+
+# Import our sibling src folder into the path
+sys.path.append(os.path.abspath('src'))
+# Classes to test - manually imported from sibling folder
+from falconpy import Hosts, RealTimeResponse, Result
+from falconpy._error import APIError
+
+HEADERS = CaseInsensitiveDict({"Content-Type": "application/json", "X-Cs-Region": "us-1"})
+
+
+@pytest.fixture
+def mock():
+    with MockFalcon() as server:
+        server.route("GET", "/devices/queries/devices/v1", falcon_body(resources=["abc", "def"]))
+        server.route("POST", "/real-time-response/combined/batch-init-session/v1",
+                     {"meta": {}, "batch_id": "batch1", "resources": {"device1": {"complete": True}}, "errors": []}
+                     )
+        server.route("GET", "/devices/entities/online-state/v1",
+                     (403, {}, falcon_body(errors=[{"code": 403, "message": "access denied"}]))
+                     )
+        yield server
+
+
+class TestResultLazy:
+    def test_components_created_on_access(self):
+        result = Result(200, HEADERS, {"meta": {"trace_id": "abc"}, "resources": ["abc"], "errors": []})
+        assert result.status_code == 200 and not result._components
+        assert result.data == ["abc"]
+        assert list(result._components) == ["resources"]
+        assert result.trace_id == "abc" and result.region == "us-1"
+        assert sorted(result._components) == ["headers", "meta", "resources"]
+
+    def test_full_return(self):
+        result = Result(200, HEADERS, {"meta": {}, "resources": ["abc"], "errors": []})
+        assert result.full_return == {"status_code": 200,
+                                      "headers": {"Content-Type": "application/json", "X-Cs-Region": "us-1"},
+                                      "body": {"meta": {}, "resources": ["abc"], "errors": []}
+                                      }
+        assert "headers" not in result._components
+        assert Result(200, HEADERS, b"binary").full_return == b"binary"
+        empty = Result()
+        assert not empty.data and empty.headers.data == {} and empty.raw.data == {}
+
+    def test_pythonic_response_built_once(self, mock):
+        hosts = Hosts(client_id="whatever", client_secret="whatever", base_url=mock.base_url, pythonic=True)
+        result = hosts.query_devices_by_filter()
+        assert isinstance(result, Result) and result.data == ["abc", "def"]
+        # Built from the received response rather than from a dictionary representation.
+        assert isinstance(result._headers_rcv, CaseInsensitiveDict)
+        with pytest.raises(APIError) as failure:
+            hosts.get_online_state(ids="abc")
+        assert failure.value.message == "ERROR: access denied"
+
+    def test_batch_responses(self, mock):
+        rtr = RealTimeResponse(client_id="whatever", client_secret="whatever", base_url=mock.base_url, pythonic=True)
+        result = rtr.batch_init_sessions(host_ids=["device1"])
+        assert result.batch_id == "batch1" and result.batch_get_cmd_req_id is None
+        assert result.resources.data == {"device1": {"complete": True}}
+        combined = Result(200, HEADERS, {"meta": {}, "combined": {"resources": {}},
+                                         "batch_get_cmd_req_id": "req1", "errors": []
+                                         })
+        assert combined.batch_id is None and combined.batch_get_cmd_req_id == "req1"
@@ -0,0 +1,38 @@
+"""
+test_result_views.py -  This class tests copy-free access to Result components
+"""
+import os
+import sys
+
+# Import our sibling src folder into the path
+sys.path.append(os.path.abspath('src'))
+# Classes to test - manually imported from sibling folder
+from falconpy import Result, Meta, Headers, Errors, Resources
+
+RECORDS = [f"id{num}" for num in range(5000)]
+FULL = {"status_code": 200,
+        "headers": {"Content-Type": "application/json"},
+        "body": {"meta": {"trace_id": "abc"}, "resources": RECORDS, "errors": []}
+        }
+
+
+class TestResultViews:
+    def test_data_is_not_copied(self):
+        result = Result(full=FULL)
+        assert result.data is result.resources.data is RECORDS
+        assert result.meta.data is result.meta.data
+        assert [result[pos] for pos in range(len(result))] == RECORDS
+        assert "id4999" in result and "missing" not in result
+
+    def test_copy(self):
+        result = Result(full=FULL)
+        resources = result.resources.copy()
+        resources.append("added")
+        meta = result.meta.copy()
+        meta["added"] = True
+        assert len(result) == 5000 and "added" not in result.meta.data
+        assert result.full_return["body"]["resources"] == RECORDS
+
+    def test_slots(self):
+        for component in (Meta(), Headers(), Errors(), Resources()):
+            assert not hasattr(component, "__dict__")
@@ -0,0 +1,129 @@
+"""
+test_retry.py -  This class tests the retry policy applied to transient request failures
+"""
+import io
+import os
+import socket
+import sys
+import time
+import pytest
+from tests.mock_falcon import MockFalcon, falcon_body
+
+# Import our sibling src folder into the path
+sys.path.append(os.path.abspath('src'))
+# Classes to test - manually imported from sibling folder
+from falconpy import Hosts, SampleUploads, APIHarnessV2, RetryPolicy
+
+UPLOAD = "/samples/entities/samples/v3"
+THROTTLED = (429, {"X-RateLimit-RetryAfter": "0"}, falcon_body(errors=[{"code": 429, "message": "Too many requests."}]))
+UNAVAILABLE = (503, {}, falcon_body(errors=[{"code": 503, "message": "Service unavailable."}]))
+
+
+class FlakyRoute:
+    """Route that fails a set number of times before succeeding."""
+
+    def __init__(self, failures, response=UNAVAILABLE):
+        self.failures = failures
+        self.response = response
+
+    def __call__(self, request):
+        if self.failures:
+            self.failures -= 1
+            return self.response
+        return 200, {}, falcon_body(resources=["abc"])
+
+
+def unused_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def mock():
+    with MockFalcon() as server:
+        yield server
+
+
+class TestRetry:
+    def test_transient_status_retried(self, mock):
+        mock.route("GET", "/devices/queries/devices/v1", FlakyRoute(2))
+        policy = RetryPolicy(backoff_factor=0.01)
+        hosts = Hosts(client_id="whatever", client_secret="whatever", base_url=mock.base_url, retry=policy)
+        assert hosts.query_devices_by_filter()["status_code"] == 200
+        assert len(mock.calls("/devices/queries/devices/v1")) == 3
+        assert policy.retries == {"QueryDevicesByFilter": 2}
+        # Retries reuse the pooled connection.
+        assert mock.connections == 1
+
+    def test_attempts_exhausted(self, mock):
+        mock.route("GET", "/devices/queries/devices/v1", UNAVAILABLE)
+        hosts = Hosts(client_id="whatever", client_secret="whatever", base_url=mock.base_url,
+                      retry=RetryPolicy(max_attempts=4, backoff_factor=0.01)
+                      )
+        assert hosts.query_devices_by_filter()["status_code"] == 503
+        assert len(mock.calls("/devices/queries/devices/v1")) == 4
+
+    def test_non_idempotent_method(self, mock):
+        mock.route("POST", "/devices/entities/devices/v2", FlakyRoute(1))
+        hosts = Hosts(client_id="whatever", client_secret="whatever", base_url=mock.base_url, retry=True)
+        assert hosts.get_device_details(ids="abc")["status_code"] == 503
+        assert len(mock.calls("/devices/entities/devices/v2")) == 1
+        # Throttled requests were never processed and are retried regardless of method.
+        mock.route("POST", "/devices/entities/devices/v2",
+                   FlakyRoute(1, (429, {"X-RateLimit-RetryAfter": str(time.time() + 0.3)}, falcon_body()))
+                   )
+        start = time.time()
+        assert hosts.get_device_details(ids="abc")["status_code"] == 200
+        assert time.time() - start >= 0.25
+        assert hosts.retry_policy.retries == {"PostDeviceDetailsV2": 1}
+
+    def test_uploads_rewound(self, mock):
+        mock.route("POST", UPLOAD, FlakyRoute(2, THROTTLED))
+        samples = SampleUploads(client_id="whatever", client_secret="whatever", base_url=mock.base_url,
+                                retry=RetryPolicy(backoff_factor=0.01)
+                                )
+        sample = io.BytesIO(b"header" + b"sample content")
+        sample.read(6)
+        assert samples.upload_sample(file_name="sample.bin", file_data=sample)["status_code"] == 200
+        calls = mock.calls(UPLOAD)
+        assert len(calls) == 3
+        # Every attempt sends the file from the position it was provided at.
+        assert all(b"sample content" in call.body and b"headersample" not in call.body for call in calls)
+
+    def test_unrewindable_upload(self, mock):
+        class Unseekable(io.BytesIO):
+            def seekable(self):
+                return False
+
+        mock.route("POST", UPLOAD, FlakyRoute(1, THROTTLED))
+        samples = SampleUploads(client_id="whatever", client_secret="whatever", base_url=mock.base_url,
+                                retry=RetryPolicy(backoff_factor=0.01)
+                                )
+        result = samples.upload_sample(file_name="sample.bin", file_data=Unseekable(b"sample content"))
+        assert result["status_code"] == 429 and len(mock.calls(UPLOAD)) == 1
+        assert samples.retry_policy.retries == {}
+
+    def test_connection_error(self):
+        retried = []
+        policy = RetryPolicy(backoff_factor=0.01, on_retry=lambda *args: retried.append(args))
+        uber = APIHarnessV2(access_token="whatever", base_url=f"http://127.0.0.1:{unused_port()}", retry=policy)
+        assert uber.command("QueryDevicesByFilter")["status_code"] == 500
+        assert [(operation, attempt) for operation, attempt, _, _ in retried] == [("QueryDevicesByFilter", 1),
+                                                                                  ("QueryDevicesByFilter", 2)
+                                                                                  ]
+        assert all(isinstance(cause, Exception) for _, _, _, cause in retried)
+
+    def test_backoff(self):
+        policy = RetryPolicy(backoff_factor=1, backoff_max=5, jitter=False)
+        assert [policy.delay(attempt) for attempt in range(1, 6)] == [1, 2, 4, 5, 5]
+        assert policy.delay(1, {"Retry-After": "7"}) == 7
+        assert 0 <= RetryPolicy(backoff_factor=1).delay(3) <= 4
+        assert not policy.retryable("GET", 3, status_code=503)
+        assert not policy.retryable("GET", 1, status_code=404)
+
+    def test_disabled_by_default(self, mock):
+        mock.route("GET", "/devices/queries/devices/v1", FlakyRoute(1))
+        hosts = Hosts(client_id="whatever", client_secret="whatever", base_url=mock.base_url)
+        assert hosts.retry_policy is None
+        assert hosts.query_devices_by_filter()["status_code"] == 503
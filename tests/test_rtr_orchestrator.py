@@ -0,0 +1,393 @@
+"""
+test_rtr_orchestrator.py -  This class tests the Real Time Response batch orchestrator
+"""
+import hashlib
+import os
+import sys
+import threading
+import time
+import tracemalloc
+import pytest
+from tests.mock_falcon import MockFalcon, falcon_body
+
+# Import our sibling src folder into the path
+sys.path.append(os.path.abspath('src'))
+# Classes to test - manually imported from sibling folder
+from falconpy import RealTimeResponse, RTRBatchOrchestrator, RTRHostResult, RTRFileResult
+
+INIT = "/real-time-response/combined/batch-init-session/v1"
+REFRESH = "/real-time-response/combined/batch-refresh-session/v1"
+COMMAND = "/real-time-response/combined/batch-command/v1"
+STATUS = "/real-time-response/entities/command/v1"
+RESPONDER = "/real-time-response/combined/batch-active-responder-command/v1"
+RESPONDER_STATUS = "/real-time-response/entities/active-responder-command/v1"
+ADMIN = "/real-time-response/combined/batch-admin-command/v1"
+ADMIN_STATUS = "/real-time-response/entities/admin-command/v1"
+FILES = "/real-time-response/entities/file/v2"
+CONTENTS = "/real-time-response/entities/extracted-file-contents/v1"
+
+
+class FakeRTR:
+    """Batch sessions and commands of a Real Time Response stub."""
+
+    def __init__(self, offline=(), slow=None, failing_batches=(), files=None, uploaded_after=1, delay=0.0, chunks=None):
+        self.offline = set(offline)
+        # Output of each host returned in sequences after the first.
+        self.chunks = chunks or {}
+        # Contents of the files uploaded by each host, listed after a number of checks.
+        self.files = files or {}
+        self.uploaded_after = uploaded_after
+        self.delay = delay
+        self.listed = {}
+        # Number of status checks before the command completes on slow hosts, None never completes.
+        self.slow = slow or {}
+        self.failing_batches = set(failing_batches)
+        self.batches = {}
+        self.checks = {}
+        self.lock = threading.Lock()
+
+    def init(self, request):
+        hosts = request.json["host_ids"]
+        with self.lock:
+            batch_id = f"batch-{len(self.batches)}"
+            self.batches[batch_id] = hosts
+        body = falcon_body()
+        body["batch_id"] = batch_id
+        body["resources"] = {aid: {"session_id": "", "complete": False, "errors": [{"code": 404, "message": "offline"}]}
+                             if aid in self.offline else {"session_id": f"session-{aid}", "complete": True, "errors": []}
+                             for aid in hosts
+                             }
+        return 201, {}, body
+
+    def command(self, request):
+        payload = request.json
+        if payload["batch_id"] in self.failing_batches:
+            return 500, {}, falcon_body(errors=[{"code": 500, "message": "batch failed"}])
+        body = falcon_body()
+        body["combined"] = {"resources": {
+            aid: {"session_id": f"session-{aid}", "task_id": f"task-{aid}", "base_command": payload["base_command"],
+                  "complete": aid not in self.slow, "stderr": "", "errors": [],
+                  "stdout": "" if aid in self.slow else f"{aid}: {payload['command_string']}"}
+            for aid in self.batches[payload["batch_id"]] if aid not in self.offline
+            }}
+        return 201, {}, body
+
+    def status(self, request):
+        aid = request.query["cloud_request_id"][0].replace("task-", "")
+        sequence = int(request.query.get("sequence_id", ["0"])[0])
+        if sequence:
+            chunks = self.chunks.get(aid, [])
+            return 200, {}, falcon_body(resources=[{
+                "session_id": f"session-{aid}", "task_id": f"task-{aid}", "complete": True,
+                "stdout": chunks[sequence - 1] if sequence <= len(chunks) else "", "stderr": ""
+                }])
+        with self.lock:
+            self.checks[aid] = self.checks.get(aid, 0) + 1
+            complete = self.slow[aid] is not None and self.checks[aid] >= self.slow[aid]
+        return 200, {}, falcon_body(resources=[{
+            "session_id": f"session-{aid}", "task_id": f"task-{aid}", "complete": complete,
+            "stdout": f"{aid}: done" if complete else "", "stderr": ""
+            }])
+
+    def list_files(self, request):
+        aid = request.query["session_id"][0].replace("session-", "")
+        with self.lock:
+            self.listed[aid] = self.listed.get(aid, 0) + 1
+            uploaded = aid in self.files and self.listed[aid] >= self.uploaded_after
+        return 200, {}, falcon_body(resources=[{
+            "cloud_request_id": f"task-{aid}", "name": "C:\\Windows\\Temp\\evidence.log",
+            "sha256": hashlib.sha256(self.files[aid]).hexdigest(), "size": len(self.files[aid])
+            }] if uploaded else [])
+
+    def contents(self, request):
+        sha256 = request.query["sha256"][0]
+        content = next(content for content in self.files.values() if hashlib.sha256(content).hexdigest() == sha256)
+
+        def stream():
+            time.sleep(self.delay)
+            for position in range(0, len(content), 65536):
+                yield content[position:position + 65536]
+
+        return 200, {"Content-Type": "application/x-7z-compressed"}, stream()
+
+    def install(self, mock):
+        mock.route("GET", FILES, self.list_files)
+        mock.route("GET", CONTENTS, self.contents)
+        mock.route("POST", INIT, self.init)
+        mock.route("POST", REFRESH, (201, {}, falcon_body()))
+        for command, status in [(COMMAND, STATUS), (RESPONDER, RESPONDER_STATUS), (ADMIN, ADMIN_STATUS)]:
+            mock.route("POST", command, self.command)
+            mock.route("GET", status, self.status)
+
+
+def hosts(count):
+    return [f"{num:032x}" for num in range(count)]
+
+
+@pytest.fixture
+def mock():
+    with MockFalcon() as server:
+        yield server
+
+
+def service(mock):
+    return RealTimeResponse(client_id="whatever", client_secret="whatever", base_url=mock.base_url)
+
+
+class TestRTRBatchOrchestrator:
+    def test_thousands_of_hosts(self, mock):
+        FakeRTR().install(mock)
+        with service(mock).orchestrate(host_ids=hosts(2500) + hosts(10)) as rtr:
+            assert isinstance(rtr, RTRBatchOrchestrator)
+            results = list(rtr.run("ls C:/Windows"))
+            assert rtr.progress == 1.0
+            metrics = rtr.metrics
+        assert len(mock.calls(INIT)) == 3 and len(mock.calls(COMMAND)) == 3
+        assert [shard.metrics["hosts"] for shard in rtr.shards] == [1000, 1000, 500]
+        assert len({result.aid for result in results}) == len(results) == 2500
+        assert all(isinstance(result, RTRHostResult) and result.succeeded for result in results)
+        assert results[0].stdout == f"{results[0].aid}: ls C:/Windows" and results[0].base_command == "ls"
+        assert {(result.batch_id, result.shard) for result in results} == {(shard.batch_id, shard.shard)
+                                                                           for shard in rtr.shards
+                                                                           }
+        assert metrics["shards"] == 3 and metrics["completed"] == 2500 and metrics["pending"] == 0
+        assert {request.json["batch_id"] for request in mock.calls(COMMAND)} == {"batch-0", "batch-1", "batch-2"}
+
+    def test_results_streamed_as_hosts_complete(self, mock):
+        host_ids = hosts(20)
+        FakeRTR(slow={host_ids[0]: 3, host_ids[1]: 1}).install(mock)
+        with service(mock).orchestrate(host_ids=host_ids, batch_size=5, poll_interval=0.01) as rtr:
+            results = list(rtr.run("ps"))
+        assert [result.aid for result in results[-2:]] == [host_ids[1], host_ids[0]]
+        assert results[-1].succeeded and results[-1].stdout == f"{host_ids[0]}: done"
+        assert results[-1].elapsed > results[0].elapsed
+        assert rtr.shards[0].metrics["polls"] == 4 and rtr.metrics["polls"] == 4
+
+    def test_adaptive_backoff(self, mock):
+        host_ids = hosts(2)
+        FakeRTR(slow={host_ids[0]: None}).install(mock)
+        with service(mock).orchestrate(host_ids=host_ids, poll_interval=0.01, max_poll_interval=0.2) as rtr:
+            started = time.perf_counter()
+            results = {result.aid: result for result in rtr.run("ps", command_timeout=1)}
+            assert 1 <= time.perf_counter() - started < 1.5
+        # The interval doubles while nothing completes: 0.01, 0.02, 0.04, 0.08, 0.16, 0.2...
+        assert 6 <= len(mock.calls(STATUS)) <= 10
+        assert results[host_ids[1]].succeeded
+        assert not results[host_ids[0]].complete and results[host_ids[0]].errors[0]["code"] == 408
+
+    def test_chunked_output(self, mock):
+        host_ids = hosts(2)
+        FakeRTR(slow={host_ids[0]: 1}, chunks={host_ids[0]: ["part 1\n", "part 2\n"]}).install(mock)
+        with service(mock).orchestrate(host_ids=host_ids, poll_interval=0.01) as rtr:
+            results = {result.aid: result for result in rtr.run("ps")}
+        assert results[host_ids[0]].stdout == f"{host_ids[0]}: donepart 1\npart 2\n"
+        assert [request.query["sequence_id"] for request in mock.calls(STATUS)] == [["0"], ["1"], ["2"], ["3"]]
+        assert rtr.metrics["polls"] == 1
+
+    def test_status_checks_concurrent(self, mock):
+        host_ids = hosts(200)
+        stub = FakeRTR(slow={aid: 2 for aid in host_ids})
+        stub.install(mock)
+        active, peak = [0], [0]
+
+        def status(request):
+            with stub.lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.01)
+            with stub.lock:
+                active[0] -= 1
+            return stub.status(request)
+
+        mock.route("GET", STATUS, status)
+        with service(mock).orchestrate(host_ids=host_ids, poll_interval=0.01, status_workers=8) as rtr:
+            started = time.perf_counter()
+            results = list(rtr.run("ps"))
+            elapsed = time.perf_counter() - started
+        assert len(results) == 200 and all(result.succeeded for result in results)
+        # Each pending host is checked once per round, with no more than status_workers checks in progress.
+        assert len([request for request in mock.calls(STATUS) if request.query["sequence_id"] == ["0"]]) == 400
+        assert rtr.metrics["polls"] == 400
+        assert 1 < peak[0] <= 8
+        assert elapsed < 600 * 0.01
+
+    def test_session_failures(self, mock):
+        host_ids = hosts(6)
+        FakeRTR(offline=[host_ids[0]], failing_batches=["batch-1"]).install(mock)
+        with service(mock).orchestrate(host_ids=host_ids, batch_size=3) as rtr:
+            results = {result.aid: result for result in rtr.run("ps")}
+            assert rtr.shards[0].errors[host_ids[0]][0]["message"] == "offline"
+            assert rtr.shards[0].metrics["sessions"] == 2
+        assert results[host_ids[0]].errors[0]["message"] == "offline" and not results[host_ids[0]].session_id
+        assert results[host_ids[1]].succeeded and results[host_ids[2]].succeeded
+        assert all(results[aid].errors[0]["message"] == "batch failed" for aid in host_ids[3:])
+        assert rtr.metrics["failed"] == 4 and rtr.metrics["completed"] == 2
+
+    def test_init_failure(self, mock):
+        mock.route("POST", INIT, (500, {}, falcon_body(errors=[{"code": 500, "message": "unavailable"}])))
+        with service(mock).orchestrate(host_ids=hosts(3)) as rtr:
+            results = list(rtr.run("ps"))
+            assert rtr.shards[0].batch_id is None
+        assert not mock.calls(COMMAND)
+        assert [result.errors[0]["code"] for result in results] == [500, 500, 500]
+
+    def test_sessions_refreshed(self, mock):
+        FakeRTR().install(mock)
+        rtr = service(mock).orchestrate(host_ids=hosts(4), batch_size=2, refresh_interval=0.1).start()
+        time.sleep(0.35)
+        rtr.close()
+        refreshes = mock.calls(REFRESH)
+        assert len(refreshes) >= 4 and rtr.metrics["refreshes"] == len(refreshes)
+        assert {request.json["batch_id"] for request in refreshes} == {"batch-0", "batch-1"}
+        time.sleep(0.2)
+        assert len(mock.calls(REFRESH)) == len(refreshes)
+        assert not [thread for thread in threading.enumerate() if thread.name.startswith("falconpy-rtr-batch")]
+
+    def test_permission_levels(self, mock):
+        FakeRTR().install(mock)
+        with service(mock).orchestrate(host_ids=hosts(2)) as rtr:
+            assert len(list(rtr.run("kill 1234", level="active_responder"))) == 2
+            assert len(list(rtr.run("runscript -CloudFile=test", level="admin", timeout=60))) == 2
+            with pytest.raises(ValueError):
+                list(rtr.run("ps", level="superuser"))
+        assert mock.calls(RESPONDER)[0].json["base_command"] == "kill"
+        assert mock.calls(ADMIN)[0].json["command_string"] == "runscript -CloudFile=test"
+        assert mock.calls(ADMIN)[0].query["timeout"] == ["60"]
+        assert rtr.metrics["commands"] == 2
+
+
+class TestRTRFileRetrieval:
+    # The files served by FakeRTR are not archives, verification is tested using real archives below.
+    def test_files_streamed_to_disk(self, mock, tmp_path):
+        host_ids = hosts(6)
+        files = {aid: aid.encode() * 1000 for aid in host_ids[1:]}
+        FakeRTR(offline=[host_ids[0]], files=files, uploaded_after=3).install(mock)
+        with service(mock).orchestrate(host_ids=host_ids, batch_size=4, poll_interval=0.01) as rtr:
+            retrieved = rtr.retrieve("C:\\Windows\\Temp\\evidence.log", tmp_path, verify=False)
+            results = {result.aid: result for result in retrieved}
+            metrics = rtr.metrics
+        assert all(isinstance(result, RTRFileResult) for result in results.values())
+        assert not results[host_ids[0]].succeeded and results[host_ids[0]].errors[0]["message"] == "offline"
+        for aid, content in files.items():
+            result = results[aid]
+            assert result.succeeded and result.sha256 == hashlib.sha256(content).hexdigest()
+            assert result.path == str(tmp_path / aid / f"{result.sha256}.7z")
+            with open(result.path, "rb") as archive:
+                assert archive.read() == content
+            assert result.bytes_written == result.size == len(content)
+            assert result.archive_sha256 == result.sha256
+        assert mock.calls(RESPONDER)[0].json["command_string"] == "get C:\\Windows\\Temp\\evidence.log"
+        assert mock.calls(CONTENTS)[0].query["filename"] == ["evidence.log"]
+        assert metrics["files"] == 5 and metrics["download_errors"] == 1 and metrics["file_polls"] == 15
+        assert metrics["bytes"] == sum(len(content) for content in files.values())
+
+    def test_upload_timeout(self, mock, tmp_path):
+        host_ids = hosts(2)
+        FakeRTR(files={host_ids[0]: b"evidence"}).install(mock)
+        with service(mock).orchestrate(host_ids=host_ids, poll_interval=0.01, max_poll_interval=0.05) as rtr:
+            retrieved = rtr.retrieve("/tmp/evidence", tmp_path, command_timeout=0.3, verify=False)
+            results = {result.aid: result for result in retrieved}
+        assert results[host_ids[0]].succeeded
+        assert results[host_ids[1]].errors[0]["code"] == 408 and results[host_ids[1]].path is None
+
+    def test_stale_upload_ignored(self, mock, tmp_path):
+        host_ids = hosts(1)
+        stub = FakeRTR(files={host_ids[0]: b"evidence"}, uploaded_after=3)
+        stub.install(mock)
+        stale = {"cloud_request_id": "task-earlier", "name": "C:\\Windows\\Temp\\evidence.log",
+                 "sha256": hashlib.sha256(b"stale").hexdigest(), "size": 5
+                 }
+
+        def list_files(request):
+            status, headers, body = stub.list_files(request)
+            body["resources"].append(stale)
+            return status, headers, body
+
+        mock.route("GET", FILES, list_files)
+        with service(mock).orchestrate(host_ids=host_ids, poll_interval=0.01) as rtr:
+            results = list(rtr.retrieve("C:\\Windows\\Temp\\evidence.log", tmp_path, verify=False))
+        assert results[0].succeeded and results[0].sha256 == hashlib.sha256(b"evidence").hexdigest()
+        assert rtr.metrics["file_polls"] == 3
+
+    def test_concurrent_downloads(self, mock, tmp_path):
+        host_ids = hosts(8)
+        FakeRTR(files={aid: aid.encode() for aid in host_ids}, delay=0.25).install(mock)
+        elapsed = {}
+        for workers in [1, 8]:
+            with service(mock).orchestrate(host_ids=host_ids, poll_interval=0.01) as rtr:
+                started = time.perf_counter()
+                retrieved = rtr.retrieve("/tmp/evidence", tmp_path, max_workers=workers, verify=False)
+                assert all(result.succeeded for result in retrieved)
+                elapsed[workers] = time.perf_counter() - started
+        assert elapsed[1] >= 2 and elapsed[8] < 1
+
+    def test_constant_memory(self, mock, tmp_path):
+        host_ids = hosts(2)
+        files = {aid: os.urandom(8 * 1048576) for aid in host_ids}
+        FakeRTR(files=files).install(mock)
+        with service(mock).orchestrate(host_ids=host_ids, poll_interval=0.01) as rtr:
+            tracemalloc.start()
+            results = list(rtr.retrieve("/tmp/evidence", tmp_path, verify=False))
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        assert all(result.bytes_written == 8 * 1048576 for result in results)
+        assert peak < 8 * 1048576
+
+    def test_unverified(self, mock, tmp_path):
+        host_ids = hosts(1)
+        FakeRTR(files={host_ids[0]: b"not an archive"}).install(mock)
+        with service(mock).orchestrate(host_ids=host_ids, poll_interval=0.01) as rtr:
+            result = next(rtr.retrieve("/tmp/evidence", tmp_path, verify=False))
+        assert result.succeeded and result.verified is None
+
+    def test_verification_unavailable(self, mock, tmp_path, monkeypatch):
+        host_ids = hosts(1)
+        FakeRTR(files={host_ids[0]: b"not an archive"}).install(mock)
+        monkeypatch.setitem(sys.modules, "py7zr", None)
+        with service(mock).orchestrate(host_ids=host_ids, poll_interval=0.01) as rtr:
+            result = next(rtr.retrieve("/tmp/evidence", tmp_path))
+            metrics = rtr.metrics
+        assert not result.succeeded and result.verified is None and result.errors[0]["code"] == 501
+        assert metrics["unverified"] == 1 and metrics["files"] == 0
+
+    def test_damaged_archive(self, mock, tmp_path):
+        pytest.importorskip("py7zr")
+        host_ids = hosts(1)
+        FakeRTR(files={host_ids[0]: b"not an archive"}).install(mock)
+        with service(mock).orchestrate(host_ids=host_ids, poll_interval=0.01) as rtr:
+            result = next(rtr.retrieve("/tmp/evidence", tmp_path))
+        assert not result.succeeded and result.verified is None and result.errors[0]["code"] == 422
+
+    def test_verified_archive(self, mock, tmp_path):
+        py7zr = pytest.importorskip("py7zr")
+        host_ids = hosts(2)
+        archives = {}
+        for aid, content in [(host_ids[0], b"evidence"), (host_ids[1], b"tampered")]:
+            source = tmp_path / f"{aid}.log"
+            source.write_bytes(content)
+            with py7zr.SevenZipFile(tmp_path / f"{aid}.7z", "w", password="infected") as archive:
+                archive.write(source, "evidence.log")
+            archives[aid] = (tmp_path / f"{aid}.7z").read_bytes()
+        rtr_stub = FakeRTR(files=archives)
+        reported = {host_ids[0]: hashlib.sha256(b"evidence").hexdigest(), host_ids[1]: hashlib.sha256(b"original").hexdigest()}
+
+        def list_files(request):
+            aid = request.query["session_id"][0].replace("session-", "")
+            return 200, {}, falcon_body(resources=[{"cloud_request_id": f"task-{aid}", "name": "/tmp/evidence",
+                                                    "sha256": reported[aid], "size": 8}])
+
+        def contents(request):
+            aid = next(aid for aid, sha256 in reported.items() if sha256 == request.query["sha256"][0])
+            return 200, {"Content-Type": "application/x-7z-compressed"}, archives[aid]
+
+        rtr_stub.install(mock)
+        mock.route("GET", FILES, list_files)
+        mock.route("GET", CONTENTS, contents)
+        with service(mock).orchestrate(host_ids=host_ids, poll_interval=0.01) as rtr:
+            results = {result.aid: result for result in rtr.retrieve("/tmp/evidence", tmp_path / "out")}
+        assert results[host_ids[0]].verified is True and results[host_ids[0]].succeeded
+        assert results[host_ids[1]].verified is False and results[host_ids[1]].errors[0]["code"] == 422
+        # The file within each archive is hashed in memory, only the archives are written.
+        written = [name for _, _, names in os.walk(tmp_path / "out") for name in names]
+        assert sorted(written) == sorted(f"{sha256}.7z" for sha256 in reported.values())
+        assert rtr.metrics["verified"] == 1 and rtr.metrics["mismatched"] == 1
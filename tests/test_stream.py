@@ -0,0 +1,101 @@
+"""
+test_stream.py -  This class tests streaming binary downloads straight to disk
+"""
+import hashlib
+import io
+import os
+import sys
+import tracemalloc
+import pytest
+from tests.mock_falcon import MockFalcon, falcon_body
+
+# Import our sibling src folder into the path
+sys.path.append(os.path.abspath('src'))
+# Classes to test - manually imported from sibling folder
+from falconpy import MalQuery, SensorDownload, APIHarnessV2, Result
+
+CHUNK = bytes(range(256)) * 256  # 64 KiB
+CONTENT = CHUNK * 16             # 1 MiB
+
+
+def ranged(request):
+    """Serve CONTENT, honoring range requests."""
+    requested = request.headers.get("Range")
+    if not requested:
+        return 200, {}, CONTENT
+    start = int(requested.split("=")[1].rstrip("-"))
+    if start >= len(CONTENT):
+        return 416, {"Content-Range": f"bytes */{len(CONTENT)}"}, b""
+    return 206, {"Content-Range": f"bytes {start}-{len(CONTENT) - 1}/{len(CONTENT)}"}, CONTENT[start:]
+
+
+@pytest.fixture
+def mock():
+    with MockFalcon() as server:
+        server.route("GET", "/malquery/entities/download-files/v1", ranged)
+        yield server
+
+
+class TestStream:
+    def test_constant_memory(self, mock, tmp_path):
+        # 64 MiB served using chunked transfer encoding.
+        mock.route("GET", "/sensors/entities/download-installer/v1", (200, {}, (CHUNK for _ in range(1024))))
+        sensors = SensorDownload(client_id="whatever", client_secret="whatever", base_url=mock.base_url)
+        sensors.get_sensor_installer_ccid()  # Authenticate before measuring
+        tracemalloc.start()
+        try:
+            result = sensors.download_sensor_installer(id="abc", file_name="sensor.rpm", download_path=str(tmp_path))
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert result["status_code"] == 200 and result["body"]["message"] == "Download successful"
+        assert os.path.getsize(tmp_path / "sensor.rpm") == 64 * 1024 * 1024
+        assert peak < 8 * 1024 * 1024
+
+    def test_hash_on_the_fly(self, mock, tmp_path):
+        malquery = MalQuery(client_id="whatever", client_secret="whatever", base_url=mock.base_url)
+        result = malquery.get_download(ids="abc", stream=True, target=tmp_path / "sample.bin", hash_algorithm="sha256")
+        download = result["body"]["resources"][0]
+        assert result["status_code"] == 200
+        assert download["bytes_written"] == download["size"] == len(CONTENT)
+        assert download["sha256"] == hashlib.sha256(CONTENT).hexdigest()
+        assert (tmp_path / "sample.bin").read_bytes() == CONTENT
+
+    def test_resume(self, mock, tmp_path):
+        target = tmp_path / "sample.bin"
+        target.write_bytes(CONTENT[:300000])
+        malquery = MalQuery(client_id="whatever", client_secret="whatever", base_url=mock.base_url)
+        result = malquery.get_download(ids="abc", stream=True, target=str(target), hash_algorithm="sha256", resume=True)
+        download = result["body"]["resources"][0]
+        assert result["status_code"] == 206
+        assert mock.calls("/malquery/entities/download-files/v1")[-1].headers["Range"] == "bytes=300000-"
+        assert download["bytes_written"] == len(CONTENT) - 300000
+        assert download["sha256"] == hashlib.sha256(CONTENT).hexdigest()
+        assert target.read_bytes() == CONTENT
+        # Resuming a complete download sends a range request that cannot be satisfied.
+        result = malquery.get_download(ids="abc", stream=True, target=str(target), hash_algorithm="sha256", resume=True)
+        assert result["status_code"] == 200
+        assert result["body"]["resources"][0]["bytes_written"] == 0
+        assert result["body"]["resources"][0]["sha256"] == hashlib.sha256(CONTENT).hexdigest()
+
+    def test_file_object(self, mock):
+        buffer = io.BytesIO()
+        uber = APIHarnessV2(client_id="whatever", client_secret="whatever", base_url=mock.base_url, pythonic=True)
+        result = uber.command("GetMalQueryDownloadV1", ids="abc", stream=True, target=buffer, chunk_size=4096)
+        assert isinstance(result, Result)
+        assert result.data[0]["path"] is None and result.data[0]["bytes_written"] == len(CONTENT)
+        assert buffer.getvalue() == CONTENT
+
+    def test_error_not_written(self, mock, tmp_path):
+        mock.route("GET", "/malquery/entities/download-files/v1",
+                   (404, {}, falcon_body(errors=[{"code": 404, "message": "file not found"}]))
+                   )
+        malquery = MalQuery(client_id="whatever", client_secret="whatever", base_url=mock.base_url)
+        result = malquery.get_download(ids="abc", stream=True, target=tmp_path / "sample.bin")
+        assert result["status_code"] == 404
+        assert result["body"]["errors"][0]["message"] == "file not found"
+        assert not (tmp_path / "sample.bin").exists()
+
+    def test_not_streamed_by_default(self, mock):
+        malquery = MalQuery(client_id="whatever", client_secret="whatever", base_url=mock.base_url)
+        assert malquery.get_download(ids="abc") == CONTENT
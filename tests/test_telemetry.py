@@ -0,0 +1,215 @@
+"""
+test_telemetry.py -  This class tests the request telemetry hooks, aggregator and exporters
+"""
+import asyncio
+import os
+import sys
+import pytest
+from tests.mock_falcon import MockFalcon, falcon_body
+
+# Import our sibling src folder into the path
+sys.path.append(os.path.abspath('src'))
+# Classes to test - manually imported from sibling folder
+from falconpy import (
+    Hosts,
+    FirewallManagement,
+    OAuth2,
+    APIHarnessV2,
+    RetryPolicy,
+    Telemetry,
+    RequestEvent,
+    MetricsAggregator,
+    PrometheusExporter,
+    OpenTelemetryExporter
+    )
+from falconpy._error import APIError
+from falconpy._telemetry import Histogram
+
+TRACED = {"X-Cs-Traceid": "abc-123"}
+
+
+class FlakyRoute:
+    """Route failing a number of times before succeeding."""
+
+    def __init__(self, failures):
+        self.failures = failures
+
+    def __call__(self, request):
+        if self.failures:
+            self.failures -= 1
+            return 503, {}, falcon_body(errors=[{"code": 503, "message": "Service unavailable."}])
+        return 200, TRACED, falcon_body(resources=["abc"])
+
+
+@pytest.fixture
+def mock():
+    with MockFalcon() as server:
+        server.route("GET", "/devices/queries/devices/v1", (200, TRACED, falcon_body(resources=["abc", "def"])))
+        server.route("GET", "/devices/entities/online-state/v1",
+                     (403, {}, falcon_body(errors=[{"code": 403, "message": "access denied"}]))
+                     )
+        yield server
+
+
+class TestTelemetry:
+    def test_hook_receives_event(self, mock):
+        events = []
+        hosts = Hosts(client_id="whatever", client_secret="whatever", base_url=mock.base_url,
+                      telemetry=events.append
+                      )
+        assert hosts.query_devices_by_filter()["status_code"] == 200
+        token, query = events
+        assert token.operation == "oauth2AccessToken" and token.status_code == 201
+        assert isinstance(query, RequestEvent)
+        assert query.operation == "QueryDevicesByFilter" and query.method == "GET"
+        assert query.status_code == 200 and query.attempts == 1 and query.trace_id == "abc-123"
+        assert query.response_bytes > 0 and token.request_bytes > 0
+        assert query.duration >= query.ttfb + query.download > 0
+        assert query.client == Telemetry.client_label("whatever") and "whatever" not in query.client
+        assert not (query.failed or query.cached or query.coalesced)
+
+    def test_aggregator(self, mock):
+        mock.route("GET", "/devices/queries/devices/v1", FlakyRoute(1))
+        hosts = Hosts(client_id="whatever", client_secret="whatever", base_url=mock.base_url,
+                      telemetry=True, retry=RetryPolicy(backoff_factor=0.01)
+                      )
+        for _ in range(3):
+            hosts.query_devices_by_filter()
+        hosts.get_online_state(ids="abc")
+        aggregator = hosts.telemetry.aggregator
+        assert isinstance(aggregator, MetricsAggregator)
+        query = aggregator.operation("QueryDevicesByFilter")
+        assert query["requests"] == 3 and query["attempts"] == 4 and query["retries"] == 1
+        assert query["statuses"] == {"200": 3} and query["latency"]["count"] == 3
+        assert query["latency"]["buckets"]["+Inf"] == 3 and query["latency"]["p50"] is not None
+        assert aggregator.operation("GetOnlineState_V1")["failures"] == 1
+        client = aggregator.metrics["clients"][hosts.telemetry.client]
+        assert client["requests"] == 5 and client["statuses"]["403"] == 1
+
+    def test_shared_hooks_per_auth_object(self, mock):
+        aggregator = MetricsAggregator()
+        telemetry = Telemetry(aggregator)
+        first = Hosts(client_id="first", client_secret="whatever", base_url=mock.base_url, telemetry=telemetry)
+        second = Hosts(auth_object=OAuth2(client_id="second", client_secret="whatever", base_url=mock.base_url,
+                                          telemetry=telemetry
+                                          ))
+        first.query_devices_by_filter()
+        second.query_devices_by_filter()
+        second.query_devices_by_filter()
+        assert first.telemetry.hooks == second.telemetry.hooks
+        clients = aggregator.metrics["clients"]
+        assert clients[Telemetry.client_label("first")]["requests"] == 2
+        assert clients[Telemetry.client_label("second")]["requests"] == 3
+        assert aggregator.operation("QueryDevicesByFilter")["requests"] == 3
+
+    def test_cached_and_coalesced(self, mock):
+        events = []
+        mock.route("GET", "/fwmgr/entities/firewall-fields/v1", falcon_body(resources=[{"id": "abc"}]))
+        hosts = Hosts(client_id="whatever", client_secret="whatever", base_url=mock.base_url,
+                      telemetry=events.append, cache=True
+                      )
+        firewall = FirewallManagement(auth_object=hosts.auth_object)
+        firewall.get_firewall_fields(ids="abc")
+        firewall.get_firewall_fields(ids="abc")
+        assert [event.cached for event in events[-2:]] == [False, True]
+        assert events[-1].attempts == 0 and events[-1].status_code == 200
+
+    def test_hook_errors_ignored(self, mock):
+        def broken(event):
+            raise RuntimeError("broken hook")
+
+        hosts = Hosts(client_id="whatever", client_secret="whatever", base_url=mock.base_url,
+                      telemetry=[broken, MetricsAggregator()]
+                      )
+        assert hosts.query_devices_by_filter()["status_code"] == 200
+        assert hosts.telemetry.metrics == {"events": 2, "hook_errors": 2}
+        assert hosts.telemetry.aggregator.operation("QueryDevicesByFilter")["requests"] == 1
+
+    def test_pythonic_error(self, mock):
+        events = []
+        hosts = Hosts(client_id="whatever", client_secret="whatever", base_url=mock.base_url,
+                      telemetry=events.append, pythonic=True
+                      )
+        with pytest.raises(APIError):
+            hosts.get_online_state(ids="abc")
+        assert events[-1].status_code == 403 and events[-1].error == "APIError" and events[-1].failed
+
+    def test_uber_class(self, mock):
+        events = []
+        uber = APIHarnessV2(client_id="whatever", client_secret="whatever", base_url=mock.base_url,
+                            telemetry=events.append
+                            )
+        uber.command("QueryDevicesByFilter")
+        assert events[-1].operation == "QueryDevicesByFilter" and events[-1].trace_id == "abc-123"
+
+    def test_async(self, mock):
+        pytest.importorskip("httpx")
+        from falconpy import AsyncServiceClass, AsyncFalconInterface
+        events = []
+
+        async def scenario():
+            auth = AsyncFalconInterface(client_id="whatever", client_secret="whatever", base_url=mock.base_url,
+                                        telemetry=events.append
+                                        )
+            async with AsyncServiceClass(Hosts, auth_object=auth) as hosts:
+                return await hosts.query_devices_by_filter()
+
+        assert asyncio.run(scenario())["status_code"] == 200
+        query = [event for event in events if event.operation == "QueryDevicesByFilter"][0]
+        assert query.attempts == 1 and query.status_code == 200 and query.trace_id == "abc-123"
+
+    def test_histogram(self):
+        histogram = Histogram((0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 2.0):
+            histogram.observe(value)
+        assert histogram.to_dict()["buckets"] == {"0.1": 2, "1.0": 3, "+Inf": 4}
+        assert histogram.quantile(0.5) == 0.1 and histogram.quantile(1) == float("inf")
+        assert Histogram().quantile(0.5) is None
+
+    def test_exporters(self, mock):
+        prometheus = PrometheusExporter()
+        otel = OpenTelemetryExporter()
+        hosts = Hosts(client_id="whatever", client_secret="whatever", base_url=mock.base_url,
+                      telemetry=[prometheus, otel]
+                      )
+        assert hosts.query_devices_by_filter()["status_code"] == 200
+        assert hosts.telemetry.metrics["hook_errors"] == 0
+
+    def test_prometheus(self, mock):
+        prometheus_client = pytest.importorskip("prometheus_client")
+        registry = prometheus_client.CollectorRegistry()
+        exporter = PrometheusExporter(registry=registry)
+        assert exporter.enabled and PrometheusExporter(registry=registry).enabled
+        hosts = Hosts(client_id="whatever", client_secret="whatever", base_url=mock.base_url, telemetry=exporter)
+        hosts.query_devices_by_filter()
+        assert registry.get_sample_value("falconpy_requests_total",
+                                         {"operation": "QueryDevicesByFilter", "method": "GET", "status": "200",
+                                          "client": hosts.telemetry.client
+                                          }) == 1
+
+    def test_opentelemetry(self, mock):
+        pytest.importorskip("opentelemetry.sdk")
+        from opentelemetry.sdk.metrics import MeterProvider
+        from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+        from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+        reader = InMemoryMetricReader()
+        spans = InMemorySpanExporter()
+        tracer_provider = TracerProvider()
+        tracer_provider.add_span_processor(SimpleSpanProcessor(spans))
+        exporter = OpenTelemetryExporter(meter_provider=MeterProvider(metric_readers=[reader]),
+                                         tracer_provider=tracer_provider
+                                         )
+        assert exporter.enabled
+        hosts = Hosts(client_id="whatever", client_secret="whatever", base_url=mock.base_url, telemetry=exporter)
+        hosts.query_devices_by_filter()
+        hosts.get_online_state(ids="abc")
+        names = [span.name for span in spans.get_finished_spans()]
+        assert names == ["oauth2AccessToken", "QueryDevicesByFilter", "GetOnlineState_V1"]
+        failed = spans.get_finished_spans()[-1]
+        assert failed.attributes["http.response.status_code"] == 403 and not failed.status.is_ok
+        metrics = reader.get_metrics_data().resource_metrics[0].scope_metrics[0].metrics
+        assert {metric.name for metric in metrics} == {"falconpy.request.duration", "falconpy.request.attempts",
+                                                        "falconpy.request.bytes"
+                                                        }
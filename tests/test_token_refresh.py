@@ -0,0 +1,77 @@
+"""
+test_token_refresh.py -  This class tests thread-safe token refresh
+"""
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from tests.mock_falcon import MockFalcon, falcon_body, TOKEN_ROUTE
+
+# Import our sibling src folder into the path
+sys.path.append(os.path.abspath('src'))
+# Classes to test - manually imported from sibling folder
+from falconpy import Hosts, OAuth2
+
+
+@pytest.fixture
+def mock():
+    with MockFalcon() as server:
+        server.route("GET", "/devices/queries/devices/v1", falcon_body(resources=["abc"]))
+        yield server
+
+
+def slow_token(mock, status=None):
+    def respond(request):
+        time.sleep(0.2)
+        if status:
+            with mock._lock:
+                mock.token_requests += 1
+            return status, {}, falcon_body(errors=[{"code": status, "message": "access denied"}])
+        return mock._token(request)
+    return respond
+
+
+def query_from_threads(hosts, count=32):
+    with ThreadPoolExecutor(max_workers=count) as pool:
+        return list(pool.map(lambda _: hosts.query_devices_by_filter()["status_code"], range(count)))
+
+
+class TestTokenRefresh:
+    def test_stale_token_refreshed_once(self, mock):
+        auth = OAuth2(client_id="whatever", client_secret="whatever", base_url=mock.base_url)
+        hosts = Hosts(auth_object=auth)
+        mock.route("POST", TOKEN_ROUTE, slow_token(mock))
+        auth.token_time = time.time() - auth.token_expiration
+        assert query_from_threads(hosts) == [200] * 32
+        assert mock.token_requests == 2
+        tokens = {req.headers["Authorization"] for req in mock.calls("/devices/queries/devices/v1")}
+        assert tokens == {"Bearer mock-token-2"}
+
+    def test_failed_refresh_is_shared(self, mock):
+        auth = OAuth2(client_id="whatever", client_secret="whatever", base_url=mock.base_url)
+        hosts = Hosts(auth_object=auth)
+        mock.route("POST", TOKEN_ROUTE, slow_token(mock, 403))
+        auth.token_time = time.time() - auth.token_expiration
+        query_from_threads(hosts)
+        assert mock.token_requests == 2
+        assert auth.token_fail_reason == "access denied"
+
+    def test_background_refresh(self):
+        with MockFalcon(token_lifetime=151) as server:
+            server.route("GET", "/devices/queries/devices/v1", falcon_body(resources=["abc"]))
+            hosts = Hosts(client_id="whatever", client_secret="whatever", base_url=server.base_url,
+                          background_refresh=True
+                          )
+            assert hosts.auth_object._token_refresher.running
+            time.sleep(1.5)
+            assert server.token_requests == 2
+            assert hosts.auth_object.token_value == "mock-token-2"
+            hosts.query_devices_by_filter()
+            assert server.token_requests == 2
+            hosts.auth_object.stop_refresher()
+            assert not hosts.auth_object._token_refresher.running
+
+    def test_background_refresh_disabled_for_token_authentication(self, mock):
+        auth = OAuth2(access_token="whatever", base_url=mock.base_url, background_refresh=True)
+        assert auth._token_refresher is None
@@ -0,0 +1,69 @@
+"""
+test_transport.py -  This class tests the pooled HTTP transport
+"""
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from tests.mock_falcon import MockFalcon, falcon_body
+
+# Import our sibling src folder into the path
+sys.path.append(os.path.abspath('src'))
+# Classes to test - manually imported from sibling folder
+from falconpy import Hosts, HostGroup, OAuth2, APIHarnessV2, Transport
+
+
+@pytest.fixture
+def mock():
+    with MockFalcon() as server:
+        server.route("GET", "/devices/queries/devices/v1", falcon_body(resources=["abc", "def"]))
+        server.route("GET", "/devices/queries/host-groups/v1", falcon_body(resources=["123"]))
+        yield server
+
+
+class TestTransport:
+    def test_connections_are_reused(self, mock):
+        hosts = Hosts(client_id="whatever", client_secret="whatever", base_url=mock.base_url)
+        for _ in range(25):
+            assert hosts.query_devices_by_filter()["status_code"] == 200
+        assert mock.connections == 1
+
+    def test_service_classes_share_auth_object_pool(self, mock):
+        auth = OAuth2(client_id="whatever", client_secret="whatever", base_url=mock.base_url)
+        hosts = Hosts(auth_object=auth)
+        groups = HostGroup(auth_object=auth)
+        assert hosts.transport is groups.transport is auth.transport
+        hosts.query_devices_by_filter()
+        groups.query_host_groups()
+        assert mock.connections == 1
+
+    def test_uber_class_uses_pool(self, mock):
+        uber = APIHarnessV2(client_id="whatever", client_secret="whatever", base_url=mock.base_url)
+        for _ in range(10):
+            assert uber.command("QueryDevicesByFilter")["body"]["resources"] == ["abc", "def"]
+        assert mock.connections == 1
+
+    def test_pool_size_bounds_connections(self, mock):
+        hosts = Hosts(client_id="whatever", client_secret="whatever", base_url=mock.base_url, pool_maxsize=4)
+        assert hosts.transport.pool_maxsize == 4
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(lambda _: hosts.query_devices_by_filter()["status_code"], range(200)))
+        assert results == [200] * 200
+        assert mock.connections <= 5  # Four pooled connections plus the token request
+
+    def test_keep_alive_disabled(self, mock):
+        hosts = Hosts(client_id="whatever", client_secret="whatever", base_url=mock.base_url, keep_alive=False)
+        hosts.query_devices_by_filter()
+        hosts.query_devices_by_filter()
+        assert mock.connections == 3
+        assert mock.calls("/devices/queries/devices/v1")[0].headers["Connection"] == "close"
+
+    def test_shared_transport_object(self, mock):
+        shared = Transport(pool_maxsize=2)
+        first = OAuth2(client_id="whatever", client_secret="whatever", base_url=mock.base_url, transport=shared)
+        second = APIHarnessV2(client_id="whatever", client_secret="whatever", base_url=mock.base_url, transport=shared)
+        assert first.transport is second.transport is shared
+        second.command("QueryDevicesByFilter")
+        Hosts(auth_object=first).query_devices_by_filter()
+        assert mock.connections == 1
+        shared.close()